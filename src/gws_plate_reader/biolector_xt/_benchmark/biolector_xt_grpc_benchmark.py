@@ -0,0 +1,305 @@
+"""
+Benchmark of the gRPC calls of BiolectorXTService against the in-process BiolectorXT mock server.
+
+Compares the latency of the calls with a new channel per call (the previous behaviour of the
+service) and with the pooled channel of BiolectorXTChannelPool, and measures the throughput of
+the protocol upload for several chunk sizes and of concurrent experiment downloads:
+
+    python -m gws_plate_reader.biolector_xt._benchmark.biolector_xt_grpc_benchmark
+
+The list calls and the uploads run against BiolectorXTMockServer without simulated latency, so
+the timings measure the channel and serialization overhead only, not the device. The downloads
+use the simulated network profiles.
+"""
+
+import argparse
+import hashlib
+import os
+import statistics
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from concurrent import futures
+from dataclasses import dataclass
+
+import grpc
+from google.protobuf.empty_pb2 import Empty
+from gws_core import Logger
+
+from gws_plate_reader.biolector_xt._benchmark.biolector_xt_mock_server import (
+    NETWORK_PROFILES,
+    BiolectorXTMockServer,
+    BiolectorXTMockServicer,
+)
+from gws_plate_reader.biolector_xt.biolector_xt_grpc_channel import (
+    DEFAULT_CHANNEL_OPTIONS,
+    BiolectorXTChannelPool,
+)
+from gws_plate_reader.biolector_xt.biolector_xt_service import BiolectorXTService
+from gws_plate_reader.biolector_xt.grpc.biolectorxtremotecontrol_pb2_grpc import (
+    BioLectorXtRemoteControlStub,
+)
+
+
+@dataclass
+class CallMeasure:
+    """Latency of a repeated call, in milliseconds."""
+
+    nb_calls: int
+    mean_ms: float
+    median_ms: float
+    min_ms: float
+    max_ms: float
+
+    def to_dict(self) -> dict:
+        return {
+            "nb_calls": self.nb_calls,
+            "mean_ms": self.mean_ms,
+            "median_ms": self.median_ms,
+            "min_ms": self.min_ms,
+            "max_ms": self.max_ms,
+        }
+
+
+def measure_calls(call: Callable[[], object], nb_calls: int) -> CallMeasure:
+    """
+    Time each call of a function.
+
+    :param call: The function to call
+    :param nb_calls: Number of timed calls
+    :return: The latency of the calls
+    """
+    durations_ms: list[float] = []
+    for _ in range(nb_calls):
+        start = time.perf_counter()
+        call()
+        durations_ms.append((time.perf_counter() - start) * 1000)
+    return CallMeasure(
+        nb_calls=nb_calls,
+        mean_ms=statistics.mean(durations_ms),
+        median_ms=statistics.median(durations_ms),
+        min_ms=min(durations_ms),
+        max_ms=max(durations_ms),
+    )
+
+
+def get_experiments_with_new_channel(endpoint: str, timeout: float = 20) -> list:
+    """Call GetExperimentList with a new channel, closed after the call."""
+    with grpc.insecure_channel(endpoint, options=DEFAULT_CHANNEL_OPTIONS) as channel:
+        stub = BioLectorXtRemoteControlStub(channel)
+        return list(stub.GetExperimentList(Empty(), timeout=timeout).experiment)
+
+
+def run_benchmark(
+    nb_calls: int = 200, nb_experiments: int = 200, nb_protocols: int = 20
+) -> dict[str, CallMeasure]:
+    """
+    Measure the latency of GetExperimentList with a new channel per call and with the pooled
+    channel of BiolectorXTService, and of get_biolector_experiments (experiments and protocols).
+
+    :param nb_calls: Number of timed calls of each case
+    :param nb_experiments: Number of experiments of the mock server
+    :param nb_protocols: Number of protocols of the mock server
+    :return: The latency of each case
+    """
+    servicer = BiolectorXTMockServicer(nb_protocols=nb_protocols, nb_experiments=nb_experiments)
+    server = BiolectorXTMockServer(servicer, max_workers=4).start()
+    endpoint = server.get_endpoint()
+    try:
+        service = BiolectorXTService(server.get_credentials())
+        # warm-up: the first call of the pooled channel connects it
+        service.get_experiments()
+        get_experiments_with_new_channel(endpoint)
+
+        return {
+            "new_channel": measure_calls(
+                lambda: get_experiments_with_new_channel(endpoint), nb_calls
+            ),
+            "pooled_channel": measure_calls(service.get_experiments, nb_calls),
+            "biolector_experiments": measure_calls(service.get_biolector_experiments, nb_calls),
+        }
+    finally:
+        BiolectorXTChannelPool.remove(endpoint)
+        server.stop()
+
+
+@dataclass
+class UploadMeasure:
+    """Throughput of the upload of a protocol file."""
+
+    chunk_size: int
+    use_mmap: bool
+    file_size: int
+    duration_s: float
+
+    @property
+    def throughput_mb_s(self) -> float:
+        return self.file_size / (1024 * 1024) / self.duration_s
+
+
+def run_upload_benchmark(
+    file_size: int = 32 * 1024 * 1024,
+    chunk_sizes: tuple[int, ...] = (50_000, BiolectorXTService.MAX_UPLOAD_CHUNK_SIZE),
+) -> list[UploadMeasure]:
+    """
+    Measure the throughput of BiolectorXTService.upload_protocol with file reads and with a
+    memory map, for each chunk size.
+
+    :param file_size: Size of the uploaded file, in bytes
+    :param chunk_sizes: The chunk sizes to measure
+    :return: The throughput of each chunk size and read mode
+    """
+    servicer = BiolectorXTMockServicer(nb_protocols=0, nb_experiments=0)
+    server = BiolectorXTMockServer(servicer, max_workers=4).start()
+    with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as file:
+        file.write(os.urandom(file_size))
+    try:
+        service = BiolectorXTService(server.get_credentials())
+        service.check_connection()
+
+        measures: list[UploadMeasure] = []
+        for chunk_size in chunk_sizes:
+            for use_mmap in (False, True):
+                start = time.perf_counter()
+                service.upload_protocol(file.name, chunk_size=chunk_size, use_mmap=use_mmap)
+                duration_s = time.perf_counter() - start
+                if servicer.uploaded_size != file_size:
+                    raise RuntimeError(
+                        f"The mock server received {servicer.uploaded_size} bytes, "
+                        f"expected {file_size}"
+                    )
+                measures.append(UploadMeasure(chunk_size, use_mmap, file_size, duration_s))
+        return measures
+    finally:
+        os.remove(file.name)
+        BiolectorXTChannelPool.remove(server.get_endpoint())
+        server.stop()
+
+
+def format_upload_report(measures: list[UploadMeasure]) -> str:
+    lines = [f"{'chunk size':>12}{'mmap':>6}{'MB':>8}{'MB/s':>10}"]
+    for measure in measures:
+        lines.append(
+            f"{measure.chunk_size:>12}{'yes' if measure.use_mmap else 'no':>6}"
+            f"{measure.file_size / (1024 * 1024):>8.1f}{measure.throughput_mb_s:>10.1f}"
+        )
+    return "\n".join(lines)
+
+
+@dataclass
+class DownloadMeasure:
+    """Throughput of concurrent experiment downloads through a simulated network."""
+
+    profile: str
+    nb_clients: int
+    total_size: int
+    duration_s: float
+
+    @property
+    def throughput_mb_s(self) -> float:
+        return self.total_size / (1024 * 1024) / self.duration_s
+
+
+def run_download_benchmark(
+    experiment_size: int = 8 * 1024 * 1024,
+    profile_names: tuple[str, ...] = ("local", "lan"),
+    nb_clients: tuple[int, ...] = (1, 4),
+) -> list[DownloadMeasure]:
+    """
+    Measure the throughput of BiolectorXTService.download_experiment against the mock server,
+    with several clients downloading different experiments at the same time. The SHA-256 of
+    each downloaded file is checked.
+
+    :param experiment_size: Size of the zip file of each experiment, in bytes
+    :param profile_names: The network profiles of the mock server (see NETWORK_PROFILES)
+    :param nb_clients: The numbers of concurrent downloads to measure
+    :return: The throughput of each profile and number of clients
+    """
+    measures: list[DownloadMeasure] = []
+    for profile_name in profile_names:
+        servicer = BiolectorXTMockServicer(
+            nb_protocols=1,
+            nb_experiments=max(nb_clients),
+            experiment_size=experiment_size,
+            profile=NETWORK_PROFILES[profile_name],
+        )
+        with BiolectorXTMockServer(servicer, max_workers=max(nb_clients) + 2) as server:
+            service = BiolectorXTService(server.get_credentials())
+            try:
+                for nb_client in nb_clients:
+                    experiment_ids = [f"experiment-{i}" for i in range(nb_client)]
+                    expected_sha256 = {
+                        experiment_id: hashlib.sha256(
+                            servicer.get_experiment_data(experiment_id)
+                        ).hexdigest()
+                        for experiment_id in experiment_ids
+                    }
+
+                    start = time.perf_counter()
+                    with futures.ThreadPoolExecutor(max_workers=nb_client) as executor:
+                        file_paths = list(
+                            executor.map(
+                                lambda experiment_id: service.download_experiment(
+                                    experiment_id, expected_sha256[experiment_id]
+                                ),
+                                experiment_ids,
+                            )
+                        )
+                    duration_s = time.perf_counter() - start
+
+                    total_size = sum(os.path.getsize(file_path) for file_path in file_paths)
+                    for file_path in file_paths:
+                        os.remove(file_path)
+                    measures.append(
+                        DownloadMeasure(profile_name, nb_client, total_size, duration_s)
+                    )
+            finally:
+                BiolectorXTChannelPool.remove(server.get_endpoint())
+    return measures
+
+
+def format_download_report(measures: list[DownloadMeasure]) -> str:
+    lines = [f"{'profile':<10}{'clients':>8}{'MB':>8}{'MB/s':>10}"]
+    for measure in measures:
+        lines.append(
+            f"{measure.profile:<10}{measure.nb_clients:>8}"
+            f"{measure.total_size / (1024 * 1024):>8.1f}{measure.throughput_mb_s:>10.1f}"
+        )
+    return "\n".join(lines)
+
+
+def format_report(measures: dict[str, CallMeasure]) -> str:
+    lines = [f"{'case':<24}{'calls':>8}{'mean ms':>10}{'median ms':>11}{'min ms':>9}{'max ms':>9}"]
+    for name, measure in measures.items():
+        lines.append(
+            f"{name:<24}{measure.nb_calls:>8}{measure.mean_ms:>10.3f}{measure.median_ms:>11.3f}"
+            f"{measure.min_ms:>9.3f}{measure.max_ms:>9.3f}"
+        )
+    if "new_channel" in measures and "pooled_channel" in measures:
+        speedup = measures["new_channel"].median_ms / measures["pooled_channel"].median_ms
+        lines.append(f"pooled channel speedup (median): x{speedup:.1f}")
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--calls", type=int, default=200, help="Number of timed calls per case")
+    parser.add_argument("--experiments", type=int, default=200, help="Experiments of the server")
+    parser.add_argument("--protocols", type=int, default=20, help="Protocols of the server")
+    parser.add_argument(
+        "--upload-mb", type=int, default=32, help="Size of the uploaded protocol file in MB"
+    )
+    parser.add_argument(
+        "--download-mb", type=int, default=8, help="Size of the downloaded experiments in MB"
+    )
+    args = parser.parse_args(argv)
+
+    Logger.info(format_report(run_benchmark(args.calls, args.experiments, args.protocols)))
+    Logger.info(format_upload_report(run_upload_benchmark(args.upload_mb * 1024 * 1024)))
+    Logger.info(format_download_report(run_download_benchmark(args.download_mb * 1024 * 1024)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
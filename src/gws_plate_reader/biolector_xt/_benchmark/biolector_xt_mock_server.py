@@ -0,0 +1,506 @@
+"""
+In-process gRPC server simulating a BiolectorXT device, to test and benchmark the real
+BiolectorXTService without the device and without network:
+
+    python -m gws_plate_reader.biolector_xt._benchmark.biolector_xt_mock_server --port 50051 \
+        --profile wifi
+
+The experiments are synthetic BiolectorXT exports (raw data CSV and BXT.json metadata) zipped
+and padded to a configurable size, the responses are delayed and the streams are throttled
+according to a network profile.
+"""
+
+import argparse
+import io
+import json
+import math
+import os
+import random
+import sys
+import threading
+import time
+import zipfile
+import zlib
+from collections import Counter
+from concurrent import futures
+from dataclasses import dataclass, replace
+
+import grpc
+from google.protobuf.empty_pb2 import Empty
+from google.protobuf.timestamp_pb2 import Timestamp
+from gws_core import Logger
+
+from gws_plate_reader.biolector_xt.biolector_xt_types import CredentialsDataBiolector
+from gws_plate_reader.biolector_xt.grpc.biolectorxtremotecontrol_pb2 import (
+    CommentKind,
+    ContinueProtocolResponse,
+    CoverStatus,
+    CultivationValuesItem,
+    ExperimentInfo,
+    FileChunk,
+    GetCultivationValuesResponse,
+    GetCurrentProgressResponse,
+    GetExperimentListResponse,
+    GetProtocolListResponse,
+    MeasurementStatus,
+    MetaData,
+    ProtocolInfo,
+    StartProtocolResponse,
+    StatusComment,
+    StatusUpdateStreamResponse,
+    StdItemStatus,
+    StdResponse,
+    StopProtocolResponse,
+    StopProtocolStatus,
+    WellLabel,
+)
+from gws_plate_reader.biolector_xt.grpc.biolectorxtremotecontrol_pb2_grpc import (
+    BioLectorXtRemoteControlServicer,
+    add_BioLectorXtRemoteControlServicer_to_server,
+)
+from gws_plate_reader.biolector_xt_data_parser.biolector_xt_synthetic_export import (
+    SYNTHETIC_METADATA_FILE_NAME,
+    SYNTHETIC_RAW_DATA_FILE_NAME,
+    SyntheticExportConfig,
+    make_synthetic_export,
+)
+
+
+@dataclass(frozen=True)
+class BiolectorXTNetworkProfile:
+    """Network conditions simulated by the mock server."""
+
+    # delay before each response, in seconds
+    latency: float = 0
+    # maximum throughput of the file transfers, in bytes per second, None for no limit
+    bandwidth: float | None = None
+
+
+NETWORK_PROFILES: dict[str, BiolectorXTNetworkProfile] = {
+    "local": BiolectorXTNetworkProfile(),
+    "lan": BiolectorXTNetworkProfile(latency=0.002, bandwidth=50 * 1024 * 1024),
+    "wifi": BiolectorXTNetworkProfile(latency=0.02, bandwidth=5 * 1024 * 1024),
+    "remote": BiolectorXTNetworkProfile(latency=0.1, bandwidth=1024 * 1024),
+}
+
+
+class BiolectorXTMockServicer(BioLectorXtRemoteControlServicer):
+    """
+    Simulated BiolectorXT device.
+
+    Like the device, the ids of the experiments and their protocol ids are between brackets,
+    the ids of the protocol list are not. Each experiment is a zip file of a synthetic export
+    (see `make_synthetic_export`), generated from the seed and the experiment id on the first
+    download. A zip file smaller than `experiment_size` bytes is padded with a random
+    `padding.bin` file, ignored by the loaders, to reach this size. The status stream sends a
+    measurement of each well and channel every `status_interval` seconds, with values
+    following a growth curve.
+
+    The uploaded protocols are added to the protocol list, the name, size and largest chunk of
+    the last upload are kept.
+    """
+
+    CHUNK_SIZE = 64 * 1024
+    PADDING_FILE_NAME = "padding.bin"
+    CHANNELS = ["Biomass", "pH", "DO"]
+    WELLS = [name for name in WellLabel.keys() if name != "LABEL_UNKNOWN"]
+    # duration of a cycle of the running protocol, in seconds
+    CYCLE_DURATION = 10
+
+    experiment_size: int
+    export_config: SyntheticExportConfig
+    profile: BiolectorXTNetworkProfile
+    status_interval: float
+    seed: int
+
+    protocols: list[ProtocolInfo]
+    experiments: list[ExperimentInfo]
+    # number of calls of each method
+    nb_calls: Counter
+    running_protocol_id: str | None
+    paused: bool
+    uploaded_filename: str | None
+    uploaded_size: int
+    max_uploaded_chunk_size: int
+
+    _experiment_data: dict[str, bytes]
+    _protocol_start_time: float | None
+    _lock: threading.Lock
+
+    def __init__(
+        self,
+        nb_protocols: int = 5,
+        nb_experiments: int = 20,
+        experiment_size: int = 1024 * 1024,
+        export_config: SyntheticExportConfig | None = None,
+        profile: BiolectorXTNetworkProfile | None = None,
+        status_interval: float = 1,
+        seed: int = 0,
+    ) -> None:
+        """
+        :param nb_protocols: Number of protocols of the device
+        :param nb_experiments: Number of finished experiments of the device
+        :param experiment_size: Minimum size of each experiment zip file, in bytes
+        :param export_config: Shape of the export of each experiment, the seed is replaced by
+            a seed of the experiment. The default shape if not provided
+        :param profile: The simulated network conditions, no latency and no bandwidth limit if
+            not provided
+        :param status_interval: Interval between the measurements of the status stream, in seconds
+        :param seed: Seed of the experiment exports
+        """
+        self.experiment_size = experiment_size
+        self.export_config = export_config or SyntheticExportConfig()
+        self.profile = profile or BiolectorXTNetworkProfile()
+        self.status_interval = status_interval
+        self.seed = seed
+
+        self.protocols = [
+            ProtocolInfo(protocol_id=f"protocol-{i}", protocol_name=f"Protocol {i}")
+            for i in range(nb_protocols)
+        ]
+        self.experiments = [
+            ExperimentInfo(
+                experiment_id=f"{{experiment-{i}}}",
+                protocol_id=f"{{protocol-{i % max(nb_protocols, 1)}}}",
+                start_time=f"2024-01-01T{i % 24:02d}:00:00+01:00",
+                file_path=f"C:/BioLectorXT/experiment_{i}",
+                finished=True,
+            )
+            for i in range(nb_experiments)
+        ]
+        self.nb_calls = Counter()
+        self.running_protocol_id = None
+        self.paused = False
+        self.uploaded_filename = None
+        self.uploaded_size = 0
+        self.max_uploaded_chunk_size = 0
+
+        self._experiment_data = {}
+        self._protocol_start_time = None
+        self._lock = threading.Lock()
+
+    def get_experiment_data(self, experiment_id: str) -> bytes:
+        """
+        Get the zip file of an experiment, it is the same on each call.
+
+        :param experiment_id: The id of the experiment, with or without brackets
+        :return: The content of the zip file
+        """
+        experiment_id = experiment_id.strip("{}")
+        with self._lock:
+            data = self._experiment_data.get(experiment_id)
+            if data is None:
+                data = self._create_experiment_data(experiment_id)
+                self._experiment_data[experiment_id] = data
+            return data
+
+    def GetProtocols(self, request, context):
+        self._start_call("GetProtocols")
+        with self._lock:
+            return GetProtocolListResponse(protocols=self.protocols)
+
+    def GetExperimentList(self, request, context):
+        self._start_call("GetExperimentList")
+        with self._lock:
+            return GetExperimentListResponse(experiment=self.experiments)
+
+    def DownloadExperiment(self, request, context):
+        self._start_call("DownloadExperiment")
+        experiment_id = request.value.strip("{}")
+        if not any(
+            experiment.experiment_id.strip("{}") == experiment_id for experiment in self.experiments
+        ):
+            context.abort(grpc.StatusCode.NOT_FOUND, f"Experiment {request.value} not found")
+
+        data = self.get_experiment_data(experiment_id)
+        yield FileChunk(metadata=MetaData(filename=f"{experiment_id}.zip"))
+        for offset in range(0, len(data), self.CHUNK_SIZE):
+            chunk = data[offset : offset + self.CHUNK_SIZE]
+            self._throttle(len(chunk))
+            yield FileChunk(chunk_data=chunk)
+
+    def UploadProtocol(self, request_iterator, context):
+        self._start_call("UploadProtocol")
+        filename = None
+        uploaded_size = 0
+        max_uploaded_chunk_size = 0
+        for file_chunk in request_iterator:
+            if file_chunk.HasField("metadata"):
+                filename = file_chunk.metadata.filename
+            else:
+                uploaded_size += len(file_chunk.chunk_data)
+                max_uploaded_chunk_size = max(max_uploaded_chunk_size, len(file_chunk.chunk_data))
+                self._throttle(len(file_chunk.chunk_data))
+
+        with self._lock:
+            self.uploaded_filename = filename
+            self.uploaded_size = uploaded_size
+            self.max_uploaded_chunk_size = max_uploaded_chunk_size
+            self.protocols.append(
+                ProtocolInfo(
+                    protocol_id=f"protocol-{len(self.protocols)}",
+                    protocol_name=os.path.splitext(os.path.basename(filename or "protocol"))[0],
+                )
+            )
+        return StdResponse(status=StdItemStatus.OK)
+
+    def StartProtocol(self, request, context):
+        self._start_call("StartProtocol")
+        with self._lock:
+            if not any(protocol.protocol_id == request.value for protocol in self.protocols):
+                return StartProtocolResponse(status=StartProtocolResponse.PROTOCOL_NOT_FOUND)
+            if self.running_protocol_id is not None:
+                return StartProtocolResponse(status=StartProtocolResponse.DEVICE_NOT_IDLE)
+
+            self.running_protocol_id = request.value
+            self.paused = False
+            self._protocol_start_time = time.time()
+            self.experiments.append(
+                ExperimentInfo(
+                    experiment_id=f"{{experiment-{len(self.experiments)}}}",
+                    protocol_id=f"{{{request.value}}}",
+                    start_time=time.strftime("%Y-%m-%dT%H:%M:%S+00:00", time.gmtime()),
+                    file_path=f"C:/BioLectorXT/experiment_{len(self.experiments)}",
+                    finished=False,
+                )
+            )
+        return StartProtocolResponse(status=StartProtocolResponse.SUCCESS)
+
+    def StopProtocol(self, request, context):
+        self._start_call("StopProtocol")
+        with self._lock:
+            if self.running_protocol_id is None:
+                return StopProtocolResponse(status=StopProtocolStatus.NOT_RUNNING)
+            self.running_protocol_id = None
+            self.paused = False
+            self._protocol_start_time = None
+            self.experiments[-1].finished = True
+        return StopProtocolResponse(status=StopProtocolStatus.SUCCESS)
+
+    def PauseProtocol(self, request, context):
+        self._start_call("PauseProtocol")
+        with self._lock:
+            self.paused = self.running_protocol_id is not None and request.value
+        return Empty()
+
+    def ContinueProtocol(self, request, context):
+        self._start_call("ContinueProtocol")
+        with self._lock:
+            if not self.paused:
+                return ContinueProtocolResponse(status=ContinueProtocolResponse.NOT_PAUSED)
+            self.paused = False
+        return ContinueProtocolResponse(status=ContinueProtocolResponse.SUCCESS)
+
+    def GetCurrentProgress(self, request, context):
+        self._start_call("GetCurrentProgress")
+        elapsed_time = self._get_elapsed_time()
+        return GetCurrentProgressResponse(
+            cycle=int(elapsed_time // self.CYCLE_DURATION),
+            elapsed_time=int(elapsed_time),
+            next_cycle_time=int(self.CYCLE_DURATION - elapsed_time % self.CYCLE_DURATION),
+            total_channels=len(self.CHANNELS),
+            total_cultivations=len(self.WELLS),
+        )
+
+    def GetCultivationValues(self, request, context):
+        self._start_call("GetCultivationValues")
+        time_stamp = Timestamp()
+        time_stamp.GetCurrentTime()
+        elapsed_time = self._get_elapsed_time()
+        return GetCultivationValuesResponse(
+            cultivation=[
+                CultivationValuesItem(
+                    label=WellLabel.Value(well),
+                    current_volume=800,
+                    value=[
+                        CultivationValuesItem.Value(
+                            index=well_index,
+                            name=channel,
+                            value=self._get_value(well_index, channel, elapsed_time),
+                            time_stamp=time_stamp,
+                        )
+                        for channel in self.CHANNELS
+                    ],
+                )
+                for well_index, well in enumerate(self.WELLS)
+            ]
+        )
+
+    def StatusUpdateStream(self, request, context):
+        self._start_call("StatusUpdateStream")
+        terminated = threading.Event()
+        context.add_callback(terminated.set)
+
+        yield StatusUpdateStreamResponse(cover_state=CoverStatus.COV_CLOSED)
+        yield StatusUpdateStreamResponse(target_temperature=30)
+        yield StatusUpdateStreamResponse(
+            comment_status=StatusComment(kind=CommentKind.C_SYSTEM, comment="Status stream started")
+        )
+        while not terminated.is_set():
+            elapsed_time = self._get_elapsed_time()
+            time_stamp = Timestamp()
+            time_stamp.GetCurrentTime()
+            yield StatusUpdateStreamResponse(
+                actual_temperature=30 + 0.1 * math.sin(elapsed_time / 60)
+            )
+            for well_index, well in enumerate(self.WELLS):
+                for channel_index, channel in enumerate(self.CHANNELS):
+                    yield StatusUpdateStreamResponse(
+                        measurement_status=MeasurementStatus(
+                            cultivation=WellLabel.Value(well),
+                            channel_index=channel_index,
+                            channel_name=channel,
+                            value=self._get_value(well_index, channel, elapsed_time),
+                            experiment_duration=int(elapsed_time),
+                            time_stamp=time_stamp,
+                        )
+                    )
+            terminated.wait(self.status_interval)
+
+    def _create_experiment_data(self, experiment_id: str) -> bytes:
+        seed = zlib.crc32(f"{self.seed}-{experiment_id}".encode())
+        raw_data, metadata = make_synthetic_export(replace(self.export_config, seed=seed))
+        files = {
+            SYNTHETIC_RAW_DATA_FILE_NAME: raw_data.to_csv(sep=";", index=False).encode(),
+            SYNTHETIC_METADATA_FILE_NAME: json.dumps(metadata).encode(),
+        }
+        data = self._zip_files(files)
+
+        # the padding entry adds a local header and a central directory entry to the zip file
+        padding_size = self.experiment_size - len(data) - 76 - 2 * len(self.PADDING_FILE_NAME)
+        if padding_size > 0:
+            # the padding is random, it would not be compressed
+            files[self.PADDING_FILE_NAME] = random.Random(seed).randbytes(padding_size)
+            data = self._zip_files(files)
+        return data
+
+    def _zip_files(self, files: dict[str, bytes]) -> bytes:
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w") as zip_file:
+            for file_name, content in files.items():
+                compress_type = (
+                    zipfile.ZIP_STORED
+                    if file_name == self.PADDING_FILE_NAME
+                    else zipfile.ZIP_DEFLATED
+                )
+                zip_file.writestr(file_name, content, compress_type=compress_type)
+        return buffer.getvalue()
+
+    def _start_call(self, method_name: str) -> None:
+        with self._lock:
+            self.nb_calls[method_name] += 1
+        if self.profile.latency:
+            time.sleep(self.profile.latency)
+
+    def _throttle(self, nb_bytes: int) -> None:
+        if self.profile.bandwidth:
+            time.sleep(nb_bytes / self.profile.bandwidth)
+
+    def _get_elapsed_time(self) -> float:
+        start_time = self._protocol_start_time
+        return 0 if start_time is None else time.time() - start_time
+
+    def _get_value(self, well_index: int, channel: str, elapsed_time: float) -> float:
+        hours = elapsed_time / 3600
+        if channel == "Biomass":
+            # logistic growth, each well has its own growth rate
+            growth_rate = 0.5 + 0.01 * well_index
+            return 100 / (1 + 99 * math.exp(-growth_rate * hours))
+        if channel == "pH":
+            return 7 - 0.5 * (1 - math.exp(-0.2 * hours))
+        return 100 * math.exp(-0.1 * hours)
+
+
+class BiolectorXTMockServer:
+    """
+    gRPC server of a BiolectorXTMockServicer, on a local port.
+
+    Use it as a context manager, `get_credentials` returns the credentials of the server for
+    BiolectorXTService.
+    """
+
+    servicer: BiolectorXTMockServicer
+    host: str
+    port: int
+    max_workers: int
+
+    _server: grpc.Server | None
+
+    def __init__(
+        self,
+        servicer: BiolectorXTMockServicer | None = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        max_workers: int = 10,
+    ) -> None:
+        """
+        :param servicer: The simulated device, a device with the default parameters if not
+            provided
+        :param host: The host of the server
+        :param port: The port of the server, a free port if 0
+        :param max_workers: Number of threads of the server, the streams each use a thread
+        """
+        self.servicer = servicer or BiolectorXTMockServicer()
+        self.host = host
+        self.port = port
+        self.max_workers = max_workers
+        self._server = None
+
+    def start(self) -> "BiolectorXTMockServer":
+        if self._server is not None:
+            return self
+        self._server = grpc.server(futures.ThreadPoolExecutor(max_workers=self.max_workers))
+        add_BioLectorXtRemoteControlServicer_to_server(self.servicer, self._server)
+        self.port = self._server.add_insecure_port(f"{self.host}:{self.port}")
+        self._server.start()
+        return self
+
+    def stop(self, grace: float | None = None) -> None:
+        """Stop the server, the running calls are cancelled after `grace` seconds."""
+        if self._server is not None:
+            self._server.stop(grace).wait()
+            self._server = None
+
+    def get_endpoint(self) -> str:
+        return f"{self.host}:{self.port}"
+
+    def get_credentials(self) -> CredentialsDataBiolector:
+        return CredentialsDataBiolector(endpoint_url=self.get_endpoint(), secure_channel=False)
+
+    def __enter__(self) -> "BiolectorXTMockServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+        return False
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--host", default="127.0.0.1", help="Host of the server")
+    parser.add_argument("--port", type=int, default=50051, help="Port of the server")
+    parser.add_argument("--profile", choices=NETWORK_PROFILES, default="local")
+    parser.add_argument("--experiments", type=int, default=20, help="Number of experiments")
+    parser.add_argument("--protocols", type=int, default=5, help="Number of protocols")
+    parser.add_argument(
+        "--experiment-mb", type=float, default=1, help="Minimum experiment size in MB"
+    )
+    args = parser.parse_args(argv)
+
+    servicer = BiolectorXTMockServicer(
+        nb_protocols=args.protocols,
+        nb_experiments=args.experiments,
+        experiment_size=int(args.experiment_mb * 1024 * 1024),
+        profile=NETWORK_PROFILES[args.profile],
+    )
+    with BiolectorXTMockServer(servicer, args.host, args.port) as server:
+        Logger.info(f"BiolectorXT mock server listening on {server.get_endpoint()}")
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
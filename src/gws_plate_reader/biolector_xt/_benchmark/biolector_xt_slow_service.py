@@ -0,0 +1,99 @@
+"""
+BiolectorXT service whose list calls take some time, like the calls to the device, to test the
+concurrency of the callers without the device. The calls running at the same time are counted,
+so the tests assert how many calls overlap instead of measuring the elapsed time.
+"""
+
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from gws_plate_reader.biolector_xt.biolector_xt_exception import BiolectorXTConnectException
+from gws_plate_reader.biolector_xt.biolector_xt_service_i import BiolectorXTServiceI
+from gws_plate_reader.biolector_xt.grpc.biolectorxtremotecontrol_pb2 import (
+    ExperimentInfo,
+    ProtocolInfo,
+)
+
+
+class BiolectorXTCallCounter:
+    """Thread-safe count of the calls running at the same time."""
+
+    nb_running_calls: int
+    # largest number of calls that were running at the same time
+    max_running_calls: int
+
+    _lock: threading.Lock
+
+    def __init__(self) -> None:
+        self.nb_running_calls = 0
+        self.max_running_calls = 0
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def count_call(self) -> Iterator[None]:
+        """Count the call running in the context."""
+        with self._lock:
+            self.nb_running_calls += 1
+            self.max_running_calls = max(self.max_running_calls, self.nb_running_calls)
+        try:
+            yield
+        finally:
+            with self._lock:
+                self.nb_running_calls -= 1
+
+
+class BiolectorXTSlowListService(BiolectorXTServiceI):
+    """
+    Service whose list calls take `call_duration` seconds. Several services can share a call
+    counter to count the calls running on all of them.
+    """
+
+    experiments: list[ExperimentInfo]
+    protocols: list[ProtocolInfo]
+    call_duration: float
+    call_counter: BiolectorXTCallCounter
+    # number of list calls of this service
+    nb_calls: int
+    # the list calls raise BiolectorXTConnectException when False
+    reachable: bool
+
+    _lock: threading.Lock
+
+    def __init__(
+        self,
+        experiments: list[ExperimentInfo],
+        protocols: list[ProtocolInfo],
+        call_duration: float = 0.3,
+        call_counter: BiolectorXTCallCounter | None = None,
+    ) -> None:
+        """
+        :param experiments: The experiments returned by get_experiments
+        :param protocols: The protocols returned by get_protocols
+        :param call_duration: Duration of each list call, in seconds
+        :param call_counter: Counter of the running calls, a new counter if not provided
+        """
+        super().__init__()
+        self.experiments = experiments
+        self.protocols = protocols
+        self.call_duration = call_duration
+        self.call_counter = call_counter or BiolectorXTCallCounter()
+        self.nb_calls = 0
+        self.reachable = True
+        self._lock = threading.Lock()
+
+    def get_experiments(self) -> list[ExperimentInfo]:
+        return self._slow_call(self.experiments)
+
+    def get_protocols(self) -> list[ProtocolInfo]:
+        return self._slow_call(self.protocols)
+
+    def _slow_call(self, result: list) -> list:
+        with self._lock:
+            self.nb_calls += 1
+        with self.call_counter.count_call():
+            time.sleep(self.call_duration)
+        if not self.reachable:
+            raise BiolectorXTConnectException()
+        return result
@@ -0,0 +1,200 @@
+import asyncio
+from collections.abc import AsyncIterator
+
+import grpc
+from google.protobuf.empty_pb2 import Empty
+from google.protobuf.wrappers_pb2 import BoolValue, StringValue
+from gws_core import FileHelper, MessageDispatcher
+
+from gws_plate_reader.biolector_xt.biolector_xt_exception import BiolectorXTConnectException
+from gws_plate_reader.biolector_xt.biolector_xt_experiment_downloader import (
+    BiolectorXTDownloadConfig,
+)
+from gws_plate_reader.biolector_xt.biolector_xt_grpc_channel import DEFAULT_CHANNEL_OPTIONS
+from gws_plate_reader.biolector_xt.biolector_xt_service import BiolectorXTService
+from gws_plate_reader.biolector_xt.biolector_xt_service_i import BiolectorXTServiceI
+from gws_plate_reader.biolector_xt.biolector_xt_types import (
+    BiolectorXTExperiment,
+    CredentialsDataBiolector,
+)
+from gws_plate_reader.biolector_xt.grpc.biolectorxtremotecontrol_pb2 import (
+    ContinueProtocolResponse,
+    ExperimentInfo,
+    FileChunk,
+    GetCultivationValuesResponse,
+    GetCurrentProgressResponse,
+    MetaData,
+    ProtocolInfo,
+    StartProtocolResponse,
+    StdResponse,
+    StopProtocolResponse,
+)
+from gws_plate_reader.biolector_xt.grpc.biolectorxtremotecontrol_pb2_grpc import (
+    BioLectorXtRemoteControlStub,
+)
+
+
+class BiolectorXTAsyncService:
+    """
+    Asyncio version of the BiolectorXT service, on grpc.aio.
+
+    The methods are coroutines with the same names as the methods of BiolectorXTServiceI, each
+    call has its own deadline (the `timeout` argument, the `timeout` attribute if not provided)
+    and is cancelled on the device when the awaiting task is cancelled. Independent calls can be
+    run concurrently with asyncio.gather, like in `get_biolector_experiments`.
+
+    The grpc.aio channel is created on the first call and is bound to the event loop of that
+    call, so an instance must only be used from one event loop. Use BiolectorXTSyncService to
+    call it from synchronous code.
+    """
+
+    _credentials: CredentialsDataBiolector
+    message_dispatcher: MessageDispatcher
+    download_config: BiolectorXTDownloadConfig
+    timeout: float = 20
+
+    _channel: grpc.aio.Channel | None
+    _stub: BioLectorXtRemoteControlStub | None
+
+    def __init__(
+        self,
+        credentials: CredentialsDataBiolector,
+        message_dispatcher: MessageDispatcher | None = None,
+        download_config: BiolectorXTDownloadConfig | None = None,
+        timeout: float | None = None,
+    ) -> None:
+        """
+        :param credentials: The credentials of the device
+        :param message_dispatcher: Dispatcher of the download messages
+        :param download_config: The configuration of the experiment downloads
+        :param timeout: Default deadline of the calls, in seconds
+        """
+        self._credentials = credentials
+        self.message_dispatcher = message_dispatcher or MessageDispatcher()
+        self.download_config = download_config or BiolectorXTDownloadConfig()
+        if timeout is not None:
+            self.timeout = timeout
+        self._channel = None
+        self._stub = None
+
+    async def get_protocols(self, timeout: float | None = None) -> list[ProtocolInfo]:
+        response = await self._call("GetProtocols", Empty(), timeout)
+        return list(response.protocols)
+
+    async def get_experiments(self, timeout: float | None = None) -> list[ExperimentInfo]:
+        response = await self._call("GetExperimentList", Empty(), timeout)
+        return list(response.experiment)
+
+    async def get_biolector_experiments(
+        self, timeout: float | None = None
+    ) -> list[BiolectorXTExperiment]:
+        """Get the experiments with their protocol, the two lists are fetched concurrently."""
+        experiments, protocols = await asyncio.gather(
+            self.get_experiments(timeout), self.get_protocols(timeout)
+        )
+        return BiolectorXTServiceI.build_biolector_experiments(experiments, protocols)
+
+    async def upload_protocol(
+        self, file_path: str, chunk_size: int | None = None, timeout: float | None = None
+    ) -> StdResponse:
+        """
+        Upload a protocol file to the device, the file is read by chunks in a worker thread
+        while the chunks are sent.
+        """
+        if not FileHelper.exists_on_os(file_path):
+            raise FileNotFoundError(f"File not found: {file_path}")
+
+        return await self._call(
+            "UploadProtocol", self._upload_protocol_chunker(file_path, chunk_size), timeout
+        )
+
+    async def _upload_protocol_chunker(
+        self, file_path: str, chunk_size: int | None = None
+    ) -> AsyncIterator[FileChunk]:
+        if chunk_size is None:
+            chunk_size = BiolectorXTService.upload_chunk_size
+        if not 0 < chunk_size <= BiolectorXTService.MAX_UPLOAD_CHUNK_SIZE:
+            raise ValueError(
+                f"The chunk size must be between 1 and {BiolectorXTService.MAX_UPLOAD_CHUNK_SIZE}"
+                f", got {chunk_size}"
+            )
+
+        with open(file_path, "rb") as binary_file:
+            # Send the file name first
+            yield FileChunk(metadata=MetaData(filename=file_path))
+
+            chunk = await asyncio.to_thread(binary_file.read, chunk_size)
+            while chunk:
+                yield FileChunk(chunk_data=chunk)
+                chunk = await asyncio.to_thread(binary_file.read, chunk_size)
+
+    async def start_protocol(
+        self, protocol_id: str, timeout: float | None = None
+    ) -> StartProtocolResponse:
+        return await self._call("StartProtocol", StringValue(value=protocol_id), timeout)
+
+    async def stop_current_protocol(self, timeout: float | None = None) -> StopProtocolResponse:
+        return await self._call("StopProtocol", Empty(), timeout)
+
+    async def pause_current_protocol(self, timeout: float | None = None) -> None:
+        await self._call("PauseProtocol", BoolValue(value=True), timeout)
+
+    async def resume_current_protocol(
+        self, timeout: float | None = None
+    ) -> ContinueProtocolResponse:
+        return await self._call("ContinueProtocol", Empty(), timeout)
+
+    async def download_experiment(
+        self, experiment_id: str, expected_sha256: str | None = None
+    ) -> str:
+        """
+        Download the experiment as a zip file and return the path to the file.
+
+        The download writes and hashes the file, it is run in a worker thread with the resumable
+        downloader of BiolectorXTService so the event loop is not blocked.
+        """
+        service = BiolectorXTService(
+            self._credentials, self.message_dispatcher, self.download_config
+        )
+        return await asyncio.to_thread(service.download_experiment, experiment_id, expected_sha256)
+
+    def get_status_update_stream(self) -> grpc.aio.UnaryStreamCall:
+        """
+        Stream of the status updates of the device, to iterate with `async for`. The stream has
+        no deadline, it ends when the connection is lost or when it is cancelled with its cancel
+        method.
+        """
+        return self._get_stub().StatusUpdateStream(Empty())
+
+    async def get_cultivation_values(
+        self, timeout: float | None = None
+    ) -> GetCultivationValuesResponse:
+        return await self._call("GetCultivationValues", Empty(), timeout)
+
+    async def get_current_progress(
+        self, timeout: float | None = None
+    ) -> GetCurrentProgressResponse:
+        return await self._call("GetCurrentProgress", Empty(), timeout)
+
+    async def close(self) -> None:
+        """Close the channel, the running calls are cancelled."""
+        if self._channel is not None:
+            await self._channel.close()
+            self._channel = None
+            self._stub = None
+
+    async def _call(self, method_name: str, request, timeout: float | None):
+        """Call a unary-response method of the device with a deadline."""
+        method = getattr(self._get_stub(), method_name)
+        try:
+            return await method(request, timeout=self.timeout if timeout is None else timeout)
+        except grpc.aio.AioRpcError as err:
+            raise BiolectorXTConnectException() from err
+
+    def _get_stub(self) -> BioLectorXtRemoteControlStub:
+        if self._stub is None:
+            self._channel = grpc.aio.insecure_channel(
+                self._credentials.endpoint_url, options=DEFAULT_CHANNEL_OPTIONS
+            )
+            self._stub = BioLectorXtRemoteControlStub(self._channel)
+        return self._stub
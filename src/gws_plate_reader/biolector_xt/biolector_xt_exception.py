@@ -3,3 +3,7 @@
 class BiolectorXTConnectException(Exception):
     def __init__(self):
         super().__init__('Could not connect with the biolector device, is it on and available ?')
+
+
+class BiolectorXTDownloadException(Exception):
+    """Error during the download of an experiment from the biolector device"""
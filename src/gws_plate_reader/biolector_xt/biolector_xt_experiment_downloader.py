@@ -0,0 +1,290 @@
+import hashlib
+import os
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+import grpc
+from google.protobuf.wrappers_pb2 import StringValue
+from gws_core import MessageDispatcher
+
+from gws_plate_reader.biolector_xt.biolector_xt_exception import BiolectorXTDownloadException
+from gws_plate_reader.biolector_xt.grpc.biolectorxtremotecontrol_pb2_grpc import (
+    BioLectorXtRemoteControlStub,
+)
+
+# errors after which the download is resumed, the other errors stop the download
+RETRYABLE_STATUS_CODES = {
+    grpc.StatusCode.UNAVAILABLE,
+    grpc.StatusCode.DEADLINE_EXCEEDED,
+    grpc.StatusCode.ABORTED,
+    grpc.StatusCode.RESOURCE_EXHAUSTED,
+}
+
+
+@dataclass(frozen=True)
+class BiolectorXTDownloadConfig:
+    """Configuration of the download of a BiolectorXT experiment."""
+
+    # maximum time to wait for the next chunk, in seconds
+    chunk_timeout: float = 60
+    # maximum duration of one attempt, in seconds, None for no limit
+    timeout: float | None = None
+    # number of resumes after a connection loss or a chunk timeout
+    max_retries: int = 3
+    # delay before the first resume, doubled on each resume, in seconds
+    retry_delay: float = 1
+    # size of the buffer of the written file, in bytes
+    write_buffer_size: int = 1024 * 1024
+    # a progress message is sent each time this number of bytes is received
+    progress_step_size: int = 10 * 1024 * 1024
+
+
+@dataclass
+class BiolectorXTDownloadResult:
+    """Downloaded experiment file."""
+
+    file_path: str
+    size: int
+    # hexadecimal SHA-256 of the file
+    sha256: str
+    # number of streams opened, more than 1 when the download was resumed
+    nb_attempts: int
+
+
+class _ChunkDeadline:
+    """Cancel a streaming call when no chunk is received for `timeout` seconds."""
+
+    expired: bool
+
+    def __init__(self, call: grpc.Call, timeout: float) -> None:
+        self._call = call
+        self._timeout = timeout
+        self._last_chunk_time = time.monotonic()
+        self._stopped = threading.Event()
+        self.expired = False
+        self._thread = threading.Thread(target=self._watch, daemon=True)
+        self._thread.start()
+
+    def reset(self) -> None:
+        """Restart the deadline, to call on each received chunk."""
+        self._last_chunk_time = time.monotonic()
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+    def _watch(self) -> None:
+        while True:
+            remaining = self._last_chunk_time + self._timeout - time.monotonic()
+            if remaining <= 0:
+                self.expired = True
+                self._call.cancel()
+                return
+            if self._stopped.wait(remaining):
+                return
+
+
+class _ResumeMismatchError(Exception):
+    """The resumed stream does not start with the bytes already written."""
+
+
+class _ChunkTimeoutError(grpc.RpcError):
+    """No chunk was received before the chunk deadline, the stream was cancelled."""
+
+    def __init__(self, chunk_timeout: float) -> None:
+        super().__init__()
+        self._chunk_timeout = chunk_timeout
+
+    def code(self) -> grpc.StatusCode:
+        return grpc.StatusCode.DEADLINE_EXCEEDED
+
+    def details(self) -> str:
+        return f"No data received for {self._chunk_timeout:g} s"
+
+
+@dataclass
+class _DownloadState:
+    # number of bytes written
+    offset: int
+    # hash of the bytes written
+    hasher: "hashlib._Hash"
+    nb_attempts: int = 0
+    next_progress_offset: int = 0
+
+
+class BiolectorXTExperimentDownloader:
+    """
+    Stream the zip file of a BiolectorXT experiment to the disk.
+
+    Each chunk has its own deadline instead of a deadline for the whole stream, so a large
+    experiment is not interrupted as long as the device keeps sending data. After a connection
+    loss or a chunk timeout the download is resumed: the DownloadExperiment call has no offset,
+    so a new stream is opened and its first bytes, already written, are skipped. Their SHA-256
+    is compared with the SHA-256 of the written bytes, the download restarts from the beginning
+    if the file changed on the device. The SHA-256 of the file is computed while writing it and
+    checked against the expected one when provided.
+    """
+
+    _get_stub: Callable[[], BioLectorXtRemoteControlStub]
+    message_dispatcher: MessageDispatcher
+    config: BiolectorXTDownloadConfig
+
+    def __init__(
+        self,
+        get_stub: Callable[[], BioLectorXtRemoteControlStub],
+        message_dispatcher: MessageDispatcher,
+        config: BiolectorXTDownloadConfig | None = None,
+    ) -> None:
+        """
+        :param get_stub: Function returning the stub of the device, called for each stream so a
+            broken channel can be replaced
+        :param message_dispatcher: Dispatcher of the progress messages
+        :param config: The download configuration, the default configuration if not provided
+        """
+        self._get_stub = get_stub
+        self.message_dispatcher = message_dispatcher
+        self.config = config or BiolectorXTDownloadConfig()
+
+    def download(
+        self, experiment_id: str, file_path: str, expected_sha256: str | None = None
+    ) -> BiolectorXTDownloadResult:
+        """
+        Download the zip file of an experiment.
+
+        The file is written next to `file_path` with a `.part` extension and renamed when it is
+        complete, so `file_path` only exists for a complete and verified download.
+
+        :param experiment_id: The id of the experiment
+        :param file_path: The path of the downloaded file
+        :param expected_sha256: The expected hexadecimal SHA-256 of the file, not checked if
+            not provided
+        :return: The downloaded file with its size and its SHA-256
+        """
+        part_path = file_path + ".part"
+        state = _DownloadState(offset=0, hasher=hashlib.sha256())
+        try:
+            with open(part_path, "wb", buffering=self.config.write_buffer_size) as file:
+                self._download_with_retries(experiment_id, file, state)
+
+            sha256 = state.hasher.hexdigest()
+            if expected_sha256 is not None and sha256 != expected_sha256.lower():
+                raise BiolectorXTDownloadException(
+                    f"The SHA-256 of the downloaded experiment {experiment_id} is {sha256}, "
+                    f"expected {expected_sha256}"
+                )
+            os.replace(part_path, file_path)
+        except BaseException:
+            if os.path.exists(part_path):
+                os.remove(part_path)
+            raise
+
+        self.message_dispatcher.notify_info_message(
+            f"Downloaded experiment {experiment_id}: {self._format_size(state.offset)}, "
+            f"SHA-256 {sha256}"
+        )
+        return BiolectorXTDownloadResult(
+            file_path=file_path, size=state.offset, sha256=sha256, nb_attempts=state.nb_attempts
+        )
+
+    def _download_with_retries(self, experiment_id: str, file, state: _DownloadState) -> None:
+        nb_retries = 0
+        while True:
+            state.nb_attempts += 1
+            try:
+                self._download_stream(experiment_id, file, state)
+                return
+            except _ResumeMismatchError:
+                # the file changed on the device, the written bytes are discarded
+                self.message_dispatcher.notify_warning_message(
+                    f"The experiment {experiment_id} changed during the download, restarting "
+                    "the download from the beginning"
+                )
+                file.seek(0)
+                file.truncate()
+                state.offset = 0
+                state.hasher = hashlib.sha256()
+                state.next_progress_offset = 0
+                error_message = "the experiment changed during the download"
+            except grpc.RpcError as err:
+                if err.code() not in RETRYABLE_STATUS_CODES:
+                    raise BiolectorXTDownloadException(
+                        f"Error during the download of biolector experiment. "
+                        f"Error : '{err.details()}'. Status : '{err.code().name}'"
+                    ) from err
+                error_message = f"'{err.details()}' ({err.code().name})"
+
+            nb_retries += 1
+            if nb_retries > self.config.max_retries:
+                raise BiolectorXTDownloadException(
+                    f"Error during the download of biolector experiment, {error_message} after "
+                    f"{self.config.max_retries} retries ({self._format_size(state.offset)} "
+                    "downloaded)"
+                )
+            delay = self.config.retry_delay * 2 ** (nb_retries - 1)
+            self.message_dispatcher.notify_warning_message(
+                f"Download of experiment {experiment_id} interrupted after "
+                f"{self._format_size(state.offset)}: {error_message}. Resuming in {delay:g} s "
+                f"(retry {nb_retries}/{self.config.max_retries})"
+            )
+            file.flush()
+            time.sleep(delay)
+
+    def _download_stream(self, experiment_id: str, file, state: _DownloadState) -> None:
+        """Open a stream and write its bytes after the bytes already written."""
+        call = self._get_stub().DownloadExperiment(
+            StringValue(value=experiment_id), timeout=self.config.timeout
+        )
+        chunk_deadline = _ChunkDeadline(call, self.config.chunk_timeout)
+        # bytes already written, skipped and checked on a resumed stream
+        nb_bytes_to_skip = state.offset
+        skipped_hasher = hashlib.sha256()
+        try:
+            for chunk in call:
+                chunk_deadline.reset()
+                data = memoryview(chunk.chunk_data)
+                if not data:
+                    # metadata chunk
+                    continue
+
+                if nb_bytes_to_skip:
+                    skipped_data = data[:nb_bytes_to_skip]
+                    skipped_hasher.update(skipped_data)
+                    nb_bytes_to_skip -= len(skipped_data)
+                    data = data[len(skipped_data) :]
+                    if nb_bytes_to_skip == 0:
+                        self._check_resumed_stream(skipped_hasher, state)
+                    if not data:
+                        continue
+
+                file.write(data)
+                state.hasher.update(data)
+                state.offset += len(data)
+                if state.offset >= state.next_progress_offset:
+                    self._notify_progress(experiment_id, state)
+        except grpc.RpcError as err:
+            if chunk_deadline.expired:
+                raise _ChunkTimeoutError(self.config.chunk_timeout) from err
+            raise
+        finally:
+            chunk_deadline.stop()
+
+        if nb_bytes_to_skip:
+            # the resumed stream is shorter than the bytes already written
+            raise _ResumeMismatchError()
+
+    def _check_resumed_stream(self, skipped_hasher: "hashlib._Hash", state: _DownloadState):
+        if skipped_hasher.digest() != state.hasher.digest():
+            raise _ResumeMismatchError()
+        self.message_dispatcher.notify_info_message(
+            f"Download resumed at {self._format_size(state.offset)}"
+        )
+
+    def _notify_progress(self, experiment_id: str, state: _DownloadState) -> None:
+        self.message_dispatcher.notify_info_message(
+            f"Downloading experiment {experiment_id}: {self._format_size(state.offset)} received"
+        )
+        state.next_progress_offset = state.offset + self.config.progress_step_size
+
+    def _format_size(self, nb_bytes: int) -> str:
+        return f"{nb_bytes / (1024 * 1024):.1f} MB"
@@ -0,0 +1,184 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+from gws_core import MessageDispatcher
+from pandas import DataFrame
+
+from gws_plate_reader.biolector_xt.biolector_xt_service import BiolectorXTService
+from gws_plate_reader.biolector_xt.biolector_xt_service_i import BiolectorXTServiceI
+from gws_plate_reader.biolector_xt.biolector_xt_types import (
+    BiolectorXTExperiment,
+    CredentialsDataBiolector,
+)
+from gws_plate_reader.biolector_xt.grpc.biolectorxtremotecontrol_pb2 import ProtocolInfo
+
+EXPERIMENT_COLUMNS = [
+    "Instrument",
+    "Id",
+    "Protocol id",
+    "Protocol name",
+    "Start Date",
+    "File path",
+    "Finished",
+]
+PROTOCOL_COLUMNS = ["Instrument", "Id", "Name"]
+
+
+@dataclass
+class BiolectorXTInventory:
+    """Experiments and protocols of an instrument, fetched at the same time."""
+
+    experiments: list[BiolectorXTExperiment]
+    protocols: list[ProtocolInfo]
+    # time of the fetch, from time.monotonic
+    fetch_time: float
+
+
+class BiolectorXTFleet:
+    """
+    Several BiolectorXT instruments, queried together.
+
+    The experiments and the protocols of all the instruments are fetched concurrently, so
+    loading the lists takes the time of the slowest instrument instead of the sum of the
+    instruments. The lists of each instrument are cached for `cache_ttl` seconds. An
+    unreachable instrument does not prevent the others from being listed: its error is kept
+    in `get_errors` and its last lists are used if they were fetched before.
+    """
+
+    services: dict[str, BiolectorXTServiceI]
+    cache_ttl: float
+
+    # instrument name -> last inventory
+    _inventories: dict[str, BiolectorXTInventory]
+    # instrument name -> error of the last fetch
+    _errors: dict[str, str]
+    _lock: threading.Lock
+
+    def __init__(self, services: dict[str, BiolectorXTServiceI], cache_ttl: float = 60) -> None:
+        """
+        :param services: The service of each instrument, by instrument name
+        :param cache_ttl: Duration of validity of the fetched lists, in seconds
+        """
+        self.services = services
+        self.cache_ttl = cache_ttl
+        self._inventories = {}
+        self._errors = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_credentials(
+        cls,
+        credentials: dict[str, CredentialsDataBiolector],
+        message_dispatcher: MessageDispatcher | None = None,
+        cache_ttl: float = 60,
+    ) -> "BiolectorXTFleet":
+        """
+        Create a fleet of devices, the services use the pooled channel of each endpoint.
+
+        :param credentials: The credentials of each instrument, by instrument name
+        :param message_dispatcher: Dispatcher of the messages of the services
+        :param cache_ttl: Duration of validity of the fetched lists, in seconds
+        """
+        return cls(
+            {
+                name: BiolectorXTService(instrument_credentials, message_dispatcher)
+                for name, instrument_credentials in credentials.items()
+            },
+            cache_ttl,
+        )
+
+    def get_inventories(self, force_refresh: bool = False) -> dict[str, BiolectorXTInventory]:
+        """
+        Get the experiments and the protocols of each instrument, the expired lists are fetched
+        concurrently.
+
+        :param force_refresh: Fetch the lists of all the instruments, even if they are cached
+        :return: The lists of each instrument, the instruments that were never reached are missing
+        """
+        now = time.monotonic()
+        with self._lock:
+            names_to_fetch = [
+                name
+                for name in self.services
+                if force_refresh
+                or name not in self._inventories
+                or now - self._inventories[name].fetch_time > self.cache_ttl
+            ]
+
+        if names_to_fetch:
+            with ThreadPoolExecutor(max_workers=len(names_to_fetch)) as executor:
+                futures = {
+                    name: executor.submit(self._fetch_inventory, name) for name in names_to_fetch
+                }
+                results = {
+                    name: future.exception() or future.result() for name, future in futures.items()
+                }
+
+            with self._lock:
+                for name, result in results.items():
+                    if isinstance(result, BaseException):
+                        self._errors[name] = str(result)
+                    else:
+                        self._inventories[name] = result
+                        self._errors.pop(name, None)
+
+        with self._lock:
+            return {
+                name: self._inventories[name] for name in self.services if name in self._inventories
+            }
+
+    def get_experiments_dataframe(self, force_refresh: bool = False) -> DataFrame:
+        """Get the experiments of all the instruments, the most recent first."""
+        rows = []
+        for name, inventory in self.get_inventories(force_refresh).items():
+            for experiment in inventory.experiments:
+                rows.append(
+                    [
+                        name,
+                        experiment.id,
+                        experiment.protocol.id,
+                        experiment.protocol.name,
+                        experiment.start_time,
+                        experiment.file_path,
+                        "Yes" if experiment.finished else "No",
+                    ]
+                )
+        dataframe = DataFrame(rows, columns=EXPERIMENT_COLUMNS)
+        return dataframe.sort_values(by="Start Date", ascending=False, ignore_index=True)
+
+    def get_protocols_dataframe(self, force_refresh: bool = False) -> DataFrame:
+        """Get the protocols of all the instruments, sorted by name."""
+        rows = [
+            [name, protocol.protocol_id, protocol.protocol_name]
+            for name, inventory in self.get_inventories(force_refresh).items()
+            for protocol in inventory.protocols
+        ]
+        dataframe = DataFrame(rows, columns=PROTOCOL_COLUMNS)
+        return dataframe.sort_values(by=["Name", "Instrument"], ignore_index=True)
+
+    def get_errors(self) -> dict[str, str]:
+        """Get the error of the last fetch of each instrument that could not be reached."""
+        with self._lock:
+            return dict(self._errors)
+
+    def clear_cache(self) -> None:
+        with self._lock:
+            self._inventories.clear()
+            self._errors.clear()
+
+    def _fetch_inventory(self, name: str) -> BiolectorXTInventory:
+        service = self.services[name]
+        # the experiments and the protocols of the instrument are fetched concurrently
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            experiments_future = executor.submit(service.get_experiments)
+            protocols_future = executor.submit(service.get_protocols)
+            experiments = list(experiments_future.result())
+            protocols = list(protocols_future.result())
+
+        return BiolectorXTInventory(
+            experiments=BiolectorXTServiceI.build_biolector_experiments(experiments, protocols),
+            protocols=protocols,
+            fetch_time=time.monotonic(),
+        )
@@ -0,0 +1,215 @@
+import threading
+from collections import OrderedDict
+
+import grpc
+
+from gws_plate_reader.biolector_xt.biolector_xt_exception import BiolectorXTConnectException
+from gws_plate_reader.biolector_xt.grpc.biolectorxtremotecontrol_pb2_grpc import (
+    BioLectorXtRemoteControlStub,
+)
+
+# Keepalive pings detect a device that stops answering during a call. They are not sent while
+# the channel is idle in the pool (a device rejects the pings without calls with the default
+# gRPC server policy), so a device switched off while idle is only found by `check_health` or
+# by the next call. The reconnection backoff is capped so a device that is switched on again
+# is found quickly
+DEFAULT_CHANNEL_OPTIONS: list[tuple[str, int]] = [
+    ("grpc.keepalive_time_ms", 60_000),
+    ("grpc.keepalive_timeout_ms", 20_000),
+    ("grpc.keepalive_permit_without_calls", 0),
+    ("grpc.http2.max_pings_without_data", 0),
+    ("grpc.initial_reconnect_backoff_ms", 1_000),
+    ("grpc.max_reconnect_backoff_ms", 10_000),
+]
+
+
+class BiolectorXTGrpcChannel:
+    """
+    Long-lived gRPC channel to a BiolectorXT device, with its stub.
+
+    The channel connects lazily on the first call and reconnects by itself after a connection
+    loss, so it is meant to be reused for all the calls to the device (see
+    `BiolectorXTChannelPool`). Use it as a context manager around the calls to convert the
+    connection errors to BiolectorXTConnectException, the channel stays open on exit.
+    """
+
+    endpoint: str
+    channel: grpc.Channel
+    stub: BioLectorXtRemoteControlStub
+
+    _state: grpc.ChannelConnectivity | None
+    _closed: bool
+    # True when the channel was removed from the pool without being closed
+    _detached: bool
+    # True when a call or a health check could not reach the device
+    _failed: bool
+
+    def __init__(self, endpoint: str, options: list[tuple[str, int]] | None = None):
+        """
+        :param endpoint: The host:port of the device
+        :param options: The gRPC channel options, DEFAULT_CHANNEL_OPTIONS if not provided
+        """
+        self.endpoint = endpoint
+        self.channel = grpc.insecure_channel(
+            endpoint, options=DEFAULT_CHANNEL_OPTIONS if options is None else options
+        )
+        self.stub = BioLectorXtRemoteControlStub(self.channel)
+        self._state = None
+        self._closed = False
+        self._detached = False
+        self._failed = False
+        # track the connectivity state without forcing a connection
+        self.channel.subscribe(self._on_state_change, try_to_connect=False)
+
+    def __enter__(self) -> "BiolectorXTGrpcChannel":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if isinstance(exc_val, grpc.RpcError) and exc_val.code() == grpc.StatusCode.UNAVAILABLE:
+            self._failed = True
+        if isinstance(exc_val, grpc._channel._InactiveRpcError):
+            raise BiolectorXTConnectException()
+
+        return False
+
+    def get_state(self) -> grpc.ChannelConnectivity | None:
+        """Get the last connectivity state of the channel, None before the first connection."""
+        return self._state
+
+    def is_closed(self) -> bool:
+        return self._closed
+
+    def is_detached(self) -> bool:
+        return self._detached
+
+    def is_usable(self) -> bool:
+        """
+        Check if the channel can be reused: it is open, still in the pool and its last connection
+        attempt did not fail (a failed channel waits for its reconnection backoff before trying
+        again).
+        """
+        if self._closed or self._detached or self._failed:
+            return False
+        return self._state not in (
+            grpc.ChannelConnectivity.TRANSIENT_FAILURE,
+            grpc.ChannelConnectivity.SHUTDOWN,
+        )
+
+    def wait_for_ready(self, timeout: float) -> bool:
+        """
+        Connect the channel if needed and wait until it is ready.
+
+        :param timeout: Maximum time to wait, in seconds
+        :return: True if the device is reachable
+        """
+        try:
+            grpc.channel_ready_future(self.channel).result(timeout=timeout)
+            return True
+        except grpc.FutureTimeoutError:
+            self._failed = True
+            return False
+
+    def detach(self) -> None:
+        """
+        Stop tracking the connectivity state, without closing the channel.
+
+        The calls in progress on the channel (e.g. a stream of another session) go on, the gRPC
+        channel is released when the last caller drops it.
+        """
+        if self._closed or self._detached:
+            return
+        self._detached = True
+        # the subscription runs a polling thread that would keep the channel alive
+        self.channel.unsubscribe(self._on_state_change)
+
+    def close(self) -> None:
+        """Close the channel, the calls in progress on the channel are cancelled."""
+        if self._closed:
+            return
+        self._closed = True
+        if not self._detached:
+            self.channel.unsubscribe(self._on_state_change)
+        self.channel.close()
+
+    def _on_state_change(self, state: grpc.ChannelConnectivity) -> None:
+        self._state = state
+
+
+class BiolectorXTChannelPool:
+    """
+    Pool of the gRPC channels to the BiolectorXT devices, one channel per endpoint.
+
+    Reusing the channel avoids a TCP and HTTP/2 handshake on each call. A channel whose last
+    connection attempt failed is replaced by a new one on the next call, so a device that is
+    switched on again is reached without waiting for the reconnection backoff. The least
+    recently used channels are removed when there are more than MAX_SIZE endpoints.
+
+    Other threads can still use a replaced or removed channel (e.g. a long DownloadExperiment
+    stream), so the pool only detaches it and never closes it: closing a channel cancels all its
+    calls. Only `remove` and `clear` close the channels.
+    """
+
+    MAX_SIZE = 16
+
+    # endpoint -> channel
+    _channels: "OrderedDict[str, BiolectorXTGrpcChannel]" = OrderedDict()
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_channel(cls, endpoint: str) -> BiolectorXTGrpcChannel:
+        """
+        Get the channel of an endpoint, created on the first call.
+
+        :param endpoint: The host:port of the device
+        :return: The pooled channel, it must not be closed by the caller
+        """
+        detached_channels: list[BiolectorXTGrpcChannel] = []
+        with cls._lock:
+            channel = cls._channels.get(endpoint)
+            if channel is not None and not channel.is_usable():
+                detached_channels.append(channel)
+                channel = None
+            if channel is None:
+                channel = BiolectorXTGrpcChannel(endpoint)
+                cls._channels[endpoint] = channel
+            cls._channels.move_to_end(endpoint)
+            while len(cls._channels) > cls.MAX_SIZE:
+                detached_channels.append(cls._channels.popitem(last=False)[1])
+
+        for detached_channel in detached_channels:
+            detached_channel.detach()
+        return channel
+
+    @classmethod
+    def check_health(cls, endpoint: str, timeout: float = 5) -> bool:
+        """
+        Check that a device is reachable, the channel of the endpoint is connected if needed.
+
+        :param endpoint: The host:port of the device
+        :param timeout: Maximum time to wait for the connection, in seconds
+        :return: True if the device is reachable
+        """
+        return cls.get_channel(endpoint).wait_for_ready(timeout)
+
+    @classmethod
+    def remove(cls, endpoint: str) -> None:
+        """Close and remove the channel of an endpoint, its calls in progress are cancelled."""
+        with cls._lock:
+            channel = cls._channels.pop(endpoint, None)
+        if channel is not None:
+            channel.close()
+
+    @classmethod
+    def clear(cls) -> None:
+        """Close and remove all the channels, their calls in progress are cancelled."""
+        with cls._lock:
+            channels = list(cls._channels.values())
+            cls._channels.clear()
+        for channel in channels:
+            channel.close()
+
+    @classmethod
+    def get_endpoints(cls) -> list[str]:
+        """Get the endpoints of the pooled channels, the least recently used first."""
+        with cls._lock:
+            return list(cls._channels.keys())
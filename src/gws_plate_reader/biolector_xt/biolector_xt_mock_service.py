@@ -1,26 +1,109 @@
 import json
+import math
 import os
+import threading
+import time
+import zipfile
+import zlib
+from collections.abc import Iterator
+from dataclasses import replace
 
-from gws_core import FileDownloader, Settings
+from google.protobuf.timestamp_pb2 import Timestamp
+from gws_core import Settings
 
 from gws_plate_reader.biolector_xt.biolector_xt_service_i import BiolectorXTServiceI
 from gws_plate_reader.biolector_xt.grpc.biolectorxtremotecontrol_pb2 import (
     ContinueProtocolResponse,
     ExperimentInfo,
+    GetCultivationValuesResponse,
+    GetCurrentProgressResponse,
+    MeasurementStatus,
     ProtocolInfo,
     StartProtocolResponse,
     StatusUpdateStreamResponse,
     StdResponse,
     StopProtocolResponse,
+    WellLabel,
 )
+from gws_plate_reader.biolector_xt_data_parser.biolector_xt_synthetic_export import (
+    SyntheticExportConfig,
+    write_synthetic_export,
+)
+
+
+class BiolectorXTMockStatusStream(Iterator[StatusUpdateStreamResponse]):
+    """
+    Synthetic status stream of the mock service: the temperature and a measurement of each well
+    and channel every `interval` seconds, until the stream is cancelled.
+    """
+
+    WELLS = ["A01", "A02", "A03", "A04"]
+    CHANNELS = ["Biomass", "pH", "DO"]
+
+    interval: float
+
+    _cancelled: threading.Event
+    _responses: Iterator[StatusUpdateStreamResponse]
+
+    def __init__(self, interval: float = 5) -> None:
+        """
+        :param interval: Interval between the measurements, in seconds
+        """
+        self.interval = interval
+        self._cancelled = threading.Event()
+        self._responses = self._generate_responses()
+
+    def __next__(self) -> StatusUpdateStreamResponse:
+        return next(self._responses)
+
+    def cancel(self) -> None:
+        """Cancel the stream, the iteration stops, can be called from any thread."""
+        self._cancelled.set()
+
+    def _generate_responses(self) -> Iterator[StatusUpdateStreamResponse]:
+        start_time = time.monotonic()
+        yield StatusUpdateStreamResponse(target_temperature=30)
+        while not self._cancelled.is_set():
+            elapsed_time = time.monotonic() - start_time
+            time_stamp = Timestamp()
+            time_stamp.GetCurrentTime()
+            yield StatusUpdateStreamResponse(
+                actual_temperature=30 + 0.1 * math.sin(elapsed_time / 60)
+            )
+            for well_index, well in enumerate(self.WELLS):
+                for channel_index, channel in enumerate(self.CHANNELS):
+                    yield StatusUpdateStreamResponse(
+                        measurement_status=MeasurementStatus(
+                            cultivation=WellLabel.Value(well),
+                            channel_index=channel_index,
+                            channel_name=channel,
+                            value=self._get_value(well_index, channel, elapsed_time),
+                            experiment_duration=int(elapsed_time),
+                            time_stamp=time_stamp,
+                        )
+                    )
+            # block like a device stream until the next measurement
+            self._cancelled.wait(self.interval)
+
+    def _get_value(self, well_index: int, channel: str, elapsed_time: float) -> float:
+        if channel == "Biomass":
+            return (1 + well_index) * (1 - math.exp(-elapsed_time / 3600))
+        if channel == "pH":
+            return 7 - 0.1 * well_index * elapsed_time / 3600
+        return 100 * math.exp(-elapsed_time / 7200)
 
 
 class BiolectorXTMockService(BiolectorXTServiceI):
-    """Service to simulate the interaction with the Biolector XT device using gRPC"""
+    """
+    Service to simulate the interaction with the Biolector XT device using gRPC.
+
+    Works offline: the experiments are synthetic BiolectorXT exports (raw data CSV and BXT.json
+    metadata) generated from the experiment id, so each experiment always has the same data.
+    """
 
     PROTOCOL_LIST = "protocol_list.json"
     EXPERIMENT_LIST = "experiment_list.json"
-    EXPERIMENT_ZIP_LOCATION = "https://storage.gra.cloud.ovh.net/v1/AUTH_a0286631d7b24afba3f3cdebed2992aa/opendata/gws_plate_reader/Biolector_xt_example_data.zip"
+    EXPORT_CONFIG = SyntheticExportConfig()
 
     def get_protocols(self) -> list[ProtocolInfo]:
         protocol_infos = self._read_json_file(
@@ -72,15 +155,23 @@ class BiolectorXTMockService(BiolectorXTServiceI):
         pass
 
     def download_experiment(self, experiment_id: str) -> str:
-        dest_folder = os.path.join(Settings.make_temp_dir())
-        downloader = FileDownloader(dest_folder, self.message_dispatcher)
+        export_config = replace(self.EXPORT_CONFIG, seed=zlib.crc32(experiment_id.encode()))
+        export_files = write_synthetic_export(export_config, Settings.make_temp_dir())
 
-        dest_file = os.path.join(dest_folder, "experiment.zip")
+        dest_file = os.path.join(Settings.make_temp_dir(), "experiment.zip")
+        with zipfile.ZipFile(dest_file, "w", zipfile.ZIP_DEFLATED) as zip_file:
+            for file_path in export_files:
+                zip_file.write(file_path, os.path.basename(file_path))
+        return dest_file
 
-        return downloader.download_file_if_missing(self.EXPERIMENT_ZIP_LOCATION, dest_file)
+    def get_status_update_stream(self) -> BiolectorXTMockStatusStream:
+        return BiolectorXTMockStatusStream()
 
-    def get_status_update_stream(self) -> StatusUpdateStreamResponse:
-        pass
+    def get_cultivation_values(self) -> GetCultivationValuesResponse:
+        return GetCultivationValuesResponse()
+
+    def get_current_progress(self) -> GetCurrentProgressResponse:
+        return GetCurrentProgressResponse()
 
     def _read_json_file(self, file_path: str) -> dict:
         with open(file_path, encoding="utf-8") as file:
@@ -1,156 +1,166 @@
 
+import mmap
 import os
-from typing import Generator, List
+from typing import Generator, Iterator, List
 
-import grpc
 from google.protobuf.empty_pb2 import Empty
 from google.protobuf.wrappers_pb2 import BoolValue, StringValue
 from gws_core import FileHelper, MessageDispatcher, Settings
-from gws_plate_reader.biolector_xt.biolector_xt_exception import \
-    BiolectorXTConnectException
+from gws_plate_reader.biolector_xt.biolector_xt_experiment_downloader import (
+    BiolectorXTDownloadConfig, BiolectorXTExperimentDownloader)
+from gws_plate_reader.biolector_xt.biolector_xt_grpc_channel import (
+    BiolectorXTChannelPool, BiolectorXTGrpcChannel)
 from gws_plate_reader.biolector_xt.biolector_xt_service_i import \
     BiolectorXTServiceI
 from gws_plate_reader.biolector_xt.biolector_xt_types import \
     CredentialsDataBiolector
 from gws_plate_reader.biolector_xt.grpc.biolectorxtremotecontrol_pb2 import (
-    ContinueProtocolResponse, ExperimentInfo, FileChunk, MetaData,
+    ContinueProtocolResponse, ExperimentInfo, FileChunk,
+    GetCultivationValuesResponse, GetCurrentProgressResponse, MetaData,
     ProtocolInfo, StartProtocolResponse, StatusUpdateStreamResponse,
     StdResponse, StopProtocolResponse)
-from gws_plate_reader.biolector_xt.grpc.biolectorxtremotecontrol_pb2_grpc import \
-    BioLectorXtRemoteControlStub
-
-
-class BiolectorXTGrpcChannel():
-    """Class to handle generic gRPC channel exceptions
-    """
-
-    endpoint: str
-    channel: grpc.Channel
-
-    def __init__(self, endpoint: str):
-        self.endpoint = endpoint
-        self.channel = grpc.insecure_channel(endpoint)
-
-    def __enter__(self):
-        return self.channel.__enter__()
-
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        result = self.channel.__exit__(exc_type, exc_val, exc_tb)
-        if isinstance(exc_val, grpc._channel._InactiveRpcError):
-            raise BiolectorXTConnectException()
-
-        return result
 
 
 class BiolectorXTService(BiolectorXTServiceI):
     """Service to interact with the Biolector XT device using gRPC
+
+    The calls reuse the pooled channel of the device endpoint (see BiolectorXTChannelPool)
     """
 
     _credentials: CredentialsDataBiolector
+    download_config: BiolectorXTDownloadConfig
 
     timeout = 20
 
+    # size of the chunks of the uploaded protocols, limited by the device
+    upload_chunk_size = 50000
+    MAX_UPLOAD_CHUNK_SIZE = 131071
+
     def __init__(self, credentials: CredentialsDataBiolector,
-                 message_dispatcher: MessageDispatcher = None) -> None:
+                 message_dispatcher: MessageDispatcher = None,
+                 download_config: BiolectorXTDownloadConfig | None = None) -> None:
         super().__init__(message_dispatcher)
         self._credentials = credentials
+        self.download_config = download_config or BiolectorXTDownloadConfig()
 
     def get_protocols(self) -> List[ProtocolInfo]:
         with self.get_grpc_channel() as channel:
-            stub = BioLectorXtRemoteControlStub(channel)
-            return stub.GetProtocols(Empty(), timeout=self.timeout).protocols
+            return channel.stub.GetProtocols(Empty(), timeout=self.timeout).protocols
 
     def get_experiments(self) -> List[ExperimentInfo]:
         with self.get_grpc_channel() as channel:
-            stub = BioLectorXtRemoteControlStub(channel)
-            return stub.GetExperimentList(Empty(), timeout=self.timeout).experiment
-
-    def upload_protocol(self, file_path: str) -> StdResponse:
+            return channel.stub.GetExperimentList(Empty(), timeout=self.timeout).experiment
+
+    def upload_protocol(self, file_path: str, chunk_size: int | None = None,
+                        use_mmap: bool = False) -> StdResponse:
+        """Upload a protocol file to the device, the file is streamed by chunks
+
+        :param file_path: path of the protocol file
+        :type file_path: str
+        :param chunk_size: size of the chunks in bytes, upload_chunk_size if not provided
+        :type chunk_size: int | None
+        :param use_mmap: read the file with a memory map instead of file reads
+        :type use_mmap: bool
+        :return: response of the device
+        :rtype: StdResponse
+        """
         if not FileHelper.exists_on_os(file_path):
             raise FileNotFoundError(f"File not found: {file_path}")
 
         with self.get_grpc_channel() as channel:
-            stub = BioLectorXtRemoteControlStub(channel)
+            return channel.stub.UploadProtocol(
+                self._upload_protocol_chunker(file_path, chunk_size, use_mmap), timeout=self.timeout)
 
-            return stub.UploadProtocol(self._upload_protocol_chunker(file_path), timeout=self.timeout)
-
-    def _upload_protocol_chunker(self, file_path: str) -> Generator:
+    def _upload_protocol_chunker(self, file_path: str, chunk_size: int | None = None,
+                                 use_mmap: bool = False) -> Generator[FileChunk, None, None]:
         """
-        helper function to chop up a local file to smaller chunks that can be send via gRPC
+        Generator sending the file name then the content of a local file by chunks, the file is
+        read while the chunks are sent so only one chunk is in memory
         """
-        meta_data = MetaData(filename=file_path)
-        chunk_size = 50000  # maximum chunk size 131071
-        chunk_list = []
-        byte_array = []
-        with open(file_path, "rb") as binary_file:
-            byte = binary_file.read(chunk_size)
-            while byte:
-                byte_array.append(byte)
-                byte = binary_file.read(chunk_size)
+        if chunk_size is None:
+            chunk_size = self.upload_chunk_size
+        if not 0 < chunk_size <= self.MAX_UPLOAD_CHUNK_SIZE:
+            raise ValueError(
+                f"The chunk size must be between 1 and {self.MAX_UPLOAD_CHUNK_SIZE}, got {chunk_size}")
 
+        with open(file_path, "rb") as binary_file:
             # Send the file name first
-            file_chunk = FileChunk(
-                metadata=meta_data
-            )
-            yield file_chunk
-
-            for chunk in byte_array:
-                # send the data chunks
-                file_chunk = FileChunk(
-                    chunk_data=chunk
-                )
-                chunk_list.append(file_chunk)
-                yield file_chunk
+            yield FileChunk(metadata=MetaData(filename=file_path))
+
+            file_size = os.fstat(binary_file.fileno()).st_size
+            # an empty file cannot be memory-mapped
+            if use_mmap and file_size > 0:
+                with mmap.mmap(binary_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped_file:
+                    for offset in range(0, file_size, chunk_size):
+                        yield FileChunk(chunk_data=mapped_file[offset:offset + chunk_size])
+            else:
+                chunk = binary_file.read(chunk_size)
+                while chunk:
+                    yield FileChunk(chunk_data=chunk)
+                    chunk = binary_file.read(chunk_size)
 
     def start_protocol(self, protocol_id: str) -> StartProtocolResponse:
         with self.get_grpc_channel() as channel:
-            stub = BioLectorXtRemoteControlStub(channel)
-            return stub.StartProtocol(StringValue(value=protocol_id), timeout=self.timeout)
+            return channel.stub.StartProtocol(StringValue(value=protocol_id), timeout=self.timeout)
 
     def stop_current_protocol(self) -> StopProtocolResponse:
         with self.get_grpc_channel() as channel:
-            stub = BioLectorXtRemoteControlStub(channel)
-            return stub.StopProtocol(Empty(), timeout=self.timeout)
+            return channel.stub.StopProtocol(Empty(), timeout=self.timeout)
 
     def pause_current_protocol(self) -> None:
         with self.get_grpc_channel() as channel:
-            stub = BioLectorXtRemoteControlStub(channel)
-            return stub.PauseProtocol(BoolValue(value=True), timeout=self.timeout)
+            return channel.stub.PauseProtocol(BoolValue(value=True), timeout=self.timeout)
 
     def resume_current_protocol(self) -> ContinueProtocolResponse:
         with self.get_grpc_channel() as channel:
-            stub = BioLectorXtRemoteControlStub(channel)
-            return stub.ContinueProtocol(Empty(), timeout=self.timeout)
+            return channel.stub.ContinueProtocol(Empty(), timeout=self.timeout)
 
-    def download_experiment(self, experiment_id: str) -> str:
+    def download_experiment(self, experiment_id: str, expected_sha256: str | None = None) -> str:
         """Download the experiment as a zip file and return the path to the file
 
+        The file is streamed with a deadline per chunk and resumed after a connection loss,
+        see BiolectorXTExperimentDownloader and the download_config attribute
+
         :param experiment_id: id of the experiment to download
         :type experiment_id: str
+        :param expected_sha256: expected SHA-256 of the zip file, not checked if not provided
+        :type expected_sha256: str | None
         :return: path to the downloaded file
         :rtype: str
         """
-        with self.get_grpc_channel() as channel:
-            stub = BioLectorXtRemoteControlStub(channel)
-            response = stub.DownloadExperiment(StringValue(value=experiment_id), timeout=self.timeout)
+        tmp_dir = Settings.make_temp_dir()
+        file_path = os.path.join(tmp_dir, f"{experiment_id}.zip")
+
+        downloader = BiolectorXTExperimentDownloader(
+            lambda: self.get_grpc_channel().stub, self.message_dispatcher, self.download_config)
+        return downloader.download(experiment_id, file_path, expected_sha256).file_path
 
-            tmp_dir = Settings.make_temp_dir()
-            file_path = os.path.join(tmp_dir, f"{experiment_id}.zip")
+    def get_status_update_stream(self) -> Iterator[StatusUpdateStreamResponse]:
+        """Stream of the status updates of the device
 
-            try:
-                with open(file_path, "wb") as file:
-                    for chunk in response:
-                        file.write(chunk.chunk_data)
-            except Exception as e:
-                raise Exception(
-                    f"Error during the download of biolector experiment. Error : '{e.details()}'. Status : '{e.code().name}'")
+        The stream has no deadline, it ends when the connection is lost or when it is cancelled
+        with its cancel method
+        """
+        with self.get_grpc_channel() as channel:
+            return channel.stub.StatusUpdateStream(Empty())
 
-            return file_path
+    def get_cultivation_values(self) -> GetCultivationValuesResponse:
+        with self.get_grpc_channel() as channel:
+            return channel.stub.GetCultivationValues(Empty(), timeout=self.timeout)
 
-    def get_status_update_stream(self) -> StatusUpdateStreamResponse:
+    def get_current_progress(self) -> GetCurrentProgressResponse:
         with self.get_grpc_channel() as channel:
-            stub = BioLectorXtRemoteControlStub(channel)
-            return stub.StatusUpdateStream(Empty(), timeout=self.timeout)
+            return channel.stub.GetCurrentProgress(Empty(), timeout=self.timeout)
+
+    def check_connection(self, timeout: float = 5) -> bool:
+        """Check that the device is reachable, without calling a method of the device
+
+        :param timeout: maximum time to wait for the connection, in seconds
+        :type timeout: float
+        :return: True if the device is reachable
+        :rtype: bool
+        """
+        return BiolectorXTChannelPool.check_health(self._credentials.endpoint_url, timeout)
 
     def get_grpc_channel(self) -> BiolectorXTGrpcChannel:
-        return BiolectorXTGrpcChannel(self._credentials.endpoint_url)
+        return BiolectorXTChannelPool.get_channel(self._credentials.endpoint_url)
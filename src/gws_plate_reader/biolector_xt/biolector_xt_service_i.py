@@ -1,4 +1,6 @@
 from abc import abstractmethod
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 from gws_core import MessageDispatcher
@@ -10,6 +12,8 @@ from gws_plate_reader.biolector_xt.biolector_xt_types import (
 from gws_plate_reader.biolector_xt.grpc.biolectorxtremotecontrol_pb2 import (
     ContinueProtocolResponse,
     ExperimentInfo,
+    GetCultivationValuesResponse,
+    GetCurrentProgressResponse,
     ProtocolInfo,
     StartProtocolResponse,
     StatusUpdateStreamResponse,
@@ -62,35 +66,67 @@ class BiolectorXTServiceI:
         pass
 
     @abstractmethod
-    def get_status_update_stream(self) -> StatusUpdateStreamResponse:
+    def get_status_update_stream(self) -> Iterator[StatusUpdateStreamResponse]:
+        """Stream of the status updates of the device, it ends when the connection is lost"""
+
+    @abstractmethod
+    def get_cultivation_values(self) -> GetCultivationValuesResponse:
+        pass
+
+    @abstractmethod
+    def get_current_progress(self) -> GetCurrentProgressResponse:
         pass
 
     def get_biolector_experiments(self) -> list[BiolectorXTExperiment]:
-        """Method to get the biolector experiments with protocol information"""
+        """Method to get the biolector experiments with protocol information.
 
-        experiments = self.get_experiments()
+        The experiments and the protocols are fetched concurrently, the protocol of each
+        experiment is found with an index of the protocols by id.
+        """
 
-        protocols = self.get_protocols()
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            experiments_future = executor.submit(self.get_experiments)
+            protocols_future = executor.submit(self.get_protocols)
+            experiments = experiments_future.result()
+            protocols = protocols_future.result()
+
+        return self.build_biolector_experiments(experiments, protocols)
+
+    @staticmethod
+    def build_biolector_experiments(
+        experiments: list[ExperimentInfo], protocols: list[ProtocolInfo]
+    ) -> list[BiolectorXTExperiment]:
+        """Join the experiments of the device with their protocol.
+
+        :param experiments: experiments of the device, their ids are between brackets
+        :type experiments: list[ExperimentInfo]
+        :param protocols: protocols of the device
+        :type protocols: list[ProtocolInfo]
+        :return: the experiments with their protocol information
+        :rtype: list[BiolectorXTExperiment]
+        """
+        # the first protocol of each id, like a scan of the protocol list
+        protocols_by_id: dict[str, ProtocolInfo] = {}
+        for protocol in protocols:
+            protocols_by_id.setdefault(protocol.protocol_id, protocol)
 
         biolector_experiments: list[BiolectorXTExperiment] = []
 
         for experiment in experiments:
-            experiment.protocol_id = self._remove_brackets(experiment.protocol_id)
-            protocol = [
-                protocol for protocol in protocols if protocol.protocol_id == experiment.protocol_id
-            ]
+            experiment.protocol_id = BiolectorXTServiceI._remove_brackets(experiment.protocol_id)
+            protocol = protocols_by_id.get(experiment.protocol_id)
 
             biolector_protocol: BiolectorXTProtocol
-            if protocol:
+            if protocol is not None:
                 biolector_protocol = BiolectorXTProtocol(
-                    id=protocol[0].protocol_id, name=protocol[0].protocol_name
+                    id=protocol.protocol_id, name=protocol.protocol_name
                 )
             else:
                 biolector_protocol = BiolectorXTProtocol(id=experiment.protocol_id, name="")
 
             biolector_experiments.append(
                 BiolectorXTExperiment(
-                    id=self._remove_brackets(experiment.experiment_id),
+                    id=BiolectorXTServiceI._remove_brackets(experiment.experiment_id),
                     protocol=biolector_protocol,
                     start_time=datetime.fromisoformat(experiment.start_time),
                     file_path=experiment.file_path,
@@ -100,7 +136,8 @@ class BiolectorXTServiceI:
 
         return biolector_experiments
 
-    def _remove_brackets(self, value: str) -> str:
+    @staticmethod
+    def _remove_brackets(value: str) -> str:
         """Remove the brackets from the value
 
         :param value: value with brackets
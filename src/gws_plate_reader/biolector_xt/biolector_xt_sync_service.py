@@ -0,0 +1,159 @@
+import asyncio
+import concurrent.futures
+import threading
+from collections.abc import Coroutine, Iterator
+from typing import TypeVar
+
+import grpc
+from gws_core import MessageDispatcher
+
+from gws_plate_reader.biolector_xt.biolector_xt_async_service import BiolectorXTAsyncService
+from gws_plate_reader.biolector_xt.biolector_xt_experiment_downloader import (
+    BiolectorXTDownloadConfig,
+)
+from gws_plate_reader.biolector_xt.biolector_xt_service_i import BiolectorXTServiceI
+from gws_plate_reader.biolector_xt.biolector_xt_types import (
+    BiolectorXTExperiment,
+    CredentialsDataBiolector,
+)
+from gws_plate_reader.biolector_xt.grpc.biolectorxtremotecontrol_pb2 import (
+    ContinueProtocolResponse,
+    ExperimentInfo,
+    GetCultivationValuesResponse,
+    GetCurrentProgressResponse,
+    ProtocolInfo,
+    StartProtocolResponse,
+    StatusUpdateStreamResponse,
+    StdResponse,
+    StopProtocolResponse,
+)
+
+T = TypeVar("T")
+
+
+class BiolectorXTSyncStream(Iterator[StatusUpdateStreamResponse]):
+    """Synchronous iterator over a grpc.aio stream running on the loop of a sync service."""
+
+    _call: grpc.aio.UnaryStreamCall
+    _loop: asyncio.AbstractEventLoop
+    _cancelled: bool
+
+    def __init__(self, call: grpc.aio.UnaryStreamCall, loop: asyncio.AbstractEventLoop) -> None:
+        self._call = call
+        self._loop = loop
+        self._cancelled = False
+
+    def __next__(self) -> StatusUpdateStreamResponse:
+        future = asyncio.run_coroutine_threadsafe(self._call.read(), self._loop)
+        try:
+            response = future.result()
+        except concurrent.futures.CancelledError:
+            if self._cancelled:
+                raise StopIteration
+            raise
+        if response is grpc.aio.EOF:
+            raise StopIteration
+        return response
+
+    def cancel(self) -> None:
+        """Cancel the stream, the iteration stops, can be called from any thread."""
+        self._cancelled = True
+        self._loop.call_soon_threadsafe(self._call.cancel)
+
+
+class BiolectorXTSyncService(BiolectorXTServiceI):
+    """
+    Synchronous facade of BiolectorXTAsyncService, it can replace BiolectorXTService in the
+    existing tasks and dashboards.
+
+    The coroutines of the async service run on an event loop owned by the facade, in a daemon
+    thread. The calling thread blocks until the result but independent calls are sent
+    concurrently (see `get_biolector_experiments`), and interrupting the caller cancels the call
+    on the device. Call `close` to stop the loop.
+    """
+
+    async_service: BiolectorXTAsyncService
+
+    _loop: asyncio.AbstractEventLoop
+    _thread: threading.Thread
+
+    def __init__(
+        self,
+        credentials: CredentialsDataBiolector,
+        message_dispatcher: MessageDispatcher | None = None,
+        download_config: BiolectorXTDownloadConfig | None = None,
+        timeout: float | None = None,
+    ) -> None:
+        """
+        :param credentials: The credentials of the device
+        :param message_dispatcher: Dispatcher of the download messages
+        :param download_config: The configuration of the experiment downloads
+        :param timeout: Default deadline of the calls, in seconds
+        """
+        super().__init__(message_dispatcher)
+        self.async_service = BiolectorXTAsyncService(
+            credentials, self.message_dispatcher, download_config, timeout
+        )
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._thread.start()
+
+    def get_protocols(self) -> list[ProtocolInfo]:
+        return self._run(self.async_service.get_protocols())
+
+    def get_experiments(self) -> list[ExperimentInfo]:
+        return self._run(self.async_service.get_experiments())
+
+    def get_biolector_experiments(self) -> list[BiolectorXTExperiment]:
+        return self._run(self.async_service.get_biolector_experiments())
+
+    def upload_protocol(self, file_path: str, chunk_size: int | None = None) -> StdResponse:
+        return self._run(self.async_service.upload_protocol(file_path, chunk_size))
+
+    def start_protocol(self, protocol_id: str) -> StartProtocolResponse:
+        return self._run(self.async_service.start_protocol(protocol_id))
+
+    def stop_current_protocol(self) -> StopProtocolResponse:
+        return self._run(self.async_service.stop_current_protocol())
+
+    def pause_current_protocol(self) -> None:
+        return self._run(self.async_service.pause_current_protocol())
+
+    def resume_current_protocol(self) -> ContinueProtocolResponse:
+        return self._run(self.async_service.resume_current_protocol())
+
+    def download_experiment(self, experiment_id: str, expected_sha256: str | None = None) -> str:
+        return self._run(self.async_service.download_experiment(experiment_id, expected_sha256))
+
+    def get_status_update_stream(self) -> BiolectorXTSyncStream:
+        call = self._run(self._open_status_update_stream())
+        return BiolectorXTSyncStream(call, self._loop)
+
+    def get_cultivation_values(self) -> GetCultivationValuesResponse:
+        return self._run(self.async_service.get_cultivation_values())
+
+    def get_current_progress(self) -> GetCurrentProgressResponse:
+        return self._run(self.async_service.get_current_progress())
+
+    def close(self) -> None:
+        """Close the channel and stop the event loop, the service cannot be used after."""
+        if self._loop.is_closed():
+            return
+        self._run(self.async_service.close())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    async def _open_status_update_stream(self):
+        # the call must be created on the loop of the channel
+        return self.async_service.get_status_update_stream()
+
+    def _run(self, coroutine: Coroutine[object, object, T]) -> T:
+        """Run a coroutine on the loop of the service and wait for its result."""
+        future = asyncio.run_coroutine_threadsafe(coroutine, self._loop)
+        try:
+            return future.result()
+        except BaseException:
+            # when the caller is interrupted, the call to the device is cancelled
+            future.cancel()
+            raise
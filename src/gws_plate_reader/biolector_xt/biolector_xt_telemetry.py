@@ -0,0 +1,299 @@
+import threading
+import time
+from collections import deque
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+
+import grpc
+from google.protobuf.timestamp_pb2 import Timestamp
+from pandas import DataFrame
+
+from gws_plate_reader.biolector_xt.biolector_xt_service_i import BiolectorXTServiceI
+from gws_plate_reader.biolector_xt.grpc.biolectorxtremotecontrol_pb2 import (
+    CommentKind,
+    CoverStatus,
+    GetCultivationValuesResponse,
+    MeasurementStatus,
+    StatusUpdateStreamResponse,
+    WellLabel,
+)
+
+# (well, channel name)
+TelemetryKey = tuple[str, str]
+
+
+@dataclass
+class BiolectorXTTelemetrySnapshot:
+    """Copy of the telemetry of a BiolectorXT device at a given time."""
+
+    # last value of each status of the stream (temperature, rpm, cover state...)
+    status: dict[str, object] = field(default_factory=dict)
+    # last progress of the running protocol, empty if not fetched yet
+    progress: dict[str, object] = field(default_factory=dict)
+    # volumes of each well, from the cultivation values
+    volumes: dict[str, dict[str, float]] = field(default_factory=dict)
+    # (well, channel) -> (time in seconds since epoch, value), oldest first
+    values: dict[TelemetryKey, list[tuple[float, float]]] = field(default_factory=dict)
+    # last comments of the device, (kind, comment), oldest first
+    comments: list[tuple[str, str]] = field(default_factory=list)
+    # True while the status stream is connected
+    connected: bool = False
+    # time of the last data received from the device, in seconds since epoch
+    last_update_time: float | None = None
+    last_error: str | None = None
+    nb_reconnections: int = 0
+
+    def get_values_dataframe(self) -> DataFrame:
+        """Get the values as a table with the columns Well, Channel, Time and Value."""
+        rows = [
+            (well, channel, time_s, value)
+            for (well, channel), points in self.values.items()
+            for time_s, value in points
+        ]
+        dataframe = DataFrame(rows, columns=["Well", "Channel", "Time", "Value"])
+        dataframe["Time"] = dataframe["Time"].astype("datetime64[s]")
+        return dataframe
+
+
+class BiolectorXTTelemetryWorker:
+    """
+    Background ingestion of the telemetry of a BiolectorXT device.
+
+    A thread consumes the status update stream of the device and reconnects with an
+    exponential backoff when the stream ends or fails. A second thread polls the cultivation
+    values and the progress of the running protocol. The measured values are kept in a bounded
+    ring buffer per well and channel, so the memory does not grow with the duration of the
+    experiment.
+
+    The `get_snapshot` method only copies the buffers, it never calls the device, so it can be
+    called on each rerun of a dashboard.
+    """
+
+    service: BiolectorXTServiceI
+    buffer_size: int
+    poll_interval: float
+    initial_backoff: float
+    max_backoff: float
+
+    _values: dict[TelemetryKey, deque]
+    _comments: deque
+    _status: dict[str, object]
+    _progress: dict[str, object]
+    _volumes: dict[str, dict[str, float]]
+    _connected: bool
+    _last_update_time: float | None
+    _last_error: str | None
+    _nb_reconnections: int
+
+    _lock: threading.Lock
+    _stopped: threading.Event
+    _threads: list[threading.Thread]
+    # running status stream, cancelled on stop
+    _stream: Iterator[StatusUpdateStreamResponse] | None
+
+    def __init__(
+        self,
+        service: BiolectorXTServiceI,
+        buffer_size: int = 1000,
+        poll_interval: float = 10,
+        initial_backoff: float = 1,
+        max_backoff: float = 60,
+    ) -> None:
+        """
+        :param service: The service of the device
+        :param buffer_size: Maximum number of values kept per well and channel
+        :param poll_interval: Interval between the calls to GetCultivationValues and
+            GetCurrentProgress, in seconds
+        :param initial_backoff: Delay before the first reconnection of the stream, doubled on
+            each failed reconnection, in seconds
+        :param max_backoff: Maximum delay between the reconnections, in seconds
+        """
+        self.service = service
+        self.buffer_size = buffer_size
+        self.poll_interval = poll_interval
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+
+        self._values = {}
+        self._comments = deque(maxlen=buffer_size)
+        self._status = {}
+        self._progress = {}
+        self._volumes = {}
+        self._connected = False
+        self._last_update_time = None
+        self._last_error = None
+        self._nb_reconnections = 0
+
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._threads = []
+        self._stream = None
+
+    def start(self) -> None:
+        """Start the ingestion threads, does nothing if they are running."""
+        if self.is_running():
+            return
+        self._stopped.clear()
+        self._threads = [
+            threading.Thread(target=self._consume_status_stream, daemon=True),
+            threading.Thread(target=self._poll_values, daemon=True),
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self, timeout: float | None = 5) -> None:
+        """
+        Stop the ingestion threads, the buffered values are kept.
+
+        :param timeout: Maximum time to wait for each thread, in seconds
+        """
+        self._stopped.set()
+        self._cancel_stream()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def is_running(self) -> bool:
+        return any(thread.is_alive() for thread in self._threads)
+
+    def get_snapshot(self) -> BiolectorXTTelemetrySnapshot:
+        """Get a copy of the telemetry, without calling the device."""
+        with self._lock:
+            return BiolectorXTTelemetrySnapshot(
+                status=dict(self._status),
+                progress=dict(self._progress),
+                volumes={well: dict(volumes) for well, volumes in self._volumes.items()},
+                values={key: list(points) for key, points in self._values.items()},
+                comments=list(self._comments),
+                connected=self._connected,
+                last_update_time=self._last_update_time,
+                last_error=self._last_error,
+                nb_reconnections=self._nb_reconnections,
+            )
+
+    def clear(self) -> None:
+        """Remove the buffered values and comments."""
+        with self._lock:
+            self._values.clear()
+            self._comments.clear()
+
+    def _consume_status_stream(self) -> None:
+        nb_failures = 0
+        while not self._stopped.is_set():
+            try:
+                self._stream = self.service.get_status_update_stream()
+                # stop was called before the stream was stored
+                if self._stopped.is_set():
+                    self._cancel_stream()
+                for response in self._stream:
+                    if not self._connected:
+                        nb_failures = 0
+                        self._set_connected(True)
+                    self._add_status_update(response)
+                error = "The status stream ended"
+            except Exception as err:
+                error = self._get_error_message(err)
+            finally:
+                self._stream = None
+
+            if self._stopped.is_set():
+                break
+            self._set_connected(False, error)
+            delay = min(self.initial_backoff * 2**nb_failures, self.max_backoff)
+            nb_failures += 1
+            if self._stopped.wait(delay):
+                break
+            with self._lock:
+                self._nb_reconnections += 1
+
+        self._set_connected(False)
+
+    def _cancel_stream(self) -> None:
+        cancel = getattr(self._stream, "cancel", None)
+        if cancel is not None:
+            cancel()
+
+    def _add_status_update(self, response: StatusUpdateStreamResponse) -> None:
+        status_name = response.WhichOneof("current_status")
+        if status_name is None:
+            return
+        with self._lock:
+            self._last_update_time = time.time()
+            if status_name == "measurement_status":
+                self._add_measurement(response.measurement_status)
+            elif status_name == "comment_status":
+                self._comments.append(
+                    (
+                        CommentKind.Name(response.comment_status.kind),
+                        response.comment_status.comment,
+                    )
+                )
+            elif status_name == "cover_state":
+                self._status[status_name] = CoverStatus.Name(response.cover_state)
+            else:
+                self._status[status_name] = getattr(response, status_name)
+
+    def _add_measurement(self, measurement: MeasurementStatus) -> None:
+        self._add_value(
+            WellLabel.Name(measurement.cultivation),
+            measurement.channel_name,
+            self._get_time(measurement.time_stamp),
+            measurement.value,
+        )
+
+    def _poll_values(self) -> None:
+        while not self._stopped.is_set():
+            try:
+                cultivation_values = self.service.get_cultivation_values()
+                progress = self.service.get_current_progress()
+            except Exception as err:
+                with self._lock:
+                    self._last_error = self._get_error_message(err)
+            else:
+                with self._lock:
+                    self._last_update_time = time.time()
+                    self._add_cultivation_values(cultivation_values)
+                    self._progress = {
+                        progress_field.name: getattr(progress, progress_field.name)
+                        for progress_field in progress.DESCRIPTOR.fields
+                    }
+            self._stopped.wait(self.poll_interval)
+
+    def _add_cultivation_values(self, response: GetCultivationValuesResponse) -> None:
+        for cultivation in response.cultivation:
+            well = WellLabel.Name(cultivation.label)
+            self._volumes[well] = {
+                "current_volume": cultivation.current_volume,
+                "pumped_volume_a": cultivation.pumped_volume_a,
+                "pumped_volume_b": cultivation.pumped_volume_b,
+                "pumped_external": cultivation.pumped_external,
+            }
+            for value in cultivation.value:
+                self._add_value(well, value.name, self._get_time(value.time_stamp), value.value)
+
+    def _add_value(self, well: str, channel: str, time_s: float, value: float) -> None:
+        """Add a value to its ring buffer, the values already received are ignored."""
+        points = self._values.get((well, channel))
+        if points is None:
+            points = deque(maxlen=self.buffer_size)
+            self._values[(well, channel)] = points
+        # the stream and the polling can both return the last measurement
+        if points and points[-1][0] >= time_s:
+            return
+        points.append((time_s, value))
+
+    def _set_connected(self, connected: bool, error: str | None = None) -> None:
+        with self._lock:
+            self._connected = connected
+            if error is not None:
+                self._last_error = error
+
+    def _get_time(self, time_stamp: Timestamp) -> float:
+        if time_stamp.seconds == 0 and time_stamp.nanos == 0:
+            return time.time()
+        return time_stamp.seconds + time_stamp.nanos / 1e9
+
+    def _get_error_message(self, err: Exception) -> str:
+        if isinstance(err, grpc.RpcError):
+            return f"{err.details()} ({err.code().name})"
+        return str(err)
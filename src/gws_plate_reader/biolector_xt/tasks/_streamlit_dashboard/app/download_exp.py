@@ -11,6 +11,7 @@ from gws_core import (
     Tag,
 )
 
+from gws_plate_reader.biolector_xt.biolector_xt_fleet import BiolectorXTFleet
 from gws_plate_reader.biolector_xt.tasks.biolector_download_experiment_task import (
     BiolectorDownloadExperiment,
 )
@@ -21,15 +22,46 @@ from gws_plate_reader.cell_culture_app_core.generate_constellab_bioprocess_dashb
 DOWNLOAD_TAG_KEY = "biolector_download"
 
 
-def render_download_exp_main(credentials_name: str, mock_service: bool):
+def render_download_exp_main(
+    fleet: BiolectorXTFleet, credentials_names: dict[str, str], mock_service: bool
+):
+    """Render the page to import an experiment from one of the instruments of the fleet
+
+    :param fleet: fleet of the instruments
+    :param credentials_names: name of the credentials of each instrument, by instrument name
+    :param mock_service: whether the download task uses the mock service
+    """
     st.header("Import Biolector experiment")
     if "existing_scenario" not in st.session_state:
         st.session_state.existing_scenario = None
 
+    # the selected experiment fills the instrument and the experiment id of the form
+    experiments_df = fleet.get_experiments_dataframe()
+    selection = st.dataframe(
+        experiments_df,
+        width="stretch",
+        hide_index=True,
+        height=300,
+        on_select="rerun",
+        selection_mode="single-row",
+        key="download_exp_experiments",
+    )
+    instruments = list(fleet.services.keys())
+    selected_instrument = instruments[0]
+    selected_exp_id = ""
+    if selection.selection.rows:
+        selected_row = experiments_df.iloc[selection.selection.rows[0]]
+        selected_instrument = selected_row["Instrument"]
+        selected_exp_id = selected_row["Id"]
+
     # Create a form
     with st.form(key="download_exp"):
-        exp_id = st.text_input(label="Experiment id")
+        instrument = st.selectbox(
+            label="Instrument", options=instruments, index=instruments.index(selected_instrument)
+        )
+        exp_id = st.text_input(label="Experiment id", value=selected_exp_id)
         submit_button = st.form_submit_button(label="Import biolector experiment result")
+    credentials_name = credentials_names[instrument]
 
     # Handle form submission
     if submit_button:
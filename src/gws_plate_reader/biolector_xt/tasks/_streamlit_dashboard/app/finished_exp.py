@@ -0,0 +1,100 @@
+import os
+
+import streamlit as st
+from gws_core import FileHelper, Settings, ZipCompress
+from pandas import DataFrame
+
+from gws_plate_reader.biolector_xt.biolector_xt_fleet import BiolectorXTFleet
+from gws_plate_reader.biolector_xt_data_parser.biolector_run_cache import (
+    BiolectorCachedRun,
+    BiolectorRunCache,
+)
+from gws_plate_reader.biolector_xt_data_parser.biolector_xt_metadata import load_metadata_file
+
+
+# a finished experiment does not change, its run is shared by the reruns and the sessions and
+# the run cache is kept on the disk, so the export is only downloaded and parsed once even
+# after a restart
+@st.cache_resource(show_spinner=False)
+def get_finished_experiment_run(
+    _fleet: BiolectorXTFleet, instrument: str, experiment_id: str
+) -> BiolectorCachedRun:
+    return load_finished_experiment_run(_fleet, instrument, experiment_id)
+
+
+def render_finished_exp_main(fleet: BiolectorXTFleet):
+    st.header("Finished Biolector experiment")
+
+    experiments_df = fleet.get_experiments_dataframe()
+    finished_df = experiments_df[experiments_df["Finished"] == "Yes"]
+    if finished_df.empty:
+        st.info("No finished experiment")
+        return
+
+    row_index = st.selectbox(
+        "Experiment",
+        finished_df.index,
+        format_func=lambda index: (
+            f"{finished_df.at[index, 'Instrument']} - "
+            f"{finished_df.at[index, 'Protocol name']} ({finished_df.at[index, 'Start Date']})"
+        ),
+    )
+    instrument = finished_df.at[row_index, "Instrument"]
+    experiment_id = finished_df.at[row_index, "Id"]
+
+    with st.spinner("Loading the experiment data"):
+        try:
+            run = get_finished_experiment_run(fleet, instrument, experiment_id)
+        except Exception as e:
+            st.error(f"An error occurred while loading the experiment data : {str(e)}")
+            return
+
+    filters = run.get_filters()
+    channel = st.selectbox("Channel", filters)
+    wells = st.multiselect("Wells", run.wells, default=run.wells[:8])
+    if not wells:
+        st.info("Select the wells to display")
+        return
+
+    # only the selected wells of the channel are read from the disk
+    filterset = run.get_filtersets()[filters.index(channel)]
+    channel_df = DataFrame(
+        {well: run.get_well_values(filterset, well) for well in wells},
+        index=run.get_times(filterset),
+    )
+    st.line_chart(channel_df)
+
+
+def load_finished_experiment_run(
+    fleet: BiolectorXTFleet, instrument: str, experiment_id: str
+) -> BiolectorCachedRun:
+    """Get the run of a finished experiment from the run cache, download it if not cached
+
+    :param fleet: fleet of the instrument that ran the experiment
+    :param instrument: name of the instrument
+    :param experiment_id: id of the experiment, without the brackets
+    :return: the cached run, the export is only downloaded and parsed if it is not in the cache
+    """
+    run_cache = BiolectorRunCache()
+    # the experiment is finished, its export does not change
+    alias = f"experiment/{instrument}/{experiment_id}"
+    run = run_cache.open_alias(alias)
+    if run is not None:
+        return run
+
+    zip_path = fleet.services[instrument].download_experiment("{" + experiment_id + "}")
+    tmp_dir = Settings.make_temp_dir()
+    try:
+        ZipCompress.decompress(zip_path, tmp_dir)
+        csv_file_names = sorted(
+            file_name for file_name in os.listdir(tmp_dir) if file_name.endswith(".csv")
+        )
+        if not csv_file_names:
+            raise ValueError("No CSV file found in the export of the experiment")
+        metadata = load_metadata_file(tmp_dir)
+        run = run_cache.get_or_create(os.path.join(tmp_dir, csv_file_names[0]), metadata)
+        run_cache.set_alias(alias, run.header["key"])
+        return run
+    finally:
+        FileHelper.delete_file(zip_path)
+        FileHelper.delete_dir(tmp_dir)
@@ -0,0 +1,79 @@
+import streamlit as st
+from gws_core import FileHelper, Settings, ZipCompress
+from pandas import DataFrame
+
+from gws_plate_reader.biolector_xt.biolector_xt_fleet import BiolectorXTFleet
+from gws_plate_reader.biolector_xt_data_parser.biolector_live_data_index import (
+    BiolectorLiveExperiment,
+)
+
+
+# shared by the reruns and the sessions, each refresh only parses the rows added to the export.
+# The experiments not opened for a while are released with their parsed data
+@st.cache_resource(max_entries=8, ttl=12 * 3600)
+def get_live_experiment(experiment_key: str) -> BiolectorLiveExperiment:
+    return BiolectorLiveExperiment(experiment_key)
+
+
+def render_running_exp_main(fleet: BiolectorXTFleet):
+    st.header("Running Biolector experiment")
+
+    experiments_df = fleet.get_experiments_dataframe()
+    running_df = experiments_df[experiments_df["Finished"] == "No"]
+    if running_df.empty:
+        st.info("No running experiment")
+        return
+
+    row_index = st.selectbox(
+        "Experiment",
+        running_df.index,
+        format_func=lambda index: f"{running_df.at[index, 'Instrument']} - "
+        f"{running_df.at[index, 'Protocol name']} ({running_df.at[index, 'Start Date']})",
+    )
+    instrument = running_df.at[row_index, "Instrument"]
+    experiment_id = running_df.at[row_index, "Id"]
+    live_experiment = get_live_experiment(f"{instrument}/{experiment_id}")
+
+    if st.button("Refresh data") or live_experiment.last_refresh_time is None:
+        with st.spinner("Downloading the experiment data"):
+            try:
+                refresh_live_experiment(fleet, instrument, experiment_id, live_experiment)
+            except Exception as e:
+                st.error(f"An error occurred while refreshing the experiment data : {str(e)}")
+
+    if not live_experiment.well_data:
+        st.info("No data measured yet")
+        return
+
+    channel = st.selectbox("Channel", live_experiment.filters)
+    channel_df = DataFrame(
+        {
+            well: well_df.set_index("Time")[channel]
+            for well, well_df in live_experiment.well_data.items()
+            if channel in well_df.columns
+        }
+    )
+    st.line_chart(channel_df)
+
+
+def refresh_live_experiment(
+    fleet: BiolectorXTFleet,
+    instrument: str,
+    experiment_id: str,
+    live_experiment: BiolectorLiveExperiment,
+) -> None:
+    """Download the current export of a running experiment and parse its new rows
+
+    :param fleet: fleet of the instrument running the experiment
+    :param instrument: name of the instrument
+    :param experiment_id: id of the experiment, without the brackets
+    :param live_experiment: data of the experiment, updated with the new rows
+    """
+    zip_path = fleet.services[instrument].download_experiment("{" + experiment_id + "}")
+    tmp_dir = Settings.make_temp_dir()
+    try:
+        ZipCompress.decompress(zip_path, tmp_dir)
+        live_experiment.refresh(tmp_dir)
+    finally:
+        FileHelper.delete_file(zip_path)
+        FileHelper.delete_dir(tmp_dir)
@@ -7,13 +7,21 @@ StreamlitMainState.initialize()
 from gws_core import Credentials, CredentialsDataOther
 from pandas import DataFrame
 
+from gws_plate_reader.biolector_xt.biolector_xt_fleet import BiolectorXTFleet
 from gws_plate_reader.biolector_xt.biolector_xt_mock_service import BiolectorXTMockService
-from gws_plate_reader.biolector_xt.biolector_xt_service import BiolectorXTService
 from gws_plate_reader.biolector_xt.biolector_xt_service_i import BiolectorXTServiceI
+from gws_plate_reader.biolector_xt.biolector_xt_sync_service import BiolectorXTSyncService
+from gws_plate_reader.biolector_xt.biolector_xt_telemetry import BiolectorXTTelemetryWorker
 from gws_plate_reader.biolector_xt.biolector_xt_types import CredentialsDataBiolector
 from gws_plate_reader.biolector_xt.tasks._streamlit_dashboard.app.download_exp import (
     render_download_exp_main,
 )
+from gws_plate_reader.biolector_xt.tasks._streamlit_dashboard.app.finished_exp import (
+    render_finished_exp_main,
+)
+from gws_plate_reader.biolector_xt.tasks._streamlit_dashboard.app.running_exp import (
+    render_running_exp_main,
+)
 
 params = StreamlitMainState.get_params()
 # run in local :
@@ -24,66 +32,57 @@ params = StreamlitMainState.get_params()
 # TODO : if get experiment didn't work, don't break the app, same for protocol
 
 
-@st.cache_data
-def get_service(params: dict) -> BiolectorXTServiceI:
-    if params.get("mock_service"):
-        return BiolectorXTMockService()
-    else:
-        credentials_name = params.get("credentials_name")
-
-        credentials = Credentials.find_by_name_and_check(credentials_name, CredentialsDataOther)
-
-        data = CredentialsDataBiolector.from_json(credentials.get_data_object().data)
-        return BiolectorXTService(data)
-
-
-@st.cache_data
-def get_experiments(_service: BiolectorXTServiceI) -> DataFrame:
-    experiments = _service.get_biolector_experiments()
-    exp_dict = []
-    for exp in experiments:
-        # date format : 2023-12-07T18:11:41+02:00, convert to datetime
-        exp_dict.append(
-            {
-                "Id": exp.id,
-                "Protocol id": exp.protocol.id,
-                "Protocol name": exp.protocol.name,
-                "Start Date": exp.start_time,
-                "File path": exp.file_path,
-                "Finished": "Yes" if exp.finished else "No",
-            }
-        )
+# the services are shared by the reruns, the calls to the device run on its event loop with a
+# deadline so a slow device does not block a rerun for long
+@st.cache_resource
+def get_instrument_service(credentials_name: str) -> BiolectorXTServiceI:
+    credentials = Credentials.find_by_name_and_check(credentials_name, CredentialsDataOther)
 
-    df = DataFrame(exp_dict)
+    data = CredentialsDataBiolector.from_json(credentials.get_data_object().data)
+    return BiolectorXTSyncService(data, timeout=10)
 
-    # sort by start date
-    df = df.sort_values(by="Start Date", ascending=False, ignore_index=True)
 
-    return df
+@st.cache_resource
+def get_mock_service() -> BiolectorXTServiceI:
+    return BiolectorXTMockService()
 
 
-@st.cache_data
-def get_protocols(_service: BiolectorXTServiceI) -> DataFrame:
-    protocols = _service.get_protocols()
-    protocol_dict = []
-    for protocol in protocols:
-        protocol_dict.append({"Id": protocol.protocol_id, "Name": protocol.protocol_name})
-
-    df = DataFrame(protocol_dict)
+# the experiments and protocols of all the instruments are fetched concurrently and cached
+# by the fleet, one instrument by credentials of the credentials_names param
+@st.cache_resource
+def get_fleet(params: dict) -> BiolectorXTFleet:
+    if params.get("mock_service"):
+        return BiolectorXTFleet({"Mock": get_mock_service()})
+    return BiolectorXTFleet(
+        {name: get_instrument_service(name) for name in get_credentials_names(params)}
+    )
 
-    # sort by protocol name
-    df = df.sort_values(by="Name", ascending=True, ignore_index=True)
 
-    return df
+def show_fleet_errors(fleet: BiolectorXTFleet) -> None:
+    for instrument, error in fleet.get_errors().items():
+        st.warning(f"The biolector '{instrument}' could not be reached: {error}")
 
 
-service = get_service(params)
+# one worker per instrument, keyed by its credentials so the sessions of an instrument share it,
+# the device is only called by the worker threads
+@st.cache_resource
+def get_telemetry_worker(credentials_name: str, mock_service: bool) -> BiolectorXTTelemetryWorker:
+    if mock_service:
+        service = get_mock_service()
+    else:
+        service = get_instrument_service(credentials_name)
+    worker = BiolectorXTTelemetryWorker(service)
+    worker.start()
+    return worker
 
 
 def experiments_page():
     try:
         st.header("Biolector experiments")
-        experiments_df = get_experiments(service)
+        fleet = get_fleet(params)
+        force_refresh = st.button("Refresh")
+        experiments_df = fleet.get_experiments_dataframe(force_refresh)
+        show_fleet_errors(fleet)
         st.dataframe(experiments_df, width="stretch", hide_index=True, height=600)
     except Exception as e:
         st.error(f"An error occurred while fetching experiments: {str(e)}")
@@ -92,14 +91,81 @@ def experiments_page():
 def protocols_page():
     try:
         st.header("Bioxlector protocols")
-        protocols_df = get_protocols(service)
+        fleet = get_fleet(params)
+        force_refresh = st.button("Refresh")
+        protocols_df = fleet.get_protocols_dataframe(force_refresh)
+        show_fleet_errors(fleet)
         st.dataframe(protocols_df, width="stretch", hide_index=True, height=600)
     except Exception as e:
         st.error(f"An error occurred while fetching protocols: {str(e)}")
 
 
+@st.fragment(run_every=5)
+def render_live_status(credentials_name: str):
+    worker = get_telemetry_worker(credentials_name, bool(params.get("mock_service")))
+    snapshot = worker.get_snapshot()
+    if snapshot.connected:
+        st.success("Connected to the biolector")
+    else:
+        st.warning(f"Not connected to the biolector: {snapshot.last_error or 'connecting...'}")
+
+    if snapshot.status:
+        st.dataframe(DataFrame([snapshot.status]), width="stretch", hide_index=True)
+    if snapshot.progress:
+        st.dataframe(DataFrame([snapshot.progress]), width="stretch", hide_index=True)
+
+    values_df = snapshot.get_values_dataframe()
+    if values_df.empty:
+        st.info("No measurement received yet")
+        return
+    channel = st.selectbox("Channel", sorted(values_df["Channel"].unique()))
+    channel_df = values_df[values_df["Channel"] == channel].pivot_table(
+        index="Time", columns="Well", values="Value"
+    )
+    st.line_chart(channel_df)
+
+
+def live_status_page():
+    st.header("Biolector live status")
+    credentials_names = get_credentials_names(params)
+    instrument = st.selectbox("Instrument", list(credentials_names.keys()))
+    render_live_status(credentials_names[instrument])
+
+
+def running_exp_page():
+    try:
+        fleet = get_fleet(params)
+        render_running_exp_main(fleet)
+        show_fleet_errors(fleet)
+    except Exception as e:
+        st.error(f"An error occurred while fetching the running experiments: {str(e)}")
+
+
+def finished_exp_page():
+    try:
+        fleet = get_fleet(params)
+        render_finished_exp_main(fleet)
+        show_fleet_errors(fleet)
+    except Exception as e:
+        st.error(f"An error occurred while fetching the finished experiments: {str(e)}")
+
+
+def get_credentials_names(params: dict) -> dict[str, str]:
+    # the instruments of the fleet are named after their credentials, the mock instrument uses
+    # the credentials of the app
+    if params.get("mock_service"):
+        return {"Mock": params.get("credentials_name")}
+    credentials_names = params.get("credentials_names") or [params.get("credentials_name")]
+    return {name: name for name in credentials_names}
+
+
 def render_download_exp_page():
-    render_download_exp_main(params.get("credentials_name"), params.get("mock_service"))
+    try:
+        fleet = get_fleet(params)
+        render_download_exp_main(fleet, get_credentials_names(params), params.get("mock_service"))
+        show_fleet_errors(fleet)
+    except Exception as e:
+        st.error(f"An error occurred while importing the experiment: {str(e)}")
 
 
 pg = st.navigation(
@@ -107,6 +173,9 @@ pg = st.navigation(
         st.Page(render_download_exp_page, title="Import Biolector experiment", url_path="import"),
         st.Page(experiments_page, title="Experiments", url_path="experiments"),
         st.Page(protocols_page, title="Protocols", url_path="protocols"),
+        st.Page(live_status_page, title="Live status", url_path="live"),
+        st.Page(running_exp_page, title="Running experiment", url_path="running"),
+        st.Page(finished_exp_page, title="Finished experiment", url_path="finished"),
     ]
 )
 pg.run()
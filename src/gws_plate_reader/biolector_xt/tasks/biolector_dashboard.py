@@ -10,6 +10,7 @@ from gws_core import (
     CredentialsParam,
     OutputSpec,
     OutputSpecs,
+    ParamSet,
     StreamlitResource,
     Task,
     TaskInputs,
@@ -43,12 +44,18 @@ class BiolectorDashboard(Task):
     - Download the data from a Biolector XT experiment and extract the table
     - List the available experiments
     - List the available protocols
+    - Follow the data of a running experiment, each refresh only parses the new measurements
+    - View the data of a finished experiment, its parsed data is cached on the disk
 
     To work, this task requires the credentials to access the Biolector XT API. The credentials must be provided in the
     Monitoring Credentials section. The credentials must be of type 'Other' and must contain the following fields:
     - endpoint_url: The URL of the Biolector XT API
     - secure_channel: A boolean ('true' or 'false') to indicate if the connection is secure (HTTPS) or not
 
+    The credentials of other Biolector XT instruments can be added in the 'Other instruments' parameter, the
+    experiments and protocols of all the instruments are then listed together and an experiment is imported
+    from the instrument that ran it.
+
     The task also has an advanced parameter 'Mock Service' that can be used to simulate the interaction with Biolector XT. This
     parameter is useful for development purposes when the Biolector XT API is not available.
 
@@ -57,6 +64,16 @@ class BiolectorDashboard(Task):
     config_specs: ConfigSpecs = ConfigSpecs(
         {
             "credentials": CredentialsParam(credentials_type=CredentialsDataOther),
+            "other_credentials": ParamSet(
+                ConfigSpecs(
+                    {
+                        "credentials": CredentialsParam(credentials_type=CredentialsDataOther),
+                    }
+                ),
+                min_number_of_occurrences=0,
+                human_name="Other instruments",
+                short_description="Credentials of other Biolector XT instruments to list with the first one",
+            ),
             "mock_service": BoolParam(
                 human_name="Mock Service",
                 short_description="Use the mock service to simulate the interaction with Biolector XT (for development purpose)",
@@ -70,20 +87,31 @@ class BiolectorDashboard(Task):
 
     def run(self, params: ConfigParams, inputs: TaskInputs) -> TaskOutputs:
         credentials_data: CredentialsDataOther = params.get_value("credentials")
+        all_credentials_data: list[CredentialsDataOther] = [credentials_data] + [
+            other_credentials["credentials"]
+            for other_credentials in params.get_value("other_credentials") or []
+        ]
 
         # check the credentials data
-        try:
-            CredentialsDataBiolector.from_json(credentials_data.data)
-        except Exception as e:
-            self.log_error_message("Invalid credentials data: " + str(e))
-            raise ValueError(
-                "Invalid credentials data. The credentials must be of type 'Other' and must contain the fields 'endpoint_url' and 'secure_channel'. Please update your credentials."
-            )
+        credentials_names: list[str] = []
+        for instrument_credentials_data in all_credentials_data:
+            try:
+                CredentialsDataBiolector.from_json(instrument_credentials_data.data)
+            except Exception as e:
+                self.log_error_message(
+                    f"Invalid credentials data '{instrument_credentials_data.meta.name}': " + str(e)
+                )
+                raise ValueError(
+                    f"Invalid credentials data '{instrument_credentials_data.meta.name}'. The credentials must be of type 'Other' and must contain the fields 'endpoint_url' and 'secure_channel'. Please update your credentials."
+                )
+            if instrument_credentials_data.meta.name not in credentials_names:
+                credentials_names.append(instrument_credentials_data.meta.name)
 
         streamlit_resource = StreamlitResource()
 
         streamlit_resource.set_app_config(BiolectorDashboardClass())
         streamlit_resource.set_param("credentials_name", credentials_data.meta.name)
+        streamlit_resource.set_param("credentials_names", credentials_names)
         streamlit_resource.set_param("mock_service", params.get_value("mock_service"))
 
         streamlit_resource.style = TypingStyle.community_icon(
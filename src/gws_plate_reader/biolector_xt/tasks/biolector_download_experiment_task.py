@@ -27,6 +27,7 @@ from gws_plate_reader.biolector_xt.biolector_xt_mock_service import BiolectorXTM
 from gws_plate_reader.biolector_xt.biolector_xt_service import BiolectorXTService
 from gws_plate_reader.biolector_xt.biolector_xt_service_i import BiolectorXTServiceI
 from gws_plate_reader.biolector_xt.biolector_xt_types import CredentialsDataBiolector
+from gws_plate_reader.biolector_xt_data_parser.biolector_xt_csv_reader import read_raw_data_csv
 
 
 @task_decorator(
@@ -48,6 +49,12 @@ class BiolectorDownloadExperiment(Task):
                 default_value=False,
                 visibility="private",
             ),
+            "compact_raw_data": BoolParam(
+                human_name="Compact raw data",
+                short_description="Read the CSV by chunks and only keep the Well, Filterset, Time and Cal columns with compact types. Recommended for long experiments.",
+                default_value=False,
+                visibility="protected",
+            ),
         }
     )
     input_specs: InputSpecs = InputSpecs()
@@ -108,16 +115,19 @@ class BiolectorDownloadExperiment(Task):
 
         self.log_info_message(f"Importing csv file: {csv_file}")
 
-        table = TableImporter.call(
-            File(csv_file),
-            {
-                "file_format": "csv",
-                "delimiter": ";",
-                "header": 0,
-                "format_header_names": True,
-                "index_column": -1,
-            },
-        )
+        if params.get_value("compact_raw_data"):
+            table = Table(read_raw_data_csv(csv_file))
+        else:
+            table = TableImporter.call(
+                File(csv_file),
+                {
+                    "file_format": "csv",
+                    "delimiter": ";",
+                    "header": 0,
+                    "format_header_names": True,
+                    "index_column": -1,
+                },
+            )
 
         folder = Folder(tmp_dir)
         folder.name = f"Biolector raw data {experiment_id}"
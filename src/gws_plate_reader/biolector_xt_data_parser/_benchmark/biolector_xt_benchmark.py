@@ -0,0 +1,498 @@
+"""
+Benchmark of the BiolectorXT loading on synthetic exports.
+
+Times `parse_data`, `create_parsed_resource_set`, the tagging of the well tables,
+`create_metadata_table` and the full `run` of BiolectorXTLoadData for several export shapes,
+measures their peak memory and compares the results with a baseline JSON file so that
+regressions are caught locally. On the one_week scenario, the per-well implementation of
+`parse_data` (`legacy_parse_data`) is also timed to show the speedup of the vectorized parse:
+
+    python -m gws_plate_reader.biolector_xt_data_parser._benchmark.biolector_xt_benchmark \
+        --update-baseline
+    # after a change
+    python -m gws_plate_reader.biolector_xt_data_parser._benchmark.biolector_xt_benchmark
+
+The full run uses a TaskRunner, it needs the environment of the brick tests (use --skip-run
+otherwise). Timings depend on the machine: the baseline is meant to be created and compared on
+the same machine.
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+from gws_core import DynamicInputs, Folder, InputSpec, Logger, ResourceSet, Table, TaskRunner
+
+from gws_plate_reader.biolector_xt_data_parser.biolector_raw_data_index import (
+    BiolectorRawDataIndex,
+)
+from gws_plate_reader.biolector_xt_data_parser.biolector_xt_load_data import BiolectorXTLoadData
+from gws_plate_reader.biolector_xt_data_parser.biolector_xt_metadata import (
+    get_filters,
+    load_metadata_file,
+)
+from gws_plate_reader.biolector_xt_data_parser.biolector_xt_synthetic_export import (
+    SyntheticExportConfig,
+    get_nb_values,
+    make_synthetic_medium_tables,
+    write_synthetic_export,
+)
+from gws_plate_reader.biolector_xt_data_parser.biolector_xt_tags import (
+    apply_well_tags,
+    build_well_column_tags,
+    build_well_tags,
+    get_user_tag_origins,
+)
+
+DEFAULT_BASELINE_PATH = "biolector_xt_benchmark_baseline.json"
+
+# one week of cultivation with a measure every 15 min
+_ONE_WEEK_CYCLES = 7 * 24 * 4
+
+BENCHMARK_SCENARIOS: dict[str, SyntheticExportConfig] = {
+    "small": SyntheticExportConfig(nb_wells=48, nb_channels=3, nb_cycles=48),
+    "one_week": SyntheticExportConfig(nb_wells=48, nb_channels=6, nb_cycles=_ONE_WEEK_CYCLES),
+    "one_week_micro_fluidics": SyntheticExportConfig(
+        nb_wells=32, nb_channels=6, nb_cycles=_ONE_WEEK_CYCLES, is_micro_fluidics=True
+    ),
+    "one_week_with_media": SyntheticExportConfig(
+        nb_wells=48, nb_channels=6, nb_cycles=_ONE_WEEK_CYCLES, nb_media=4
+    ),
+    "four_weeks": SyntheticExportConfig(nb_wells=48, nb_channels=6, nb_cycles=4 * _ONE_WEEK_CYCLES),
+}
+# scenarios where the per-well implementation of parse_data is also timed
+LEGACY_PARSE_SCENARIOS = ["one_week"]
+
+
+def legacy_parse_data(data: pd.DataFrame, filters: list[str]) -> dict[str, pd.DataFrame]:
+    """
+    Per-well implementation of `BiolectorXTDataParser.parse_data`, before the vectorized parse
+    of BiolectorRawDataIndex. Used as the reference of the parse in the benchmark and the tests.
+
+    :param data: The raw data
+    :param filters: The filter names of the metadata
+    :return: The table of each filter, with the time, the time in hours and one column per well
+    """
+    is_micro_fluidics = "A01" not in data["Well"].dropna().unique()
+    reduced_data = data.sort_values(by=["Filterset", "Well"])[["Well", "Filterset", "Time", "Cal"]]
+    df_filter_dict = {}
+    for i, value in enumerate(reduced_data["Filterset"].dropna().unique()):
+        df_filter = reduced_data[reduced_data["Filterset"] == value]
+        df_filter = df_filter.sort_values(by=["Well", "Time"]).drop(columns="Filterset")
+        first_row = "C" if is_micro_fluidics else "A"
+        columns_to_add = [
+            f"{chr(letter)}{str(num).zfill(2)}"
+            for letter in range(ord(first_row), ord("F") + 1)
+            for num in range(1, 9)
+        ]
+        df_filter = df_filter.assign(
+            time=pd.NA, Temps_en_h=pd.NA, **dict.fromkeys(columns_to_add, pd.NA)
+        )
+        df_filter["time"] = df_filter.loc[df_filter["Well"] == columns_to_add[0], "Time"]
+        df_filter["Temps_en_h"] = df_filter["time"] / 3600
+        for name_col in columns_to_add:
+            df_filter[name_col] = df_filter.loc[df_filter["Well"] == name_col, "Cal"]
+        columns_to_process = df_filter.columns[3:]
+        df_filter = df_filter.reset_index(drop=True)
+        for col in columns_to_process:
+            df_filter[col] = pd.Series(df_filter[col].dropna().values)
+        df_filter = df_filter.dropna(subset=["time"]).drop(columns=["Well", "Time", "Cal"])
+        if i < len(filters):
+            df_filter_dict[filters[i]] = df_filter
+    return df_filter_dict
+
+
+@dataclass
+class StepMeasure:
+    """Timing and peak memory of a benchmark step."""
+
+    # best time of the repetitions, the least disturbed by the other processes
+    time_s: float
+    median_time_s: float
+    # peak of the memory allocated by Python during the step
+    peak_memory_mb: float
+
+    def to_dict(self) -> dict:
+        return {
+            "time_s": self.time_s,
+            "median_time_s": self.median_time_s,
+            "peak_memory_mb": self.peak_memory_mb,
+        }
+
+
+@dataclass
+class BenchmarkRegression:
+    """A step of a scenario that is slower or uses more memory than in the baseline."""
+
+    scenario: str
+    step: str
+    metric: str
+    baseline_value: float
+    value: float
+
+    def get_message(self) -> str:
+        return (
+            f"{self.scenario} / {self.step}: {self.metric} {self.baseline_value:.4g} → "
+            f"{self.value:.4g} (+{(self.value / self.baseline_value - 1) * 100:.0f}%)"
+        )
+
+
+def measure_step(
+    step: Callable[[], object], setup: Callable[[], None] | None = None, repeat: int = 3
+) -> StepMeasure:
+    """
+    Time a step and measure its peak memory.
+
+    The step is timed `repeat` times without memory tracing, then run once more with tracemalloc
+    (tracing slows the step down, so it is not done during the timings).
+
+    :param step: The step to measure
+    :param setup: Called before each run of the step, not measured (e.g. to clear a cache)
+    :param repeat: Number of timed runs
+    :return: The measure of the step
+    """
+    times: list[float] = []
+    for _ in range(repeat + 1):
+        if setup:
+            setup()
+        gc.collect()
+        start = time.perf_counter()
+        step()
+        times.append(time.perf_counter() - start)
+    # the first run warms up the imports and caches of the libraries
+    times = times[1:]
+
+    if setup:
+        setup()
+    gc.collect()
+    tracemalloc.start()
+    try:
+        step()
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return StepMeasure(
+        time_s=min(times),
+        median_time_s=statistics.median(times),
+        peak_memory_mb=peak_memory / 1024**2,
+    )
+
+
+def benchmark_scenario(
+    config: SyntheticExportConfig,
+    repeat: int = 3,
+    include_run: bool = True,
+    include_legacy_parse: bool = False,
+) -> dict:
+    """
+    Benchmark the loading of a synthetic export.
+
+    :param config: The shape of the export
+    :param repeat: Number of timed runs of each step
+    :param include_run: If True, also measure the full run of the task with a TaskRunner
+    :param include_legacy_parse: If True, also measure the per-well implementation of
+        parse_data (parse_data_legacy step)
+    :return: The config, the size of the export and the measure of each step
+    """
+    with tempfile.TemporaryDirectory() as folder_path:
+        raw_data_path, _ = write_synthetic_export(config, folder_path)
+        data = pd.read_csv(raw_data_path, sep=";")
+        metadata = load_metadata_file(folder_path)
+
+        medium_table: Table | None = None
+        info_table: Table | None = None
+        if config.nb_media > 0:
+            medium_df, info_df = make_synthetic_medium_tables(config)
+            medium_table = Table(medium_df)
+            info_table = Table(info_df)
+
+        task = BiolectorXTLoadData()
+        raw_data_index = BiolectorRawDataIndex(data)
+        steps: dict[str, StepMeasure] = {}
+
+        # parsing from the raw data, the index cache is cleared so that each run parses
+        steps["parse_data"] = measure_step(
+            lambda: task.parse_data(data, metadata),
+            setup=BiolectorRawDataIndex.clear_cache,
+            repeat=repeat,
+        )
+        if include_legacy_parse:
+            filters = get_filters(metadata)
+            steps["parse_data_legacy"] = measure_step(
+                lambda: legacy_parse_data(data, filters), repeat=repeat
+            )
+
+        def create_parsed_resource_set():
+            return task.create_parsed_resource_set(
+                data,
+                metadata,
+                medium_table=medium_table,
+                info_table=info_table,
+                raw_data_index=raw_data_index,
+            )
+
+        steps["create_parsed_resource_set"] = measure_step(
+            create_parsed_resource_set, repeat=repeat
+        )
+
+        resource_set = create_parsed_resource_set()
+        well_dataframes = {
+            well: table.get_data() for well, table in resource_set.get_resources().items()
+        }
+        well_tables: dict[str, Table] = {}
+
+        def create_well_tables():
+            well_tables.clear()
+            well_tables.update({well: Table(well_df) for well, well_df in well_dataframes.items()})
+
+        def tag_well_tables():
+            origins = get_user_tag_origins()
+            column_tags = build_well_column_tags(next(iter(well_tables.values())).column_names)
+            for well, table in well_tables.items():
+                apply_well_tags(table, column_tags, build_well_tags(origins, "plate_0", well))
+
+        # new untagged tables are created before each run, only the tagging is measured
+        steps["tag_well_tables"] = measure_step(
+            tag_well_tables, setup=create_well_tables, repeat=repeat
+        )
+        steps["create_metadata_table"] = measure_step(
+            lambda: task.create_metadata_table(
+                resource_set, medium_table=medium_table, info_table=info_table
+            ),
+            repeat=repeat,
+        )
+
+        if include_run:
+            steps["run"] = measure_step(
+                lambda: _run_task(data, folder_path, medium_table, info_table),
+                setup=BiolectorRawDataIndex.clear_cache,
+                repeat=repeat,
+            )
+
+        return {
+            "config": config.to_dict(),
+            "nb_rows": len(data),
+            "nb_values": get_nb_values(data),
+            "steps": {step: measure.to_dict() for step, measure in steps.items()},
+        }
+
+
+def _run_task(
+    data: pd.DataFrame, folder_path: str, medium_table: Table | None, info_table: Table | None
+) -> dict:
+    """Run BiolectorXTLoadData on one plate with a TaskRunner."""
+    plate_resource_set = ResourceSet()
+    plate_resource_set.add_resource(Table(data), "raw_data")
+    plate_resource_set.add_resource(Folder(folder_path), "folder_metadata")
+    if info_table is not None:
+        plate_resource_set.add_resource(info_table, "info_table")
+
+    inputs = {"source": plate_resource_set}
+    default_specs = {"source": InputSpec(ResourceSet)}
+    if medium_table is not None:
+        inputs["medium_table"] = medium_table
+        default_specs["medium_table"] = InputSpec(Table, optional=True)
+
+    runner = TaskRunner(
+        task_type=BiolectorXTLoadData,
+        inputs=inputs,
+        input_specs=DynamicInputs(default_specs=default_specs),
+    )
+    return runner.run()
+
+
+def run_benchmarks(
+    scenarios: dict[str, SyntheticExportConfig],
+    repeat: int = 3,
+    include_run: bool = True,
+    legacy_parse_scenarios: list[str] | None = None,
+) -> dict:
+    """
+    Benchmark several scenarios.
+
+    :param scenarios: The export shape of each scenario, by scenario name
+    :param repeat: Number of timed runs of each step
+    :param include_run: If True, also measure the full run of the task
+    :param legacy_parse_scenarios: The scenarios where the per-well parse is also measured,
+        LEGACY_PARSE_SCENARIOS if not provided
+    :return: The benchmark report, with the environment and the results of each scenario
+    """
+    if legacy_parse_scenarios is None:
+        legacy_parse_scenarios = LEGACY_PARSE_SCENARIOS
+    return {
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "environment": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "pandas": pd.__version__,
+            "machine": platform.machine(),
+            "cpu_count": os.cpu_count(),
+        },
+        "repeat": repeat,
+        "scenarios": {
+            name: benchmark_scenario(
+                config,
+                repeat=repeat,
+                include_run=include_run,
+                include_legacy_parse=name in legacy_parse_scenarios,
+            )
+            for name, config in scenarios.items()
+        },
+    }
+
+
+def save_report(report: dict, file_path: str) -> None:
+    """Save a benchmark report as a baseline JSON file."""
+    with open(file_path, "w", encoding="UTF-8") as file:
+        json.dump(report, file, indent=2)
+
+
+def load_report(file_path: str) -> dict:
+    """Load a baseline JSON file saved with `save_report`."""
+    with open(file_path, encoding="UTF-8") as file:
+        return json.load(file)
+
+
+def find_regressions(
+    report: dict,
+    baseline: dict,
+    time_tolerance: float = 0.2,
+    memory_tolerance: float = 0.1,
+    min_time_difference_s: float = 0.005,
+) -> list[BenchmarkRegression]:
+    """
+    Compare a benchmark report with a baseline.
+
+    Only the scenarios and steps present in both reports are compared. Scenarios whose export
+    shape changed are skipped.
+
+    :param report: The current benchmark report
+    :param baseline: The baseline report
+    :param time_tolerance: Allowed relative increase of the time of a step
+    :param memory_tolerance: Allowed relative increase of the peak memory of a step
+    :param min_time_difference_s: Time increases below this value are ignored (timing noise of
+        the very fast steps)
+    :return: The regressions, empty if no step is slower or uses more memory than allowed
+    """
+    regressions: list[BenchmarkRegression] = []
+    for scenario, result in report["scenarios"].items():
+        baseline_result = baseline.get("scenarios", {}).get(scenario)
+        if baseline_result is None or baseline_result["config"] != result["config"]:
+            continue
+
+        for step, measure in result["steps"].items():
+            baseline_measure = baseline_result["steps"].get(step)
+            if baseline_measure is None:
+                continue
+
+            baseline_time = baseline_measure["time_s"]
+            if (
+                measure["time_s"] > baseline_time * (1 + time_tolerance)
+                and measure["time_s"] - baseline_time > min_time_difference_s
+            ):
+                regressions.append(
+                    BenchmarkRegression(scenario, step, "time_s", baseline_time, measure["time_s"])
+                )
+
+            baseline_memory = baseline_measure["peak_memory_mb"]
+            if measure["peak_memory_mb"] > baseline_memory * (1 + memory_tolerance):
+                regressions.append(
+                    BenchmarkRegression(
+                        scenario, step, "peak_memory_mb", baseline_memory, measure["peak_memory_mb"]
+                    )
+                )
+    return regressions
+
+
+def format_report(report: dict, baseline: dict | None = None) -> str:
+    """Format a benchmark report as a text table, with the change since the baseline."""
+    lines = [
+        f"{'scenario':<26} {'step':<28} {'time (s)':>10} {'peak (MB)':>10} {'vs baseline':>12}"
+    ]
+    for scenario, result in report["scenarios"].items():
+        baseline_steps = (baseline or {}).get("scenarios", {}).get(scenario, {}).get("steps", {})
+        for step, measure in result["steps"].items():
+            change = ""
+            if step in baseline_steps and baseline_steps[step]["time_s"] > 0:
+                change = f"{(measure['time_s'] / baseline_steps[step]['time_s'] - 1) * 100:+.0f}%"
+            lines.append(
+                f"{scenario:<26} {step:<28} {measure['time_s']:>10.4f} "
+                f"{measure['peak_memory_mb']:>10.1f} {change:>12}"
+            )
+        if "parse_data_legacy" in result["steps"]:
+            speedup = (
+                result["steps"]["parse_data_legacy"]["time_s"]
+                / result["steps"]["parse_data"]["time_s"]
+            )
+            lines.append(f"{scenario:<26} parse_data speedup vs per-well parse: x{speedup:.1f}")
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument(
+        "--baseline", default=DEFAULT_BASELINE_PATH, help="Path of the baseline JSON file"
+    )
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Save the results as the new baseline instead of comparing with it",
+    )
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        choices=list(BENCHMARK_SCENARIOS.keys()),
+        help="Scenario to run, can be repeated (all the scenarios by default)",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Number of timed runs of each step")
+    parser.add_argument(
+        "--skip-run", action="store_true", help="Do not measure the full run of the task"
+    )
+    parser.add_argument("--time-tolerance", type=float, default=0.2)
+    parser.add_argument("--memory-tolerance", type=float, default=0.1)
+    args = parser.parse_args(argv)
+
+    scenarios = {
+        name: config
+        for name, config in BENCHMARK_SCENARIOS.items()
+        if not args.scenario or name in args.scenario
+    }
+    report = run_benchmarks(scenarios, repeat=args.repeat, include_run=not args.skip_run)
+
+    baseline = None
+    if not args.update_baseline and os.path.exists(args.baseline):
+        baseline = load_report(args.baseline)
+    Logger.info(format_report(report, baseline))
+
+    if args.update_baseline:
+        save_report(report, args.baseline)
+        Logger.info(f"Baseline saved to {args.baseline}")
+        return 0
+
+    if baseline is None:
+        Logger.info(f"No baseline found at {args.baseline}, run with --update-baseline to create it")
+        return 0
+
+    regressions = find_regressions(
+        report, baseline, time_tolerance=args.time_tolerance, memory_tolerance=args.memory_tolerance
+    )
+    for regression in regressions:
+        Logger.error(f"REGRESSION {regression.get_message()}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,378 @@
+import io
+import os
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame, Index
+
+from gws_plate_reader.biolector_xt_data_parser.biolector_xt_csv_reader import read_raw_data_csv
+from gws_plate_reader.biolector_xt_data_parser.biolector_xt_metadata import (
+    get_filters,
+    load_metadata_file,
+)
+from gws_plate_reader.biolector_xt_data_parser.biolector_xt_pivot import (
+    RAW_DATA_COLUMNS,
+    get_plate_wells,
+    is_micro_fluidics,
+)
+
+
+class _LiveFilterset:
+    """Wide data of one filterset of a running experiment, grown cycle by cycle."""
+
+    INITIAL_CAPACITY = 256
+
+    # time of each cycle in seconds (times of the first well)
+    reference_times: np.ndarray
+    nb_cycles: int
+    # values by cycle x well, can contain values of cycles not yet measured by the first well
+    grid: np.ndarray
+    # number of values processed by well, the next value of a well goes to this cycle
+    nb_values: np.ndarray
+    # time of the last processed row by well, -inf when the well has no row yet
+    last_times: np.ndarray
+
+    def __init__(self, nb_wells: int) -> None:
+        self.reference_times = np.empty(self.INITIAL_CAPACITY)
+        self.nb_cycles = 0
+        self.grid = np.full((self.INITIAL_CAPACITY, nb_wells), np.nan)
+        self.nb_values = np.zeros(nb_wells, dtype=np.int64)
+        self.last_times = np.full(nb_wells, -np.inf)
+
+    def append(self, well_codes: np.ndarray, times: np.ndarray, values: np.ndarray) -> int:
+        """
+        Append new rows, sorted by well then time, all after the last processed row of their well.
+
+        :return: The first cycle whose values changed
+        """
+        first_changed_cycle = self.nb_cycles
+
+        # time reference: new rows of the first well
+        new_reference_times = times[well_codes == 0]
+        self._ensure_reference_capacity(self.nb_cycles + len(new_reference_times))
+        self.reference_times[self.nb_cycles : self.nb_cycles + len(new_reference_times)] = (
+            new_reference_times
+        )
+        self.nb_cycles += len(new_reference_times)
+        # the grid covers all the cycles, even the ones without any valid value yet
+        self._ensure_grid_capacity(self.nb_cycles)
+
+        np.maximum.at(self.last_times, well_codes, times)
+
+        valid = ~np.isnan(values)
+        well_codes = well_codes[valid]
+        values = values[valid]
+        if len(values) == 0:
+            return first_changed_cycle
+
+        # rank of each value within its well, after the values already processed for the well
+        positions = np.arange(len(well_codes))
+        is_block_start = np.ones(len(well_codes), dtype=bool)
+        is_block_start[1:] = well_codes[1:] != well_codes[:-1]
+        block_start = np.maximum.accumulate(np.where(is_block_start, positions, 0))
+        cycles = positions - block_start + self.nb_values[well_codes]
+
+        self._ensure_grid_capacity(int(cycles.max()) + 1)
+        self.grid[cycles, well_codes] = values
+        self.nb_values += np.bincount(well_codes, minlength=len(self.nb_values))
+
+        return min(first_changed_cycle, int(cycles.min()))
+
+    def get_table(self, wells: list[str], start_cycle: int = 0) -> DataFrame:
+        """Get the cycles from start_cycle, with the 'time' column (in seconds) and one column per well."""
+        start_cycle = min(start_cycle, self.nb_cycles)
+        table = DataFrame(self.grid[start_cycle : self.nb_cycles].copy(), columns=wells)
+        table.insert(0, "time", self.reference_times[start_cycle : self.nb_cycles].copy())
+        table.index = range(start_cycle, self.nb_cycles)
+        return table
+
+    def _ensure_reference_capacity(self, size: int) -> None:
+        if size > len(self.reference_times):
+            capacity = max(size, 2 * len(self.reference_times))
+            reference_times = np.empty(capacity)
+            reference_times[: self.nb_cycles] = self.reference_times[: self.nb_cycles]
+            self.reference_times = reference_times
+
+    def _ensure_grid_capacity(self, size: int) -> None:
+        if size > len(self.grid):
+            capacity = max(size, 2 * len(self.grid))
+            grid = np.full((capacity, self.grid.shape[1]), np.nan)
+            grid[: len(self.grid)] = self.grid
+            self.grid = grid
+
+
+class BiolectorLiveDataIndex:
+    """
+    Incremental parsed view of the raw export of a running BiolectorXT experiment.
+
+    The index remembers, for each filterset and well, the time of the last processed row and the
+    number of values already placed in the cycle x well tables. Each `update` with a new export
+    of the experiment only sorts and places the rows that were not processed yet, so refreshing a
+    long running experiment costs in proportion to the new data. After each update, the tables
+    are identical to the tables of a `BiolectorRawDataIndex` built from the whole export.
+
+    Rows are considered new when their time is after the last processed row of their
+    filterset and well: the export of a running experiment only grows.
+    """
+
+    is_micro_fluidics: bool | None
+    wells: list[str]
+    _filtersets: dict[str, _LiveFilterset]
+
+    def __init__(self) -> None:
+        self.is_micro_fluidics = None
+        self.wells = []
+        self._filtersets = {}
+
+    def update(self, data: DataFrame) -> dict[str, int]:
+        """
+        Process the rows of the export that were not processed yet.
+
+        :param data: The raw export of the experiment (whole export or only the new rows),
+            must contain the Well, Filterset, Time and Cal columns
+        :return: The first changed cycle of each filterset that changed
+        """
+        reduced_data = data[RAW_DATA_COLUMNS]
+        reduced_data = reduced_data[
+            reduced_data["Filterset"].notna() & reduced_data["Time"].notna()
+        ]
+        if reduced_data.empty:
+            return {}
+
+        if not self.wells:
+            self.is_micro_fluidics = is_micro_fluidics(reduced_data)
+            self.wells = get_plate_wells(self.is_micro_fluidics)
+
+        # keep only the rows of known wells after the last processed row of their well
+        well_codes = Index(self.wells).get_indexer(reduced_data["Well"]).astype(np.int64)
+        filtersets = reduced_data["Filterset"].astype(str).to_numpy()
+        for filterset in np.unique(filtersets):
+            if filterset not in self._filtersets:
+                self._filtersets[filterset] = _LiveFilterset(len(self.wells))
+        filterset_names = list(self._filtersets.keys())
+        filterset_codes = Index(filterset_names).get_indexer(filtersets)
+        last_times = np.stack([self._filtersets[name].last_times for name in filterset_names])
+
+        times = reduced_data["Time"].to_numpy(dtype=float)
+        is_known_well = well_codes >= 0
+        is_new = np.zeros(len(times), dtype=bool)
+        is_new[is_known_well] = (
+            times[is_known_well]
+            > last_times[filterset_codes[is_known_well], well_codes[is_known_well]]
+        )
+
+        new_data = reduced_data[is_new].assign(
+            _filterset_code=filterset_codes[is_new], _well_code=well_codes[is_new]
+        )
+        # multi-column sort is stable, ties keep the order of the export
+        new_data = new_data.sort_values(by=["_filterset_code", "_well_code", "Time"])
+
+        new_filterset_codes = new_data["_filterset_code"].to_numpy()
+        new_well_codes = new_data["_well_code"].to_numpy()
+        new_times = new_data["Time"].to_numpy(dtype=float)
+        new_values = new_data["Cal"].to_numpy(dtype=float)
+
+        changed_cycles: dict[str, int] = {}
+        boundaries = np.flatnonzero(np.diff(new_filterset_codes)) + 1
+        for positions in np.split(np.arange(len(new_data)), boundaries):
+            if len(positions) == 0:
+                continue
+            filterset = filterset_names[new_filterset_codes[positions[0]]]
+            changed_cycles[filterset] = self._filtersets[filterset].append(
+                new_well_codes[positions], new_times[positions], new_values[positions]
+            )
+        return changed_cycles
+
+    def get_filtersets(self) -> list[str]:
+        """Get the filterset values of the processed data, in sorted order."""
+        return sorted(self._filtersets.keys())
+
+    def get_nb_cycles(self) -> dict[str, int]:
+        """Get the number of cycles of each filterset (cycles measured by the first well)."""
+        return {
+            filterset: self._filtersets[filterset].nb_cycles for filterset in self.get_filtersets()
+        }
+
+    def get_last_processed_times(self, filterset: str) -> dict[str, float]:
+        """Get the time (in seconds) of the last processed row of each well of a filterset."""
+        last_times = self._filtersets[filterset].last_times
+        return {
+            well: float(last_time)
+            for well, last_time in zip(self.wells, last_times, strict=True)
+            if np.isfinite(last_time)
+        }
+
+    def get_filter_tables(
+        self, filters: list[str], start_cycles: dict[str, int] | None = None
+    ) -> dict[str, DataFrame]:
+        """
+        Get the wide table of each filterset, renamed with the metadata filter names.
+
+        Filtersets are matched with the filters by position (sorted filterset values vs metadata
+        channels), like `BiolectorRawDataIndex.get_filter_tables`.
+
+        :param filters: The filter names from the metadata channels
+        :param start_cycles: Optional first cycle to return by filterset (e.g. the result of
+            `update`), the index of the tables is the cycle number
+        :return: The tables by filter name, with the 'time' column (in seconds) and one column per well
+        """
+        filter_tables: dict[str, DataFrame] = {}
+        for filter_name, filterset in zip(filters, self.get_filtersets(), strict=False):
+            start_cycle = (start_cycles or {}).get(filterset, 0)
+            filter_tables[filter_name] = self._filtersets[filterset].get_table(
+                self.wells, start_cycle
+            )
+        return filter_tables
+
+
+def update_well_data(
+    well_data: dict[str, DataFrame],
+    live_index: BiolectorLiveDataIndex,
+    filters: list[str],
+    changed_cycles: dict[str, int],
+) -> dict[str, DataFrame]:
+    """
+    Append the new cycles of a running experiment to the data of each well.
+
+    The data of a well has the same layout as the well tables of BiolectorXTLoadData: the 'Time'
+    column (in hours, from the first filter) then one column per filter, one row per cycle. Only
+    the cycles from the first changed cycle are rebuilt, the previous rows are kept as is.
+
+    :param well_data: The current data of each well by well (e.g. A01), empty on the first call
+    :param live_index: The index of the experiment, after `update`
+    :param filters: The filter names from the metadata channels
+    :param changed_cycles: The first changed cycle by filterset, returned by `update`
+    :return: The updated data of each well, wells without any value are not included
+    """
+    updated_well_data = dict(well_data)
+    if not changed_cycles:
+        return updated_well_data
+
+    start_cycle = min(changed_cycles.values())
+    filter_tables = live_index.get_filter_tables(
+        filters, dict.fromkeys(live_index.get_filtersets(), start_cycle)
+    )
+    if not filter_tables:
+        return updated_well_data
+    # tables from the first cycle, only needed for the wells that get their first values
+    full_filter_tables: dict[str, DataFrame] | None = None
+
+    for well in live_index.wells:
+        current_data = well_data.get(well)
+        if current_data is None:
+            if all(filter_table[well].isna().all() for filter_table in filter_tables.values()):
+                continue
+            if full_filter_tables is None:
+                full_filter_tables = live_index.get_filter_tables(filters)
+            updated_well_data[well] = _build_well_rows(well, full_filter_tables)
+        else:
+            new_rows = _build_well_rows(well, filter_tables)
+            updated_well_data[well] = pd.concat([current_data.iloc[:start_cycle], new_rows])
+    return updated_well_data
+
+
+def _build_well_rows(well: str, filter_tables: dict[str, DataFrame]) -> DataFrame:
+    """Build the rows of a well, the channels are aligned by cycle on the first filter."""
+    first_table = next(iter(filter_tables.values()))
+    well_rows = DataFrame({"Time": first_table["time"] / 3600}, index=first_table.index)
+    for filter_name, filter_table in filter_tables.items():
+        well_rows[filter_name] = filter_table[well]
+    return well_rows
+
+
+class BiolectorLiveExperiment:
+    """
+    Well data of a running BiolectorXT experiment, refreshed from successive exports.
+
+    The experiment owns its `BiolectorLiveDataIndex` and remembers the number of bytes of the CSV
+    export already read. Each `refresh` reads an unzipped export of the experiment and only reads
+    and parses the CSV lines written since the previous refresh. The export itself is still
+    downloaded whole, the device has no partial export, so the download costs in proportion to
+    the whole run. The well data has the layout of the well tables of BiolectorXTLoadData.
+
+    The CSV is expected to only grow between the refreshes, an export with another header or
+    shorter than the bytes already read is parsed again from the start.
+    """
+
+    experiment_key: str
+    metadata: dict | None
+    filters: list[str]
+    # well (e.g. A01) -> Time column (in hours) then one column per filter
+    well_data: dict[str, DataFrame]
+    live_index: BiolectorLiveDataIndex
+    # time of the last refresh in seconds since epoch, None before the first refresh
+    last_refresh_time: float | None
+    _lock: threading.Lock
+    # header line of the CSV and number of bytes of the CSV already parsed
+    _csv_header: bytes | None
+    _csv_offset: int
+
+    def __init__(self, experiment_key: str) -> None:
+        """
+        :param experiment_key: Key of the experiment, unique among the instruments (e.g. the
+            instrument name and the experiment id)
+        """
+        self.experiment_key = experiment_key
+        self.metadata = None
+        self.filters = []
+        self.last_refresh_time = None
+        self._lock = threading.Lock()
+        self._reset(None)
+
+    def refresh(self, export_folder_path: str) -> dict[str, int]:
+        """
+        Parse the new rows of an export of the experiment and update the well data.
+
+        :param export_folder_path: Folder of the unzipped export, with the CSV raw data and the
+            BXT.json metadata file
+        :return: The first changed cycle of each filterset that changed
+        """
+        csv_file_names = sorted(
+            file_name for file_name in os.listdir(export_folder_path) if file_name.endswith(".csv")
+        )
+        if not csv_file_names:
+            raise ValueError("No CSV file found in the export of the experiment")
+        metadata = load_metadata_file(export_folder_path)
+        if metadata is None:
+            raise ValueError("No BXT.json metadata file found in the export of the experiment")
+
+        with self._lock:
+            data = self._read_new_rows(os.path.join(export_folder_path, csv_file_names[0]))
+            self.metadata = metadata
+            self.filters = get_filters(metadata)
+            changed_cycles = self.live_index.update(data)
+            self.well_data = update_well_data(
+                self.well_data, self.live_index, self.filters, changed_cycles
+            )
+            self.last_refresh_time = time.time()
+        return changed_cycles
+
+    def get_nb_bytes_read(self) -> int:
+        """Get the number of bytes of the CSV export already parsed."""
+        return self._csv_offset
+
+    def _read_new_rows(self, csv_path: str) -> DataFrame:
+        """Read the complete lines of the CSV written after the bytes already parsed."""
+        with open(csv_path, "rb") as file:
+            header = file.readline()
+            file_size = os.fstat(file.fileno()).st_size
+            if header != self._csv_header or file_size < self._csv_offset:
+                self._reset(header)
+            start = max(self._csv_offset, len(header))
+            file.seek(start)
+            tail = file.read()
+
+        # a line still being written by the device is read on the next refresh
+        end = tail.rfind(b"\n") + 1
+        if end == 0:
+            return DataFrame(columns=RAW_DATA_COLUMNS)
+        self._csv_offset = start + end
+        return read_raw_data_csv(io.BytesIO(header + tail[:end]))
+
+    def _reset(self, csv_header: bytes | None) -> None:
+        self.live_index = BiolectorLiveDataIndex()
+        self.well_data = {}
+        self._csv_header = csv_header
+        self._csv_offset = 0
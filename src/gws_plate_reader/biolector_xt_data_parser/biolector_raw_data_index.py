@@ -0,0 +1,179 @@
+import hashlib
+import threading
+import weakref
+from collections import OrderedDict
+
+from gws_core import Table
+from pandas import DataFrame
+from pandas.util import hash_pandas_object
+
+from gws_plate_reader.biolector_xt_data_parser.biolector_xt_csv_reader import compact_raw_data
+from gws_plate_reader.biolector_xt_data_parser.biolector_xt_pivot import (
+    RAW_DATA_COLUMNS,
+    get_plate_wells,
+    is_micro_fluidics,
+    pivot_raw_data,
+)
+
+
+class BiolectorRawDataIndex:
+    """
+    Parsed view of a BiolectorXT raw export, shared by BiolectorXTDataParser and BiolectorXTLoadData.
+
+    The raw data is pivoted once into one table per filterset (cycle x well). Indexes are cached
+    by resource id (or by content hash when the table is not saved) so that tasks working on the
+    same export in the same process parse it only once.
+
+    The content hash of a DataFrame is computed once and kept while the DataFrame is alive, the
+    raw data must not be modified in place once parsed.
+
+    The cached tables must not be modified, use `get_filter_tables` to get copies.
+    """
+
+    CACHE_MAX_SIZE = 8
+
+    is_micro_fluidics: bool
+    wells: list[str]
+    # filterset value -> DataFrame with the 'time' column (in seconds) and one column per well
+    _pivots: dict[str, DataFrame]
+
+    _cache: "OrderedDict[str, BiolectorRawDataIndex]" = OrderedDict()
+    _cache_lock = threading.Lock()
+    # id of the DataFrame -> (weak reference to the DataFrame, content hash)
+    _content_hashes: "dict[int, tuple[weakref.ref, str]]" = {}
+
+    def __init__(self, data: DataFrame) -> None:
+        # the pivot sorts and groups categorical Well and Filterset columns faster than text
+        data = compact_raw_data(data)
+        self.is_micro_fluidics = is_micro_fluidics(data)
+        self.wells = get_plate_wells(self.is_micro_fluidics)
+        self._pivots = pivot_raw_data(data, self.wells)
+
+    def get_filtersets(self) -> list[str]:
+        """Get the filterset values of the raw data, in sorted order."""
+        return list(self._pivots.keys())
+
+    def get_filter_tables(self, filters: list[str]) -> dict[str, DataFrame]:
+        """
+        Get a copy of the wide table of each filterset, renamed with the metadata filter names.
+
+        Filtersets are matched with the filters by position (sorted filterset values vs metadata
+        channels), filtersets without a matching filter are ignored.
+
+        :param filters: The filter names from the metadata channels
+        :return: The tables by filter name, with the 'time' column (in seconds) and one column per well
+        """
+        return {
+            filter_name: pivot.copy()
+            for filter_name, pivot in self.get_filter_pivots(filters).items()
+        }
+
+    def get_filter_pivots(self, filters: list[str]) -> dict[str, DataFrame]:
+        """
+        Get the cached wide table of each filterset, by filter name, without copying it.
+
+        For read-only consumers (e.g. `build_long_format_data`), the tables must not be modified.
+
+        :param filters: The filter names from the metadata channels
+        :return: The tables by filter name, with the 'time' column (in seconds) and one column per well
+        """
+        return dict(zip(filters, self._pivots.values(), strict=False))
+
+    @classmethod
+    def from_pivots(
+        cls, pivots: dict[str, DataFrame], is_micro_fluidics: bool
+    ) -> "BiolectorRawDataIndex":
+        """
+        Create an index from tables that were already pivoted (e.g. read from a run cache).
+
+        :param pivots: The wide table of each filterset in sorted filterset order, with the 'time'
+            column (in seconds) and one column per well of the plate
+        :param is_micro_fluidics: True if the raw data comes from a microfluidics plate
+        :return: The index
+        """
+        index = cls.__new__(cls)
+        index.is_micro_fluidics = is_micro_fluidics
+        index.wells = get_plate_wells(is_micro_fluidics)
+        index._pivots = pivots
+        return index
+
+    @classmethod
+    def from_table(cls, table: Table) -> "BiolectorRawDataIndex":
+        """
+        Get the index of a raw data table, from the cache if the table was already parsed.
+
+        :param table: The raw data table
+        :return: The index of the table
+        """
+        return cls.from_dataframe(table.get_data(), cls.get_table_cache_key(table))
+
+    @classmethod
+    def from_dataframe(cls, data: DataFrame, key: str | None = None) -> "BiolectorRawDataIndex":
+        """
+        Get the index of raw data, from the cache if the data was already parsed.
+
+        :param data: The raw data
+        :param key: Optional cache key, the content hash of the raw data is used if not provided
+        :return: The index of the data
+        """
+        if key is None:
+            key = cls.compute_content_hash(data)
+
+        index = cls.get_from_cache(key)
+        if index is None:
+            index = cls.add_to_cache(key, cls(data))
+        return index
+
+    @classmethod
+    def get_table_cache_key(cls, table: Table) -> str:
+        """Get the cache key of a raw data table: its resource id, or its content hash if unsaved."""
+        model_id = table.get_model_id()
+        if model_id:
+            return f"resource_{model_id}"
+        return cls.compute_content_hash(table.get_data())
+
+    @classmethod
+    def compute_content_hash(cls, data: DataFrame) -> str:
+        """
+        Compute a hash of the columns of the raw data used by the parsing.
+
+        The hash is computed once per DataFrame, the next calls with the same DataFrame return it
+        without reading the data again.
+        """
+        data_id = id(data)
+        entry = cls._content_hashes.get(data_id)
+        if entry is not None and entry[0]() is data:
+            return entry[1]
+
+        row_hashes = hash_pandas_object(data[RAW_DATA_COLUMNS], index=False)
+        content_hash = "content_" + hashlib.sha256(row_hashes.to_numpy().tobytes()).hexdigest()
+        # the entry is removed when the DataFrame is garbage collected, before its id is reused.
+        # No lock in the callback: it can run during a collection triggered under the cache lock
+        content_hashes = cls._content_hashes
+        data_ref = weakref.ref(data, lambda _: content_hashes.pop(data_id, None))
+        content_hashes[data_id] = (data_ref, content_hash)
+        return content_hash
+
+    @classmethod
+    def get_from_cache(cls, key: str) -> "BiolectorRawDataIndex | None":
+        """Get a cached index by key, None if it is not in the cache."""
+        with cls._cache_lock:
+            index = cls._cache.get(key)
+            if index is not None:
+                cls._cache.move_to_end(key)
+            return index
+
+    @classmethod
+    def add_to_cache(cls, key: str, index: "BiolectorRawDataIndex") -> "BiolectorRawDataIndex":
+        """Add an index parsed elsewhere (e.g. in a worker process) to the cache."""
+        with cls._cache_lock:
+            cls._cache[key] = index
+            while len(cls._cache) > cls.CACHE_MAX_SIZE:
+                cls._cache.popitem(last=False)
+        return index
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Remove all the indexes from the cache."""
+        with cls._cache_lock:
+            cls._cache.clear()
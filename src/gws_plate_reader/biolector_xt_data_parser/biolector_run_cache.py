@@ -0,0 +1,393 @@
+import hashlib
+import json
+import os
+import shutil
+import uuid
+
+import numpy as np
+from gws_core import Settings
+from pandas import DataFrame
+
+from gws_plate_reader.biolector_xt_data_parser.biolector_raw_data_index import (
+    BiolectorRawDataIndex,
+)
+from gws_plate_reader.biolector_xt_data_parser.biolector_xt_csv_reader import read_raw_data_csv
+from gws_plate_reader.biolector_xt_data_parser.biolector_xt_metadata import (
+    get_filters,
+    get_wells_cultivation,
+    get_wells_label_description,
+    get_wells_reservoir,
+)
+
+
+class BiolectorCachedRun:
+    """
+    Parsed BiolectorXT run stored in a run cache, opened with memory mapping.
+
+    Each filterset is stored as a contiguous well x cycle float64 array (one row per well) and a
+    time vector, so reading a single well of a channel only loads this well from the disk. The
+    header gives the wells, the filtersets and the labels of the BXT metadata.
+
+    The arrays are read-only, use `get_filter_tables` to get tables that can be modified.
+    """
+
+    path: str
+    header: dict
+
+    def __init__(self, path: str, header: dict) -> None:
+        self.path = path
+        self.header = header
+
+    @property
+    def is_micro_fluidics(self) -> bool:
+        return self.header["is_micro_fluidics"]
+
+    @property
+    def wells(self) -> list[str]:
+        return self.header["wells"]
+
+    def get_filtersets(self) -> list[str]:
+        """Get the filterset values of the run, in sorted order."""
+        return [filterset["name"] for filterset in self.header["filtersets"]]
+
+    def get_filters(self) -> list[str]:
+        """Get the filter names of the metadata channels, empty if the run has no metadata."""
+        return self.header["labels"]["filters"]
+
+    def get_labels(self) -> dict:
+        """Get the labels of the metadata (filters, cultivation and reservoir wells, well labels)."""
+        return self.header["labels"]
+
+    def get_times(self, filterset: str) -> np.ndarray:
+        """Get the time (in seconds) of each cycle of a filterset, as a read-only memory map."""
+        return np.load(self._get_filterset_file(filterset, "time_file"), mmap_mode="r")
+
+    def get_values(self, filterset: str) -> np.ndarray:
+        """Get the values of a filterset, well x cycle, as a read-only memory map."""
+        return np.load(self._get_filterset_file(filterset, "values_file"), mmap_mode="r")
+
+    def get_well_values(self, filterset: str, well: str) -> np.ndarray:
+        """
+        Get the values of one well of a filterset, only this well is read from the disk.
+
+        :param filterset: The filterset value
+        :param well: The well (e.g. A01)
+        :return: The value of each cycle (NaN when the well has no value), read-only
+        """
+        if well not in self.wells:
+            raise KeyError(f"Unknown well '{well}', the wells of the plate are {self.wells}")
+        return self.get_values(filterset)[self.wells.index(well)]
+
+    def get_filter_tables(self, filters: list[str] | None = None) -> dict[str, DataFrame]:
+        """
+        Get the wide table of each filterset, renamed with the metadata filter names.
+
+        The tables are the same as the tables of `BiolectorRawDataIndex.get_filter_tables`.
+
+        :param filters: The filter names, the filters of the cached metadata if not provided
+        :return: The tables by filter name, with the 'time' column (in seconds) and one column per well
+        """
+        if filters is None:
+            filters = self.get_filters()
+        filter_tables: dict[str, DataFrame] = {}
+        for filter_name, filterset in zip(filters, self.get_filtersets(), strict=False):
+            filter_tables[filter_name] = self._read_table(filterset)
+        return filter_tables
+
+    def to_raw_data_index(self) -> BiolectorRawDataIndex:
+        """Load the whole run as a raw data index, without parsing the raw data."""
+        pivots = {filterset: self._read_table(filterset) for filterset in self.get_filtersets()}
+        return BiolectorRawDataIndex.from_pivots(pivots, self.is_micro_fluidics)
+
+    def _read_table(self, filterset: str) -> DataFrame:
+        table = DataFrame(np.array(self.get_values(filterset).T), columns=self.wells)
+        table.insert(0, "time", np.array(self.get_times(filterset)))
+        return table
+
+    def _get_filterset_file(self, filterset: str, file_key: str) -> str:
+        for filterset_header in self.header["filtersets"]:
+            if filterset_header["name"] == filterset:
+                return os.path.join(self.path, filterset_header[file_key])
+        raise KeyError(f"Unknown filterset '{filterset}'")
+
+
+class BiolectorRunCache:
+    """
+    On-disk cache of parsed BiolectorXT runs.
+
+    Runs of a CSV export are keyed by the SHA-256 of the file, computed before any parsing, so a
+    run exported again is opened without reading its CSV. Runs of a raw data table (see
+    BiolectorXTLoadData) use the BiolectorRawDataIndex cache key of the table. An alias (e.g. the
+    id of a finished experiment) can point to a run, to open it without downloading the export.
+
+    A run is stored in its own directory: a `header.json` file and two `.npy` files by
+    filterset (values and times). Runs are written in a temporary directory then renamed, so a
+    run is either complete or absent, and processes sharing the cache directory never read a
+    partially written run. Re-opening a run only reads its header, the arrays are memory mapped.
+
+    The size of the cache is bounded: after each write, the least recently opened runs are
+    removed until the runs fit in `max_size`.
+    """
+
+    FORMAT_VERSION = 1
+    HEADER_FILE_NAME = "header.json"
+    ALIASES_DIR_NAME = ".aliases"
+    DEFAULT_MAX_SIZE = 10 * 1024**3
+
+    cache_dir: str
+    max_size: int
+
+    def __init__(self, cache_dir: str | None = None, max_size: int = DEFAULT_MAX_SIZE) -> None:
+        """
+        :param cache_dir: Directory of the cache, a directory of the lab data directory if not
+            provided
+        :param max_size: Maximum size of the runs of the cache, in bytes
+        """
+        self.cache_dir = cache_dir or os.path.join(
+            Settings.get_instance().get_data_dir(), "gws_plate_reader", "biolector_run_cache"
+        )
+        self.max_size = max_size
+
+    def get_run_path(self, key: str) -> str:
+        """Get the directory of a run."""
+        return os.path.join(self.cache_dir, key)
+
+    def open(self, key: str) -> BiolectorCachedRun | None:
+        """
+        Open a cached run.
+
+        :param key: The key of the run
+        :return: The run, None if it is not in the cache or was written with another format version
+        """
+        run_path = self.get_run_path(key)
+        header_path = os.path.join(run_path, self.HEADER_FILE_NAME)
+        if not os.path.exists(header_path):
+            return None
+        with open(header_path, encoding="UTF-8") as header_file:
+            header = json.load(header_file)
+        if header.get("format_version") != self.FORMAT_VERSION:
+            return None
+        # the time of the last use, the least recently used runs are evicted first
+        os.utime(header_path)
+        return BiolectorCachedRun(run_path, header)
+
+    def open_raw_data_index(self, key: str) -> BiolectorRawDataIndex | None:
+        """
+        Load a cached run as a raw data index, without parsing the raw data.
+
+        :param key: The key of the run
+        :return: The index, None if the run is not in the cache
+        """
+        run = self.open(key)
+        if run is None:
+            return None
+        return run.to_raw_data_index()
+
+    def write(
+        self, key: str, raw_data_index: BiolectorRawDataIndex, metadata: dict | None = None
+    ) -> BiolectorCachedRun:
+        """
+        Store a parsed run in the cache, an existing run with the same key is kept.
+
+        :param key: The key of the run
+        :param raw_data_index: The parsed raw data
+        :param metadata: Optional BXT metadata, its filters and well labels are stored in the header
+        :return: The cached run
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp_path = os.path.join(self.cache_dir, f".{key}.{uuid.uuid4().hex}.tmp")
+        os.makedirs(tmp_path)
+        try:
+            filtersets = raw_data_index.get_filtersets()
+            filtersets_header = []
+            for filterset_idx, (filterset, table) in enumerate(
+                zip(filtersets, raw_data_index.get_filter_pivots(filtersets).values(), strict=True)
+            ):
+                values_file = f"filterset_{filterset_idx}_values.npy"
+                time_file = f"filterset_{filterset_idx}_time.npy"
+                # one contiguous row per well
+                values = np.ascontiguousarray(
+                    table[raw_data_index.wells].to_numpy(dtype=np.float64).T
+                )
+                np.save(os.path.join(tmp_path, values_file), values)
+                np.save(os.path.join(tmp_path, time_file), table["time"].to_numpy(dtype=np.float64))
+                filtersets_header.append(
+                    {
+                        "name": filterset,
+                        "nb_cycles": len(table),
+                        "values_file": values_file,
+                        "time_file": time_file,
+                    }
+                )
+
+            header = {
+                "format_version": self.FORMAT_VERSION,
+                "key": key,
+                "is_micro_fluidics": raw_data_index.is_micro_fluidics,
+                "wells": raw_data_index.wells,
+                "filtersets": filtersets_header,
+                "labels": self._get_labels(metadata),
+            }
+            with open(
+                os.path.join(tmp_path, self.HEADER_FILE_NAME), "w", encoding="UTF-8"
+            ) as header_file:
+                json.dump(header, header_file)
+
+            run_path = self.get_run_path(key)
+            try:
+                os.rename(tmp_path, run_path)
+            except OSError:
+                # the run was written by another process in the meantime
+                if not os.path.exists(os.path.join(run_path, self.HEADER_FILE_NAME)):
+                    raise
+        finally:
+            shutil.rmtree(tmp_path, ignore_errors=True)
+
+        self.evict(keep_key=key)
+        return self.open(key)
+
+    def get_or_create(
+        self, raw_data_path: str, metadata: dict | None = None, delimiter: str = ";"
+    ) -> BiolectorCachedRun:
+        """
+        Get the cached run of a raw CSV export, the export is parsed and stored on the first call.
+
+        When the run is cached and the metadata is provided, the labels of the header are
+        updated if the metadata changed since the run was stored.
+
+        :param raw_data_path: Path of the CSV export
+        :param metadata: Optional BXT metadata of the export, its filters and well labels are
+            stored in the header
+        :param delimiter: Delimiter of the CSV file
+        :return: The cached run
+        """
+        key = self.compute_file_key(raw_data_path)
+        run = self.open(key)
+        if run is None:
+            data = read_raw_data_csv(raw_data_path, delimiter=delimiter)
+            return self.write(key, BiolectorRawDataIndex(data), metadata)
+
+        if metadata is not None and run.get_labels() != self._get_labels(metadata):
+            run = self._write_header(run, {**run.header, "labels": self._get_labels(metadata)})
+        return run
+
+    @classmethod
+    def compute_file_key(cls, file_path: str) -> str:
+        """Compute the key of a raw data file, the SHA-256 of its content."""
+        sha256 = hashlib.sha256()
+        with open(file_path, "rb") as file:
+            for chunk in iter(lambda: file.read(1024 * 1024), b""):
+                sha256.update(chunk)
+        return "file_" + sha256.hexdigest()
+
+    def open_alias(self, alias: str) -> BiolectorCachedRun | None:
+        """
+        Open the run an alias points to.
+
+        :param alias: The alias, any string (e.g. the instrument and the id of an experiment)
+        :return: The run, None if the alias is unknown or its run was evicted
+        """
+        alias_path = self._get_alias_path(alias)
+        if not os.path.exists(alias_path):
+            return None
+        with open(alias_path, encoding="UTF-8") as alias_file:
+            return self.open(alias_file.read().strip())
+
+    def set_alias(self, alias: str, key: str) -> None:
+        """
+        Point an alias to a run, only for data that does not change (e.g. a finished experiment).
+
+        :param alias: The alias, any string
+        :param key: The key of the run
+        """
+        alias_path = self._get_alias_path(alias)
+        os.makedirs(os.path.dirname(alias_path), exist_ok=True)
+        tmp_alias_path = f"{alias_path}.{uuid.uuid4().hex}.tmp"
+        with open(tmp_alias_path, "w", encoding="UTF-8") as alias_file:
+            alias_file.write(key)
+        os.replace(tmp_alias_path, alias_path)
+
+    def get_size(self) -> int:
+        """Get the size of the runs of the cache, in bytes."""
+        return sum(size for _, size, _ in self._list_runs())
+
+    def evict(self, keep_key: str | None = None) -> list[str]:
+        """
+        Remove the least recently opened runs until the runs fit in `max_size`.
+
+        :param keep_key: Key of a run that is never removed (e.g. the run just written)
+        :return: The keys of the removed runs
+        """
+        runs = self._list_runs()
+        total_size = sum(size for _, size, _ in runs)
+        removed_keys: list[str] = []
+        for key, size, _ in sorted(runs, key=lambda run: run[2]):
+            if total_size <= self.max_size:
+                break
+            if key == keep_key:
+                continue
+            self.remove(key)
+            total_size -= size
+            removed_keys.append(key)
+        return removed_keys
+
+    def remove(self, key: str) -> None:
+        """Remove a run from the cache."""
+        shutil.rmtree(self.get_run_path(key), ignore_errors=True)
+
+    def clear(self) -> None:
+        """Remove all the runs and the aliases from the cache."""
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def _list_runs(self) -> list[tuple[str, int, float]]:
+        """List the (key, size in bytes, time of the last use) of the complete runs."""
+        if not os.path.isdir(self.cache_dir):
+            return []
+        runs: list[tuple[str, int, float]] = []
+        for key in os.listdir(self.cache_dir):
+            # temporary runs and the aliases start with a dot
+            run_path = self.get_run_path(key)
+            header_path = os.path.join(run_path, self.HEADER_FILE_NAME)
+            if key.startswith(".") or not os.path.exists(header_path):
+                continue
+            try:
+                size = sum(entry.stat().st_size for entry in os.scandir(run_path))
+                runs.append((key, size, os.path.getmtime(header_path)))
+            except FileNotFoundError:
+                # removed by another process in the meantime
+                continue
+        return runs
+
+    def _get_alias_path(self, alias: str) -> str:
+        alias_hash = hashlib.sha256(alias.encode("UTF-8")).hexdigest()
+        return os.path.join(self.cache_dir, self.ALIASES_DIR_NAME, alias_hash)
+
+    def _write_header(self, run: BiolectorCachedRun, header: dict) -> BiolectorCachedRun:
+        """Replace the header of a run, the header file is replaced in one go."""
+        header_path = os.path.join(run.path, self.HEADER_FILE_NAME)
+        tmp_header_path = f"{header_path}.{uuid.uuid4().hex}.tmp"
+        with open(tmp_header_path, "w", encoding="UTF-8") as header_file:
+            json.dump(header, header_file)
+        os.replace(tmp_header_path, header_path)
+        return BiolectorCachedRun(run.path, header)
+
+    def _get_labels(self, metadata: dict | None) -> dict:
+        if metadata is None:
+            return {
+                "filters": [],
+                "cultivation_wells": [],
+                "reservoir_wells": [],
+                "well_labels": {},
+                "experiment_name": None,
+            }
+        return {
+            "filters": get_filters(metadata),
+            "cultivation_wells": get_wells_cultivation(metadata),
+            "reservoir_wells": get_wells_reservoir(metadata),
+            "well_labels": {
+                well: data["label"]
+                for well, data in get_wells_label_description(metadata).items()
+                if isinstance(data["label"], str) and data["label"]
+            },
+            "experiment_name": metadata.get("Name"),
+        }
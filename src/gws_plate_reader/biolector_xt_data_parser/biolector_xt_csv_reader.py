@@ -0,0 +1,91 @@
+from typing import IO
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+from pandas.api.types import union_categoricals
+
+from gws_plate_reader.biolector_xt_data_parser.biolector_xt_pivot import RAW_DATA_COLUMNS
+
+# Number of CSV rows read at once, bounds the memory used by the raw text of the export
+DEFAULT_CHUNK_SIZE = 200_000
+
+
+def read_raw_data_csv(
+    file_path: str | IO,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    delimiter: str = ";",
+    value_dtype: type[np.floating] = np.float64,
+) -> DataFrame:
+    """
+    Read a BiolectorXT CSV export by chunks, keeping only the columns used by the parsers.
+
+    Only the Well, Filterset, Time and Cal columns are kept, with categorical Well and Filterset.
+    Time stays float64, float32 loses the second on multi-day runs. The memory used is the compact
+    data plus one chunk, instead of the whole export with all its text columns.
+
+    :param file_path: Path of the CSV export, or a file object with its content
+    :param chunk_size: Number of rows read at once
+    :param delimiter: Delimiter of the CSV file
+    :param value_dtype: Type of the Cal column. np.float32 halves its memory but rounds the
+        measured values, the default keeps them as written in the export
+    :return: The raw data with the Well, Filterset, Time and Cal columns
+    """
+    wells: list[pd.Categorical] = []
+    filtersets: list[pd.Categorical] = []
+    times: list[np.ndarray] = []
+    values: list[np.ndarray] = []
+
+    reader = pd.read_csv(
+        file_path,
+        sep=delimiter,
+        usecols=RAW_DATA_COLUMNS,
+        dtype={"Well": "category", "Filterset": "category"},
+        chunksize=chunk_size,
+    )
+    with reader:
+        for chunk in reader:
+            wells.append(chunk["Well"].array)
+            filtersets.append(chunk["Filterset"].array)
+            times.append(pd.to_numeric(chunk["Time"], errors="coerce").to_numpy(np.float64))
+            values.append(
+                pd.to_numeric(chunk["Cal"], errors="coerce").to_numpy(dtype=value_dtype)
+            )
+
+    if not wells:
+        return DataFrame(
+            {
+                "Well": pd.Categorical([]),
+                "Filterset": pd.Categorical([]),
+                "Time": np.array([], dtype=np.float64),
+                "Cal": np.array([], dtype=value_dtype),
+            }
+        )
+
+    # sorted categories keep the lexical order when the parsers sort the data
+    return DataFrame(
+        {
+            "Well": union_categoricals(wells, sort_categories=True),
+            "Filterset": union_categoricals(filtersets, sort_categories=True),
+            "Time": np.concatenate(times),
+            "Cal": np.concatenate(values),
+        }
+    )
+
+
+def compact_raw_data(data: DataFrame) -> DataFrame:
+    """
+    Keep the columns of the raw data used by the parsers, with categorical Well and Filterset.
+
+    Used on raw data that was not read with `read_raw_data_csv` (e.g. an uploaded table), the
+    pivot sorts and groups the category codes instead of the text. Time and Cal are kept as is.
+
+    :param data: The raw data, must contain the Well, Filterset, Time and Cal columns
+    :return: The raw data with the Well, Filterset, Time and Cal columns
+    """
+    compact_data = data[RAW_DATA_COLUMNS]
+    for column in ["Well", "Filterset"]:
+        if not isinstance(compact_data[column].dtype, pd.CategoricalDtype):
+            # the categories of astype are sorted, the parsers keep the lexical order
+            compact_data = compact_data.assign(**{column: compact_data[column].astype("category")})
+    return compact_data
@@ -1,5 +1,3 @@
-import json
-import os
 from typing import Any
 
 from gws_core import (
@@ -21,7 +19,20 @@ from gws_core import (
 from gws_core.tag.tag import Tag, TagOrigins
 from gws_core.tag.tag_dto import TagOriginType
 from gws_core.user.current_user_service import CurrentUserService
-from pandas import NA, DataFrame, Series
+from pandas import NA, DataFrame
+
+from gws_plate_reader.biolector_xt_data_parser.biolector_raw_data_index import (
+    BiolectorRawDataIndex,
+)
+from gws_plate_reader.biolector_xt_data_parser.biolector_xt_metadata import (
+    BiolectorMetadataIndex,
+    get_filters,
+    get_wells,
+    get_wells_cultivation,
+    get_wells_label_description,
+    get_wells_reservoir,
+)
+from gws_plate_reader.biolector_xt_data_parser.biolector_xt_pivot import is_micro_fluidics
 
 DOWNLOAD_TAG_KEY = "biolector_download"
 
@@ -57,8 +68,7 @@ class BiolectorXTDataParser(Task):
 
         :return: True if the task is running in a microfluidics environment, False otherwise.
         """
-        unique_wells = data["Well"].dropna().unique()
-        return "A01" not in unique_wells
+        return is_micro_fluidics(data)
 
     def get_filters(self, metadata: dict) -> list[str]:
         """
@@ -67,101 +77,38 @@ class BiolectorXTDataParser(Task):
         :param metadata: The metadata to include in the parsed data.
         :return: The filters to apply to the data.
         """
-        filters = []
-        for channel in metadata.get("Channels", []):
-            filters.append(channel["Name"])
-        return filters
-
-    def parse_data(self, data: DataFrame, metadata: dict) -> dict[str, DataFrame]:
+        return get_filters(metadata)
+
+    def parse_data(
+        self,
+        data: DataFrame,
+        metadata: dict,
+        raw_data_index: BiolectorRawDataIndex | None = None,
+    ) -> dict[str, DataFrame]:
         """
         Parse the raw data from BiolectorXT and save it in a JSON format.
 
         :param data: The raw data to parse.
         :param metadata: The metadata to include in the parsed data.
+        :param raw_data_index: Index of the raw data, retrieved from the cache if not provided.
         :return: The parsed data.
         """
-
-        # Step 1: Check if the task is running in a microfluidics environment and get the filters
-        is_micro_fluidics: bool = self.is_micro_fluidics(data)
-        filters: list[str] = self.get_filters(metadata)
-
-        # Step 2
-        # Filter the Filterset column alphabetically and the Well column
-        row_data = data.sort_values(by=["Filterset", "Well"])
-        # Only keep columns: Well, Filterset, Time, Cal
-        reduced_data = row_data[["Well", "Filterset", "Time", "Cal"]]
-        # Extract unique values from 'Filterset' column
-        unique_values = reduced_data["Filterset"].dropna().unique()
-
-        # Create a dictionary to store data frames with filter names as keys
-        df_filter_dict: dict[str, DataFrame] = {}
-        for i, value in enumerate(unique_values):
-            # Create DataFrame for each unique filterset value
-            df_filter = reduced_data[reduced_data["Filterset"] == value]
-
-            # Step 3:
-            # Filter Well column and Time
-            df_filter = df_filter.sort_values(by=["Well", "Time"])
-            # Delete FilterSet column
-            df_filter = df_filter.drop(columns="Filterset")
-
-            # Check if it's microfluidics
-            if is_micro_fluidics:
-                # Add column C01 to F08
-                columns_to_add = [
-                    f"{chr(letter)}{str(num).zfill(2)}"
-                    for letter in range(ord("C"), ord("F") + 1)
-                    for num in range(1, 9)
-                ]
-            else:
-                # Else, add column A01 to F08
-                columns_to_add = [
-                    f"{chr(letter)}{str(num).zfill(2)}"
-                    for letter in range(ord("A"), ord("F") + 1)
-                    for num in range(1, 9)
-                ]
-
-            # Add columns to the DataFrame
-            df_filter = df_filter.assign(
-                time=NA, Temps_en_h=NA, **dict.fromkeys(columns_to_add, NA)
-            )
-
-            # Fill time and Temps_en_h columns
-            df_filter["time"] = df_filter.loc[df_filter["Well"] == columns_to_add[0], "Time"]
-            df_filter["Temps_en_h"] = df_filter["time"] / 3600
-
-            # Copy values of 'Cal' in the corresponding column (A01, A02, ...)
-            for name_col in columns_to_add:
-                df_filter[name_col] = df_filter.loc[df_filter["Well"] == name_col, "Cal"]
-
-            # Delete NaN values and set cell to up
-            columns_to_process = df_filter.columns[3 : len(df_filter.columns)]
-            # reset index
-            df_filter = df_filter.reset_index(drop=True)
-
-            # Apply the shifting function to each specified column
-            for col in columns_to_process:
-                df_filter[col] = Series(df_filter[col].dropna().values)
-
-            # Drop nan rows at the end of the dataframe:
-            df_filter = df_filter.dropna(subset=["time"])
-            df_filter = df_filter.drop(columns="Well")
-            df_filter = df_filter.drop(columns="Time")
-            df_filter = df_filter.drop(columns="Cal")
-
-            # Add the processed DataFrame to the dictionary with filter name as key
-            if i < len(filters):  # Ensure index is within bounds of filters list
-                filter_name = filters[i]
-                df_filter_dict[filter_name] = df_filter
+        if raw_data_index is None:
+            raw_data_index = BiolectorRawDataIndex.from_dataframe(data)
+
+        # One table per filter with the time and one column per well
+        # (C01 to F08 for microfluidics, else A01 to F08)
+        df_filter_dict = raw_data_index.get_filter_tables(self.get_filters(metadata))
+        for df_filter in df_filter_dict.values():
+            # Add the time in hours next to the time in seconds
+            df_filter.insert(1, "Temps_en_h", df_filter["time"] / 3600)
         return df_filter_dict
 
     def get_wells_cultivation(self, metadata: dict) -> list[str]:
-        microplate = metadata.get("Microplate", {})
-        return microplate.get("CultivationLabels", [])
+        return get_wells_cultivation(metadata)
 
     def get_wells_reservoir(self, metadata: dict) -> list[str]:
-        microplate = metadata.get("Microplate", {})
-        return microplate.get("ReservoirLabels", [])
+        return get_wells_reservoir(metadata)
 
     def get_wells(self, metadata: dict) -> list[str]:
         """
@@ -170,15 +117,7 @@ class BiolectorXTDataParser(Task):
         :param metadata: The metadata to include in the parsed data.
         :return: The wells.
         """
-        wells = []
-        # Get the cultivation wells
-        cultivation_wells = self.get_wells_cultivation(metadata)
-        # Get the reservoir wells
-        reservoir_wells = self.get_wells_reservoir(metadata)
-
-        wells.extend(cultivation_wells)
-        wells.extend(reservoir_wells)
-        return wells
+        return get_wells(metadata)
 
     def get_wells_label_description(
         self, metadata: dict, existing_plate_layout: dict | None = None
@@ -189,61 +128,28 @@ class BiolectorXTDataParser(Task):
         :param metadata: The metadata to include in the parsed data.
         :return: The wells label description.
         """
-        # A01 to F08
-        wells = [
-            f"{chr(letter)}{str(num).zfill(2)}"
-            for letter in range(ord("A"), ord("F") + 1)
-            for num in range(1, 9)
-        ]
-        wells_label = {well: {"label": ""} for well in wells}
-        microplate = metadata.get("Layout", {})
-        cultivation_map = microplate.get("CultivationLabelDescriptionsMap", {})
-        reservoir_map = microplate.get("ReservoirLabelDescriptionsMap", {})
-        # Strip and update values for existing wells
-        for well, description in cultivation_map.items():
-            if well in wells_label:
-                wells_label[well] = {"label": description.strip() or wells_label[well]}
-
-        for well, description in reservoir_map.items():
-            if well in wells_label:
-                wells_label[well] = {"label": description.strip() or wells_label[well]}
-        if existing_plate_layout:
-            # Retrieve data in existing_plate_layout and override label if key "label" is present
-            for well, data in existing_plate_layout.items():
-                if len(well) == 2:
-                    well = f"{well[0]}0{well[1]}"
-                if well in wells_label and isinstance(data, dict):  # Ensure it's a dictionary
-                    # Get the existing data, ensuring it's a dictionary
-                    existing_data = (
-                        wells_label[well]
-                        if isinstance(wells_label[well], dict)
-                        else {"label": wells_label[well]}
-                    )
-                    # If "label" exists in data, overwrite it
-                    if "label" in data:
-                        existing_data["label"] = data["label"]
-
-                    # Update with all keys from data
-                    existing_data.update(data)
-
-                    # Assign back to wells_label
-                    wells_label[well] = existing_data
-
-        return wells_label
+        return get_wells_label_description(metadata, existing_plate_layout)
 
     def create_parsed_resource_set(
-        self, data: DataFrame, metadata: dict, existing_plate_layout: dict | None = None
+        self,
+        data: DataFrame,
+        metadata: dict,
+        existing_plate_layout: dict | None = None,
+        raw_data_index: BiolectorRawDataIndex | None = None,
     ) -> ResourceSet:
         """
         Create a resource set from the parsed data.
 
         :param data: The parsed data.
         :param metadata: The metadata to include in the resource set.
+        :param raw_data_index: Index of the raw data, retrieved from the cache if not provided.
         :return: The resource set.
         """
         # Create a resource set from the parsed data
         resource_set = ResourceSet()
-        parsed_data: dict[str, DataFrame] = self.parse_data(data=data, metadata=metadata)
+        parsed_data: dict[str, DataFrame] = self.parse_data(
+            data=data, metadata=metadata, raw_data_index=raw_data_index
+        )
         parsed_data_tables: dict[str, Table] = {}
         wells_data = self.get_wells_label_description(
             metadata=metadata, existing_plate_layout=existing_plate_layout
@@ -289,20 +195,14 @@ class BiolectorXTDataParser(Task):
         folder_metadata: Folder = inputs.get("folder_metadata")
         plate_layout: JSONDict = inputs.get("plate_layout")
 
-        metadata: dict = None
-        for file_name in os.listdir(folder_metadata.path):
-            if file_name.endswith("BXT.json"):
-                file_path = os.path.join(folder_metadata.path, file_name)
-                try:
-                    with open(file_path, encoding="UTF-8") as json_file:
-                        metadata = json.load(json_file)
-                except Exception as e:
-                    raise Exception(f"Error while reading the metadata file {file_name}: {e}")
-
+        metadata_files = BiolectorMetadataIndex.get_folder_metadata(folder_metadata.path)
+        metadata: dict = metadata_files.metadata
         if metadata is None:
             raise Exception(
                 "No metadata file found in the provided folder. The folder must contain a file that ends with 'BXT.json'"
             )
+        if metadata_files.is_ambiguous():
+            self.log_warning_message(metadata_files.get_ambiguity_message())
 
         existing_plate_layout: dict | None = None
         if plate_layout:
@@ -310,7 +210,10 @@ class BiolectorXTDataParser(Task):
             existing_plate_layout = plate_layout.get_data()
 
         resource_set = self.create_parsed_resource_set(
-            data=raw_data.get_data(), metadata=metadata, existing_plate_layout=existing_plate_layout
+            data=raw_data.get_data(),
+            metadata=metadata,
+            existing_plate_layout=existing_plate_layout,
+            raw_data_index=BiolectorRawDataIndex.from_table(raw_data),
         )
         resource_set.tags.add_tags(raw_data.tags.get_by_key(DOWNLOAD_TAG_KEY))
 
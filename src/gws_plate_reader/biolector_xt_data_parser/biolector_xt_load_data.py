@@ -1,17 +1,17 @@
-import json
-import os
 from typing import Any
 
 import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 from gws_core import (
+    BoolParam,
     ConfigParams,
     ConfigSpecs,
     DynamicInputs,
     Folder,
     InputSpec,
     InputSpecs,
+    IntParam,
     ListParam,
     OutputSpec,
     OutputSpecs,
@@ -25,10 +25,45 @@ from gws_core import (
     task_decorator,
 )
 from gws_core.resource.resource_set.resource_list import ResourceList
-from gws_core.tag.tag import Tag, TagOrigins
-from gws_core.tag.tag_dto import TagOriginType
-from gws_core.user.current_user_service import CurrentUserService
-from pandas import NA, DataFrame, Series
+from pandas import DataFrame
+
+from gws_plate_reader.biolector_xt_data_parser.biolector_raw_data_index import (
+    BiolectorRawDataIndex,
+)
+from gws_plate_reader.biolector_xt_data_parser.biolector_run_cache import BiolectorRunCache
+from gws_plate_reader.biolector_xt_data_parser.biolector_xt_long_format import (
+    build_long_format_data,
+    concat_long_format_data,
+)
+from gws_plate_reader.biolector_xt_data_parser.biolector_xt_medium import (
+    MediumCompositionIndex,
+    PlateMediumMapping,
+    to_short_well_ids,
+)
+from gws_plate_reader.biolector_xt_data_parser.biolector_xt_metadata import (
+    get_filters,
+    get_wells,
+    get_wells_cultivation,
+    get_wells_label_description,
+    get_wells_reservoir,
+)
+from gws_plate_reader.biolector_xt_data_parser.biolector_xt_pivot import is_micro_fluidics
+from gws_plate_reader.biolector_xt_data_parser.biolector_xt_plate_loader import (
+    ParsedPlate,
+    load_plate_metadata,
+    parse_plates_in_parallel,
+)
+from gws_plate_reader.biolector_xt_data_parser.biolector_xt_tags import (
+    apply_well_tags,
+    build_well_column_tags,
+    build_well_tags,
+    get_user_tag_origins,
+)
+from gws_plate_reader.cell_culture_filter.cell_culture_compact import (
+    compact_dataframe,
+    format_memory_report,
+    get_memory_usage,
+)
 
 DOWNLOAD_TAG_KEY = "biolector_download"
 
@@ -327,6 +362,16 @@ class BiolectorXTLoadData(Task):
     - Output format is compatible with filtering and analysis tasks
     - Plate layout overrides metadata labels when provided
     - Tags include batch (experiment name) and sample (well ID) for easy filtering
+    - Optional compact mode stores measurements as float32 and repeated text as categories,
+      the memory saved per plate is reported in the logs. Batch, sample and medium are tags of
+      the well tables, not columns, so only the measurements are compacted there
+    - With more than one worker, plates are parsed concurrently in separate processes; outputs
+      are merged in plate order and are identical to a sequential run
+    - Optional long format table output (Plate, Well, Channel, Time, Value) with all the wells of
+      all the plates, ResourceSetToDataTable reads it without iterating over the well tables and
+      `BiolectorLongFormatView` gives access to it by plate, well and channel
+    - Optional run cache: the parsed raw data of each plate is stored on the disk, the next runs
+      on the same raw data (e.g. a new analysis of the same plates) reopen it without parsing
 
     ## Comparison with BiolectorXTDataParser
 
@@ -363,7 +408,32 @@ class BiolectorXTLoadData(Task):
                 short_description="Custom names for each plate. Leave empty to use default names (plate_0, plate_1, etc.). Must match the number of input plates if provided.",
                 optional=True,
                 default_value=[],
-            )
+            ),
+            "compact_mode": BoolParam(
+                human_name="Compact mode",
+                short_description="Store measurements as float32 and repeated text as categories to reduce memory. A memory report is added to the logs.",
+                default_value=False,
+                visibility="protected",
+            ),
+            "max_workers": IntParam(
+                human_name="Number of workers",
+                short_description="Number of processes used to parse the plates in parallel. Use 1 to parse the plates sequentially.",
+                default_value=1,
+                min_value=1,
+                visibility="protected",
+            ),
+            "long_format_table": BoolParam(
+                human_name="Long format table",
+                short_description="Also output all the measurements in a single long-format table (Plate, Well, Channel, Time, Value), to analyse all the wells with vectorized operations.",
+                default_value=False,
+                visibility="protected",
+            ),
+            "use_run_cache": BoolParam(
+                human_name="Use run cache",
+                short_description="Store the parsed raw data of each plate on the disk, so the next runs on the same raw data do not parse it again.",
+                default_value=False,
+                visibility="protected",
+            ),
         }
     )
 
@@ -393,6 +463,12 @@ class BiolectorXTLoadData(Task):
                 short_description="Table with unique medium compositions (output when medium_table provided as input)",
                 optional=True,
             ),
+            "long_format_table": OutputSpec(
+                Table,
+                human_name="Long format data table",
+                short_description="All the measurements with one row per value: Plate, Well, Channel, Time (h), Value (output when long_format_table is enabled)",
+                optional=True,
+            ),
         }
     )
 
@@ -403,8 +479,7 @@ class BiolectorXTLoadData(Task):
         :param data: Raw data DataFrame
         :return: True if microfluidics, False otherwise
         """
-        unique_wells = data["Well"].dropna().unique()
-        return "A01" not in unique_wells
+        return is_micro_fluidics(data)
 
     def get_filters(self, metadata: dict) -> list[str]:
         """
@@ -413,124 +488,63 @@ class BiolectorXTLoadData(Task):
         :param metadata: Metadata dictionary
         :return: List of filter names
         """
-        filters = []
-        for channel in metadata.get("Channels", []):
-            filters.append(channel["Name"])
-        return filters
+        return get_filters(metadata)
 
-    def parse_data(self, data: DataFrame, metadata: dict) -> dict[str, DataFrame]:
+    def parse_data(
+        self,
+        data: DataFrame,
+        metadata: dict,
+        raw_data_index: BiolectorRawDataIndex | None = None,
+    ) -> dict[str, DataFrame]:
         """
         Parse the raw data from BiolectorXT into wide format tables.
 
         :param data: Raw data DataFrame
         :param metadata: Metadata dictionary
+        :param raw_data_index: Index of the raw data, retrieved from the cache if not provided
         :return: Dictionary mapping filter names to parsed DataFrames
         """
-        self.log_info_message("🔍 [PARSE_DATA] Starting parse_data...")
-        self.log_info_message(f"📊 [PARSE_DATA] Input data shape: {data.shape}")
-        self.log_info_message(f"📋 [PARSE_DATA] Input data columns: {list(data.columns)}")
-        self.log_info_message(f"🔢 [PARSE_DATA] First few rows of data:\n{data.head(3)}")
+        self.log_info_message(
+            f"🔍 [PARSE_DATA] Starting parse_data, input data shape: {data.shape}"
+        )
 
-        is_micro_fluidics: bool = self.is_micro_fluidics(data)
-        filters: list[str] = self.get_filters(metadata)
+        if raw_data_index is None:
+            raw_data_index = BiolectorRawDataIndex.from_dataframe(data)
 
-        self.log_info_message(f"🧪 [PARSE_DATA] Microfluidics mode: {is_micro_fluidics}")
+        filters: list[str] = self.get_filters(metadata)
+        self.log_info_message(
+            f"🧪 [PARSE_DATA] Microfluidics mode: {raw_data_index.is_micro_fluidics}"
+        )
         self.log_info_message(f"🎨 [PARSE_DATA] Filters detected: {filters}")
 
-        # Sort and filter data
-        row_data = data.sort_values(by=["Filterset", "Well"])
-        reduced_data = row_data[["Well", "Filterset", "Time", "Cal"]]
-        unique_values = reduced_data["Filterset"].dropna().unique()
-
-        self.log_info_message(f"📦 [PARSE_DATA] Unique filterset values: {list(unique_values)}")
-        self.log_info_message(f"📊 [PARSE_DATA] Reduced data shape: {reduced_data.shape}")
-
-        df_filter_dict: dict[str, DataFrame] = {}
-
-        for i, value in enumerate(unique_values):
-            self.log_info_message(
-                f"\n🔄 [PARSE_DATA] Processing filter {i + 1}/{len(unique_values)}: {value}"
+        filtersets = raw_data_index.get_filtersets()
+        if len(filtersets) > len(filters):
+            self.log_warning_message(
+                f"⚠️ [PARSE_DATA] {len(filtersets)} filtersets for {len(filters)} filters, "
+                f"skipping filtersets {filtersets[len(filters) :]}"
             )
-            df_filter = reduced_data[reduced_data["Filterset"] == value]
-            df_filter = df_filter.sort_values(by=["Well", "Time"])
-            df_filter = df_filter.drop(columns="Filterset")
-
-            # Determine well range based on microfluidics mode
-            if is_micro_fluidics:
-                columns_to_add = [
-                    f"{chr(letter)}{str(num).zfill(2)}"
-                    for letter in range(ord("C"), ord("F") + 1)
-                    for num in range(1, 9)
-                ]
-            else:
-                columns_to_add = [
-                    f"{chr(letter)}{str(num).zfill(2)}"
-                    for letter in range(ord("A"), ord("F") + 1)
-                    for num in range(1, 9)
-                ]
-
-            # Save original time column before we overwrite it
-            original_time_col = df_filter["Time"].copy()
 
-            # Add columns for time and wells
-            # Create only 'Time' column in hours (standardized)
-            df_filter = df_filter.assign(Time=NA, **dict.fromkeys(columns_to_add, NA))
-
-            # Fill Time column in hours
-            df_filter["Time"] = original_time_col / 3600
-
-            # Populate well columns
-            for name_col in columns_to_add:
-                df_filter[name_col] = df_filter.loc[df_filter["Well"] == name_col, "Cal"]
-
-            # Shift values up to remove NaN rows
-            columns_to_process = df_filter.columns[3 : len(df_filter.columns)]
-            df_filter = df_filter.reset_index(drop=True)
-
-            for col in columns_to_process:
-                df_filter[col] = Series(df_filter[col].dropna().values)
-
-            # Clean up - keep standardized 'Time' column (in hours)
-            df_filter = df_filter.dropna(subset=["Time"])
-            self.log_info_message(f"📊 [PARSE_DATA] After dropna, shape: {df_filter.shape}")
-
-            df_filter = df_filter.drop(columns=["Well", "Cal"])
-            self.log_info_message(f"📊 [PARSE_DATA] After drop columns, shape: {df_filter.shape}")
-            self.log_info_message(f"📋 [PARSE_DATA] Final columns: {list(df_filter.columns)}")
-
-            # Add to dictionary
-            if i < len(filters):
-                filter_name = filters[i]
-                df_filter_dict[filter_name] = df_filter
-                self.log_info_message(
-                    f"✅ [PARSE_DATA] Added filter '{filter_name}' with shape {df_filter.shape}"
-                )
-            else:
-                self.log_warning_message(
-                    f"⚠️ [PARSE_DATA] Filter index {i} >= len(filters) {len(filters)}, skipping"
-                )
+        df_filter_dict = raw_data_index.get_filter_tables(filters)
+        for df_filter in df_filter_dict.values():
+            # Standardized 'Time' column in hours
+            df_filter.insert(0, "Time", df_filter.pop("time") / 3600)
 
         self.log_info_message(
-            f"\n✅ [PARSE_DATA] parse_data completed. Generated {len(df_filter_dict)} filter tables"
+            f"✅ [PARSE_DATA] parse_data completed. Generated {len(df_filter_dict)} filter tables"
         )
         return df_filter_dict
 
     def get_wells_cultivation(self, metadata: dict) -> list[str]:
         """Get cultivation wells from metadata."""
-        microplate = metadata.get("Microplate", {})
-        return microplate.get("CultivationLabels", [])
+        return get_wells_cultivation(metadata)
 
     def get_wells_reservoir(self, metadata: dict) -> list[str]:
         """Get reservoir wells from metadata."""
-        microplate = metadata.get("Microplate", {})
-        return microplate.get("ReservoirLabels", [])
+        return get_wells_reservoir(metadata)
 
     def get_wells(self, metadata: dict) -> list[str]:
         """Get all wells (cultivation + reservoir) from metadata."""
-        wells = []
-        wells.extend(self.get_wells_cultivation(metadata))
-        wells.extend(self.get_wells_reservoir(metadata))
-        return wells
+        return get_wells(metadata)
 
     def get_wells_label_description(
         self, metadata: dict, existing_plate_layout: dict | None = None
@@ -542,45 +556,7 @@ class BiolectorXTLoadData(Task):
         :param existing_plate_layout: Optional plate layout override
         :return: Dictionary mapping well IDs to their metadata
         """
-        # Create all possible wells A01 to F08
-        wells = [
-            f"{chr(letter)}{str(num).zfill(2)}"
-            for letter in range(ord("A"), ord("F") + 1)
-            for num in range(1, 9)
-        ]
-        wells_label = {well: {"label": ""} for well in wells}
-
-        # Get labels from metadata
-        microplate = metadata.get("Layout", {})
-        cultivation_map = microplate.get("CultivationLabelDescriptionsMap", {})
-        reservoir_map = microplate.get("ReservoirLabelDescriptionsMap", {})
-
-        for well, description in cultivation_map.items():
-            if well in wells_label:
-                wells_label[well] = {"label": description.strip() or wells_label[well]}
-
-        for well, description in reservoir_map.items():
-            if well in wells_label:
-                wells_label[well] = {"label": description.strip() or wells_label[well]}
-
-        # Override with plate layout if provided
-        if existing_plate_layout:
-            for well, data in existing_plate_layout.items():
-                # Normalize well ID (A1 → A01)
-                if len(well) == 2:
-                    well = f"{well[0]}0{well[1]}"
-                if well in wells_label and isinstance(data, dict):
-                    existing_data = (
-                        wells_label[well]
-                        if isinstance(wells_label[well], dict)
-                        else {"label": wells_label[well]}
-                    )
-                    if "label" in data:
-                        existing_data["label"] = data["label"]
-                    existing_data.update(data)
-                    wells_label[well] = existing_data
-
-        return wells_label
+        return get_wells_label_description(metadata, existing_plate_layout)
 
     def create_parsed_resource_set(
         self,
@@ -590,6 +566,9 @@ class BiolectorXTLoadData(Task):
         medium_table: Table | None = None,
         info_table: Table | None = None,
         plate_name: str = "plate_0",
+        raw_data_index: BiolectorRawDataIndex | None = None,
+        compact_mode: bool = False,
+        medium_mapping: PlateMediumMapping | None = None,
     ) -> ResourceSet:
         """
         Create a ResourceSet from parsed data with proper tagging.
@@ -602,6 +581,10 @@ class BiolectorXTLoadData(Task):
         :param medium_table: Optional table with medium compositions
         :param info_table: Optional table mapping wells to medium names
         :param plate_name: Name of the plate (e.g., "plate_0", "plate_1")
+        :param raw_data_index: Index of the raw data, retrieved from the cache if not provided
+        :param compact_mode: If True, convert the well tables to compact types (float32, categories)
+        :param medium_mapping: Well → medium → composition join of the plate, computed from
+            medium_table and info_table if not provided
         :return: ResourceSet containing one table per well
         """
         self.log_info_message(f"\n🏗️ [CREATE_RESOURCE_SET] Starting for plate: {plate_name}")
@@ -613,32 +596,18 @@ class BiolectorXTLoadData(Task):
         well_to_medium = {}
         medium_compositions = {}
 
-        if medium_table is not None and info_table is not None:
-            # Get DataFrames
-            medium_df = medium_table.get_data()
-            info_df = info_table.get_data()
-
-            # Normalize well IDs in info_table (A1 -> A01, etc.)
-            def normalize_well_id(well_id: str) -> str:
-                if len(well_id) == 2:
-                    return f"{well_id[0]}0{well_id[1]}"
-                return well_id
-
-            info_df["Well"] = info_df["Well"].apply(normalize_well_id)
-
-            # Create well -> medium name mapping
-            well_to_medium = dict(zip(info_df["Well"], info_df["Medium"], strict=False))
-
-            # Create medium name -> composition dict mapping
-            for _, row in medium_df.iterrows():
-                medium_name = row["Medium"]
-                composition = {col: row[col] for col in medium_df.columns if col != "Medium"}
-                medium_compositions[medium_name] = composition
-
-            # Medium data prepared for tagging
+        if medium_mapping is None and medium_table is not None and info_table is not None:
+            medium_mapping = MediumCompositionIndex(medium_table.get_data()).map_wells(
+                info_table.get_data()
+            )
+        if medium_mapping is not None:
+            well_to_medium = medium_mapping.get_well_to_medium()
+            medium_compositions = medium_mapping.get_medium_compositions()
 
         # Get parsed data (one DataFrame per filter/channel)
-        parsed_data: dict[str, DataFrame] = self.parse_data(data=data, metadata=metadata)
+        parsed_data: dict[str, DataFrame] = self.parse_data(
+            data=data, metadata=metadata, raw_data_index=raw_data_index
+        )
         self.log_info_message(
             f"📦 [CREATE_RESOURCE_SET] Parsed data contains {len(parsed_data)} filters: {list(parsed_data.keys())}"
         )
@@ -692,6 +661,12 @@ class BiolectorXTLoadData(Task):
             f"\n🔄 [CREATE_RESOURCE_SET] Creating tables for {len(well_columns)} wells..."
         )
         tables_created = 0
+        memory_before = 0
+        memory_after = 0
+
+        # Tag origins and column tags are the same for all the wells of the plate
+        origins = get_user_tag_origins()
+        column_tags_by_columns: dict[tuple[str, ...], list[dict[str, str]]] = {}
 
         for well in well_columns:
             # Convert well name from C01 format to C1 format (remove leading zero)
@@ -709,84 +684,42 @@ class BiolectorXTLoadData(Task):
 
             # Only create table if we have data (not all NaN)
             if not well_df.drop(columns=["Time"]).isna().all().all():
+                if compact_mode:
+                    memory_before += get_memory_usage(well_df)
+                    well_df = compact_dataframe(well_df, keep_columns=["Time"])
+                    memory_after += get_memory_usage(well_df)
+
                 table = Table(well_df)
                 table.name = well_clean  # Use clean name without leading zero
 
-                # Get user info for tag origins
-                user_id = (
-                    CurrentUserService.get_current_user().id
-                    if CurrentUserService.get_current_user()
-                    else None
-                )
-                origins = TagOrigins(TagOriginType.USER, user_id)
-
-                # Add column tags for proper column identification
-                # Tag Time column as index column (in hours)
-                table.add_column_tag_by_name("Time", "column_name", "Time")
-                table.add_column_tag_by_name("Time", "unit", "h")
-                table.add_column_tag_by_name("Time", "is_index_column", "true")
-
-                # Tag measurement columns as data columns
-                for col in table.column_names:
-                    if col != "Time":
-                        # This is a measurement column (Biomass, pH, pO2, etc.)
-                        table.add_column_tag_by_name(col, "column_name", col)
-                        table.add_column_tag_by_name(col, "is_data_column", "true")
-
-                # Add batch and sample tags only
-                # Batch is the plate name, sample is the well identifier
-                batch_tag = Tag(
-                    key="batch",
-                    value=plate_name,
-                    auto_parse=True,
-                    origins=origins,
-                    is_propagable=True,
-                )
-                sample_tag = Tag(
-                    key="sample",
-                    value=well_clean,
-                    auto_parse=True,  # Use clean name
-                    origins=origins,
-                    is_propagable=True,
-                )
-                table.tags._tags.extend([batch_tag, sample_tag])
-
-                # Add medium tag if medium data is available for this well
-                if well in well_to_medium:
-                    medium_name = well_to_medium[well]
-                    medium_composition = medium_compositions.get(medium_name, {})
-
-                    medium_tag = Tag(
-                        key="medium",
-                        value=medium_name,
-                        auto_parse=True,
-                        additional_info={"composed": medium_composition},
-                        origins=origins,
-                        is_propagable=True,
+                # Tag Time column as index column (in hours) and the measurement columns
+                # (Biomass, pH, pO2, etc.) as data columns
+                column_names = tuple(table.column_names)
+                if column_names not in column_tags_by_columns:
+                    column_tags_by_columns[column_names] = build_well_column_tags(
+                        list(column_names)
                     )
-                    table.tags._tags.append(medium_tag)
 
                 # Check if well is missing from plate_layout (only if plate_layout is provided)
-                if existing_plate_layout:
-                    # Try both formats: C01 and C1
-                    well_normalized = well  # C01 format
-                    well_short = well_clean  # C1 format
-
-                    has_plate_layout = (
-                        well_normalized in existing_plate_layout
-                        or well_short in existing_plate_layout
-                    )
-
-                    if not has_plate_layout:
-                        # Well is missing from plate_layout - add missing_value tag
-                        missing_tag = Tag(
-                            key="missing_value",
-                            value="plate_layout",
-                            auto_parse=True,
-                            origins=origins,
-                            is_propagable=True,
-                        )
-                        table.tags._tags.append(missing_tag)
+                # Try both formats: C01 and C1
+                missing_value = None
+                if existing_plate_layout and not (
+                    well in existing_plate_layout or well_clean in existing_plate_layout
+                ):
+                    missing_value = "plate_layout"
+
+                # Batch is the plate name, sample is the well identifier, medium tag is added
+                # if medium data is available for this well
+                medium_name = well_to_medium.get(well)
+                well_tags = build_well_tags(
+                    origins,
+                    batch=plate_name,
+                    sample=well_clean,
+                    medium_name=medium_name,
+                    medium_composition=medium_compositions.get(medium_name, {}),
+                    missing_value=missing_value,
+                )
+                apply_well_tags(table, column_tags_by_columns[column_names], well_tags)
 
                 resource_set.add_resource(table, well_clean)  # Use clean name
                 tables_created += 1
@@ -802,6 +735,10 @@ class BiolectorXTLoadData(Task):
         self.log_info_message(
             f"\n✅ [CREATE_RESOURCE_SET] Completed. Created {tables_created} tables in resource_set"
         )
+        if compact_mode:
+            self.log_info_message(
+                f"💾 [COMPACT] {format_memory_report(plate_name, memory_before, memory_after)}"
+            )
 
         # Create tables for missing wells (expected in metadata but no data in raw_data)
         wells_with_data = set(well_columns)
@@ -810,12 +747,9 @@ class BiolectorXTLoadData(Task):
 
         if missing_wells:
             self.log_info_message(f"\nCreating {len(missing_wells)} empty tables for missing wells")
-            user_id = (
-                CurrentUserService.get_current_user().id
-                if CurrentUserService.get_current_user()
-                else None
+            column_tags = build_well_column_tags(
+                ["Temps_en_h"], index_column="Temps_en_h", index_column_name="Temps"
             )
-            origins = TagOrigins(TagOriginType.USER, user_id)
 
             for well in sorted(missing_wells):
                 # Convert well name from C01 format to C1 format
@@ -826,76 +760,23 @@ class BiolectorXTLoadData(Task):
                 table = Table(empty_df)
                 table.name = well_clean
 
-                # Add column tags
-                table.add_column_tag_by_name("Temps_en_h", "column_name", "Temps")
-                table.add_column_tag_by_name("Temps_en_h", "unit", "h")
-                table.add_column_tag_by_name("Temps_en_h", "is_index_column", "true")
-
-                # Add batch and sample tags
-                batch_tag = Tag(
-                    key="batch",
-                    value="plate_0",
-                    auto_parse=True,
-                    origins=origins,
-                    is_propagable=True,
-                )
-                sample_tag = Tag(
-                    key="sample",
-                    value=well_clean,
-                    auto_parse=True,
-                    origins=origins,
-                    is_propagable=True,
+                # Also check plate_layout for this missing well (C01 and C1 formats)
+                missing_value = "raw_data"
+                if existing_plate_layout and not (
+                    well in existing_plate_layout or well_clean in existing_plate_layout
+                ):
+                    missing_value = "raw_data, plate_layout"
+
+                medium_name = well_to_medium.get(well)
+                well_tags = build_well_tags(
+                    origins,
+                    batch="plate_0",
+                    sample=well_clean,
+                    medium_name=medium_name,
+                    medium_composition=medium_compositions.get(medium_name, {}),
+                    missing_value=missing_value,
                 )
-                table.tags._tags.extend([batch_tag, sample_tag])
-
-                # Add medium tag if medium data is available for this well
-                if well in well_to_medium:
-                    medium_name = well_to_medium[well]
-                    medium_composition = medium_compositions.get(medium_name, {})
-
-                    medium_tag = Tag(
-                        key="medium",
-                        value=medium_name,
-                        auto_parse=True,
-                        additional_info={"composed": medium_composition},
-                        origins=origins,
-                        is_propagable=True,
-                    )
-                    table.tags._tags.append(medium_tag)
-
-                # Add missing_value tag for raw_data
-                missing_tag = Tag(
-                    key="missing_value",
-                    value="raw_data",
-                    auto_parse=True,
-                    origins=origins,
-                    is_propagable=True,
-                )
-                table.tags._tags.append(missing_tag)
-
-                # Also check plate_layout for this missing well
-                if existing_plate_layout:
-                    well_normalized = well  # C01 format
-                    well_short = well_clean  # C1 format
-
-                    has_plate_layout = (
-                        well_normalized in existing_plate_layout
-                        or well_short in existing_plate_layout
-                    )
-
-                    if not has_plate_layout:
-                        # Well is also missing from plate_layout - update tag
-                        table.tags._tags = [
-                            tag for tag in table.tags._tags if tag.key != "missing_value"
-                        ]
-                        combined_missing_tag = Tag(
-                            key="missing_value",
-                            value="raw_data, plate_layout",
-                            auto_parse=True,
-                            origins=origins,
-                            is_propagable=True,
-                        )
-                        table.tags._tags.append(combined_missing_tag)
+                apply_well_tags(table, column_tags, well_tags)
 
                 resource_set.add_resource(table, well_clean)
 
@@ -907,6 +788,7 @@ class BiolectorXTLoadData(Task):
         existing_plate_layout: dict | None = None,
         medium_table: Table | None = None,
         info_table: Table | None = None,
+        medium_mapping: PlateMediumMapping | None = None,
     ) -> Table:
         """
         Create a metadata table for machine learning purposes.
@@ -918,46 +800,25 @@ class BiolectorXTLoadData(Task):
         :param existing_plate_layout: Optional plate layout with well metadata (legacy)
         :param medium_table: Optional table with medium compositions
         :param info_table: Optional table mapping wells to medium names
+        :param medium_mapping: Well → medium → composition join of the plate, computed from
+            medium_table and info_table if not provided
         :return: Table with metadata for ML feature extraction
         """
 
         metadata_rows = []
+        metadata_df: DataFrame | None = None
 
-        # If medium_table and info_table are provided, use them
-        if medium_table is not None and info_table is not None:
-            self.log_info_message("Creating metadata table from medium_table and info_table...")
-
-            # Get dataframes
-            medium_df = medium_table.get_data()
-            info_df = info_table.get_data()
-
-            # Normalize well identifiers in info_df to C1 format (C01 → C1, C10 → C10, A1 → A1, A01 → A1)
-            def normalize_well_id(well_id):
-                """Normalize well ID to format like A1, C1, C10, etc. (without leading zero)."""
-                well_id = str(well_id).strip()
-                if len(well_id) >= 2:
-                    # Extract letter and number parts
-                    letter = well_id[0]
-                    number_str = well_id[1:]
-                    # Convert to int and back to string to remove leading zeros
-                    return f"{letter}{int(number_str)}"
-                return well_id
-
-            # Create a copy to avoid modifying the original
-            info_df_normalized = info_df.copy()
-            info_df_normalized["Well"] = info_df_normalized["Well"].apply(normalize_well_id)
-
-            # Create a mapping from well to medium name
-            well_to_medium = dict(
-                zip(info_df_normalized["Well"], info_df_normalized["Medium"], strict=False)
+        if medium_mapping is None and medium_table is not None and info_table is not None:
+            medium_mapping = MediumCompositionIndex(medium_table.get_data()).map_wells(
+                info_table.get_data()
             )
 
-            # Identify info columns (all columns except Well and Medium)
-            # Keep all info columns including string columns (compound, label, etc.)
-            info_columns = [
-                col for col in info_df_normalized.columns if col not in ["Well", "Medium"]
-            ]
+        # If medium_table and info_table are provided, use them
+        if medium_mapping is not None:
+            self.log_info_message("Creating metadata table from medium_table and info_table...")
 
+            series: list[str] = []
+            wells: list[str] = []
             for well_name, table in resource_set.get_resources().items():
                 if not isinstance(table, Table):
                     continue
@@ -965,58 +826,13 @@ class BiolectorXTLoadData(Task):
                 # Extract plate_name from batch tag
                 batch_tags = table.tags.get_by_key("batch")
                 plate_name = batch_tags[0].value if batch_tags else "plate_0"
+                series.append(f"{plate_name}_{well_name}")
+                wells.append(well_name)
 
-                # Initialize row with Series identifier
-                metadata_row = {"Series": f"{plate_name}_{well_name}"}
-
-                # Get medium name for this well
-                medium_name = well_to_medium.get(well_name)
-
-                if medium_name:
-                    # Get medium composition from medium_table
-                    medium_row = medium_df[medium_df["Medium"] == medium_name]
-
-                    if not medium_row.empty:
-                        # Add all medium composition columns (except 'Medium' column)
-                        for col in medium_df.columns:
-                            if col != "Medium":
-                                value = medium_row.iloc[0][col]
-                                metadata_row[col] = value
-
-                # Add info columns from info_table
-                info_row = info_df_normalized[info_df_normalized["Well"] == well_name]
-                for col in info_columns:
-                    if not info_row.empty:
-                        value = info_row.iloc[0][col]
-                        # Fill missing values: 0 for numeric, NaN for non-numeric
-                        if pd.isna(value) or value == "":
-                            # Try to infer if column is numeric
-                            try:
-                                float_val = float(value)
-                                metadata_row[col] = 0
-                            except (ValueError, TypeError):
-                                metadata_row[col] = np.nan
-                        else:
-                            # Try to convert to numeric, else keep as is
-                            try:
-                                metadata_row[col] = float(value)
-                            except (ValueError, TypeError):
-                                metadata_row[col] = value
-                    else:
-                        # No info for this well: fill missing
-                        # Try to infer if column is numeric from all values in info_df
-                        col_vals = info_df_normalized[col].dropna().astype(str)
-                        is_numeric = False
-                        for v in col_vals:
-                            try:
-                                float(v)
-                                is_numeric = True
-                                break
-                            except ValueError:
-                                continue
-                        metadata_row[col] = 0 if is_numeric else np.nan
-
-                metadata_rows.append(metadata_row)
+            # Medium composition and info columns of all the wells in one go
+            if wells:
+                metadata_df = medium_mapping.get_metadata(wells)
+                metadata_df.insert(0, "Series", series)
 
         else:
             # Legacy mode: use plate_layout
@@ -1054,12 +870,13 @@ class BiolectorXTLoadData(Task):
                 metadata_rows.append(metadata_row)
 
         # Create DataFrame
-        if not metadata_rows:
+        if metadata_df is None and metadata_rows:
+            metadata_df = pd.DataFrame(metadata_rows)
+
+        if metadata_df is None:
             # Return empty table if no data
             metadata_df = pd.DataFrame()
         else:
-            metadata_df = pd.DataFrame(metadata_rows)
-
             # Get list of medium composition columns (from medium_table if provided)
             medium_columns = set()
             if medium_table is not None:
@@ -1112,6 +929,98 @@ class BiolectorXTLoadData(Task):
 
         return metadata_table
 
+    def parse_plates(
+        self,
+        plates_inputs: list[tuple[Table, Folder, Table | None]],
+        plate_names: list[str],
+        max_workers: int = 1,
+        run_cache: BiolectorRunCache | None = None,
+    ) -> list[ParsedPlate]:
+        """
+        Load the metadata file and parse the raw data of each plate.
+
+        With more than one worker, the plates are parsed concurrently in a process pool. The
+        results are always returned in plate order so the outputs do not depend on the number
+        of workers.
+
+        :param plates_inputs: The (raw_data, folder_metadata, info_table) of each plate
+        :param plate_names: The name of each plate
+        :param max_workers: Maximum number of worker processes, 1 to parse the plates sequentially
+        :param run_cache: Optional on-disk cache, the plates found in it are not parsed and the
+            parsed plates are stored in it
+        :return: The metadata and parsed raw data of each plate, in plate order
+        """
+        if run_cache is None:
+            return self._parse_plates(plates_inputs, plate_names, max_workers)
+
+        # the plates of the run cache are put in the BiolectorRawDataIndex cache, the parsing
+        # finds them there
+        cache_keys = [
+            BiolectorRawDataIndex.get_table_cache_key(raw_data) for raw_data, _, _ in plates_inputs
+        ]
+        plate_indexes_to_store: list[int] = []
+        for plate_idx, cache_key in enumerate(cache_keys):
+            if BiolectorRawDataIndex.get_from_cache(cache_key) is not None:
+                continue
+            raw_data_index = run_cache.open_raw_data_index(cache_key)
+            if raw_data_index is None:
+                plate_indexes_to_store.append(plate_idx)
+            else:
+                BiolectorRawDataIndex.add_to_cache(cache_key, raw_data_index)
+                self.log_info_message(f"Loaded {plate_names[plate_idx]} from the run cache")
+
+        parsed_plates = self._parse_plates(plates_inputs, plate_names, max_workers)
+        for plate_idx in plate_indexes_to_store:
+            parsed_plate = parsed_plates[plate_idx]
+            run_cache.write(
+                cache_keys[plate_idx], parsed_plate.raw_data_index, parsed_plate.metadata
+            )
+        return parsed_plates
+
+    def _parse_plates(
+        self,
+        plates_inputs: list[tuple[Table, Folder, Table | None]],
+        plate_names: list[str],
+        max_workers: int,
+    ) -> list[ParsedPlate]:
+        nb_plates = len(plates_inputs)
+
+        def log_plate_parsed(plate_idx: int, nb_parsed: int) -> None:
+            self.update_progress_value(
+                nb_parsed / nb_plates * 50,
+                f"Parsed {plate_names[plate_idx]} ({nb_parsed}/{nb_plates} plates)",
+            )
+
+        if max_workers <= 1 or nb_plates <= 1:
+            parsed_plates: list[ParsedPlate] = []
+            for plate_idx, (raw_data, folder_metadata, _) in enumerate(plates_inputs):
+                parsed_plates.append(
+                    ParsedPlate(
+                        folder_metadata=load_plate_metadata(
+                            folder_metadata.path, plate_names[plate_idx]
+                        ),
+                        raw_data_index=BiolectorRawDataIndex.from_table(raw_data),
+                    )
+                )
+                log_plate_parsed(plate_idx, plate_idx + 1)
+            return parsed_plates
+
+        self.log_info_message(
+            f"Parsing {nb_plates} plates with {min(max_workers, nb_plates)} worker processes"
+        )
+        return parse_plates_in_parallel(
+            [
+                (raw_data.get_data(), folder_metadata.path, plate_names[plate_idx])
+                for plate_idx, (raw_data, folder_metadata, _) in enumerate(plates_inputs)
+            ],
+            max_workers,
+            on_plate_parsed=log_plate_parsed,
+            cache_keys=[
+                BiolectorRawDataIndex.get_table_cache_key(raw_data)
+                for raw_data, _, _ in plates_inputs
+            ],
+        )
+
     def run(self, params: ConfigParams, inputs: TaskInputs) -> TaskOutputs:
         """
         Execute the BiolectorXT data loading and processing.
@@ -1197,7 +1106,10 @@ class BiolectorXTLoadData(Task):
             plate_names = [f"plate_{i}" for i in range(num_actual_plates)]
             self.log_info_message(f"Using default plate names: {plate_names}")
 
-        # Process each plate
+        compact_mode: bool = params.get_value("compact_mode")
+        max_workers: int = params.get_value("max_workers")
+        long_format_table: bool = params.get_value("long_format_table")
+        run_cache = BiolectorRunCache() if params.get_value("use_run_cache") else None
 
         # Initialize combined outputs
         all_resource_sets = []
@@ -1205,14 +1117,11 @@ class BiolectorXTLoadData(Task):
         all_medium_info_wells = set()
         all_raw_data_wells = set()
         all_metadata_dfs = []
+        all_long_format_dfs = []
 
-        # Process each plate
+        # Get the inputs of each plate
+        plates_inputs: list[tuple[Table, Folder, Table | None]] = []
         for plate_idx, plate_resource_set in enumerate(actual_plates):
-            plate_name = plate_names[plate_idx]
-            self.log_info_message(f"\n{'=' * 80}")
-            self.log_info_message(f"PROCESSING {plate_name.upper()}")
-            self.log_info_message(f"{'=' * 80}")
-
             # Extract resources from ResourceSet
             if not isinstance(plate_resource_set, ResourceSet):
                 raise Exception(
@@ -1236,29 +1145,34 @@ class BiolectorXTLoadData(Task):
                     f"Found: {list(plate_resource_set.get_resources().keys())}"
                 )
 
-            # Load metadata file
+            plates_inputs.append((raw_data, folder_metadata, info_table))
 
-            # Load metadata
-            metadata: dict | None = None
-            for file_name in os.listdir(folder_metadata.path):
-                if file_name.endswith("BXT.json"):
-                    file_path = os.path.join(folder_metadata.path, file_name)
-                    try:
-                        with open(file_path, encoding="UTF-8") as json_file:
-                            metadata = json.load(json_file)
+        # Load the metadata and parse the raw data of the plates (in parallel if max_workers > 1)
+        parsed_plates = self.parse_plates(plates_inputs, plate_names, max_workers, run_cache)
 
-                    except Exception as e:
-                        raise Exception(
-                            f"Error while reading the metadata file {file_name}: {e}"
-                        ) from e
+        # Medium compositions are computed once for all the plates
+        medium_index: MediumCompositionIndex | None = None
+        if medium_table is not None:
+            medium_index = MediumCompositionIndex(medium_table.get_data())
 
-            if metadata is None:
-                raise Exception(
-                    f"No metadata file found in the provided folder for {plate_name}. "
-                    "The folder must contain a file that ends with 'BXT.json'"
+        # Process each plate
+        for plate_idx, (raw_data, _, info_table) in enumerate(plates_inputs):
+            plate_name = plate_names[plate_idx]
+            self.log_info_message(f"\n{'=' * 80}")
+            self.log_info_message(f"PROCESSING {plate_name.upper()}")
+            self.log_info_message(f"{'=' * 80}")
+
+            metadata = parsed_plates[plate_idx].metadata
+            if parsed_plates[plate_idx].folder_metadata.is_ambiguous():
+                self.log_warning_message(
+                    f"⚠️ {plate_name}: "
+                    + parsed_plates[plate_idx].folder_metadata.get_ambiguity_message()
                 )
 
-            # Parse data for this plate
+            # Well → medium → composition join, shared by the well tags and the metadata table
+            medium_mapping: PlateMediumMapping | None = None
+            if medium_index is not None and info_table is not None:
+                medium_mapping = medium_index.map_wells(info_table.get_data())
 
             # Create parsed resource set for this plate
             self.log_info_message(f"Parsing BiolectorXT data for {plate_name}...")
@@ -1269,14 +1183,30 @@ class BiolectorXTLoadData(Task):
                 medium_table=medium_table,
                 info_table=info_table,
                 plate_name=plate_name,
+                raw_data_index=parsed_plates[plate_idx].raw_data_index,
+                compact_mode=compact_mode,
+                medium_mapping=medium_mapping,
             )
 
             # Copy download tags from raw data
             resource_set.tags.add_tags(raw_data.tags.get_by_key(DOWNLOAD_TAG_KEY))
 
+            if long_format_table:
+                raw_data_index = parsed_plates[plate_idx].raw_data_index
+                # the long format is built from the cached tables, they are only read
+                all_long_format_dfs.append(
+                    build_long_format_data(
+                        plate_name, raw_data_index.get_filter_pivots(self.get_filters(metadata))
+                    )
+                )
+
             self.log_success_message(
                 f"Created {len(resource_set.get_resources())} parsed tables for {plate_name}"
             )
+            self.update_progress_value(
+                50 + (plate_idx + 1) / num_actual_plates * 40,
+                f"Created the tables of {plate_name} ({plate_idx + 1}/{num_actual_plates} plates)",
+            )
 
             # Collect for combined outputs
             all_resource_sets.append(resource_set)
@@ -1291,20 +1221,8 @@ class BiolectorXTLoadData(Task):
             # Wells with medium info (from info_table if provided)
             medium_info_wells = set()
             if info_table is not None:
-                info_df = info_table.get_data()
-
                 # Normalize well IDs to C1 format (remove leading zeros)
-                def normalize_well_id(well_id):
-                    """Convert to C1 format: C01 → C1, C10 → C10, A1 → A1"""
-                    if isinstance(well_id, str) and len(well_id) >= 2:
-                        letter = well_id[0]
-                        number_str = well_id[1:]
-                        return f"{letter}{int(number_str)}"
-                    return well_id
-
-                info_df_normalized = info_df.copy()
-                info_df_normalized["Well"] = info_df_normalized["Well"].apply(normalize_well_id)
-                medium_info_wells = set(info_df_normalized["Well"].unique())
+                medium_info_wells = set(to_short_well_ids(info_table.get_data()["Well"]).unique())
             # Add plate prefix to medium info wells (convert C01 to C1 format)
             for well in medium_info_wells:
                 well_c1 = f"{well[0]}{int(well[1:])}" if len(well) > 1 else well
@@ -1318,7 +1236,7 @@ class BiolectorXTLoadData(Task):
 
             # Create metadata table for this plate and collect it
             plate_metadata_table = self.create_metadata_table(
-                resource_set, None, medium_table, info_table
+                resource_set, None, medium_table, info_table, medium_mapping=medium_mapping
             )
             all_metadata_dfs.append(plate_metadata_table.get_data())
 
@@ -1408,6 +1326,16 @@ class BiolectorXTLoadData(Task):
             "metadata_table": metadata_table,
         }
 
+        if long_format_table:
+            long_format_df = concat_long_format_data(all_long_format_dfs)
+            if compact_mode:
+                long_format_df = compact_dataframe(long_format_df, keep_columns=["Time"])
+            long_format_data_table = Table(long_format_df)
+            long_format_data_table.name = "BiolectorXT long format data"
+            long_format_data_table.add_column_tag_by_name("Time", "unit", "h")
+            outputs["long_format_table"] = long_format_data_table
+            self.log_success_message(f"Long format table created with {len(long_format_df)} values")
+
         # Add medium_table to outputs if provided as input
         if medium_table is not None:
             # Replace NaN values in numeric columns with 0
@@ -0,0 +1,184 @@
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+
+LONG_FORMAT_COLUMNS = ["Plate", "Well", "Channel", "Time", "Value"]
+
+
+def get_short_well_name(well: str) -> str:
+    """Convert a well name from C01 format to C1 format, the format of the well resource names."""
+    row_label = well.rstrip("0123456789")
+    col = well[len(row_label) :]
+    return f"{row_label}{int(col)}" if row_label and col else well
+
+
+def build_long_format_data(plate_name: str, filter_tables: dict[str, DataFrame]) -> DataFrame:
+    """
+    Build the long-format data of a plate: one row per measured value.
+
+    Like in the well tables of BiolectorXTLoadData, the channels are aligned by cycle and the time
+    of a cycle is the time of the first channel. Missing values are not stored, wells without any
+    value have no row.
+
+    :param plate_name: Name of the plate
+    :param filter_tables: The wide table of each channel, with the 'time' column (in seconds) first
+        and one column per well, see `BiolectorRawDataIndex.get_filter_pivots`. The tables are only
+        read, they can be the cached tables of the index
+    :return: DataFrame with the Plate, Well (C1 format), Channel, Time (in hours) and Value columns,
+        sorted by well, channel and time
+    """
+    plate_parts: list[DataFrame] = []
+    times: np.ndarray | None = None
+    for channel, filter_table in filter_tables.items():
+        # one copy of the table, the time column is the first column
+        table_values = filter_table.to_numpy(dtype=np.float64)
+        if times is None:
+            times = table_values[:, 0] / 3600
+        wells = [str(col) for col in filter_table.columns[1:]]
+        # cycles after the last cycle of the first channel are not in the well tables
+        values = table_values[: len(times), 1:]
+
+        # values are stored cycle x well, transpose to get the rows well by well
+        well_codes, cycles = np.nonzero(~np.isnan(values.T))
+        plate_parts.append(
+            DataFrame(
+                {
+                    "Well": pd.Categorical.from_codes(
+                        well_codes, categories=[get_short_well_name(well) for well in wells]
+                    ),
+                    "Channel": channel,
+                    "Time": times[cycles],
+                    "Value": values[cycles, well_codes],
+                }
+            )
+        )
+
+    if not plate_parts:
+        return DataFrame({col: [] for col in LONG_FORMAT_COLUMNS})
+
+    plate_data = pd.concat(plate_parts, ignore_index=True)
+    plate_data.insert(0, "Plate", plate_name)
+    # stable sort keeps the time order within each well/channel
+    plate_data = plate_data.sort_values(by="Well", kind="stable", ignore_index=True)
+    return plate_data
+
+
+def concat_long_format_data(plates_data: list[DataFrame]) -> DataFrame:
+    """
+    Concatenate the long-format data of several plates.
+
+    Plate, Well and Channel are stored as categories, in the order of the plates (and of the
+    wells and channels in the plates).
+
+    :param plates_data: The long-format data of each plate, see `build_long_format_data`
+    :return: The long-format data of all the plates
+    """
+    if not plates_data:
+        return DataFrame({col: [] for col in LONG_FORMAT_COLUMNS})
+
+    data = pd.concat(plates_data, ignore_index=True)
+    for col in ["Plate", "Well", "Channel"]:
+        values = data[col].astype(str)
+        data[col] = pd.Categorical(values, categories=list(dict.fromkeys(values)))
+    return data[LONG_FORMAT_COLUMNS]
+
+
+def pivot_long_format_data(data: DataFrame, channel: str) -> DataFrame:
+    """
+    Get the values of a channel with one column per plate/well, from the long-format data.
+
+    :param data: The long-format data, see `concat_long_format_data`
+    :param channel: The channel to extract
+    :return: DataFrame with the Time column (sorted) and one column per well named Plate_Well,
+        in the order of the long-format data. NaN when a well has no value at a time
+    """
+    channel_data = data[data["Channel"].astype(str) == channel]
+    channel_data = channel_data[channel_data["Time"].notna()]
+    if channel_data.empty:
+        return DataFrame({"Time": []})
+    series = channel_data["Plate"].astype(str) + "_" + channel_data["Well"].astype(str)
+
+    pivot = DataFrame(
+        {"Time": channel_data["Time"], "Series": series, "Value": channel_data["Value"]}
+    ).pivot_table(index="Time", columns="Series", values="Value", aggfunc="first", sort=True)
+    pivot = pivot.reindex(columns=list(dict.fromkeys(series)))
+    pivot.columns.name = None
+    return pivot.reset_index()
+
+
+class BiolectorLongFormatView:
+    """
+    Lightweight view of the long-format data (Plate, Well, Channel, Time, Value) with access by
+    plate, well and channel, without splitting the data into one table per well.
+
+    The rows of each plate/well/channel are indexed once, analysis steps select them with numpy
+    indexing instead of filtering the whole table for each well.
+    """
+
+    data: DataFrame
+    # (plate, well, channel) -> row positions in data, in data order
+    _group_indices: dict[tuple[str, str, str], np.ndarray]
+
+    def __init__(self, data: DataFrame) -> None:
+        """
+        :param data: The long-format data, see `concat_long_format_data`
+        """
+        self.data = data
+        self._group_indices = {
+            (str(plate), str(well), str(channel)): indices
+            for (plate, well, channel), indices in data.groupby(
+                ["Plate", "Well", "Channel"], sort=False, observed=True
+            ).indices.items()
+        }
+
+    def get_wells(self) -> list[tuple[str, str]]:
+        """Get the (plate, well) pairs with values, in the order of the data."""
+        return list(dict.fromkeys((plate, well) for plate, well, _ in self._group_indices))
+
+    def get_channels(self) -> list[str]:
+        """Get the channels with values, in the order of the data."""
+        return list(dict.fromkeys(channel for _, _, channel in self._group_indices))
+
+    def get_values(self, plate: str, well: str, channel: str) -> DataFrame:
+        """
+        Get the values of a channel of a well.
+
+        :param plate: The plate name
+        :param well: The well name in C1 format
+        :param channel: The channel name
+        :return: DataFrame with the Time and Value columns, empty if the well has no value
+        """
+        indices = self._group_indices.get((plate, well, channel), np.empty(0, dtype=np.intp))
+        return self.data.iloc[indices][["Time", "Value"]].reset_index(drop=True)
+
+    def get_well_data(self, plate: str, well: str) -> DataFrame:
+        """
+        Get the data of a well in the shape of the well tables of BiolectorXTLoadData.
+
+        :param plate: The plate name
+        :param well: The well name in C1 format
+        :return: DataFrame with the Time column then one column per channel, one row per time
+        """
+        well_data = self.select_wells([(plate, well)])
+        wide_data = well_data.pivot_table(
+            index="Time", columns="Channel", values="Value", aggfunc="first", observed=True
+        )
+        wide_data.columns = [str(col) for col in wide_data.columns]
+        return wide_data.reset_index()
+
+    def select_wells(self, wells: list[tuple[str, str]]) -> DataFrame:
+        """
+        Get the rows of some wells, in the order of the data.
+
+        :param wells: The (plate, well) pairs to select, wells without values are ignored
+        :return: The long-format rows of the wells, with a new index
+        """
+        selected_wells = set(wells)
+        indices = [
+            group_indices
+            for (plate, well, _), group_indices in self._group_indices.items()
+            if (plate, well) in selected_wells
+        ]
+        if not indices:
+            return self.data.iloc[[]].reset_index(drop=True)
+        return self.data.iloc[np.sort(np.concatenate(indices))].reset_index(drop=True)
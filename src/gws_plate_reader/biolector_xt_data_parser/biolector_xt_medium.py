@@ -0,0 +1,139 @@
+import numpy as np
+import pandas as pd
+from pandas import DataFrame, Series
+
+MEDIUM_COLUMN = "Medium"
+WELL_COLUMN = "Well"
+
+_WELL_ID_PATTERN = r"^([A-Za-z])0*(\d+)$"
+
+
+def to_short_well_ids(wells: Series) -> Series:
+    """
+    Normalize well IDs to the format without leading zero (C01 → C1, C10 → C10, A1 → A1).
+
+    Values that are not well IDs are returned as stripped strings.
+    """
+    wells = wells.astype(str).str.strip()
+    parts = wells.str.extract(_WELL_ID_PATTERN)
+    return (parts[0] + parts[1]).fillna(wells)
+
+
+def to_long_well_ids(wells: Series) -> Series:
+    """
+    Normalize well IDs to the format with 2 digits (C1 → C01, C10 → C10, A01 → A01).
+
+    Values that are not well IDs are returned as stripped strings.
+    """
+    wells = wells.astype(str).str.strip()
+    parts = wells.str.extract(_WELL_ID_PATTERN)
+    return (parts[0] + parts[1].str.zfill(2)).fillna(wells)
+
+
+class MediumCompositionIndex:
+    """
+    Compositions of the media of a medium table, computed once and shared by all the plates
+    that use the same medium table.
+
+    When a medium is defined on several rows, the first row is used.
+    """
+
+    medium_columns: list[str]
+    # composition columns indexed by medium name
+    compositions: DataFrame
+    _compositions_dict: dict[str, dict] | None
+
+    def __init__(self, medium_df: DataFrame) -> None:
+        self.medium_columns = [col for col in medium_df.columns if col != MEDIUM_COLUMN]
+        self.compositions = medium_df.drop_duplicates(subset=MEDIUM_COLUMN).set_index(
+            MEDIUM_COLUMN
+        )[self.medium_columns]
+        self._compositions_dict = None
+
+    def get_compositions(self) -> dict[str, dict]:
+        """Get the composition of each medium, by medium name."""
+        if self._compositions_dict is None:
+            self._compositions_dict = self.compositions.to_dict(orient="index")
+        return self._compositions_dict
+
+    def map_wells(self, info_df: DataFrame) -> "PlateMediumMapping":
+        """
+        Join the wells of a plate info table with the medium compositions.
+
+        :param info_df: The info table of the plate, with the Well and Medium columns
+        :return: The medium mapping of the plate
+        """
+        return PlateMediumMapping(self, info_df)
+
+
+class PlateMediumMapping:
+    """
+    Well → medium → composition join of a plate, computed with one merge and shared by the
+    well table tags and the metadata table.
+    """
+
+    composition_index: MediumCompositionIndex
+    info_columns: list[str]
+    # one row per well (first row of the info table), indexed by well ID without leading zero,
+    # with the Medium column, the info columns and the medium composition columns
+    wells: DataFrame
+
+    def __init__(self, composition_index: MediumCompositionIndex, info_df: DataFrame) -> None:
+        self.composition_index = composition_index
+        self.info_columns = [
+            col for col in info_df.columns if col not in [WELL_COLUMN, MEDIUM_COLUMN]
+        ]
+
+        # the info table is not modified
+        wells = info_df.assign(**{WELL_COLUMN: to_short_well_ids(info_df[WELL_COLUMN])})
+        wells = wells.drop_duplicates(subset=WELL_COLUMN).set_index(WELL_COLUMN)
+        compositions = composition_index.compositions
+        # composition columns that are also info columns are taken from the info table
+        composition_columns = [col for col in compositions.columns if col not in wells.columns]
+        self.wells = wells.join(compositions[composition_columns], on=MEDIUM_COLUMN)
+
+    def get_well_to_medium(self) -> dict[str, str]:
+        """Get the medium of each well, by well ID with 2 digits (e.g. C01)."""
+        long_well_ids = to_long_well_ids(self.wells.index.to_series())
+        return dict(zip(long_well_ids, self.wells[MEDIUM_COLUMN], strict=True))
+
+    def get_medium_compositions(self) -> dict[str, dict]:
+        """Get the composition of each medium, by medium name."""
+        return self.composition_index.get_compositions()
+
+    def get_metadata(self, wells: list[str]) -> DataFrame:
+        """
+        Get the medium composition and info columns of wells, for the ML metadata table.
+
+        Medium composition columns are NaN for wells without known medium. Info values are
+        converted to numbers when possible, missing values are 0 and empty strings are NaN.
+        Wells that are not in the info table get 0 for numeric info columns and NaN otherwise.
+
+        :param wells: The well IDs without leading zero (e.g. C1)
+        :return: DataFrame with one row per well, the composition then the info columns
+        """
+        medium_columns = self.composition_index.medium_columns
+        composition_columns = [col for col in medium_columns if col not in self.info_columns]
+        well_rows = self.wells.reindex(wells)
+        metadata = well_rows[composition_columns].reset_index(drop=True)
+
+        is_known_well = Series(np.isin(wells, self.wells.index))
+        for col in self.info_columns:
+            values = _convert_info_values(well_rows[col].reset_index(drop=True))
+            missing_value = 0 if _has_numeric_value(self.wells[col]) else np.nan
+            metadata[col] = values.where(is_known_well, missing_value)
+        return metadata
+
+
+def _convert_info_values(values: Series) -> Series:
+    """Convert the info values to numbers when possible, NaN → 0 and empty string → NaN."""
+    numeric_values = pd.to_numeric(values, errors="coerce").astype(np.float64)
+    converted = values.astype(object).where(numeric_values.isna(), numeric_values)
+    converted = converted.mask(values.isna(), 0)
+    converted = converted.mask(values.astype(str) == "", np.nan)
+    return converted.infer_objects()
+
+
+def _has_numeric_value(values: Series) -> bool:
+    """Check if at least one value of the column can be converted to a number."""
+    return bool(pd.to_numeric(values.dropna().astype(str), errors="coerce").notna().any())
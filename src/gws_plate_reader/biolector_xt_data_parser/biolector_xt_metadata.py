@@ -0,0 +1,214 @@
+import json
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+from gws_plate_reader.biolector_xt_data_parser.biolector_xt_pivot import get_plate_wells
+
+
+# Keys of the BXT metadata used by the parsers, the other keys (protocol details) are not kept
+METADATA_KEYS = [
+    "Channels",
+    "Microplate",
+    "Layout",
+    "Name",
+    "Comment",
+    "UserName",
+    "LastModifiedAt",
+]
+METADATA_FILE_SUFFIX = "BXT.json"
+
+
+@dataclass
+class FolderMetadata:
+    """BXT metadata files of a folder and the metadata of the selected file."""
+
+    folder_path: str
+    # names of the files that end with 'BXT.json', in sorted order
+    file_names: list[str]
+    # the last file in sorted order, None if the folder has no metadata file
+    selected_file_name: str | None
+    metadata: dict | None
+
+    def is_ambiguous(self) -> bool:
+        """Check if the folder has several metadata files."""
+        return len(self.file_names) > 1
+
+    def get_ambiguity_message(self) -> str:
+        """Get a message describing the metadata files of an ambiguous folder."""
+        return (
+            f"{len(self.file_names)} metadata files found in the folder ({self.file_names}), "
+            f"using '{self.selected_file_name}'"
+        )
+
+
+class BiolectorMetadataIndex:
+    """
+    Index of the BXT metadata files, shared by the BiolectorXT tasks.
+
+    A folder is scanned once per call, and each metadata file is parsed only when its size or
+    modification time changed since the last parsing. Only the keys used by the parsers
+    (METADATA_KEYS) are kept in the cache.
+
+    The cached metadata is shared between the callers and must not be modified.
+    """
+
+    CACHE_MAX_SIZE = 64
+
+    # file path -> (size, modification time in ns, metadata)
+    _cache: "OrderedDict[str, tuple[int, int, dict]]" = OrderedDict()
+    _cache_lock = threading.Lock()
+
+    @classmethod
+    def get_folder_metadata(cls, folder_path: str) -> FolderMetadata:
+        """
+        Find the metadata files of a folder and load the metadata of the selected file.
+
+        When the folder has several metadata files, the last one in sorted order is selected,
+        use `FolderMetadata.is_ambiguous` to report it.
+
+        :param folder_path: Path of the metadata folder
+        :return: The metadata files of the folder and the metadata of the selected file
+        """
+        with os.scandir(folder_path) as entries:
+            metadata_entries = sorted(
+                (
+                    entry
+                    for entry in entries
+                    if entry.name.endswith(METADATA_FILE_SUFFIX) and entry.is_file()
+                ),
+                key=lambda entry: entry.name,
+            )
+
+        if not metadata_entries:
+            return FolderMetadata(folder_path, [], None, None)
+
+        selected_entry = metadata_entries[-1]
+        return FolderMetadata(
+            folder_path=folder_path,
+            file_names=[entry.name for entry in metadata_entries],
+            selected_file_name=selected_entry.name,
+            metadata=cls.load_metadata(selected_entry.path, selected_entry.stat()),
+        )
+
+    @classmethod
+    def load_metadata(cls, file_path: str, file_stat: os.stat_result | None = None) -> dict:
+        """
+        Load the metadata of a BXT metadata file, from the cache if the file did not change.
+
+        :param file_path: Path of the metadata file
+        :param file_stat: Stat of the file if already known
+        :return: The metadata, with only the keys used by the parsers
+        """
+        file_stat = file_stat or os.stat(file_path)
+        with cls._cache_lock:
+            cached = cls._cache.get(file_path)
+            if cached is not None and cached[:2] == (file_stat.st_size, file_stat.st_mtime_ns):
+                cls._cache.move_to_end(file_path)
+                return cached[2]
+
+        try:
+            with open(file_path, encoding="UTF-8") as json_file:
+                content = json.load(json_file)
+        except Exception as e:
+            raise Exception(
+                f"Error while reading the metadata file {os.path.basename(file_path)}: {e}"
+            ) from e
+        metadata = {key: content[key] for key in METADATA_KEYS if key in content}
+
+        with cls._cache_lock:
+            cls._cache[file_path] = (file_stat.st_size, file_stat.st_mtime_ns, metadata)
+            cls._cache.move_to_end(file_path)
+            while len(cls._cache) > cls.CACHE_MAX_SIZE:
+                cls._cache.popitem(last=False)
+        return metadata
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Remove all the metadata from the cache."""
+        with cls._cache_lock:
+            cls._cache.clear()
+
+
+def load_metadata_file(folder_path: str) -> dict | None:
+    """
+    Load the BXT metadata from the file of the folder that ends with 'BXT.json'.
+
+    :param folder_path: Path of the metadata folder
+    :return: The BXT metadata, None if the folder does not contain a metadata file
+    """
+    return BiolectorMetadataIndex.get_folder_metadata(folder_path).metadata
+
+
+def get_filters(metadata: dict) -> list[str]:
+    """
+    Get the names of the measurement filters/channels from the BXT metadata.
+
+    :param metadata: The BXT metadata
+    :return: The filter names, in the order of the metadata channels
+    """
+    return [channel["Name"] for channel in metadata.get("Channels", [])]
+
+
+def get_wells_cultivation(metadata: dict) -> list[str]:
+    """Get the cultivation wells from the BXT metadata."""
+    return metadata.get("Microplate", {}).get("CultivationLabels", [])
+
+
+def get_wells_reservoir(metadata: dict) -> list[str]:
+    """Get the reservoir wells from the BXT metadata."""
+    return metadata.get("Microplate", {}).get("ReservoirLabels", [])
+
+
+def get_wells(metadata: dict) -> list[str]:
+    """Get all wells (cultivation + reservoir) from the BXT metadata."""
+    wells = []
+    wells.extend(get_wells_cultivation(metadata))
+    wells.extend(get_wells_reservoir(metadata))
+    return wells
+
+
+def get_wells_label_description(
+    metadata: dict, existing_plate_layout: dict | None = None
+) -> dict[str, Any]:
+    """
+    Get the label and description of the wells A01 to F08 from the BXT metadata.
+
+    :param metadata: The BXT metadata
+    :param existing_plate_layout: Optional plate layout, its values override the metadata labels
+    :return: The wells data by well (e.g. {"A01": {"label": "..."}})
+    """
+    wells_label = {well: {"label": ""} for well in get_plate_wells(is_micro_fluidics=False)}
+
+    layout = metadata.get("Layout", {})
+    cultivation_map = layout.get("CultivationLabelDescriptionsMap", {})
+    reservoir_map = layout.get("ReservoirLabelDescriptionsMap", {})
+    # Strip and update values for existing wells
+    for well, description in cultivation_map.items():
+        if well in wells_label:
+            wells_label[well] = {"label": description.strip() or wells_label[well]}
+
+    for well, description in reservoir_map.items():
+        if well in wells_label:
+            wells_label[well] = {"label": description.strip() or wells_label[well]}
+
+    if existing_plate_layout:
+        # Retrieve data in existing_plate_layout and override label if key "label" is present
+        for well, data in existing_plate_layout.items():
+            # Normalize well ID (A1 → A01)
+            if len(well) == 2:
+                well = f"{well[0]}0{well[1]}"
+            if well in wells_label and isinstance(data, dict):
+                existing_data = (
+                    wells_label[well]
+                    if isinstance(wells_label[well], dict)
+                    else {"label": wells_label[well]}
+                )
+                if "label" in data:
+                    existing_data["label"] = data["label"]
+                existing_data.update(data)
+                wells_label[well] = existing_data
+
+    return wells_label
@@ -0,0 +1,97 @@
+import numpy as np
+from pandas import DataFrame, Index
+
+# Columns of the BiolectorXT raw export used by the parsers
+RAW_DATA_COLUMNS = ["Well", "Filterset", "Time", "Cal"]
+
+
+def is_micro_fluidics(data: DataFrame) -> bool:
+    """
+    Check if the raw data comes from a microfluidics plate (no A01 well).
+
+    :param data: The raw data, must contain the Well column
+    :return: True if the plate is a microfluidics plate, False otherwise
+    """
+    unique_wells = data["Well"].dropna().unique()
+    return "A01" not in unique_wells
+
+
+def get_plate_wells(is_micro_fluidics: bool) -> list[str]:
+    """
+    Get the wells of a BiolectorXT plate in column order.
+
+    :param is_micro_fluidics: True for a microfluidics plate (C01 to F08), False otherwise (A01 to F08)
+    :return: The list of wells (e.g. ["A01", "A02", ..., "F08"])
+    """
+    first_row = "C" if is_micro_fluidics else "A"
+    return [
+        f"{chr(letter)}{str(num).zfill(2)}"
+        for letter in range(ord(first_row), ord("F") + 1)
+        for num in range(1, 9)
+    ]
+
+
+def pivot_raw_data(data: DataFrame, wells: list[str]) -> dict[str, DataFrame]:
+    """
+    Pivot the long BiolectorXT raw data into one wide table per filterset, in a single pass.
+
+    Rows are sorted once by Filterset, Well and Time, then every measurement gets a cycle index
+    (its rank within its well). Each filterset table has one row per cycle of the first well
+    of the plate and one column per well:
+
+    - `time`: time of the cycle in seconds (taken from the first well)
+    - one column per well with the `Cal` values, NaN when the well has no value for the cycle
+
+    Missing `Cal` values are skipped so that the values of a well are contiguous.
+
+    :param data: The raw data, must contain the Well, Filterset, Time and Cal columns
+    :param wells: The wells to pivot, the first one is used as time reference
+    :return: The wide tables by filterset value, in sorted filterset order
+    """
+    reduced_data = data[RAW_DATA_COLUMNS]
+    reduced_data = reduced_data[reduced_data["Filterset"].notna()]
+    # multi-column sort is stable, ties keep the order of the export
+    reduced_data = reduced_data.sort_values(by=["Filterset", "Well", "Time"])
+
+    # position of the well in the plate, -1 for unknown wells (works on object and categorical columns)
+    well_codes = Index(wells).get_indexer(reduced_data["Well"]).astype(np.int64)
+    times = reduced_data["Time"].to_numpy(dtype=float)
+    values = reduced_data["Cal"].to_numpy(dtype=float)
+
+    groups = reduced_data.groupby("Filterset", sort=False, observed=True).indices
+
+    pivots: dict[str, DataFrame] = {}
+    for filterset in reduced_data["Filterset"].unique():
+        positions = groups[filterset]
+        pivots[filterset] = _pivot_filterset(
+            well_codes[positions], times[positions], values[positions], wells
+        )
+    return pivots
+
+
+def _pivot_filterset(
+    well_codes: np.ndarray, times: np.ndarray, values: np.ndarray, wells: list[str]
+) -> DataFrame:
+    """Pivot the rows of one filterset, already sorted by well then time."""
+    reference_times = times[well_codes == 0]
+    reference_times = reference_times[~np.isnan(reference_times)]
+    nb_cycles = len(reference_times)
+
+    valid = (well_codes >= 0) & ~np.isnan(values)
+    well_codes = well_codes[valid]
+    values = values[valid]
+
+    # rank of each value within its well, the rows of a well are contiguous
+    positions = np.arange(len(well_codes))
+    is_block_start = np.ones(len(well_codes), dtype=bool)
+    is_block_start[1:] = well_codes[1:] != well_codes[:-1]
+    block_start = np.maximum.accumulate(np.where(is_block_start, positions, 0))
+    cycles = positions - block_start
+
+    in_range = cycles < nb_cycles
+    grid = np.full((nb_cycles, len(wells)), np.nan)
+    grid[cycles[in_range], well_codes[in_range]] = values[in_range]
+
+    pivot = DataFrame(grid, columns=wells)
+    pivot.insert(0, "time", reference_times)
+    return pivot
@@ -0,0 +1,133 @@
+import multiprocessing
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+
+from pandas import DataFrame
+
+from gws_plate_reader.biolector_xt_data_parser.biolector_raw_data_index import (
+    BiolectorRawDataIndex,
+)
+from gws_plate_reader.biolector_xt_data_parser.biolector_xt_metadata import (
+    BiolectorMetadataIndex,
+    FolderMetadata,
+)
+from gws_plate_reader.biolector_xt_data_parser.biolector_xt_pivot import RAW_DATA_COLUMNS
+
+
+@dataclass
+class ParsedPlate:
+    """Metadata and parsed raw data of a plate, the part of the loading that runs in a worker."""
+
+    folder_metadata: FolderMetadata
+    raw_data_index: BiolectorRawDataIndex
+
+    @property
+    def metadata(self) -> dict:
+        return self.folder_metadata.metadata
+
+
+def load_plate_metadata(folder_metadata_path: str, plate_name: str) -> FolderMetadata:
+    """
+    Load the BXT metadata of a plate, raise an error if the folder has no metadata file.
+
+    :param folder_metadata_path: Path of the folder containing the BXT.json metadata file
+    :param plate_name: Name of the plate, used in the error message
+    :return: The metadata files of the folder and the BXT metadata
+    """
+    folder_metadata = BiolectorMetadataIndex.get_folder_metadata(folder_metadata_path)
+    if folder_metadata.metadata is None:
+        raise Exception(
+            f"No metadata file found in the provided folder for {plate_name}. "
+            "The folder must contain a file that ends with 'BXT.json'"
+        )
+    return folder_metadata
+
+
+def parse_plate(raw_data: DataFrame, folder_metadata_path: str, plate_name: str) -> ParsedPlate:
+    """
+    Load the BXT metadata of a plate and parse its raw data.
+
+    Only uses plain data (DataFrame, paths, dict) so that it can run in a worker process.
+
+    :param raw_data: The raw data of the plate
+    :param folder_metadata_path: Path of the folder containing the BXT.json metadata file
+    :param plate_name: Name of the plate, used in the error messages
+    :return: The metadata and the parsed raw data of the plate
+    """
+    return ParsedPlate(
+        folder_metadata=load_plate_metadata(folder_metadata_path, plate_name),
+        raw_data_index=BiolectorRawDataIndex(raw_data),
+    )
+
+
+def parse_plates_in_parallel(
+    plates: list[tuple[DataFrame, str, str]],
+    max_workers: int,
+    on_plate_parsed: Callable[[int, int], None] | None = None,
+    cache_keys: list[str] | None = None,
+) -> list[ParsedPlate]:
+    """
+    Parse plates concurrently in a process pool.
+
+    The plates are independent, the results are returned in the order of the input plates
+    whatever the order in which the workers finish.
+
+    With cache keys, the plates whose raw data is in the BiolectorRawDataIndex cache are not sent
+    to the workers, and the indexes parsed by the workers are added to the cache of the calling
+    process, like when the plates are parsed sequentially.
+
+    :param plates: The (raw data, metadata folder path, plate name) of each plate
+    :param max_workers: Maximum number of worker processes
+    :param on_plate_parsed: Called in the calling process each time a plate is parsed, with the
+        index of the plate and the number of plates parsed so far
+    :param cache_keys: The BiolectorRawDataIndex cache key of the raw data of each plate
+    :return: The parsed plates, in the order of the input plates
+    """
+    results: list[ParsedPlate | None] = [None] * len(plates)
+    nb_parsed = 0
+
+    plate_indexes_to_parse: list[int] = []
+    for plate_idx, (_, folder_metadata_path, plate_name) in enumerate(plates):
+        raw_data_index = (
+            BiolectorRawDataIndex.get_from_cache(cache_keys[plate_idx]) if cache_keys else None
+        )
+        if raw_data_index is None:
+            plate_indexes_to_parse.append(plate_idx)
+            continue
+        results[plate_idx] = ParsedPlate(
+            folder_metadata=load_plate_metadata(folder_metadata_path, plate_name),
+            raw_data_index=raw_data_index,
+        )
+        nb_parsed += 1
+        if on_plate_parsed:
+            on_plate_parsed(plate_idx, nb_parsed)
+
+    if not plate_indexes_to_parse:
+        return results
+
+    # spawn does not copy the state of the calling process (locks, connections) to the workers
+    with ProcessPoolExecutor(
+        max_workers=min(max_workers, len(plate_indexes_to_parse)),
+        mp_context=multiprocessing.get_context("spawn"),
+    ) as executor:
+        # only the parsed columns are sent to the workers, the other columns are not pickled
+        futures = {}
+        for plate_idx in plate_indexes_to_parse:
+            raw_data, folder_metadata_path, plate_name = plates[plate_idx]
+            future = executor.submit(
+                parse_plate, raw_data[RAW_DATA_COLUMNS], folder_metadata_path, plate_name
+            )
+            futures[future] = plate_idx
+        for future in as_completed(futures):
+            plate_idx = futures[future]
+            parsed_plate = future.result()
+            if cache_keys:
+                BiolectorRawDataIndex.add_to_cache(
+                    cache_keys[plate_idx], parsed_plate.raw_data_index
+                )
+            results[plate_idx] = parsed_plate
+            nb_parsed += 1
+            if on_plate_parsed:
+                on_plate_parsed(plate_idx, nb_parsed)
+    return results
@@ -0,0 +1,161 @@
+import json
+import os
+from dataclasses import asdict, dataclass
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+
+from gws_plate_reader.biolector_xt_data_parser.biolector_xt_pivot import get_plate_wells
+
+# Name of the synthetic metadata file, must end with 'BXT.json' to be found by the loader
+SYNTHETIC_METADATA_FILE_NAME = "synthetic BXT.json"
+SYNTHETIC_RAW_DATA_FILE_NAME = "synthetic.csv"
+
+
+@dataclass(frozen=True)
+class SyntheticExportConfig:
+    """Shape of a synthetic BiolectorXT export."""
+
+    # number of wells with data, taken in plate order (48 max, 32 max with microfluidics),
+    # all the wells of the plate if None
+    nb_wells: int | None = None
+    nb_channels: int = 6
+    # one cycle every `cycle_duration` seconds for each channel
+    nb_cycles: int = 96
+    is_micro_fluidics: bool = False
+    cycle_duration: float = 900.0
+    # ratio of rows with a missing Cal value and of rows removed from the export
+    missing_ratio: float = 0.01
+    # number of media of the medium table, 0 to not create medium and info tables
+    nb_media: int = 0
+    seed: int = 42
+
+    def get_wells(self) -> list[str]:
+        """Get the wells with data, the first one is the time reference of the plate."""
+        plate_wells = get_plate_wells(self.is_micro_fluidics)
+        if self.nb_wells is None:
+            return plate_wells
+        if not 1 <= self.nb_wells <= len(plate_wells):
+            raise ValueError(
+                f"The number of wells must be between 1 and {len(plate_wells)}, got {self.nb_wells}"
+            )
+        return plate_wells[: self.nb_wells]
+
+    def to_dict(self) -> dict:
+        """Get the config as a JSON serializable dict."""
+        return asdict(self)
+
+
+def make_synthetic_export(config: SyntheticExportConfig) -> tuple[DataFrame, dict]:
+    """
+    Create a BiolectorXT raw export and its BXT metadata.
+
+    The export has the columns of the BiolectorXT csv export used by the parsers (Well, Filterset,
+    Time, Cal) plus a Comment column. Rows are shuffled, times have a small jitter, and a few
+    rows are removed or have no Cal value, like the exports of the instrument.
+
+    :param config: The shape of the export
+    :return: The raw data and the BXT metadata
+    """
+    rng = np.random.default_rng(config.seed)
+    wells = config.get_wells()
+    filtersets = [f"Filterset {i}" for i in range(config.nb_channels)]
+    rows_by_well = config.nb_channels * config.nb_cycles
+    nb_rows = len(wells) * rows_by_well
+
+    cal = rng.normal(loc=10, scale=2, size=nb_rows)
+    cal[rng.random(nb_rows) < config.missing_ratio] = np.nan
+    data = DataFrame(
+        {
+            "Well": np.repeat(wells, rows_by_well),
+            "Filterset": np.tile(np.repeat(filtersets, config.nb_cycles), len(wells)),
+            "Time": np.tile(
+                np.arange(config.nb_cycles) * config.cycle_duration,
+                len(wells) * config.nb_channels,
+            )
+            + rng.integers(0, 30, nb_rows),
+            "Cal": cal,
+            "Comment": "",
+        }
+    )
+    nb_removed_rows = int(nb_rows * config.missing_ratio)
+    if nb_removed_rows > 0:
+        data = data.drop(index=rng.choice(nb_rows, nb_removed_rows, replace=False))
+    data = data.sample(frac=1, random_state=config.seed).reset_index(drop=True)
+
+    plate_wells = get_plate_wells(config.is_micro_fluidics)
+    reservoir_wells = (
+        [well for well in get_plate_wells(False) if well not in plate_wells]
+        if config.is_micro_fluidics
+        else []
+    )
+    metadata = {
+        "Channels": [{"Name": f"Channel {i}"} for i in range(config.nb_channels)],
+        "Microplate": {"CultivationLabels": wells, "ReservoirLabels": reservoir_wells},
+        "Layout": {
+            "CultivationLabelDescriptionsMap": {well: f"Culture {well}" for well in wells},
+            "ReservoirLabelDescriptionsMap": {well: "Reservoir" for well in reservoir_wells},
+        },
+    }
+    return data, metadata
+
+
+def make_synthetic_medium_tables(config: SyntheticExportConfig) -> tuple[DataFrame, DataFrame]:
+    """
+    Create the medium table and the info table of a synthetic export.
+
+    The media are assigned to the wells in turn, each medium has a glucose and a nitrogen
+    concentration and the info table has a numeric and a text column.
+
+    :param config: The shape of the export, nb_media must be greater than 0
+    :return: The medium table (Medium column then one column per component) and the info
+        table (Well, Medium and info columns, wells without leading zero)
+    """
+    if config.nb_media <= 0:
+        raise ValueError("The number of media must be greater than 0")
+
+    media = [f"M{i}" for i in range(config.nb_media)]
+    medium_df = DataFrame(
+        {
+            "Medium": media,
+            "Glucose": np.linspace(5, 20, config.nb_media),
+            "Nitrogen": np.linspace(1, 2, config.nb_media),
+        }
+    )
+    wells = config.get_wells()
+    info_df = DataFrame(
+        {
+            "Well": [f"{well[0]}{int(well[1:])}" for well in wells],
+            "Medium": [media[i % config.nb_media] for i in range(len(wells))],
+            "Temperature": np.full(len(wells), 30.0),
+            "Operator": "synthetic",
+        }
+    )
+    return medium_df, info_df
+
+
+def write_synthetic_export(config: SyntheticExportConfig, folder_path: str) -> tuple[str, str]:
+    """
+    Write a synthetic export in a folder, like an experiment downloaded from the BiolectorXT.
+
+    :param config: The shape of the export
+    :param folder_path: The folder where the raw data csv file and the BXT.json metadata file are
+        written, created if it does not exist
+    :return: The path of the raw data csv file (';' delimiter) and the path of the metadata file
+    """
+    data, metadata = make_synthetic_export(config)
+    os.makedirs(folder_path, exist_ok=True)
+
+    raw_data_path = os.path.join(folder_path, SYNTHETIC_RAW_DATA_FILE_NAME)
+    data.to_csv(raw_data_path, sep=";", index=False)
+
+    metadata_path = os.path.join(folder_path, SYNTHETIC_METADATA_FILE_NAME)
+    with open(metadata_path, "w", encoding="UTF-8") as metadata_file:
+        json.dump(metadata, metadata_file)
+    return raw_data_path, metadata_path
+
+
+def get_nb_values(data: DataFrame) -> int:
+    """Get the number of measured values of an export (rows with a Cal value)."""
+    return int(pd.notna(data["Cal"]).sum())
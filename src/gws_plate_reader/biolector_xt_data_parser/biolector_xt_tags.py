@@ -0,0 +1,101 @@
+from gws_core import Table
+from gws_core.tag.tag import Tag, TagOrigins
+from gws_core.tag.tag_dto import TagOriginType
+from gws_core.user.current_user_service import CurrentUserService
+
+
+def get_user_tag_origins() -> TagOrigins:
+    """Get the tag origins of the current user (no user id when there is no current user)."""
+    current_user = CurrentUserService.get_current_user()
+    return TagOrigins(TagOriginType.USER, current_user.id if current_user else None)
+
+
+def build_well_column_tags(
+    column_names: list[str],
+    index_column: str = "Time",
+    index_column_name: str = "Time",
+    index_unit: str = "h",
+) -> list[dict[str, str]]:
+    """
+    Build the column tags of a well table: the index column (time in hours) and one data column
+    per measurement.
+
+    The result only depends on the column names, it is computed once per plate and applied to
+    each well table with `apply_well_tags`.
+
+    :param column_names: The columns of the well table
+    :param index_column: The time column of the table
+    :param index_column_name: Value of the 'column_name' tag of the time column
+    :param index_unit: Unit of the time column
+    :return: The tags of each column, in the order of the columns
+    """
+    column_tags: list[dict[str, str]] = []
+    for column_name in column_names:
+        if column_name == index_column:
+            column_tags.append(
+                {"column_name": index_column_name, "unit": index_unit, "is_index_column": "true"}
+            )
+        else:
+            column_tags.append({"column_name": column_name, "is_data_column": "true"})
+    return column_tags
+
+
+def build_well_tags(
+    origins: TagOrigins,
+    batch: str,
+    sample: str,
+    medium_name: str | None = None,
+    medium_composition: dict | None = None,
+    missing_value: str | None = None,
+) -> list[Tag]:
+    """
+    Build the tags of a well table: batch (plate), sample (well), and optionally the medium with
+    its composition and the missing_value tag.
+
+    :param origins: Origins of the tags, see `get_user_tag_origins`
+    :param batch: The plate name
+    :param sample: The well name (e.g. C1)
+    :param medium_name: The medium of the well, if known
+    :param medium_composition: The composition of the medium, stored in the tag additional info
+    :param missing_value: Value of the missing_value tag (e.g. 'raw_data', 'plate_layout')
+    :return: The tags of the well table
+    """
+    tags = [
+        Tag(key="batch", value=batch, auto_parse=True, origins=origins, is_propagable=True),
+        Tag(key="sample", value=sample, auto_parse=True, origins=origins, is_propagable=True),
+    ]
+    if medium_name is not None:
+        tags.append(
+            Tag(
+                key="medium",
+                value=medium_name,
+                auto_parse=True,
+                additional_info={"composed": medium_composition or {}},
+                origins=origins,
+                is_propagable=True,
+            )
+        )
+    if missing_value is not None:
+        tags.append(
+            Tag(
+                key="missing_value",
+                value=missing_value,
+                auto_parse=True,
+                origins=origins,
+                is_propagable=True,
+            )
+        )
+    return tags
+
+
+def apply_well_tags(table: Table, column_tags: list[dict[str, str]], tags: list[Tag]) -> None:
+    """
+    Set all the column tags and add the tags of a well table in one go.
+
+    :param table: The well table
+    :param column_tags: The tags of each column, see `build_well_column_tags`
+    :param tags: The tags of the table, see `build_well_tags`
+    """
+    # each table gets its own dicts so that a later change of one table does not affect the others
+    table.set_all_column_tags([dict(tags_dict) for tags_dict in column_tags])
+    table.tags._tags.extend(tags)
@@ -15,6 +15,10 @@ from gws_core import (
     task_decorator,
 )
 
+from gws_plate_reader.biolector_xt_data_parser.biolector_xt_long_format import (
+    pivot_long_format_data,
+)
+
 
 @task_decorator(
     "ResourceSetToDataTable",
@@ -40,6 +44,8 @@ class ResourceSetToDataTable(Task):
     ## Inputs
 
     - **resource_set**: ResourceSet containing Table resources with batch/sample tags
+    - **long_format_table** (optional): long format table of BiolectorXTLoadData (Plate, Well,
+      Channel, Time, Value), used instead of the ResourceSet when provided
 
     ## Configuration
 
@@ -72,6 +78,8 @@ class ResourceSetToDataTable(Task):
     - Missing values (NaN) in the index column are automatically removed
     - Tables are merged using outer join to preserve all time points
     - Final table is sorted by the index column
+    - With the long format table, the data column is the channel and the index column must be
+      `Time`. The table is pivoted in one operation, the columns are named Plate_Well
     """
 
     # Tag constants for batch and sample identification
@@ -84,7 +92,14 @@ class ResourceSetToDataTable(Task):
                 ResourceSet,
                 human_name="Resource Set",
                 short_description="ResourceSet containing Table resources from Quality Check",
-            )
+                optional=True,
+            ),
+            "long_format_table": InputSpec(
+                Table,
+                human_name="Long format table",
+                short_description="Long format table of BiolectorXTLoadData, used instead of the ResourceSet",
+                optional=True,
+            ),
         }
     )
 
@@ -119,10 +134,20 @@ class ResourceSetToDataTable(Task):
         The dataframe will contain the index column and data columns.
         One data column per couple batch/sample, named Batch_Sample.
         """
-        resource_set: ResourceSet = inputs["resource_set"]
+        resource_set: ResourceSet | None = inputs.get("resource_set")
+        long_format_table: Table | None = inputs.get("long_format_table")
         index_column: str = params.get_value("index_column")
         data_column: str = params.get_value("data_column")
 
+        if long_format_table is not None:
+            return {
+                "data_table": self._build_from_long_format(
+                    long_format_table, index_column, data_column
+                )
+            }
+        if resource_set is None:
+            raise ValueError("A ResourceSet or a long format table must be provided")
+
         self.log_info_message(
             f"Converting ResourceSet to Table with index='{index_column}' and data='{data_column}'"
         )
@@ -227,3 +252,25 @@ class ResourceSetToDataTable(Task):
         except Exception as e:
             self.log_error_message(f"Error during conversion: {str(e)}")
             raise
+
+    def _build_from_long_format(
+        self, long_format_table: Table, index_column: str, data_column: str
+    ) -> Table:
+        """Build the data table from the long format table, without a loop over the wells."""
+        if index_column != "Time":
+            raise ValueError(
+                f"The index column of a long format table is 'Time', got '{index_column}'"
+            )
+
+        self.log_info_message(f"Converting long format table with data='{data_column}'")
+        combined_data = pivot_long_format_data(long_format_table.get_data(), data_column)
+        if len(combined_data.columns) <= 1:
+            self.log_error_message("No valid data could be extracted from the long format table")
+            raise ValueError(f"Failed to build table: no value for channel '{data_column}'")
+
+        self.log_success_message(
+            f"Successfully created table with {len(combined_data)} rows and "
+            f"{len(combined_data.columns) - 1} batch/sample columns"
+        )
+        self.update_progress_value(100, "Complete")
+        return Table(data=combined_data)
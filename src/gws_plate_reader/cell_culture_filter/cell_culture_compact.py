@@ -0,0 +1,78 @@
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+
+# Text columns with fewer distinct values than this ratio of rows are converted to categorical
+CATEGORY_MAX_UNIQUE_RATIO = 0.5
+
+
+def compact_dataframe(df: DataFrame, keep_columns: list[str] | None = None) -> DataFrame:
+    """
+    Convert a cell culture DataFrame to compact types.
+
+    - float64 measurement columns → float32
+    - integer columns and integer index → int32 when the values fit
+    - repeated text columns → categorical
+
+    The BiolectorXT raw export and the per-well tables have no batch, sample or medium column,
+    these are resource tags. Only tables that carry them as text columns (e.g. merged tables)
+    get categorical columns.
+
+    :param df: The DataFrame to convert, it is not modified
+    :param keep_columns: Columns to keep with their original type (e.g. the time column)
+    :return: The compact DataFrame
+    """
+    keep_columns = keep_columns or []
+    compact_df = df.copy()
+
+    for col in compact_df.columns:
+        if col in keep_columns:
+            continue
+        column = compact_df[col]
+        if pd.api.types.is_float_dtype(column.dtype) and column.dtype != np.float32:
+            compact_df[col] = column.astype(np.float32)
+        elif pd.api.types.is_integer_dtype(column.dtype) and _fits_int32(column):
+            compact_df[col] = column.astype(np.int32)
+        elif pd.api.types.is_object_dtype(column.dtype) or pd.api.types.is_string_dtype(
+            column.dtype
+        ):
+            if len(column) > 0 and column.nunique() <= len(column) * CATEGORY_MAX_UNIQUE_RATIO:
+                compact_df[col] = column.astype("category")
+
+    index = compact_df.index
+    if (
+        not isinstance(index, pd.RangeIndex)
+        and pd.api.types.is_integer_dtype(index.dtype)
+        and _fits_int32(index)
+    ):
+        compact_df.index = index.astype(np.int32)
+
+    return compact_df
+
+
+def get_memory_usage(df: DataFrame) -> int:
+    """Get the memory used by a DataFrame in bytes, including the text values."""
+    return int(df.memory_usage(index=True, deep=True).sum())
+
+
+def format_memory_report(name: str, bytes_before: int, bytes_after: int) -> str:
+    """
+    Format the memory saved by the compact mode.
+
+    :param name: Name of the converted data (e.g. the plate name)
+    :param bytes_before: Memory used before the conversion in bytes
+    :param bytes_after: Memory used after the conversion in bytes
+    :return: The message, e.g. "plate_0: 1,204,224 → 602,112 bytes (saved 602,112 bytes, 50.0%)"
+    """
+    saved = bytes_before - bytes_after
+    ratio = saved / bytes_before * 100 if bytes_before else 0
+    return f"{name}: {bytes_before:,} → {bytes_after:,} bytes (saved {saved:,} bytes, {ratio:.1f}%)"
+
+
+def _fits_int32(values: pd.Series | pd.Index) -> bool:
+    if len(values) == 0:
+        return True
+    if values.isna().any():
+        return False
+    info = np.iinfo(np.int32)
+    return bool(values.min() >= info.min and values.max() <= info.max)
@@ -2,6 +2,7 @@ import json
 from typing import Any
 
 from gws_core import (
+    BoolParam,
     ConfigParams,
     ConfigSpecs,
     InputSpec,
@@ -17,6 +18,15 @@ from gws_core import (
     task_decorator,
 )
 
+from gws_plate_reader.biolector_xt_data_parser.biolector_xt_long_format import (
+    BiolectorLongFormatView,
+)
+from gws_plate_reader.cell_culture_filter.cell_culture_compact import (
+    compact_dataframe,
+    format_memory_report,
+    get_memory_usage,
+)
+
 BATCH_TAG_KEY = "batch"
 SAMPLE_TAG_KEY = "sample"
 
@@ -222,6 +232,11 @@ class FilterFermentorAnalyseLoadedResourceSetBySelection(Task):
     - Preserves complete data integrity (no data modification)
     - Tag keys ('batch', 'sample') are hardcoded constants for consistency
     - Output can be used directly with CellCultureSubsampling task
+    - Optional long format table of BiolectorXTLoadData (Plate, Well, Channel, Time, Value): the
+      rows of the selected plate/well pairs (batch/sample) are selected at once through
+      `BiolectorLongFormatView`, without one table per well
+    - Optional compact mode (float32 measurements, categorical text, index columns unchanged)
+      reports the memory saved per batch in the logs
     - Compatible with Streamlit dashboard for interactive use
     """
 
@@ -233,6 +248,12 @@ class FilterFermentorAnalyseLoadedResourceSetBySelection(Task):
                 short_description="ResourceSet from CellCultureLoadData containing batch/sample tagged resources",
                 optional=False,
             ),
+            "long_format_table": InputSpec(
+                Table,
+                human_name="Long format table",
+                short_description="Long format table of BiolectorXTLoadData, filtered with the same selection",
+                optional=True,
+            ),
         }
     )
 
@@ -242,7 +263,13 @@ class FilterFermentorAnalyseLoadedResourceSetBySelection(Task):
                 ResourceSet,
                 human_name="Filtered ResourceSet",
                 short_description="ResourceSet containing only selected batch/sample combinations",
-            )
+            ),
+            "filtered_long_format_table": OutputSpec(
+                Table,
+                human_name="Filtered long format table",
+                short_description="Rows of the selected batch/sample combinations (output when long_format_table is provided)",
+                optional=True,
+            ),
         }
     )
 
@@ -252,13 +279,21 @@ class FilterFermentorAnalyseLoadedResourceSetBySelection(Task):
                 human_name="Selection criteria with Batch/Sample pairs",
                 short_description="List of dictionaries with 'batch' and 'sample' keys for filtering",
                 optional=False,
-            )
+            ),
+            "compact_mode": BoolParam(
+                human_name="Compact mode",
+                short_description="Store measurements as float32 and repeated text as categories to reduce memory. A memory report is added to the logs.",
+                default_value=False,
+                visibility="protected",
+            ),
         }
     )
 
     def run(self, params: ConfigParams, inputs) -> dict[str, Any]:
         resource_set: ResourceSet = inputs["resource_set"]
+        long_format_table: Table | None = inputs.get("long_format_table")
         selection_criteria: list[dict[str, str]] = params.get_value("selection_criteria")
+        compact_mode: bool = params.get_value("compact_mode")
 
         self.log_info_message(
             f"Filtering ResourceSet with {len(selection_criteria)} selected batch/sample combinations"
@@ -279,6 +314,8 @@ class FilterFermentorAnalyseLoadedResourceSetBySelection(Task):
         self.log_info_message(f"Selection criteria: {selection_set}")
 
         matched_count = 0
+        # memory before and after compact mode by batch
+        memory_by_batch: dict[str, list[int]] = {}
         total_resources = len(resource_set.get_resources())
 
         # Filter each resource in the ResourceSet based on tags
@@ -327,7 +364,20 @@ class FilterFermentorAnalyseLoadedResourceSetBySelection(Task):
             # If this resource should be included, add it to filtered ResourceSet
             if should_include:
                 # Create a copy of the resource to preserve all tags and properties
-                filtered_table = Table(resource.get_data().copy())
+                if compact_mode:
+                    index_columns = [
+                        column_name
+                        for column_name in resource.get_column_names()
+                        if resource.get_column_tags_by_name(column_name).get("is_index_column")
+                        == "true"
+                    ]
+                    filtered_df = compact_dataframe(resource.get_data(), keep_columns=index_columns)
+                    batch_memory = memory_by_batch.setdefault(batch_tag_value, [0, 0])
+                    batch_memory[0] += get_memory_usage(resource.get_data())
+                    batch_memory[1] += get_memory_usage(filtered_df)
+                else:
+                    filtered_df = resource.get_data().copy()
+                filtered_table = Table(filtered_df)
                 filtered_table.name = resource.name
 
                 # Copy all original tags to ensure they are preserved
@@ -350,9 +400,42 @@ class FilterFermentorAnalyseLoadedResourceSetBySelection(Task):
             f"Filtered {matched_count}/{total_resources} resources based on selection criteria"
         )
 
+        for batch, (memory_before, memory_after) in memory_by_batch.items():
+            self.log_info_message(
+                f"💾 [COMPACT] {format_memory_report(batch, memory_before, memory_after)}"
+            )
+
         if matched_count == 0:
             self.log_warning_message(
                 "No resources matched the selection criteria. Check that resources have proper 'batch' and 'sample' tags."
             )
 
-        return {"filtered_resource_set": filtered_res}
+        outputs = {"filtered_resource_set": filtered_res}
+        if long_format_table is not None:
+            outputs["filtered_long_format_table"] = self._filter_long_format_table(
+                long_format_table, selection_set, compact_mode
+            )
+        return outputs
+
+    def _filter_long_format_table(
+        self, long_format_table: Table, selection_set: set[tuple[str, str]], compact_mode: bool
+    ) -> Table:
+        """Select the rows of the selected wells, the batch is the plate and the sample the well."""
+        view = BiolectorLongFormatView(long_format_table.get_data())
+        filtered_df = view.select_wells(list(selection_set))
+        if compact_mode:
+            filtered_df = compact_dataframe(filtered_df, keep_columns=["Time"])
+
+        filtered_table = Table(filtered_df)
+        filtered_table.name = long_format_table.name
+        for column_name in long_format_table.get_column_names():
+            for col_tag_key, col_tag_value in long_format_table.get_column_tags_by_name(
+                column_name
+            ).items():
+                filtered_table.add_column_tag_by_name(column_name, col_tag_key, col_tag_value)
+
+        nb_wells = len(set(zip(filtered_df["Plate"], filtered_df["Well"], strict=True)))
+        self.log_success_message(
+            f"Filtered long format table: {len(filtered_df)} values of {nb_wells} wells"
+        )
+        return filtered_table
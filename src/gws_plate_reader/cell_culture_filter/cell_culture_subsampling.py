@@ -3,6 +3,7 @@ from typing import Any
 import numpy as np
 import pandas as pd
 from gws_core import (
+    BoolParam,
     ConfigParams,
     ConfigSpecs,
     InputSpec,
@@ -27,6 +28,12 @@ from scipy.interpolate import (
     interp1d,
 )
 
+from gws_plate_reader.cell_culture_filter.cell_culture_compact import (
+    compact_dataframe,
+    format_memory_report,
+    get_memory_usage,
+)
+
 
 @task_decorator(
     "CellCultureSubsampling",
@@ -405,6 +412,8 @@ class CellCultureSubsampling(Task):
     - Original data is never modified (creates new Tables)
     - Interpolation tag added for traceability
     - Compatible with all Cell Culture workflow tasks
+    - Optional compact mode stores the output measurements as float32 and repeated text as
+      categories, the memory saved per batch is reported in the logs
     - Designed for biological time-series (fermentation focus)
     """
 
@@ -507,6 +516,12 @@ class CellCultureSubsampling(Task):
                 min_value=1,
                 optional=True,
             ),
+            "compact_mode": BoolParam(
+                human_name="Compact mode",
+                short_description="Store output measurements as float32 and repeated text as categories to reduce memory. A memory report is added to the logs.",
+                default_value=False,
+                visibility="protected",
+            ),
         }
     )
 
@@ -761,6 +776,7 @@ class CellCultureSubsampling(Task):
         edge_strategy = params.get_value("edge_strategy")
         reference_index = params.get_value("reference_index")
         min_values_threshold = params.get_value("min_values_threshold")
+        compact_mode = params.get_value("compact_mode")
 
         self.log_info_message(
             f"Starting interpolation with method: {method}, grid strategy: {grid_strategy}"
@@ -852,6 +868,8 @@ class CellCultureSubsampling(Task):
 
         # Create output ResourceSet with combined data
         subsampled_res = ResourceSet()
+        # memory before and after compact mode by batch
+        memory_by_batch: dict[str, list[int]] = {}
 
         for resource_name, interpolated_df in results.items():
             # Get original data
@@ -911,6 +929,14 @@ class CellCultureSubsampling(Task):
             if non_time_cols:
                 combined_df = combined_df.dropna(subset=non_time_cols, how="all")
 
+            if compact_mode:
+                batch_tags = original_resource.tags.get_by_key("batch")
+                batch = batch_tags[0].value if batch_tags else resource_name
+                batch_memory = memory_by_batch.setdefault(batch, [0, 0])
+                batch_memory[0] += get_memory_usage(combined_df)
+                combined_df = compact_dataframe(combined_df, keep_columns=[time_col])
+                batch_memory[1] += get_memory_usage(combined_df)
+
             # Create new Table with combined data
             combined_table = Table(combined_df)
             combined_table.name = f"{resource_name}_subsampled"
@@ -940,6 +966,11 @@ class CellCultureSubsampling(Task):
 
             subsampled_res.add_resource(combined_table, resource_name)
 
+        for batch, (memory_before, memory_after) in memory_by_batch.items():
+            self.log_info_message(
+                f"💾 [COMPACT] {format_memory_report(batch, memory_before, memory_after)}"
+            )
+
         self.log_success_message(
             f"Successfully subsampled {len(results)} resources using {method} method"
         )
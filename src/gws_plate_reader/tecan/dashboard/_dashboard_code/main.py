@@ -12,6 +12,7 @@ import numpy as np
 from datetime import datetime
 from gws_core import Table
 from gws_plate_reader.tecan.tecan_parser import TecanParser
+from gws_plate_reader.tecan.tecan_plate_format import parse_well
 from streamlit_extras.stylable_container import stylable_container
 
 
@@ -30,8 +31,9 @@ def show_content(microplate: TecanParser):
         if len(st.session_state['well_clicked']) > 0:
             # Loop through the clicked wells and set only those cells in df_filtered
             for well in st.session_state['well_clicked']:
-                row = well[0]  # Extract the row letter
-                col = well[1:]  # Extract the column number
+                # Extract the row label (A, ..., AF on 1536 plates) and the column number
+                row, col = parse_well(well)
+                col = str(col)
                 # Add value to df_filtered only if the cell is in bounds
                 if row in df.index and col in df.columns:
                     df_filtered.loc[row, col] = df.loc[row, col]
@@ -176,55 +178,53 @@ with st.sidebar:
                 }
                 """,):
 
-            # Define the structure of the 96-well microplate
-            ROWS = 8
-            COLS = 12
-
-            # Define the structure of the 96-well microplate
-            wells = [[f"{chr(65 + row)}{col + 1}" for col in range(COLS)]
-                     for row in range(ROWS)]
+            # Structure of the microplate (96, 384 or 1536 wells), from the format of the parsed plate
+            row_labels = microplate.plate_format.row_labels
+            col_labels = microplate.plate_format.col_labels
+            wells = [[row_label + col_label for col_label in col_labels]
+                     for row_label in row_labels]
             # Define well data (e.g., volume information for each well)
             well_data = microplate.get_wells_label_description()
 
 
             # Column header buttons
-            cols_header = st.columns(COLS + 1)
-            for col in range(COLS):
-                if cols_header[col + 1].button(str(col + 1), key=f"col_{col + 1}"):
-                    if col + 1 in st.session_state.selected_cols:
-                        st.session_state.selected_cols.remove(col + 1)
-                        for row in range(ROWS):
+            cols_header = st.columns(len(col_labels) + 1)
+            for col, col_label in enumerate(col_labels):
+                if cols_header[col + 1].button(col_label, key=f"col_{col_label}"):
+                    if col_label in st.session_state.selected_cols:
+                        st.session_state.selected_cols.remove(col_label)
+                        for row in range(len(row_labels)):
                             well = wells[row][col]
                             if well in st.session_state['well_clicked']:
                                 st.session_state['well_clicked'].remove(well)
                     else:
-                        st.session_state.selected_cols.append(col + 1)
-                        for row in range(ROWS):
+                        st.session_state.selected_cols.append(col_label)
+                        for row in range(len(row_labels)):
                             well = wells[row][col]
                             if well not in st.session_state['well_clicked']:
                                 st.session_state['well_clicked'].append(well)
                     st.rerun(scope="app")
 
             # Loop over the wells and create a grid of buttons
-            for row in range(ROWS):
-                cols_object = st.columns(COLS + 1 )
+            for row, row_label in enumerate(row_labels):
+                cols_object = st.columns(len(col_labels) + 1)
                 # Row header button
-                if cols_object[0].button(chr(65 + row), key=f"row_{chr(65 + row)}"):
-                    if chr(65 + row) in st.session_state.selected_rows:
-                        st.session_state.selected_rows.remove(chr(65 + row))
-                        for col in range(COLS):
+                if cols_object[0].button(row_label, key=f"row_{row_label}"):
+                    if row_label in st.session_state.selected_rows:
+                        st.session_state.selected_rows.remove(row_label)
+                        for col in range(len(col_labels)):
                             well = wells[row][col]
                             if well  in st.session_state['well_clicked']:
                                 st.session_state['well_clicked'].remove(well)
                     else:
-                        st.session_state.selected_rows.append(chr(65 + row))
-                        for col in range(COLS):
+                        st.session_state.selected_rows.append(row_label)
+                        for col in range(len(col_labels)):
                             well = wells[row][col]
                             if well not in st.session_state['well_clicked']:
                                 st.session_state['well_clicked'].append(well)
                     st.rerun(scope="app")
 
-                for col in range(COLS):
+                for col in range(len(col_labels)):
                     well = wells[row][col]
                     if well in st.session_state['well_clicked']:
                         if cols_object[col+1].button(f"**:green[{well}]**", key=well, help=well_data[well]):
@@ -0,0 +1,149 @@
+from gws_core import (
+    ConfigParams,
+    ConfigSpecs,
+    InputSpec,
+    InputSpecs,
+    IntParam,
+    JSONDict,
+    OutputSpec,
+    OutputSpecs,
+    ResourceSet,
+    StrParam,
+    Table,
+    Task,
+    TaskInputs,
+    TaskOutputs,
+    TypingStyle,
+    task_decorator,
+)
+
+from gws_plate_reader.tecan.tecan_batch_statistics import (
+    compute_batch_statistics,
+    stack_plate_reads,
+)
+from gws_plate_reader.tecan.tecan_plate_format import TecanPlateFormat
+from gws_plate_reader.tecan.tecan_well_index import build_layout_grid
+
+
+@task_decorator(
+    "TecanBatchAnalysis",
+    human_name="Tecan batch analysis",
+    short_description="Compute the per-compound statistics and the Z' factor of many Tecan plate reads sharing a plate layout",
+    style=TypingStyle.community_icon(icon_technical_name="dashboard", background_color="#c3fa7f"),
+)
+class TecanBatchAnalysis(Task):
+    """
+    Compute the statistics of each compound of many Tecan endpoint reads sharing a plate layout.
+
+    ## Inputs
+    - **plate_reads**: ResourceSet of Tables, one per plate read. Each table has one row per
+      plate row (A, B, ...) and one column per plate column (1, 2, ...), like the raw data of the
+      Tecan dashboard. The name of the resource is used as plate name.
+    - **plate_layout**: JSONDict with the description of each well (e.g. `{"A1": {"compound":
+      "untreated"}}`), shared by all the reads.
+
+    ## Processing
+    The reads are stacked into a plate x row x column array and the statistics of all the
+    compounds of all the plates are computed in one vectorized pass (NaN values are ignored):
+    - **Mean**, **SD** (ddof=1) and **CV (%)** of the wells of each compound
+    - **Z' factor** of each plate: `1 - 3 (SDp + SDn) / |Meanp - Meann|` computed from the
+      positive and negative control compounds, when both are configured and in the layout
+
+    ## Output
+    - **summary_table**: one row per plate and compound with the columns Plate, Compound,
+      Nb wells, Nb values, Mean, SD, CV (%) and Z' factor.
+    """
+
+    input_specs: InputSpecs = InputSpecs(
+        {
+            "plate_reads": InputSpec(
+                ResourceSet,
+                human_name="Plate reads",
+                short_description="ResourceSet of Tables, one per plate read (rows A, B, ... and columns 1, 2, ...)",
+            ),
+            "plate_layout": InputSpec(
+                JSONDict,
+                human_name="Plate layout",
+                short_description="JSON containing the plate layout, shared by all the reads",
+            ),
+        }
+    )
+
+    output_specs: OutputSpecs = OutputSpecs(
+        {
+            "summary_table": OutputSpec(
+                Table,
+                human_name="Summary table",
+                short_description="Mean, SD, CV and Z' factor by plate and compound",
+            )
+        }
+    )
+
+    config_specs: ConfigSpecs = ConfigSpecs(
+        {
+            "positive_control": StrParam(
+                human_name="Positive control compound",
+                short_description="Compound of the positive control wells, used for the Z' factor",
+                optional=True,
+            ),
+            "negative_control": StrParam(
+                human_name="Negative control compound",
+                short_description="Compound of the negative control wells, used for the Z' factor",
+                default_value="untreated",
+                optional=True,
+            ),
+            "nb_wells": IntParam(
+                human_name="Number of wells",
+                short_description="Format of the plates (96, 384 or 1536). Leave empty to detect it from the reads.",
+                optional=True,
+                allowed_values=[96, 384, 1536],
+                visibility="protected",
+            ),
+        }
+    )
+
+    def run(self, params: ConfigParams, inputs: TaskInputs) -> TaskOutputs:
+        plate_reads: ResourceSet = inputs["plate_reads"]
+        plate_layout: JSONDict = inputs["plate_layout"]
+
+        reads = {
+            name: resource.get_data()
+            for name, resource in plate_reads.get_resources().items()
+            if isinstance(resource, Table)
+        }
+        if not reads:
+            raise Exception("The plate reads ResourceSet must contain at least one Table")
+        nb_ignored = len(plate_reads.get_resources()) - len(reads)
+        if nb_ignored > 0:
+            self.log_warning_message(f"{nb_ignored} resource(s) that are not Tables ignored")
+
+        nb_wells: int | None = params.get_value("nb_wells")
+        if nb_wells:
+            plate_format = TecanPlateFormat.from_nb_wells(nb_wells)
+        else:
+            # the smallest format that contains all the reads
+            plate_format = max(
+                (TecanPlateFormat.detect(read) for read in reads.values()),
+                key=lambda read_format: read_format.nb_wells,
+            )
+        self.log_info_message(
+            f"Processing {len(reads)} plate read(s) of {plate_format.nb_wells} wells"
+        )
+
+        stack = stack_plate_reads(list(reads.values()), plate_format)
+        compound_grid, _ = build_layout_grid(plate_format, plate_layout.get_data())
+
+        positive_control: str | None = params.get_value("positive_control") or None
+        negative_control: str | None = params.get_value("negative_control") or None
+        summary = compute_batch_statistics(
+            stack, compound_grid, list(reads.keys()), positive_control, negative_control
+        )
+        if positive_control and negative_control and summary["Z' factor"].isna().all():
+            self.log_warning_message(
+                f"Z' factor not computed: the control compounds '{positive_control}' and "
+                f"'{negative_control}' must both be in the plate layout with values"
+            )
+
+        summary_table = Table(summary)
+        summary_table.name = "Tecan batch summary"
+        return {"summary_table": summary_table}
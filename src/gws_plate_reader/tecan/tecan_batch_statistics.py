@@ -0,0 +1,113 @@
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+
+from gws_plate_reader.tecan.tecan_plate_format import TecanPlateFormat
+
+BATCH_SUMMARY_COLUMNS = [
+    "Plate",
+    "Compound",
+    "Nb wells",
+    "Nb values",
+    "Mean",
+    "SD",
+    "CV (%)",
+    "Z' factor",
+]
+
+
+def stack_plate_reads(reads: list[DataFrame], plate_format: TecanPlateFormat) -> np.ndarray:
+    """
+    Stack plate reads into a plate x row x column array.
+
+    Each read is aligned on the rows and columns of the plate format, the wells that are not in
+    a read or that have no numeric value are NaN.
+
+    :param reads: The data table of each read, one row per plate row (A, B, ...) and one column
+        per plate column ("1", "2", ...)
+    :param plate_format: The format of the plates
+    :return: The values, of shape (number of reads, number of rows, number of columns)
+    """
+    stack = np.full((len(reads), plate_format.nb_rows, plate_format.nb_cols), np.nan)
+    for read_idx, read in enumerate(reads):
+        aligned_read = read.rename(index=str, columns=str).reindex(
+            index=plate_format.row_labels, columns=plate_format.col_labels
+        )
+        try:
+            stack[read_idx] = aligned_read.to_numpy(dtype=np.float64)
+        except (TypeError, ValueError):
+            stack[read_idx] = aligned_read.apply(pd.to_numeric, errors="coerce").to_numpy(
+                dtype=np.float64
+            )
+    return stack
+
+
+def compute_batch_statistics(
+    stack: np.ndarray,
+    compound_grid: np.ndarray,
+    plate_names: list[str],
+    positive_control: str | None = None,
+    negative_control: str | None = None,
+) -> DataFrame:
+    """
+    Compute the statistics of each compound of each plate in one vectorized pass.
+
+    The wells of a compound are summed with one matrix product over all the plates, NaN values
+    are ignored. The Z' factor of a plate is 1 - 3 (SDp + SDn) / |Meanp - Meann| with the
+    positive and negative control compounds, it is the same on all the rows of the plate.
+
+    :param stack: The values, plate x row x column (see `stack_plate_reads`)
+    :param compound_grid: The compound of each well of the plates, row x column, None for the
+        wells without compound
+    :param plate_names: The name of each plate
+    :param positive_control: The compound of the positive control wells, for the Z' factor
+    :param negative_control: The compound of the negative control wells, for the Z' factor
+    :return: One row per plate and compound, with the columns of BATCH_SUMMARY_COLUMNS
+    """
+    nb_plates = stack.shape[0]
+    values = stack.reshape(nb_plates, -1)
+
+    compound_codes, compound_names = pd.factorize(pd.Series(compound_grid.ravel()), sort=True)
+    compound_names = list(compound_names)
+    nb_compounds = len(compound_names)
+
+    # well x compound membership matrix, wells without compound belong to no compound
+    membership = np.zeros((values.shape[1], nb_compounds))
+    has_compound = compound_codes >= 0
+    membership[np.flatnonzero(has_compound), compound_codes[has_compound]] = 1
+
+    is_valid = ~np.isnan(values)
+    valid_values = np.where(is_valid, values, 0)
+    nb_wells = np.broadcast_to(membership.sum(axis=0), (nb_plates, nb_compounds))
+    nb_values = is_valid.astype(np.float64) @ membership
+    with np.errstate(invalid="ignore", divide="ignore"):
+        means = (valid_values @ membership) / nb_values
+        # deviation of each well from the mean of its compound on its plate
+        well_means = np.full(values.shape, np.nan)
+        well_means[:, has_compound] = means[:, compound_codes[has_compound]]
+        squared_deviations = np.where(is_valid & has_compound, (values - well_means) ** 2, 0)
+        sds = np.sqrt((squared_deviations @ membership) / (nb_values - 1))
+        sds[nb_values < 2] = np.nan
+        cvs = sds / np.abs(means) * 100
+
+        z_factors = np.full(nb_plates, np.nan)
+        if positive_control in compound_names and negative_control in compound_names:
+            positive = compound_names.index(positive_control)
+            negative = compound_names.index(negative_control)
+            z_factors = 1 - 3 * (sds[:, positive] + sds[:, negative]) / np.abs(
+                means[:, positive] - means[:, negative]
+            )
+
+    return DataFrame(
+        {
+            "Plate": np.repeat(plate_names, nb_compounds),
+            "Compound": np.tile(np.array(compound_names, dtype=object), nb_plates),
+            "Nb wells": nb_wells.ravel().astype(np.int64),
+            "Nb values": nb_values.ravel().astype(np.int64),
+            "Mean": means.ravel(),
+            "SD": sds.ravel(),
+            "CV (%)": cvs.ravel(),
+            "Z' factor": np.repeat(z_factors, nb_compounds),
+        },
+        columns=BATCH_SUMMARY_COLUMNS,
+    )
@@ -0,0 +1,307 @@
+import numpy as np
+import pandas as pd
+from gws_core import (
+    ConfigParams,
+    ConfigSpecs,
+    InputSpec,
+    InputSpecs,
+    JSONDict,
+    OutputSpec,
+    OutputSpecs,
+    ResourceSet,
+    StrParam,
+    Table,
+    Task,
+    TaskInputs,
+    TaskOutputs,
+    TypingStyle,
+    task_decorator,
+)
+from gws_core.tag.tag import TagOrigins
+from pandas import DataFrame
+
+from gws_plate_reader.biolector_xt_data_parser.biolector_xt_long_format import (
+    build_long_format_data,
+)
+from gws_plate_reader.biolector_xt_data_parser.biolector_xt_tags import (
+    apply_well_tags,
+    build_well_column_tags,
+    build_well_tags,
+    get_user_tag_origins,
+)
+from gws_plate_reader.tecan.tecan_kinetic_parser import (
+    TecanKineticData,
+    align_channels,
+    parse_kinetic_table,
+)
+from gws_plate_reader.tecan.tecan_plate_format import parse_well
+
+
+@task_decorator(
+    "TecanKineticLoadData",
+    human_name="Load Tecan kinetic data",
+    short_description="Load a Tecan kinetic read into one time-indexed table per well",
+    style=TypingStyle.community_icon(icon_technical_name="table", background_color="#c3fa7f"),
+)
+class TecanKineticLoadData(Task):
+    """
+    Load a Tecan kinetic (time-resolved) read into one table per well, with the same layout as
+    the output of BiolectorXTLoadData, so Tecan kinetics go through the same subsampling, quality
+    check and feature extraction tasks.
+
+    ## Inputs
+    - **kinetic_data**: ResourceSet of Tables, one per label of the read (e.g. OD600, GFP). The
+      name of the resource is used as channel name. Each table is a Tecan kinetic export in one of
+      its two orientations:
+      - one row per cycle, with a time column ("Time [s]") and one column per well ("A1", ...)
+      - one row per well (index or first column), with the time row ("Time [s]") and one column
+        per cycle
+      Other rows or columns ("Cycle Nr.", "Temp. [°C]") are ignored. The time unit is read from
+      the label: [s] (default), [min] or [h].
+    - **plate_layout** (optional): JSONDict with the description of each well (e.g.
+      `{"A1": {"compound": "glucose"}}`).
+
+    ## Outputs
+    - **resource_set**: one Table per well named `{plate_name}_{well}` (e.g. plate_0_A1), with
+      the `Time` column (in hours, index column) and one data column per channel. The tables are
+      tagged with `batch` (plate name) and `sample` (well). Like in BiolectorXTLoadData, the
+      channels are aligned by cycle with the time of the first channel, wells without any value
+      are not output, and when a plate layout is provided:
+      - the wells of the layout without data get an empty table tagged `missing_value=raw_data`
+      - the wells with data that are not in the layout are tagged `missing_value=plate_layout`
+    - **metadata_table**: one row per well with the `Series` column (`{plate_name}_{well}`) and
+      the plate layout keys as `plate_{key}` columns, for the feature extraction.
+    - **long_format_table**: all the values with one row per value (Plate, Well, Channel, Time,
+      Value).
+    """
+
+    input_specs: InputSpecs = InputSpecs(
+        {
+            "kinetic_data": InputSpec(
+                ResourceSet,
+                human_name="Kinetic data",
+                short_description="ResourceSet of Tables, one per label (channel) of the kinetic read",
+            ),
+            "plate_layout": InputSpec(
+                JSONDict,
+                human_name="Plate layout",
+                short_description="JSON containing the plate layout",
+                optional=True,
+            ),
+        }
+    )
+
+    output_specs: OutputSpecs = OutputSpecs(
+        {
+            "resource_set": OutputSpec(
+                ResourceSet,
+                human_name="Parsed data tables resource set",
+                short_description="One table per well with all measurement channels as columns",
+                sub_class=True,
+            ),
+            "metadata_table": OutputSpec(
+                Table,
+                human_name="Metadata table for ML",
+                short_description="Table with well metadata for feature extraction",
+            ),
+            "long_format_table": OutputSpec(
+                Table,
+                human_name="Long format data table",
+                short_description="All the measurements with one row per value: Plate, Well, Channel, Time (h), Value",
+            ),
+        }
+    )
+
+    config_specs: ConfigSpecs = ConfigSpecs(
+        {
+            "plate_name": StrParam(
+                human_name="Plate name",
+                short_description="Name of the plate, used as batch tag and as prefix of the table names",
+                default_value="plate_0",
+            ),
+        }
+    )
+
+    def run(self, params: ConfigParams, inputs: TaskInputs) -> TaskOutputs:
+        kinetic_data: ResourceSet = inputs["kinetic_data"]
+        plate_layout_json: JSONDict | None = inputs.get("plate_layout")
+        plate_name: str = params.get_value("plate_name")
+
+        channels: dict[str, TecanKineticData] = {}
+        for channel_name, resource in kinetic_data.get_resources().items():
+            if not isinstance(resource, Table):
+                self.log_warning_message(f"Resource '{channel_name}' ignored, it is not a Table")
+                continue
+            try:
+                channels[channel_name] = parse_kinetic_table(resource.get_data())
+            except ValueError as err:
+                raise Exception(f"Error while parsing the channel '{channel_name}': {err}") from err
+        if not channels:
+            raise Exception("The kinetic data ResourceSet must contain at least one Table")
+
+        first_channel = next(iter(channels.values()))
+        for channel_name, channel in channels.items():
+            if channel.nb_cycles != first_channel.nb_cycles:
+                self.log_warning_message(
+                    f"The channel '{channel_name}' has {channel.nb_cycles} cycles instead of "
+                    f"{first_channel.nb_cycles}, the channels are aligned on the cycles of the "
+                    "first channel"
+                )
+        channels = align_channels(channels)
+        self.log_info_message(
+            f"Parsed {len(channels)} channel(s) of {first_channel.nb_cycles} cycles: "
+            f"{list(channels.keys())}"
+        )
+
+        plate_layout = self.get_plate_layout(plate_layout_json)
+        resource_set = self.create_parsed_resource_set(channels, plate_name, plate_layout)
+        self.log_success_message(
+            f"Created {len(resource_set.get_resources())} well tables for {plate_name}"
+        )
+
+        metadata_table = self.create_metadata_table(
+            list(resource_set.get_resources().keys()), plate_name, plate_layout
+        )
+
+        long_format_table = Table(
+            build_long_format_data(
+                plate_name,
+                {
+                    channel_name: channel.to_filter_table()
+                    for channel_name, channel in channels.items()
+                },
+            )
+        )
+        long_format_table.name = "Long format data table"
+
+        return {
+            "resource_set": resource_set,
+            "metadata_table": metadata_table,
+            "long_format_table": long_format_table,
+        }
+
+    def get_plate_layout(self, plate_layout_json: JSONDict | None) -> dict[str, dict] | None:
+        """
+        Get the plate layout with the wells in C1 format, the entries that are not wells are
+        ignored.
+
+        :param plate_layout_json: The plate layout, optional
+        :return: The description of each well, None if there is no plate layout
+        """
+        if plate_layout_json is None:
+            return None
+        plate_layout: dict[str, dict] = {}
+        for well, description in plate_layout_json.get_data().items():
+            parsed_well = parse_well(well)
+            if parsed_well is not None:
+                plate_layout[f"{parsed_well[0]}{parsed_well[1]}"] = description
+        return plate_layout
+
+    def create_parsed_resource_set(
+        self,
+        channels: dict[str, TecanKineticData],
+        plate_name: str,
+        plate_layout: dict[str, dict] | None = None,
+    ) -> ResourceSet:
+        """
+        Create one table per well with the time (in hours) and the value of each channel.
+
+        :param channels: The data of each channel, aligned with `align_channels`
+        :param plate_name: Name of the plate, used as batch tag and as prefix of the table names
+        :param plate_layout: Optional plate layout, with the wells in C1 format
+        :return: ResourceSet containing one table per well
+        """
+        resource_set = ResourceSet()
+        if not channels:
+            return resource_set
+
+        first_channel = next(iter(channels.values()))
+        wells = first_channel.wells
+        times = first_channel.times / 3600
+        # channel x well x cycle, a well table is one slice of the stack
+        stack = np.stack([channel.values for channel in channels.values()])
+        has_values = ~np.isnan(stack).all(axis=(0, 2))
+
+        origins = get_user_tag_origins()
+        column_names = ["Time", *channels.keys()]
+        column_tags = build_well_column_tags(column_names)
+
+        for well_idx in np.flatnonzero(has_values):
+            well = wells[well_idx]
+            well_df = DataFrame(
+                np.column_stack([times, stack[:, well_idx, :].T]), columns=column_names
+            )
+            missing_value = None
+            if plate_layout is not None and well not in plate_layout:
+                missing_value = "plate_layout"
+            self._add_well_table(
+                resource_set, well_df, plate_name, well, column_tags, origins, missing_value
+            )
+
+        if plate_layout is not None:
+            # wells of the plate layout without data
+            wells_with_data = {wells[well_idx] for well_idx in np.flatnonzero(has_values)}
+            missing_wells = [well for well in plate_layout if well not in wells_with_data]
+            if missing_wells:
+                self.log_info_message(
+                    f"⚠️ {len(missing_wells)} missing wells (in plate layout but no data)"
+                )
+            empty_column_tags = build_well_column_tags(["Time"])
+            for well in missing_wells:
+                self._add_well_table(
+                    resource_set,
+                    DataFrame({"Time": []}),
+                    plate_name,
+                    well,
+                    empty_column_tags,
+                    origins,
+                    "raw_data",
+                )
+
+        return resource_set
+
+    def create_metadata_table(
+        self, table_names: list[str], plate_name: str, plate_layout: dict[str, dict] | None
+    ) -> Table:
+        """
+        Create the metadata table of the wells: the Series column and one `plate_{key}` column
+        per key of the plate layout.
+
+        :param table_names: The names of the well tables ({plate_name}_{well})
+        :param plate_name: Name of the plate
+        :param plate_layout: Optional plate layout, with the wells in C1 format
+        :return: Table with one row per well table
+        """
+        metadata_rows = []
+        for table_name in table_names:
+            metadata_row = {"Series": table_name}
+            well = table_name[len(plate_name) + 1 :]
+            well_description = (plate_layout or {}).get(well)
+            if isinstance(well_description, dict):
+                for key, value in well_description.items():
+                    metadata_row[f"plate_{key}"] = value
+            metadata_rows.append(metadata_row)
+
+        metadata_df = pd.DataFrame(metadata_rows) if metadata_rows else DataFrame({"Series": []})
+        metadata_table = Table(metadata_df)
+        metadata_table.name = "Metadata table"
+        return metadata_table
+
+    def _add_well_table(
+        self,
+        resource_set: ResourceSet,
+        well_df: DataFrame,
+        plate_name: str,
+        well: str,
+        column_tags: list[dict[str, str]],
+        origins: TagOrigins,
+        missing_value: str | None,
+    ) -> None:
+        table_name = f"{plate_name}_{well}"
+        table = Table(well_df)
+        table.name = table_name
+        well_tags = build_well_tags(
+            origins, batch=plate_name, sample=well, missing_value=missing_value
+        )
+        apply_well_tags(table, column_tags, well_tags)
+        resource_set.add_resource(table, table_name)
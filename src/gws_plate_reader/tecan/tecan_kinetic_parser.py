@@ -0,0 +1,149 @@
+import re
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+
+from gws_plate_reader.tecan.tecan_plate_format import parse_well
+
+# time labels of the Tecan exports: "Time [s]", "Time [min]", "Time [h]" or "Time"
+_TIME_LABEL_PATTERN = re.compile(r"^time\s*(?:\[\s*(s|sec|min|h)\s*\])?$", re.IGNORECASE)
+_TIME_UNIT_IN_SECONDS = {None: 1, "s": 1, "sec": 1, "min": 60, "h": 3600}
+
+
+def get_time_unit_in_seconds(label: str) -> int | None:
+    """
+    Get the unit of a Tecan time label in seconds.
+
+    :param label: A row or column label of the export (e.g. "Time [s]")
+    :return: The number of seconds of the unit (1, 60 or 3600), None if the label is not a time
+        label. A label without unit ("Time") is in seconds, the unit of the Tecan exports.
+    """
+    match = _TIME_LABEL_PATTERN.match(str(label).strip())
+    if match is None:
+        return None
+    unit = match.group(1).lower() if match.group(1) else None
+    return _TIME_UNIT_IN_SECONDS[unit]
+
+
+@dataclass
+class TecanKineticData:
+    """Values of one label (channel) of a Tecan kinetic read, aligned by cycle."""
+
+    # time of each cycle, in seconds
+    times: np.ndarray
+    # well names in C1 format (A1, B12, AA3), in the order of the rows of values
+    wells: list[str]
+    # values, well x cycle, NaN for the missing or non numeric values
+    values: np.ndarray
+
+    @property
+    def nb_cycles(self) -> int:
+        return len(self.times)
+
+    def to_filter_table(self) -> DataFrame:
+        """
+        Get the wide table of the channel: the 'time' column (in seconds) and one column per well,
+        the format of `BiolectorRawDataIndex.get_filter_tables`.
+        """
+        table = DataFrame(self.values.T, columns=self.wells)
+        table.insert(0, "time", self.times)
+        return table
+
+
+def parse_kinetic_table(data: DataFrame) -> TecanKineticData:
+    """
+    Parse one label of a Tecan kinetic export.
+
+    The two orientations of the exports are supported:
+    - one row per cycle: a time column ("Time [s]") and one column per well ("A1", "A2", ...)
+    - one row per well: the time row ("Time [s]") and the well rows as index or in the first
+      column, one column per cycle
+
+    The other rows or columns ("Cycle Nr.", "Temp. [°C]", ...) are ignored. The wells are
+    renamed in C1 format (A01 → A1) and the cycles without time are removed.
+
+    :param data: The table of the label
+    :return: The times and the values of the wells
+    """
+    cycles_as_rows = _find_time_label(data.columns) is not None
+    if not cycles_as_rows:
+        data = _get_wells_as_rows(data).T
+
+    time_label = _find_time_label(data.columns)
+    if time_label is None:
+        raise ValueError("The kinetic table has no time row or column, expected a 'Time [s]' label")
+
+    wells: list[str] = []
+    well_columns = []
+    for column in data.columns:
+        parsed_well = parse_well(str(column))
+        if parsed_well is None:
+            continue
+        wells.append(f"{parsed_well[0]}{parsed_well[1]}")
+        well_columns.append(column)
+    if not wells:
+        raise ValueError("The kinetic table has no well row or column (A1, A2, ...)")
+    if len(set(wells)) != len(wells):
+        raise ValueError("The kinetic table has duplicated wells")
+
+    times = pd.to_numeric(data[time_label], errors="coerce").to_numpy(dtype=np.float64)
+    values = data[well_columns].apply(pd.to_numeric, errors="coerce").to_numpy(dtype=np.float64)
+    has_time = ~np.isnan(times)
+    return TecanKineticData(
+        times=times[has_time] * get_time_unit_in_seconds(time_label),
+        wells=wells,
+        # well x cycle, one contiguous row per well
+        values=np.ascontiguousarray(values[has_time].T),
+    )
+
+
+def align_channels(channels: dict[str, TecanKineticData]) -> dict[str, TecanKineticData]:
+    """
+    Align the channels of a kinetic read by cycle, like the filtersets of a BiolectorXT run: the
+    time of a cycle is the time of the first channel, the cycles after the last cycle of the
+    first channel are removed and the missing cycles of the other channels are NaN. The wells
+    are the wells of all the channels, in plate order.
+
+    :param channels: The data of each channel
+    :return: The aligned data of each channel, with the same times and wells
+    """
+    if not channels:
+        return {}
+    times = next(iter(channels.values())).times
+    nb_cycles = len(times)
+    all_wells = {well for channel in channels.values() for well in channel.wells}
+    wells = sorted(all_wells, key=_get_well_sort_key)
+
+    aligned_channels: dict[str, TecanKineticData] = {}
+    for channel_name, channel in channels.items():
+        values = np.full((len(wells), nb_cycles), np.nan)
+        rows = pd.Index(wells).get_indexer(channel.wells)
+        nb_shared_cycles = min(nb_cycles, channel.nb_cycles)
+        values[rows, :nb_shared_cycles] = channel.values[:, :nb_shared_cycles]
+        aligned_channels[channel_name] = TecanKineticData(times=times, wells=wells, values=values)
+    return aligned_channels
+
+
+def _find_time_label(labels: pd.Index) -> str | None:
+    for label in labels:
+        if get_time_unit_in_seconds(label) is not None:
+            return label
+    return None
+
+
+def _get_wells_as_rows(data: DataFrame) -> DataFrame:
+    """Get a table with one row per well with the row labels as index."""
+    if _find_time_label(data.index) is not None:
+        return data
+    # labels in the first column, as in the exports read without index
+    first_column = data.columns[0]
+    if _find_time_label(data[first_column].astype(str)) is not None:
+        return data.set_index(first_column)
+    raise ValueError("The kinetic table has no time row or column, expected a 'Time [s]' label")
+
+
+def _get_well_sort_key(well: str) -> tuple[int, str, int]:
+    row_label, col = parse_well(well)
+    return len(row_label), row_label, col
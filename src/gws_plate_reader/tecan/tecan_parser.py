@@ -1,27 +1,40 @@
 import json
-import math
-import copy
-import itertools
 import numpy as np
 from gws_core import Table, JSONDict
+from pandas import DataFrame
+
+from gws_plate_reader.tecan.tecan_plate_format import PLATE_96, TecanPlateFormat
+from gws_plate_reader.tecan.tecan_well_index import TecanWellIndex
 
 class TecanParser:
-    def __init__(self, data_file: Table = None, plate_layout : JSONDict = None):
+    def __init__(self, data_file: Table = None, plate_layout : JSONDict = None,
+                 plate_format: TecanPlateFormat = None):
         """
         Initialize the TecanParser object with the data file.
+
+        :param plate_format: Format of the plate (96, 384 or 1536 wells), detected from the
+            rows and columns of the data file if not provided (96 wells without data file)
         """
         super().__init__()
+        self._well_index = None
+        # data table with the excluded wells set to NaN, materialized when needed
+        self._data = None
+        self.plate_format = plate_format
 
         if data_file is not None:
             self.data_file = data_file
             self.plate_layout = plate_layout
+            if self.plate_format is None:
+                self.plate_format = TecanPlateFormat.detect(data_file.get_data())
+
+        if self.plate_format is None:
+            self.plate_format = PLATE_96
+        # wells removed from the data, in the order of the wells of the plate
+        self._excluded_wells = np.zeros(self.plate_format.nb_wells, dtype=bool)
 
     def get_wells_tecan(self):
-        # Generate all possible values from A1 to H12
-        rows = [chr(i) for i in range(ord('A'), ord('H') + 1)]
-        cols = [str(i) for i in range(1, 13)]
-        all_values = [r + c for r, c in itertools.product(rows, cols)]
-        return all_values
+        # Generate all the wells of the plate, from A1 to H12 for a 96-well plate
+        return list(self.plate_format.wells)
 
     def get_wells_filled_with_info(self):
         return self.plate_layout.get_data().keys()
@@ -43,54 +56,57 @@ class TecanParser:
         wells = self.get_wells_tecan()
         # Initialize the wells_label dictionary with all well labels and default value as None
         wells_label = {well: {} for well in wells}
-        metadata_well = copy.deepcopy(self.plate_layout.get_data())
+        metadata_well = self.plate_layout.get_data()
 
-        # Strip and update values for existing wells
+        # Strip and update values for existing wells, with a copy of the description so the
+        # layout is not modified through the returned dict
         for well, description in metadata_well.items():
             if well in wells_label:
-                wells_label[well] = description
+                wells_label[well] = dict(description) if isinstance(description, dict) else description
         return wells_label
 
+    def get_well_index(self) -> TecanWellIndex:
+        """Give the well index of the plate (values and compounds by well), built once."""
+        if self._well_index is None:
+            plate_layout = self.plate_layout.get_data() if self.plate_layout is not None else {}
+            self._well_index = TecanWellIndex(
+                self.plate_format, self.data_file.get_data(), plate_layout, self._excluded_wells
+            )
+        return self._well_index
+
+    def get_excluded_wells(self) -> list[str]:
+        """Give the wells removed with remove_wells_from_dataframe."""
+        return [well for well, excluded in zip(self.plate_format.wells, self._excluded_wells) if excluded]
+
     def enrich_well_metadata(self):
-        wells_dict = self.get_wells_label_description_dict()
-        df = self.data_file.get_data()
         # Add the 'data' key to each well in the dictionary
-        for well, info in wells_dict.items():
-            row = well[0]  # First character of well (A, B, etc.)
-            col = int(well[1:])  # Remaining characters as column number
-            if row in df.index and str(col) in df.columns:
-                if well not in wells_dict:
-                    wells_dict[well] = {}  # Initialize `well` if it doesn't exist
-                if "data" not in wells_dict[well]:
-                    wells_dict[well]["data"] = np.nan  # Initialize or handle default value if needed
-                wells_dict[well]["data"] = df.at[row, str(col)]
-        return wells_dict
+        return self.get_well_index().get_enriched_wells()
 
     def get_wells_list_by_compound_type(self, compound_name):
-        wells_dict = self.enrich_well_metadata()
         # Filter the wells that have the specified compound
-        selected_wells = [
-            well for well, description in wells_dict.items() if description.get("compound") == compound_name
-        ]
-        return selected_wells
+        return self.get_well_index().get_wells_by_compound(compound_name)
 
     def remove_wells_from_dataframe(self, wells):
         """
         Remove the cells corresponding to the specified wells by replacing them with NaN.
 
+        The removed wells are kept as a mask over the wells of the plate: the data table given
+        to the parser is not modified, the data with the removed wells is built only when it is
+        read (parse_data).
+
         Args:
-        df (pd.DataFrame): The input DataFrame with row labels and numeric column labels.
         wells (list): List of well identifiers (e.g., "A1", "B2") to remove.
 
         Returns:
-        pd.DataFrame: The updated DataFrame with specified wells set to NaN.
+        pd.DataFrame: The data with specified wells set to NaN, without the rows and columns
+        where all values are NaN.
         """
-        df = self.data_file.get_data()
-        for well in wells:
-            row = well[0]  # Row label (e.g., 'A')
-            col = int(well[1:])  # Column number (e.g., '1')
-            if row in df.index and str(col) in df.columns:
-                df.at[row, str(col)] = np.nan
+        mask = self.get_well_index().get_mask(wells) & ~self._excluded_wells
+        if mask.any():
+            self._excluded_wells = self._excluded_wells | mask
+            self._well_index.exclude(mask)
+            self._data = None
+        df = self.parse_data()
         # Remove rows and columns where all values are NaN
         df = df.dropna(how="all", axis=0)  # Remove rows
         df = df.dropna(how="all", axis=1)  # Remove columns
@@ -98,26 +114,35 @@ class TecanParser:
 
     def mean_data_for_compound(self, compound_name):
         """Give the mean of values of a certain compound"""
-        wells_dict = copy.deepcopy(self.enrich_well_metadata())
-        # Filter the wells that have the specified compound
-        selected_wells = [
-            well["data"]
-            for well in wells_dict.values()
-            if well.get("compound") == compound_name and not math.isnan(well["data"])
-        ]
-        # Calculate the mean of the "data" values
-        if selected_wells:
-            return sum(selected_wells) / len(selected_wells)
-        else:
-            return None  # Return None if no wells with the specified compound were found
+        # Mean of the non NaN values of the wells that have the specified compound,
+        # None if no wells with the specified compound were found
+        return self.get_well_index().get_compound_mean(compound_name)
 
     def parse_data(self):
         ## Step 1
         # Data import
-        row_data = self.data_file.get_data()
-
-        return row_data
+        if self._data is None:
+            self._data = self._mask_excluded_wells(self.data_file.get_data())
+        return self._data
+
+    def _mask_excluded_wells(self, df: DataFrame) -> DataFrame:
+        """Give the data with the excluded wells set to NaN, the data itself if there are none."""
+        well_index = self.get_well_index()
+        mask = self._excluded_wells & well_index.has_data
+        if not mask.any():
+            return df
+        # Cells of the excluded wells, set to NaN in a single operation
+        cells_to_remove = np.zeros(df.shape, dtype=bool)
+        cells_to_remove[
+            df.index.get_indexer(well_index.row_labels[mask]),
+            df.columns.get_indexer(well_index.col_labels[mask]),
+        ] = True
+        return df.mask(cells_to_remove)
 
     def update_row_data(self, updated_row_data):
         self.data_file = Table(updated_row_data)
+        # the new data replaces the data with the removed wells
+        self._excluded_wells = np.zeros(self.plate_format.nb_wells, dtype=bool)
+        self._well_index = None
+        self._data = None
 
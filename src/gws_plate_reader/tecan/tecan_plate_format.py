@@ -0,0 +1,125 @@
+import re
+from dataclasses import dataclass
+from functools import cached_property
+
+from pandas import DataFrame
+
+_WELL_PATTERN = re.compile(r"^([A-Z]+)0*(\d+)$")
+
+
+def get_row_label(row_position: int) -> str:
+    """Get the label of a plate row from its position: A to Z, then AA, AB, ... (1536 plates)."""
+    label = ""
+    row_position += 1
+    while row_position > 0:
+        row_position, remainder = divmod(row_position - 1, 26)
+        label = chr(ord("A") + remainder) + label
+    return label
+
+
+def get_row_position(row_label: str) -> int:
+    """Get the position of a plate row from its label (A → 0, Z → 25, AA → 26)."""
+    position = 0
+    for letter in row_label:
+        position = position * 26 + ord(letter) - ord("A") + 1
+    return position - 1
+
+
+def parse_well(well: str) -> tuple[str, int] | None:
+    """
+    Split a well name into its row label and its column number (e.g. AB12 → ("AB", 12)).
+
+    :param well: The well name, the column can have leading zeros (A01)
+    :return: The row label and the column number, None if the name is not a well name
+    """
+    match = _WELL_PATTERN.match(well.strip().upper()) if isinstance(well, str) else None
+    if match is None:
+        return None
+    return match.group(1), int(match.group(2))
+
+
+@dataclass(frozen=True)
+class TecanPlateFormat:
+    """Size of a microplate: 96 (8 x 12), 384 (16 x 24) or 1536 (32 x 48) wells."""
+
+    nb_rows: int
+    nb_cols: int
+
+    @property
+    def nb_wells(self) -> int:
+        return self.nb_rows * self.nb_cols
+
+    @cached_property
+    def row_labels(self) -> list[str]:
+        """Labels of the rows (A, B, ...)."""
+        return [get_row_label(row) for row in range(self.nb_rows)]
+
+    @cached_property
+    def col_labels(self) -> list[str]:
+        """Labels of the columns ("1", "2", ...), as in the columns of the data tables."""
+        return [str(col) for col in range(1, self.nb_cols + 1)]
+
+    @cached_property
+    def wells(self) -> list[str]:
+        """Names of the wells in row-major order (A1, A2, ..., B1, ...)."""
+        return [row + col for row in self.row_labels for col in self.col_labels]
+
+    def get_well_position(self, well: str) -> int | None:
+        """
+        Get the position of a well in row-major order.
+
+        :param well: The well name (e.g. B3 or B03)
+        :return: The position, None if the name is not a well of the plate
+        """
+        parsed_well = parse_well(well)
+        if parsed_well is None:
+            return None
+        row = get_row_position(parsed_well[0])
+        col = parsed_well[1] - 1
+        if not (0 <= row < self.nb_rows and 0 <= col < self.nb_cols):
+            return None
+        return row * self.nb_cols + col
+
+    @classmethod
+    def from_nb_wells(cls, nb_wells: int) -> "TecanPlateFormat":
+        """Get the standard plate format with this number of wells (96, 384 or 1536)."""
+        for plate_format in STANDARD_PLATE_FORMATS:
+            if plate_format.nb_wells == nb_wells:
+                return plate_format
+        raise ValueError(
+            f"Unsupported plate format with {nb_wells} wells, the supported formats are "
+            f"{[plate_format.nb_wells for plate_format in STANDARD_PLATE_FORMATS]}"
+        )
+
+    @classmethod
+    def detect(cls, data: DataFrame) -> "TecanPlateFormat":
+        """
+        Get the smallest standard plate format that contains all the rows and columns of a
+        data table (row labels as index, column numbers as columns).
+
+        :param data: The data table
+        :return: The plate format, 96 wells for an empty table
+        """
+        row_positions = [
+            get_row_position(str(label).strip().upper())
+            for label in data.index
+            if str(label).strip().isalpha()
+        ]
+        col_numbers = [
+            int(str(label).strip()) for label in data.columns if str(label).strip().isdigit()
+        ]
+        nb_rows = max(row_positions, default=0) + 1
+        nb_cols = max(col_numbers, default=1)
+        for plate_format in STANDARD_PLATE_FORMATS:
+            if nb_rows <= plate_format.nb_rows and nb_cols <= plate_format.nb_cols:
+                return plate_format
+        raise ValueError(
+            f"The data table has {nb_rows} rows and {nb_cols} columns, it does not fit in a "
+            "1536-well plate"
+        )
+
+
+PLATE_96 = TecanPlateFormat(nb_rows=8, nb_cols=12)
+PLATE_384 = TecanPlateFormat(nb_rows=16, nb_cols=24)
+PLATE_1536 = TecanPlateFormat(nb_rows=32, nb_cols=48)
+STANDARD_PLATE_FORMATS = [PLATE_96, PLATE_384, PLATE_1536]
@@ -0,0 +1,239 @@
+import numpy as np
+import pandas as pd
+from pandas import DataFrame, Index
+
+from gws_plate_reader.tecan.tecan_plate_format import TecanPlateFormat
+
+
+def build_layout_grid(
+    plate_format: TecanPlateFormat, plate_layout: dict | None
+) -> tuple[np.ndarray, dict[int, dict]]:
+    """
+    Place the plate layout on the grid of a plate, wells that are not in the plate are ignored.
+
+    :param plate_format: The format of the plate
+    :param plate_layout: The description of each well, with an optional 'compound' key
+    :return: The compound of each well (row x column, None when not defined) and the
+        description of the wells of the layout by well position (row-major), the descriptions
+        are the dicts of the layout and must not be modified
+    """
+    compound_grid = np.full((plate_format.nb_rows, plate_format.nb_cols), None, dtype=object)
+    descriptions: dict[int, dict] = {}
+    for well, description in (plate_layout or {}).items():
+        position = plate_format.get_well_position(well)
+        if position is None:
+            continue
+        descriptions[position] = description
+        if isinstance(description, dict):
+            compound_grid.flat[position] = description.get("compound")
+    return compound_grid, descriptions
+
+
+class TecanWellIndex:
+    """
+    Values and layout of the wells of a Tecan plate, built once per TecanParser.
+
+    The plate is stored as row x column grids (values, compounds, presence in the data table)
+    with the row and column labels of the plate format, so plates of 96, 384 or 1536 wells are
+    handled with array operations. The flat arrays (`values`, `compounds`, ...) are views of the
+    grids in row-major order, the order of `wells`. Compound masks, well lists and means are
+    kept, so repeated calls for the same compound are dictionary lookups.
+
+    Excluded wells are kept as a mask: their values are NaN in the index, the data table is
+    not modified. The index must be rebuilt when the data table or the plate layout change.
+    """
+
+    plate_format: TecanPlateFormat
+    # True when the row and the column of the well are in the data table, rows x columns
+    has_data_grid: np.ndarray
+    # value of each well as in the data table, None when the well is not in the table
+    raw_value_grid: np.ndarray
+    # numeric value of each well, NaN when the well has no numeric value or is excluded
+    value_grid: np.ndarray
+    # compound of each well in the plate layout, None when not defined
+    compound_grid: np.ndarray
+    # plate layout description of the wells of the plate layout, by well position
+    descriptions: dict[int, dict]
+    # True for the wells excluded from the data, in the order of `wells`
+    excluded: np.ndarray
+
+    _compound_masks: dict[str, np.ndarray]
+    _compound_wells: dict[str, list[str]]
+    _compound_means: dict[str, float | None]
+
+    def __init__(
+        self,
+        plate_format: TecanPlateFormat,
+        data: DataFrame,
+        plate_layout: dict | None,
+        excluded: np.ndarray | None = None,
+    ) -> None:
+        """
+        :param plate_format: The format of the plate
+        :param data: The data table, one row per plate row (A, B, ...) and one column per plate
+            column ("1", "2", ...)
+        :param plate_layout: The description of each well, with an optional 'compound' key
+        :param excluded: Mask of the wells excluded from the data, in the order of `wells`
+        """
+        self.plate_format = plate_format
+        grid_shape = (plate_format.nb_rows, plate_format.nb_cols)
+
+        row_positions = Index(data.index).get_indexer(plate_format.row_labels)
+        col_positions = Index(data.columns).get_indexer(plate_format.col_labels)
+        self.has_data_grid = (row_positions >= 0)[:, None] & (col_positions >= 0)[None, :]
+
+        self.raw_value_grid = np.full(grid_shape, None, dtype=object)
+        if self.has_data_grid.any():
+            known_rows = row_positions >= 0
+            known_cols = col_positions >= 0
+            self.raw_value_grid[np.ix_(known_rows, known_cols)] = data.to_numpy(dtype=object)[
+                np.ix_(row_positions[known_rows], col_positions[known_cols])
+            ]
+        self.value_grid = (
+            pd.to_numeric(pd.Series(self.raw_value_grid.ravel()), errors="coerce")
+            .to_numpy(dtype=np.float64, copy=True)
+            .reshape(grid_shape)
+        )
+
+        self.compound_grid, self.descriptions = build_layout_grid(plate_format, plate_layout)
+
+        self._compound_masks = {}
+        self._compound_wells = {}
+        self._compound_means = {}
+
+        self.excluded = np.zeros(plate_format.nb_wells, dtype=bool)
+        if excluded is not None:
+            self.exclude(excluded)
+
+    @property
+    def wells(self) -> list[str]:
+        return self.plate_format.wells
+
+    @property
+    def has_data(self) -> np.ndarray:
+        return self.has_data_grid.ravel()
+
+    @property
+    def values(self) -> np.ndarray:
+        return self.value_grid.ravel()
+
+    @property
+    def compounds(self) -> np.ndarray:
+        return self.compound_grid.ravel()
+
+    @property
+    def row_labels(self) -> np.ndarray:
+        """Row label of each well, in the order of `wells`."""
+        return np.repeat(
+            np.array(self.plate_format.row_labels, dtype=object), self.plate_format.nb_cols
+        )
+
+    @property
+    def col_labels(self) -> np.ndarray:
+        """Column label of each well, in the order of `wells`."""
+        return np.tile(
+            np.array(self.plate_format.col_labels, dtype=object), self.plate_format.nb_rows
+        )
+
+    def get_compound_mask(self, compound_name: str) -> np.ndarray:
+        """Get the mask of the wells of a compound, in the order of `wells` (read-only)."""
+        mask = self._compound_masks.get(compound_name)
+        if mask is None:
+            mask = self.compounds == compound_name
+            mask.flags.writeable = False
+            self._compound_masks[compound_name] = mask
+        return mask
+
+    def get_wells_by_compound(self, compound_name: str) -> list[str]:
+        """Get the wells of a compound, in the order of `wells`."""
+        wells = self._compound_wells.get(compound_name)
+        if wells is None:
+            wells = [self.wells[i] for i in np.flatnonzero(self.get_compound_mask(compound_name))]
+            self._compound_wells[compound_name] = wells
+        return list(wells)
+
+    def get_compound_mean(self, compound_name: str) -> float | None:
+        """
+        Get the mean value of the wells of a compound, wells without value are ignored.
+
+        :param compound_name: The compound
+        :return: The mean, None if no well of the compound has a value
+        """
+        if compound_name not in self._compound_means:
+            values = self.values[self.get_compound_mask(compound_name) & ~np.isnan(self.values)]
+            self._compound_means[compound_name] = (
+                float(values.sum() / len(values)) if len(values) else None
+            )
+        return self._compound_means[compound_name]
+
+    def get_compound_statistics(self) -> DataFrame:
+        """
+        Get the statistics of the values of each compound of the plate layout, in one pass.
+
+        :return: DataFrame indexed by compound with the number of wells, the number of values,
+            the mean and the standard deviation (ddof=1) of the values
+        """
+        compound_codes, compound_names = pd.factorize(pd.Series(self.compounds), sort=True)
+        has_compound = compound_codes >= 0
+        values = self.values[has_compound]
+        codes = compound_codes[has_compound]
+        is_valid = ~np.isnan(values)
+
+        nb_compounds = len(compound_names)
+        nb_wells = np.bincount(codes, minlength=nb_compounds)
+        nb_values = np.bincount(codes[is_valid], minlength=nb_compounds)
+        sums = np.bincount(codes[is_valid], weights=values[is_valid], minlength=nb_compounds)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            means = sums / nb_values
+            squared_deviations = np.bincount(
+                codes[is_valid],
+                weights=(values[is_valid] - means[codes[is_valid]]) ** 2,
+                minlength=nb_compounds,
+            )
+            stds = np.sqrt(squared_deviations / (nb_values - 1))
+        stds[nb_values < 2] = np.nan
+
+        return DataFrame(
+            {"nb_wells": nb_wells, "nb_values": nb_values, "mean": means, "std": stds},
+            index=Index(compound_names, name="compound"),
+        )
+
+    def exclude(self, mask: np.ndarray) -> None:
+        """
+        Exclude wells from the data, their values become NaN. The grids are owned by the index,
+        the data table is not modified.
+
+        :param mask: Mask of the wells to exclude, in the order of `wells`
+        """
+        new_excluded = mask & ~self.excluded
+        if not new_excluded.any():
+            return
+        self.excluded |= new_excluded
+        grid_shape = self.value_grid.shape
+        self.value_grid[new_excluded.reshape(grid_shape)] = np.nan
+        self.raw_value_grid[(new_excluded & self.has_data).reshape(grid_shape)] = np.nan
+        self._compound_means = {}
+
+    def get_mask(self, wells: list[str]) -> np.ndarray:
+        """Get the mask of a list of wells, unknown wells are ignored."""
+        mask = np.zeros(self.plate_format.nb_wells, dtype=bool)
+        positions = [self.plate_format.get_well_position(well) for well in wells]
+        mask[[position for position in positions if position is not None]] = True
+        return mask
+
+    def get_enriched_wells(self) -> dict[str, dict]:
+        """
+        Get the description of each well with its value in the 'data' key.
+
+        The 'data' key is only set for the wells that are in the data table. A new dict is
+        returned on each call, it can be modified.
+        """
+        enriched_wells: dict[str, dict] = {}
+        for position, (well, has_data, raw_value) in enumerate(
+            zip(self.wells, self.has_data, self.raw_value_grid.ravel(), strict=True)
+        ):
+            enriched_well = dict(self.descriptions.get(position, {}))
+            if has_data:
+                enriched_well["data"] = raw_value
+            enriched_wells[well] = enriched_well
+        return enriched_wells
@@ -0,0 +1,173 @@
+import json
+import os
+
+import numpy as np
+import pandas as pd
+from gws_core import BaseTestCase, Settings
+from gws_plate_reader.biolector_xt_data_parser import BiolectorXTLoadData
+from gws_plate_reader.biolector_xt_data_parser.biolector_live_data_index import (
+    BiolectorLiveDataIndex,
+    BiolectorLiveExperiment,
+    update_well_data,
+)
+from gws_plate_reader.biolector_xt_data_parser.biolector_raw_data_index import (
+    BiolectorRawDataIndex,
+)
+from gws_plate_reader.biolector_xt_data_parser.biolector_xt_csv_reader import read_raw_data_csv
+
+
+def make_running_export(nb_cycles: int, nb_channels: int) -> tuple[pd.DataFrame, dict]:
+    """Create the export of an experiment, the wells of a cycle are measured one after the other."""
+    rng = np.random.default_rng(0)
+    wells = [f"{row}{str(col).zfill(2)}" for row in "ABCDEF" for col in range(1, 9)]
+    rows = []
+    for cycle in range(nb_cycles):
+        for channel in range(nb_channels):
+            for well_idx, well in enumerate(wells):
+                rows.append(
+                    {
+                        "Well": well,
+                        "Filterset": f"Filterset {channel}",
+                        "Time": cycle * 900.0 + channel * 200 + well_idx * 2,
+                        # some wells have missing values
+                        "Cal": np.nan if rng.random() < 0.02 else rng.normal(10, 2),
+                    }
+                )
+    metadata = {"Channels": [{"Name": f"Channel {i}"} for i in range(nb_channels)]}
+    return pd.DataFrame(rows), metadata
+
+
+class TestBiolectorLiveDataIndex(BaseTestCase):
+    """Tests for the incremental parsing of running BiolectorXT experiments."""
+
+    def test_incremental_update_identical_to_full_parse(self):
+        """After each refresh, the tables and well data are the same as a full parse."""
+        data, metadata = make_running_export(nb_cycles=40, nb_channels=3)
+        loader = BiolectorXTLoadData()
+        filters = loader.get_filters(metadata)
+        live_index = BiolectorLiveDataIndex()
+        well_data: dict[str, pd.DataFrame] = {}
+
+        # refreshes in the middle of cycles, each refresh downloads the whole export so far
+        for time_cut in [1000.5, 7301.5, 7333.5, 20000.5, 40 * 900.0]:
+            export = data[data["Time"] <= time_cut]
+            changed_cycles = live_index.update(export)
+            well_data = update_well_data(well_data, live_index, filters, changed_cycles)
+
+            expected_tables = BiolectorRawDataIndex(export).get_filter_tables(filters)
+            for filter_name, table in live_index.get_filter_tables(filters).items():
+                pd.testing.assert_frame_equal(table, expected_tables[filter_name])
+
+            parsed_data = loader.parse_data(export, metadata)
+            first_df = parsed_data[filters[0]]
+            expected_wells = []
+            for well in live_index.wells:
+                expected = first_df[["Time"]].copy()
+                for filter_name, filter_df in parsed_data.items():
+                    expected[filter_name] = filter_df[well]
+                if expected.drop(columns=["Time"]).isna().all().all():
+                    continue
+                expected_wells.append(well)
+                pd.testing.assert_frame_equal(well_data[well], expected, check_index_type=False)
+            self.assertEqual(sorted(well_data.keys()), sorted(expected_wells))
+
+    def test_update_processes_only_new_rows(self):
+        """Rows already processed are ignored, the changed cycles start at the new data."""
+        data, _ = make_running_export(nb_cycles=10, nb_channels=2)
+        live_index = BiolectorLiveDataIndex()
+
+        first_changes = live_index.update(data[data["Time"] < 5 * 900])
+        self.assertEqual(first_changes, {"Filterset 0": 0, "Filterset 1": 0})
+        self.assertEqual(live_index.get_nb_cycles(), {"Filterset 0": 5, "Filterset 1": 5})
+        self.assertEqual(live_index.get_last_processed_times("Filterset 1")["A01"], 4 * 900 + 200)
+
+        # same export again: nothing to process
+        self.assertEqual(live_index.update(data[data["Time"] < 5 * 900]), {})
+
+        changes = live_index.update(data)
+        # wells with missing values have their next values in the previous cycles
+        self.assertEqual(sorted(changes.keys()), ["Filterset 0", "Filterset 1"])
+        self.assertTrue(all(0 < cycle <= 5 for cycle in changes.values()))
+        self.assertEqual(live_index.get_nb_cycles(), {"Filterset 0": 10, "Filterset 1": 10})
+        new_cycles = live_index.get_filter_tables(["Channel 0"], {"Filterset 0": 5})["Channel 0"]
+        self.assertEqual(list(new_cycles.index), [5, 6, 7, 8, 9])
+
+    def test_filterset_with_missing_values_beyond_capacity(self):
+        """A filterset without values after the initial capacity still gives one row per cycle."""
+        nb_cycles = 300
+        wells = ["A01", "A02"]
+        data = pd.DataFrame(
+            {
+                "Well": wells * nb_cycles * 2,
+                "Filterset": ["Filterset 0"] * 2 * nb_cycles + ["Filterset 1"] * 2 * nb_cycles,
+                "Time": [cycle * 900.0 for cycle in range(nb_cycles) for _ in wells] * 2,
+                # Filterset 0 has no value yet, Filterset 1 has no value after cycle 10
+                "Cal": [np.nan] * 2 * nb_cycles
+                + [1.0] * 2 * 10
+                + [np.nan] * 2 * (nb_cycles - 10),
+            }
+        )
+        live_index = BiolectorLiveDataIndex()
+        live_index.update(data[data["Time"] < 100 * 900])
+        live_index.update(data)
+
+        tables = live_index.get_filter_tables(["Channel 0", "Channel 1"])
+        for table in tables.values():
+            self.assertEqual(len(table), nb_cycles)
+            self.assertEqual(table["time"].iloc[-1], (nb_cycles - 1) * 900.0)
+        self.assertTrue(tables["Channel 0"]["A01"].isna().all())
+        self.assertEqual(tables["Channel 1"]["A02"].notna().sum(), 10)
+
+    def test_live_experiment_refresh(self):
+        """Each refresh from an export folder gives the well data of the whole export."""
+        data, metadata = make_running_export(nb_cycles=20, nb_channels=2)
+        experiment = BiolectorLiveExperiment("instrument/exp")
+        loader = BiolectorXTLoadData()
+
+        self.assertIsNone(experiment.last_refresh_time)
+        for time_cut in [3000.5, 9000.5, 20 * 900.0]:
+            folder_path = self._write_export(data[data["Time"] <= time_cut], metadata)
+            csv_path = os.path.join(folder_path, "exp.csv")
+
+            self.assertTrue(experiment.refresh(folder_path))
+            # only the new lines are read on the next refresh
+            self.assertEqual(experiment.get_nb_bytes_read(), os.path.getsize(csv_path))
+
+            parsed_data = loader.parse_data(read_raw_data_csv(csv_path), metadata)
+            first_df = parsed_data["Channel 0"]
+            for well in ["A01", "F08"]:
+                expected = first_df[["Time"]].copy()
+                for filter_name, filter_df in parsed_data.items():
+                    expected[filter_name] = filter_df[well]
+                pd.testing.assert_frame_equal(
+                    experiment.well_data[well], expected, check_index_type=False
+                )
+
+        self.assertEqual(experiment.filters, ["Channel 0", "Channel 1"])
+        # the export did not change, nothing is parsed
+        self.assertEqual(experiment.refresh(folder_path), {})
+
+        self.assertIsNotNone(experiment.last_refresh_time)
+
+        with self.assertRaises(ValueError):
+            experiment.refresh(Settings.make_temp_dir())
+
+    def test_live_experiment_rewritten_export(self):
+        """An export shorter than the bytes already read is parsed again from the start."""
+        data, metadata = make_running_export(nb_cycles=10, nb_channels=1)
+        experiment = BiolectorLiveExperiment("instrument/exp")
+
+        experiment.refresh(self._write_export(data, metadata))
+        self.assertEqual(len(experiment.well_data["A01"]), 10)
+
+        experiment.refresh(self._write_export(data[data["Time"] < 3 * 900], metadata))
+        self.assertEqual(len(experiment.well_data["A01"]), 3)
+        self.assertEqual(experiment.live_index.get_nb_cycles(), {"Filterset 0": 3})
+
+    def _write_export(self, data: pd.DataFrame, metadata: dict) -> str:
+        """Write an unzipped export of an experiment, return its folder."""
+        folder_path = Settings.make_temp_dir()
+        data.to_csv(os.path.join(folder_path, "exp.csv"), sep=";", index=False)
+        with open(os.path.join(folder_path, "exp BXT.json"), "w", encoding="UTF-8") as file:
+            json.dump(metadata, file)
+        return folder_path
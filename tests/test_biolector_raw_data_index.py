@@ -0,0 +1,105 @@
+from unittest.mock import patch
+
+import pandas as pd
+from gws_core import BaseTestCase
+from gws_plate_reader.biolector_xt_data_parser import BiolectorXTDataParser, BiolectorXTLoadData
+from gws_plate_reader.biolector_xt_data_parser.biolector_raw_data_index import (
+    BiolectorRawDataIndex,
+)
+
+
+class TestBiolectorRawDataIndex(BaseTestCase):
+    """Tests for BiolectorRawDataIndex (raw data parsing shared by the BiolectorXT tasks)."""
+
+    def _make_raw_data(self) -> pd.DataFrame:
+        """Create raw data with 2 filtersets, 3 wells and 3 cycles (A02 misses its last cycle)."""
+        rows = []
+        for filterset in ["Biomass", "pH"]:
+            for well in ["A01", "A02", "B01"]:
+                nb_cycles = 2 if well == "A02" else 3
+                for cycle in range(nb_cycles):
+                    rows.append(
+                        {
+                            "Well": well,
+                            "Filterset": filterset,
+                            "Time": cycle * 1800.0,
+                            "Cal": float(cycle) + (10 if filterset == "pH" else 0),
+                        }
+                    )
+        return pd.DataFrame(rows)
+
+    def setUp(self):
+        BiolectorRawDataIndex.clear_cache()
+
+    def test_pivot(self):
+        """The index contains one cycle x well table per filterset."""
+        index = BiolectorRawDataIndex(self._make_raw_data())
+
+        self.assertFalse(index.is_micro_fluidics)
+        self.assertEqual(index.get_filtersets(), ["Biomass", "pH"])
+
+        tables = index.get_filter_tables(["Biomass", "pH"])
+        biomass = tables["Biomass"]
+        self.assertEqual(list(biomass["time"]), [0.0, 1800.0, 3600.0])
+        self.assertEqual(list(biomass["B01"]), [0.0, 1.0, 2.0])
+        self.assertEqual(list(biomass["A02"][:2]), [0.0, 1.0])
+        self.assertTrue(pd.isna(biomass["A02"][2]))
+        self.assertTrue(biomass["F08"].isna().all())
+        self.assertEqual(list(tables["pH"]["A01"]), [10.0, 11.0, 12.0])
+
+    def test_get_filter_tables_returns_copies(self):
+        """Modifying a returned table does not modify the cached index."""
+        index = BiolectorRawDataIndex(self._make_raw_data())
+        biomass = index.get_filter_tables(["Biomass"])["Biomass"]
+        biomass["A01"] = 0
+
+        self.assertEqual(
+            list(index.get_filter_tables(["Biomass"])["Biomass"]["A01"]), [0.0, 1.0, 2.0]
+        )
+
+    def test_from_dataframe_cached(self):
+        """The same raw data is parsed once."""
+        data = self._make_raw_data()
+        index = BiolectorRawDataIndex.from_dataframe(data)
+
+        self.assertIs(BiolectorRawDataIndex.from_dataframe(data.copy()), index)
+        self.assertIs(
+            BiolectorRawDataIndex.from_dataframe(data, key="raw"),
+            BiolectorRawDataIndex.from_dataframe(data, key="raw"),
+        )
+
+        other_data = data.copy()
+        other_data.loc[0, "Cal"] = 42.0
+        self.assertIsNot(BiolectorRawDataIndex.from_dataframe(other_data), index)
+
+    def test_content_hash_computed_once(self):
+        """The content hash of a DataFrame is computed on the first parse only."""
+        data = self._make_raw_data()
+        with patch(
+            "gws_plate_reader.biolector_xt_data_parser.biolector_raw_data_index.hash_pandas_object",
+            wraps=pd.util.hash_pandas_object,
+        ) as hash_mock:
+            key = BiolectorRawDataIndex.compute_content_hash(data)
+            BiolectorRawDataIndex.from_dataframe(data)
+            BiolectorRawDataIndex.from_dataframe(data)
+
+        self.assertEqual(hash_mock.call_count, 1)
+        self.assertEqual(BiolectorRawDataIndex.compute_content_hash(data.copy()), key)
+
+    def test_parser_and_loader_share_index(self):
+        """The parser and the loader produce the same values from the same index."""
+        data = self._make_raw_data()
+        metadata = {"Channels": [{"Name": "Biomass"}, {"Name": "pH"}]}
+        index = BiolectorRawDataIndex.from_dataframe(data)
+
+        parsed = BiolectorXTDataParser().parse_data(data, metadata, raw_data_index=index)
+        loaded = BiolectorXTLoadData().parse_data(data, metadata, raw_data_index=index)
+
+        for filter_name in ["Biomass", "pH"]:
+            self.assertEqual(
+                list(loaded[filter_name]["Time"]), list(parsed[filter_name]["Temps_en_h"])
+            )
+            pd.testing.assert_frame_equal(
+                loaded[filter_name].drop(columns=["Time"]),
+                parsed[filter_name].drop(columns=["time", "Temps_en_h"]),
+            )
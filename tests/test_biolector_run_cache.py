@@ -0,0 +1,183 @@
+import os
+import tempfile
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+from gws_core import BaseTestCase, Folder, Table
+from gws_plate_reader.biolector_xt_data_parser import BiolectorXTLoadData
+from gws_plate_reader.biolector_xt_data_parser.biolector_raw_data_index import (
+    BiolectorRawDataIndex,
+)
+from gws_plate_reader.biolector_xt_data_parser.biolector_run_cache import BiolectorRunCache
+from gws_plate_reader.biolector_xt_data_parser.biolector_xt_synthetic_export import (
+    SyntheticExportConfig,
+    make_synthetic_export,
+    write_synthetic_export,
+)
+
+
+class TestBiolectorRunCache(BaseTestCase):
+    """Tests for the on-disk cache of parsed BiolectorXT runs."""
+
+    def setUp(self):
+        BiolectorRawDataIndex.clear_cache()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.cache = BiolectorRunCache(self.tmp_dir.name)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def _write_export(self, config: SyntheticExportConfig) -> tuple[str, pd.DataFrame, dict]:
+        """Write an export outside of the cache directory, return its path, data and metadata."""
+        export_dir = tempfile.mkdtemp(dir=self.tmp_dir.name, prefix=".export_")
+        raw_data_path, _ = write_synthetic_export(config, export_dir)
+        _, metadata = make_synthetic_export(config)
+        return raw_data_path, pd.read_csv(raw_data_path, sep=";"), metadata
+
+    def test_cached_run_identical_to_parse(self):
+        """The tables of the cached run are the tables of the parsed raw data."""
+        for is_micro_fluidics in [False, True]:
+            config = SyntheticExportConfig(
+                nb_wells=20, nb_channels=3, nb_cycles=30, is_micro_fluidics=is_micro_fluidics
+            )
+            raw_data_path, data, metadata = self._write_export(config)
+            run = self.cache.get_or_create(raw_data_path, metadata)
+
+            filters = run.get_filters()
+            self.assertEqual(filters, ["Channel 0", "Channel 1", "Channel 2"])
+            self.assertEqual(run.is_micro_fluidics, is_micro_fluidics)
+
+            expected = BiolectorRawDataIndex(data).get_filter_tables(filters)
+            for tables in [
+                run.get_filter_tables(),
+                run.to_raw_data_index().get_filter_tables(filters),
+            ]:
+                self.assertEqual(list(tables.keys()), filters)
+                for filter_name, table in tables.items():
+                    pd.testing.assert_frame_equal(table, expected[filter_name])
+
+    def test_slice_well_with_memory_map(self):
+        """A well of a channel is read from a read-only memory map."""
+        raw_data_path, data, metadata = self._write_export(
+            SyntheticExportConfig(nb_wells=4, nb_cycles=10)
+        )
+        run = self.cache.get_or_create(raw_data_path, metadata)
+        filterset = run.get_filtersets()[1]
+
+        values = run.get_well_values(filterset, "A03")
+        self.assertIsInstance(values.base, np.memmap)
+        self.assertFalse(values.flags.writeable)
+        expected = BiolectorRawDataIndex(data).get_filter_tables(run.get_filters())["Channel 1"]
+        np.testing.assert_array_equal(values, expected["A03"].to_numpy())
+        np.testing.assert_array_equal(run.get_times(filterset), expected["time"].to_numpy())
+        self.assertEqual(run.get_labels()["well_labels"]["A03"], "Culture A03")
+
+        with self.assertRaises(KeyError):
+            run.get_well_values(filterset, "Z99")
+
+    def test_reopen_and_keys(self):
+        """The run of the same file content is re-opened without parsing, another export gets
+        another entry."""
+        config = SyntheticExportConfig(nb_wells=4, nb_cycles=10)
+        raw_data_path, _, metadata = self._write_export(config)
+        run = self.cache.get_or_create(raw_data_path, metadata)
+        self.assertEqual(run.header["key"], BiolectorRunCache.compute_file_key(raw_data_path))
+
+        # the same export downloaded again, opened by another cache on the same directory
+        # (e.g. another process): the CSV is not read
+        downloaded_path, _, _ = self._write_export(config)
+        with mock.patch("pandas.read_csv", side_effect=AssertionError("parsed")):
+            reopened = BiolectorRunCache(self.tmp_dir.name).get_or_create(downloaded_path)
+        self.assertEqual(reopened.path, run.path)
+        self.assertEqual(reopened.header, run.header)
+
+        other_path, _, _ = self._write_export(SyntheticExportConfig(nb_wells=4, nb_cycles=11))
+        self.assertNotEqual(self.cache.get_or_create(other_path).path, run.path)
+        self.assertEqual(
+            len([name for name in os.listdir(self.tmp_dir.name) if not name.startswith(".")]), 2
+        )
+
+        self.cache.remove(run.header["key"])
+        self.assertIsNone(self.cache.open(run.header["key"]))
+
+    def test_metadata_refreshed_on_hit(self):
+        """The labels of a cached run are updated when its metadata changed."""
+        raw_data_path, _, metadata = self._write_export(
+            SyntheticExportConfig(nb_wells=4, nb_cycles=10)
+        )
+        self.assertEqual(self.cache.get_or_create(raw_data_path).get_filters(), [])
+
+        run = self.cache.get_or_create(raw_data_path, metadata)
+        self.assertEqual(
+            run.get_filters(),
+            ["Channel 0", "Channel 1", "Channel 2", "Channel 3", "Channel 4", "Channel 5"],
+        )
+        metadata["Name"] = "Renamed experiment"
+        self.cache.get_or_create(raw_data_path, metadata)
+        self.assertEqual(
+            self.cache.open(run.header["key"]).get_labels()["experiment_name"], "Renamed experiment"
+        )
+
+    def test_eviction_of_least_recently_used_runs(self):
+        """Runs are evicted, least recently opened first, when the cache is over its size."""
+        paths = [
+            self._write_export(SyntheticExportConfig(nb_wells=4, nb_cycles=10 + idx))[0]
+            for idx in range(3)
+        ]
+        keys = [self.cache.get_or_create(path).header["key"] for path in paths]
+        run_size = self.cache.get_size() // 3
+
+        # the first run is used again, the second is the least recently used
+        os.utime(os.path.join(self.cache.get_run_path(keys[1]), "header.json"), (0, 0))
+        self.cache.open(keys[0])
+        self.cache.max_size = 2 * run_size + run_size // 2
+
+        self.assertEqual(self.cache.evict(), [keys[1]])
+        self.assertIsNone(self.cache.open(keys[1]))
+        self.assertIsNotNone(self.cache.open(keys[0]))
+        self.assertIsNotNone(self.cache.open(keys[2]))
+
+        # a run just written is kept even if it alone exceeds the size
+        self.cache.max_size = 0
+        run = self.cache.get_or_create(paths[1])
+        self.assertEqual(
+            [key for key, _, _ in self.cache._list_runs()], [run.header["key"]]
+        )
+
+    def test_alias(self):
+        """An alias opens its run without the export, until the run is evicted."""
+        raw_data_path, _, metadata = self._write_export(
+            SyntheticExportConfig(nb_wells=4, nb_cycles=10)
+        )
+        self.assertIsNone(self.cache.open_alias("experiment/Mock/1"))
+
+        run = self.cache.get_or_create(raw_data_path, metadata)
+        self.cache.set_alias("experiment/Mock/1", run.header["key"])
+        self.assertEqual(self.cache.open_alias("experiment/Mock/1").path, run.path)
+
+        self.cache.remove(run.header["key"])
+        self.assertIsNone(self.cache.open_alias("experiment/Mock/1"))
+
+    def test_load_data_reopens_cached_plates(self):
+        """BiolectorXTLoadData stores the parsed plates and reopens them without parsing."""
+        config = SyntheticExportConfig(nb_wells=4, nb_cycles=10)
+        raw_data_path, data, _ = self._write_export(config)
+        plates_inputs = [(Table(data), Folder(os.path.dirname(raw_data_path)), None)]
+        loader = BiolectorXTLoadData()
+
+        parsed_plate = loader.parse_plates(plates_inputs, ["plate_0"], run_cache=self.cache)[0]
+        self.assertEqual(len(self.cache._list_runs()), 1)
+
+        BiolectorRawDataIndex.clear_cache()
+        with mock.patch(
+            "gws_plate_reader.biolector_xt_data_parser.biolector_raw_data_index.pivot_raw_data",
+            side_effect=AssertionError("parsed"),
+        ):
+            reloaded_plate = loader.parse_plates(plates_inputs, ["plate_0"], run_cache=self.cache)[0]
+
+        filters = parsed_plate.raw_data_index.get_filtersets()
+        for filter_name, table in reloaded_plate.raw_data_index.get_filter_tables(filters).items():
+            pd.testing.assert_frame_equal(
+                table, parsed_plate.raw_data_index.get_filter_tables(filters)[filter_name]
+            )
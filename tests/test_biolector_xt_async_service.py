@@ -0,0 +1,145 @@
+import asyncio
+import os
+import tempfile
+import time
+
+from google.protobuf.timestamp_pb2 import Timestamp
+from gws_core import BaseTestCase
+from gws_plate_reader.biolector_xt._benchmark.biolector_xt_mock_server import (
+    BiolectorXTMockServer,
+    BiolectorXTMockServicer,
+)
+from gws_plate_reader.biolector_xt._benchmark.biolector_xt_slow_service import (
+    BiolectorXTCallCounter,
+)
+from gws_plate_reader.biolector_xt.biolector_xt_async_service import BiolectorXTAsyncService
+from gws_plate_reader.biolector_xt.biolector_xt_exception import BiolectorXTConnectException
+from gws_plate_reader.biolector_xt.biolector_xt_sync_service import BiolectorXTSyncService
+from gws_plate_reader.biolector_xt.grpc.biolectorxtremotecontrol_pb2 import (
+    MeasurementStatus,
+    StatusUpdateStreamResponse,
+    WellLabel,
+)
+
+
+class SlowMockServicer(BiolectorXTMockServicer):
+    """
+    The list calls take CALL_DURATION seconds, the calls running at the same time and the calls
+    stopped by the client are counted.
+    """
+
+    CALL_DURATION = 0.3
+
+    def __init__(self) -> None:
+        super().__init__(nb_protocols=2, nb_experiments=4)
+        self.call_counter = BiolectorXTCallCounter()
+        self.nb_cancelled_calls = 0
+
+    def GetProtocols(self, request, context):
+        self._wait(context)
+        return super().GetProtocols(request, context)
+
+    def GetExperimentList(self, request, context):
+        self._wait(context)
+        return super().GetExperimentList(request, context)
+
+    def StatusUpdateStream(self, request, context):
+        for index in range(3):
+            yield StatusUpdateStreamResponse(
+                measurement_status=MeasurementStatus(
+                    cultivation=WellLabel.A01,
+                    channel_name="Biomass",
+                    value=index,
+                    time_stamp=Timestamp(seconds=1_700_000_000 + index),
+                )
+            )
+        while context.is_active():
+            time.sleep(0.02)
+
+    def _wait(self, context) -> None:
+        with self.call_counter.count_call():
+            end_time = time.monotonic() + self.CALL_DURATION
+            while time.monotonic() < end_time:
+                if not context.is_active():
+                    self.nb_cancelled_calls += 1
+                    return
+                time.sleep(0.01)
+
+
+class TestBiolectorXTAsyncService(BaseTestCase):
+    """Tests for the grpc.aio service of the BiolectorXT device and its sync facade."""
+
+    def setUp(self):
+        self.servicer = SlowMockServicer()
+        self.server = BiolectorXTMockServer(self.servicer, max_workers=8).start()
+        self.credentials = self.server.get_credentials()
+
+    def tearDown(self):
+        self.server.stop()
+
+    def test_async_service(self):
+        """The calls are sent concurrently, with a deadline, and cancelled with their task."""
+
+        async def run():
+            service = BiolectorXTAsyncService(self.credentials)
+            try:
+                experiments = await service.get_biolector_experiments()
+                self.assertEqual(len(experiments), 4)
+                self.assertEqual(experiments[1].protocol.name, "Protocol 1")
+                # both lists are requested at the same time
+                self.assertEqual(self.servicer.call_counter.max_running_calls, 2)
+
+                # per-call deadline
+                with self.assertRaises(BiolectorXTConnectException):
+                    await service.get_protocols(timeout=0.05)
+
+                # cancelling the task cancels the call on the device
+                task = asyncio.create_task(service.get_experiments())
+                await asyncio.sleep(0.1)
+                task.cancel()
+                with self.assertRaises(asyncio.CancelledError):
+                    await task
+
+                stream = service.get_status_update_stream()
+                values = []
+                async for response in stream:
+                    values.append(response.measurement_status.value)
+                    if len(values) == 3:
+                        break
+                stream.cancel()
+                self.assertEqual(values, [0, 1, 2])
+            finally:
+                await service.close()
+
+        asyncio.run(run())
+        # the expired and the cancelled calls are stopped on the server
+        end_time = time.monotonic() + 2
+        while self.servicer.nb_cancelled_calls < 2 and time.monotonic() < end_time:
+            time.sleep(0.02)
+        self.assertEqual(self.servicer.nb_cancelled_calls, 2)
+
+    def test_sync_facade(self):
+        """The facade runs the calls of the async service from synchronous code."""
+        service = BiolectorXTSyncService(self.credentials, timeout=5)
+        try:
+            self.assertEqual(len(service.get_protocols()), 2)
+            self.assertEqual(self.servicer.call_counter.max_running_calls, 1)
+            self.assertEqual(len(service.get_biolector_experiments()), 4)
+            # both lists are requested at the same time
+            self.assertEqual(self.servicer.call_counter.max_running_calls, 2)
+
+            with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as file:
+                file.write(os.urandom(300_000))
+            try:
+                service.upload_protocol(file.name)
+            finally:
+                os.remove(file.name)
+            self.assertEqual(self.servicer.uploaded_size, 300_000)
+            self.assertEqual(self.servicer.max_uploaded_chunk_size, 50_000)
+
+            stream = service.get_status_update_stream()
+            self.assertEqual(next(stream).measurement_status.value, 0)
+            stream.cancel()
+            self.assertEqual(list(stream), [])
+        finally:
+            service.close()
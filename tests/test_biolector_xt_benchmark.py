@@ -0,0 +1,139 @@
+import os
+import tempfile
+
+from gws_core import BaseTestCase
+from gws_plate_reader.biolector_xt_data_parser._benchmark.biolector_xt_benchmark import (
+    find_regressions,
+    format_report,
+    load_report,
+    run_benchmarks,
+    save_report,
+)
+from gws_plate_reader.biolector_xt_data_parser.biolector_raw_data_index import (
+    BiolectorRawDataIndex,
+)
+from gws_plate_reader.biolector_xt_data_parser.biolector_xt_metadata import (
+    get_filters,
+    load_metadata_file,
+)
+from gws_plate_reader.biolector_xt_data_parser.biolector_xt_synthetic_export import (
+    SyntheticExportConfig,
+    make_synthetic_export,
+    make_synthetic_medium_tables,
+    write_synthetic_export,
+)
+
+
+class TestBiolectorXTBenchmark(BaseTestCase):
+    """Tests for the synthetic BiolectorXT exports and the loading benchmark."""
+
+    def test_synthetic_export_shape(self):
+        """The export has the configured wells, channels and cycles."""
+        config = SyntheticExportConfig(nb_wells=10, nb_channels=3, nb_cycles=20, missing_ratio=0)
+        data, metadata = make_synthetic_export(config)
+
+        self.assertEqual(len(data), 10 * 3 * 20)
+        self.assertEqual(data["Well"].nunique(), 10)
+        self.assertEqual(data["Filterset"].nunique(), 3)
+        self.assertEqual(len(get_filters(metadata)), 3)
+        self.assertEqual(metadata["Microplate"]["CultivationLabels"], config.get_wells())
+
+        index = BiolectorRawDataIndex(data)
+        self.assertFalse(index.is_micro_fluidics)
+        for filter_table in index.get_filter_tables(get_filters(metadata)).values():
+            self.assertEqual(len(filter_table), 20)
+
+    def test_synthetic_export_micro_fluidics(self):
+        """Microfluidics exports start at C01, the rows A and B are reservoirs."""
+        config = SyntheticExportConfig(nb_wells=32, nb_cycles=5, is_micro_fluidics=True)
+        data, metadata = make_synthetic_export(config)
+
+        self.assertNotIn("A01", set(data["Well"]))
+        self.assertEqual(config.get_wells()[0], "C01")
+        self.assertEqual(len(metadata["Microplate"]["ReservoirLabels"]), 16)
+        self.assertTrue(BiolectorRawDataIndex(data).is_micro_fluidics)
+
+        with self.assertRaises(ValueError):
+            SyntheticExportConfig(nb_wells=33, is_micro_fluidics=True).get_wells()
+
+    def test_write_synthetic_export(self):
+        """The written metadata is found by the loader and the media cover all the wells."""
+        config = SyntheticExportConfig(nb_wells=6, nb_cycles=4, nb_media=2)
+        with tempfile.TemporaryDirectory() as folder_path:
+            raw_data_path, _ = write_synthetic_export(config, folder_path)
+            self.assertTrue(os.path.exists(raw_data_path))
+            self.assertEqual(load_metadata_file(folder_path), make_synthetic_export(config)[1])
+
+        medium_df, info_df = make_synthetic_medium_tables(config)
+        self.assertEqual(list(medium_df["Medium"]), ["M0", "M1"])
+        self.assertEqual(list(info_df["Well"]), ["A1", "A2", "A3", "A4", "A5", "A6"])
+        self.assertTrue(set(info_df["Medium"]) <= set(medium_df["Medium"]))
+
+    def test_benchmark_and_baseline(self):
+        """All the steps are measured, a report compared with itself has no regression."""
+        config = SyntheticExportConfig(nb_wells=12, nb_channels=2, nb_cycles=10, nb_media=2)
+        report = run_benchmarks({"tiny": config}, repeat=1)
+
+        steps = report["scenarios"]["tiny"]["steps"]
+        self.assertEqual(
+            list(steps.keys()),
+            [
+                "parse_data",
+                "create_parsed_resource_set",
+                "tag_well_tables",
+                "create_metadata_table",
+                "run",
+            ],
+        )
+        for measure in steps.values():
+            self.assertGreater(measure["time_s"], 0)
+            self.assertGreater(measure["peak_memory_mb"], 0)
+        self.assertIn("tiny", format_report(report, report))
+
+        with tempfile.TemporaryDirectory() as folder_path:
+            baseline_path = os.path.join(folder_path, "baseline.json")
+            save_report(report, baseline_path)
+            baseline = load_report(baseline_path)
+        self.assertEqual(find_regressions(report, baseline), [])
+
+    def test_benchmark_legacy_parse(self):
+        """The per-well parse is measured when asked, with the same tables as parse_data."""
+        config = SyntheticExportConfig(nb_wells=12, nb_channels=2, nb_cycles=10)
+        report = run_benchmarks(
+            {"tiny": config}, repeat=1, include_run=False, legacy_parse_scenarios=["tiny"]
+        )
+
+        self.assertIn("parse_data_legacy", report["scenarios"]["tiny"]["steps"])
+        self.assertIn("parse_data speedup vs per-well parse", format_report(report))
+
+    def test_find_regressions(self):
+        """Slower steps and higher peak memory are reported, timing noise is ignored."""
+        config = SyntheticExportConfig().to_dict()
+
+        def make_report(parse_time: float, run_time: float, memory: float) -> dict:
+            return {
+                "scenarios": {
+                    "one_week": {
+                        "config": config,
+                        "steps": {
+                            "parse_data": {"time_s": parse_time, "peak_memory_mb": memory},
+                            "run": {"time_s": run_time, "peak_memory_mb": 10},
+                        },
+                    }
+                }
+            }
+
+        baseline = make_report(parse_time=0.5, run_time=0.001, memory=10)
+        regressions = find_regressions(
+            make_report(parse_time=1.0, run_time=0.002, memory=20), baseline
+        )
+        self.assertEqual(
+            [(regression.step, regression.metric) for regression in regressions],
+            [("parse_data", "time_s"), ("parse_data", "peak_memory_mb")],
+        )
+        self.assertIn("+100%", regressions[0].get_message())
+
+        self.assertEqual(
+            find_regressions(make_report(parse_time=0.55, run_time=0.001, memory=10.5), baseline),
+            [],
+        )
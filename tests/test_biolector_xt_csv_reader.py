@@ -0,0 +1,75 @@
+import os
+
+import numpy as np
+import pandas as pd
+from gws_core import BaseTestCase, Settings
+from gws_plate_reader.biolector_xt_data_parser.biolector_raw_data_index import (
+    BiolectorRawDataIndex,
+)
+from gws_plate_reader.biolector_xt_data_parser.biolector_xt_csv_reader import read_raw_data_csv
+
+
+class TestBiolectorXTCsvReader(BaseTestCase):
+    """Tests for the chunked BiolectorXT CSV reader."""
+
+    def _write_export(self) -> tuple[str, pd.DataFrame]:
+        """Write a small BiolectorXT export with an extra text column, shuffled."""
+        rows = []
+        for filterset in ["pH", "Biomass"]:
+            for well in ["B01", "A01", "A02"]:
+                for cycle in range(4):
+                    rows.append(
+                        {
+                            "Well": well,
+                            "Filterset": filterset,
+                            "Time": cycle * 900,
+                            "Cal": cycle + 0.5,
+                            "Comment": "measure",
+                        }
+                    )
+        data = pd.DataFrame(rows).sample(frac=1, random_state=0)
+        file_path = os.path.join(Settings.make_temp_dir(), "export.csv")
+        data.to_csv(file_path, sep=";", index=False)
+        return file_path, data
+
+    def test_read_raw_data_csv(self):
+        """Only the parsed columns are kept, with compact types, whatever the chunk size."""
+        file_path, data = self._write_export()
+
+        result = read_raw_data_csv(file_path, chunk_size=5)
+
+        self.assertEqual(list(result.columns), ["Well", "Filterset", "Time", "Cal"])
+        self.assertEqual(len(result), len(data))
+        self.assertIsInstance(result["Well"].dtype, pd.CategoricalDtype)
+        self.assertIsInstance(result["Filterset"].dtype, pd.CategoricalDtype)
+        self.assertEqual(list(result["Well"].cat.categories), ["A01", "A02", "B01"])
+        self.assertEqual(result["Time"].dtype, np.float64)
+        self.assertEqual(result["Cal"].dtype, np.float64)
+        self.assertEqual(list(result["Well"].astype(str)), list(data["Well"]))
+
+    def test_values_round_trip(self):
+        """Cal values are not rounded by default, float32 is opt-in."""
+        data = pd.DataFrame(
+            {"Well": ["A01", "A02"], "Filterset": ["pH", "pH"], "Time": [0.0, 1.0], "Cal": [0.1, 7.3]}
+        )
+        file_path = os.path.join(Settings.make_temp_dir(), "export.csv")
+        data.to_csv(file_path, sep=";", index=False)
+
+        result = read_raw_data_csv(file_path)
+        self.assertEqual(list(result["Cal"]), [0.1, 7.3])
+
+        compact_result = read_raw_data_csv(file_path, value_dtype=np.float32)
+        self.assertEqual(compact_result["Cal"].dtype, np.float32)
+        self.assertNotEqual(float(compact_result["Cal"].iloc[0]), 0.1)
+
+    def test_index_of_compact_data(self):
+        """The index of the compact data matches the index of the full table."""
+        file_path, data = self._write_export()
+
+        index = BiolectorRawDataIndex(read_raw_data_csv(file_path, chunk_size=5))
+        expected = BiolectorRawDataIndex(data)
+
+        self.assertEqual(index.get_filtersets(), ["Biomass", "pH"])
+        filters = ["Biomass", "pH"]
+        for filter_name, table in index.get_filter_tables(filters).items():
+            pd.testing.assert_frame_equal(table, expected.get_filter_tables(filters)[filter_name])
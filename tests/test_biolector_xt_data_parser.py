@@ -8,7 +8,14 @@ from gws_core import (
     Settings,
 )
 from gws_plate_reader.biolector_xt.biolector_xt_mock_service import BiolectorXTMockService
+from gws_plate_reader.biolector_xt_data_parser._benchmark.biolector_xt_benchmark import (
+    legacy_parse_data,
+)
 from gws_plate_reader.biolector_xt_data_parser.biolector_xt_data_parser import BiolectorXTDataParser
+from gws_plate_reader.biolector_xt_data_parser.biolector_xt_synthetic_export import (
+    SyntheticExportConfig,
+    make_synthetic_export,
+)
 
 
 class TestBiolectorXTDataParser(BaseTestCase):
@@ -152,3 +159,19 @@ class TestBiolectorXTDataParser(BaseTestCase):
         # Should have entries for wells A01-F08 (48 wells)
         self.assertEqual(len(labels), 48)
         self.assertIn("A01", labels)
+
+    def test_parse_data_identical_to_legacy(self):
+        """parse_data returns the same tables as the per-well implementation."""
+        parser = BiolectorXTDataParser()
+        for is_micro_fluidics in [False, True]:
+            data, metadata = make_synthetic_export(
+                SyntheticExportConfig(
+                    nb_cycles=50, nb_channels=3, is_micro_fluidics=is_micro_fluidics
+                )
+            )
+            expected = legacy_parse_data(data, parser.get_filters(metadata))
+            result = parser.parse_data(data, metadata)
+
+            self.assertEqual(list(result.keys()), list(expected.keys()))
+            for filter_name, expected_df in expected.items():
+                pd.testing.assert_frame_equal(result[filter_name], expected_df)
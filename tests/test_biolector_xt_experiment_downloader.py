@@ -0,0 +1,161 @@
+import hashlib
+import os
+import tempfile
+import time
+
+import grpc
+from gws_core import BaseTestCase, MessageDispatcher
+from gws_plate_reader.biolector_xt._benchmark.biolector_xt_mock_server import (
+    BiolectorXTMockServer,
+    BiolectorXTMockServicer,
+)
+from gws_plate_reader.biolector_xt.biolector_xt_exception import BiolectorXTDownloadException
+from gws_plate_reader.biolector_xt.biolector_xt_experiment_downloader import (
+    BiolectorXTDownloadConfig,
+    BiolectorXTExperimentDownloader,
+)
+from gws_plate_reader.biolector_xt.biolector_xt_grpc_channel import BiolectorXTChannelPool
+from gws_plate_reader.biolector_xt.biolector_xt_service import BiolectorXTService
+from gws_plate_reader.biolector_xt.grpc.biolectorxtremotecontrol_pb2 import FileChunk, MetaData
+
+
+class DownloadServicer(BiolectorXTMockServicer):
+    """
+    Streams an experiment file, the failure of each successive call is configured with
+    `failures`: ("abort", nb_bytes) aborts the stream, ("stall", nb_bytes) stops sending data
+    and ("change", nb_bytes) sends another file.
+    """
+
+    CHUNK_SIZE = 1000
+
+    def __init__(self, data: bytes, failures: list[tuple[str, int]] | None = None) -> None:
+        super().__init__(nb_protocols=0, nb_experiments=0)
+        self.data = data
+        self.failures = list(failures or [])
+
+    def DownloadExperiment(self, request, context):
+        self._start_call("DownloadExperiment")
+        failure, failure_offset = self.failures.pop(0) if self.failures else (None, None)
+        data = self.data
+        if failure == "change":
+            data = data[:failure_offset] + bytes(len(data) - failure_offset)
+
+        yield FileChunk(metadata=MetaData(filename=f"{request.value}.zip"))
+        for offset in range(0, len(data), self.CHUNK_SIZE):
+            if failure == "abort" and offset >= failure_offset:
+                context.abort(grpc.StatusCode.UNAVAILABLE, "Connection lost")
+            if failure == "stall" and offset >= failure_offset:
+                time.sleep(2)
+                return
+            yield FileChunk(chunk_data=data[offset : offset + self.CHUNK_SIZE])
+
+
+class RecordingMessageDispatcher(MessageDispatcher):
+    def __init__(self) -> None:
+        super().__init__()
+        self.messages: list[str] = []
+
+    def notify_info_message(self, message: str) -> None:
+        self.messages.append(message)
+
+    def notify_warning_message(self, message: str) -> None:
+        self.messages.append(message)
+
+
+class TestBiolectorXTExperimentDownloader(BaseTestCase):
+    """Tests for the streaming download of the BiolectorXT experiments."""
+
+    DATA = os.urandom(25_500)
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.file_path = os.path.join(self.tmp_dir, "experiment.zip")
+        self.server = None
+
+    def tearDown(self):
+        BiolectorXTChannelPool.clear()
+        if self.server:
+            self.server.stop()
+
+    def _create_downloader(
+        self, servicer: DownloadServicer, **config
+    ) -> tuple[BiolectorXTExperimentDownloader, RecordingMessageDispatcher]:
+        self.server = BiolectorXTMockServer(servicer).start()
+        endpoint = self.server.get_endpoint()
+        message_dispatcher = RecordingMessageDispatcher()
+        config.setdefault("retry_delay", 0.01)
+        downloader = BiolectorXTExperimentDownloader(
+            lambda: BiolectorXTChannelPool.get_channel(endpoint).stub,
+            message_dispatcher,
+            BiolectorXTDownloadConfig(progress_step_size=10_000, **config),
+        )
+        return downloader, message_dispatcher
+
+    def _read_file(self) -> bytes:
+        with open(self.file_path, "rb") as file:
+            return file.read()
+
+    def test_download(self):
+        """The file is written with its SHA-256 and the progress is reported."""
+        downloader, message_dispatcher = self._create_downloader(DownloadServicer(self.DATA))
+        sha256 = hashlib.sha256(self.DATA).hexdigest()
+
+        result = downloader.download("exp", self.file_path, expected_sha256=sha256.upper())
+
+        self.assertEqual(self._read_file(), self.DATA)
+        self.assertEqual(result.size, len(self.DATA))
+        self.assertEqual(result.sha256, sha256)
+        self.assertEqual(result.nb_attempts, 1)
+        self.assertFalse(os.path.exists(self.file_path + ".part"))
+        # one message per 10 000 bytes and a final message
+        self.assertEqual(len(message_dispatcher.messages), 4)
+        self.assertIn(sha256, message_dispatcher.messages[-1])
+
+    def test_resume(self):
+        """The download resumes after the written bytes when the connection is lost."""
+        servicer = DownloadServicer(self.DATA, [("abort", 12_000), ("stall", 20_000)])
+        downloader, message_dispatcher = self._create_downloader(servicer, chunk_timeout=0.5)
+
+        result = downloader.download("exp", self.file_path)
+
+        self.assertEqual(self._read_file(), self.DATA)
+        self.assertEqual(result.nb_attempts, 3)
+        self.assertEqual(servicer.nb_calls["DownloadExperiment"], 3)
+        self.assertTrue(
+            any("No data received" in message for message in message_dispatcher.messages)
+        )
+        self.assertTrue(any("resumed" in message for message in message_dispatcher.messages))
+
+    def test_file_changed(self):
+        """The download restarts from the beginning when the resumed stream is another file."""
+        servicer = DownloadServicer(self.DATA, [("abort", 12_000), ("change", 5_000)])
+        downloader, _ = self._create_downloader(servicer)
+
+        result = downloader.download("exp", self.file_path)
+
+        self.assertEqual(self._read_file(), self.DATA)
+        self.assertEqual(result.nb_attempts, 3)
+        self.assertEqual(result.sha256, hashlib.sha256(self.DATA).hexdigest())
+
+    def test_errors(self):
+        """Errors after the last retry and hash mismatches are raised, no file is left."""
+        servicer = DownloadServicer(self.DATA, [("abort", 5_000)] * 3)
+        downloader, _ = self._create_downloader(servicer, max_retries=2)
+        with self.assertRaises(BiolectorXTDownloadException):
+            downloader.download("exp", self.file_path)
+        self.assertEqual(servicer.nb_calls["DownloadExperiment"], 3)
+
+        with self.assertRaises(BiolectorXTDownloadException):
+            downloader.download("exp", self.file_path, expected_sha256="0" * 64)
+        self.assertEqual(os.listdir(self.tmp_dir), [])
+
+    def test_service_download(self):
+        """BiolectorXTService downloads the experiment in a temporary zip file."""
+        self.server = BiolectorXTMockServer(DownloadServicer(self.DATA)).start()
+        service = BiolectorXTService(self.server.get_credentials(), RecordingMessageDispatcher())
+
+        file_path = service.download_experiment("exp")
+
+        self.assertTrue(file_path.endswith("exp.zip"))
+        with open(file_path, "rb") as file:
+            self.assertEqual(file.read(), self.DATA)
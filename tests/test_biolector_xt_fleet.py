@@ -0,0 +1,86 @@
+import time
+
+from gws_core import BaseTestCase
+from gws_plate_reader.biolector_xt._benchmark.biolector_xt_slow_service import (
+    BiolectorXTCallCounter,
+    BiolectorXTSlowListService,
+)
+from gws_plate_reader.biolector_xt.biolector_xt_fleet import BiolectorXTFleet
+from gws_plate_reader.biolector_xt.grpc.biolectorxtremotecontrol_pb2 import (
+    ExperimentInfo,
+    ProtocolInfo,
+)
+
+
+def make_instrument_service(
+    name: str, nb_experiments: int, call_counter: BiolectorXTCallCounter | None = None
+) -> BiolectorXTSlowListService:
+    """Create the service of an instrument with a protocol named after the instrument."""
+    experiments = [
+        ExperimentInfo(
+            experiment_id=f"{{{name}-{i}}}",
+            protocol_id=f"{{{name}-protocol}}",
+            start_time=f"2024-01-0{i + 1}T10:00:00+01:00",
+            file_path=f"C:/experiment_{i}",
+            finished=True,
+        )
+        for i in range(nb_experiments)
+    ]
+    protocols = [ProtocolInfo(protocol_id=f"{name}-protocol", protocol_name=name)]
+    return BiolectorXTSlowListService(experiments, protocols, call_counter=call_counter)
+
+
+class TestBiolectorXTFleet(BaseTestCase):
+    """Tests for the concurrent listing of several BiolectorXT instruments."""
+
+    def test_fleet(self):
+        """The instruments are queried concurrently, merged and cached."""
+        call_counter = BiolectorXTCallCounter()
+        services = {
+            name: make_instrument_service(name, nb_experiments, call_counter)
+            for name, nb_experiments in [("BXT-1", 2), ("BXT-2", 3), ("BXT-3", 1)]
+        }
+        fleet = BiolectorXTFleet(services, cache_ttl=60)
+
+        experiments_df = fleet.get_experiments_dataframe()
+
+        # both lists of all the instruments are requested at the same time
+        self.assertEqual(call_counter.max_running_calls, 6)
+        self.assertEqual(len(experiments_df), 6)
+        self.assertEqual(experiments_df["Instrument"].value_counts()["BXT-2"], 3)
+        self.assertEqual(experiments_df["Id"].iloc[0], "BXT-2-2")
+        self.assertEqual(experiments_df["Protocol name"].iloc[0], "BXT-2")
+
+        # the protocols come from the cache
+        protocols_df = fleet.get_protocols_dataframe()
+        self.assertEqual(list(protocols_df["Instrument"]), ["BXT-1", "BXT-2", "BXT-3"])
+        self.assertEqual([service.nb_calls for service in services.values()], [2, 2, 2])
+
+        # an unreachable instrument keeps its last lists, the others are refreshed
+        services["BXT-3"].reachable = False
+        experiments_df = fleet.get_experiments_dataframe(force_refresh=True)
+        self.assertEqual(len(experiments_df), 6)
+        self.assertEqual(list(fleet.get_errors()), ["BXT-3"])
+        self.assertEqual([service.nb_calls for service in services.values()], [4, 4, 4])
+
+    def test_cache_expiration(self):
+        """The lists are fetched again when they expire, an instrument never reached is missing."""
+        services = {
+            "BXT-1": make_instrument_service("BXT-1", 1),
+            "BXT-2": make_instrument_service("BXT-2", 1),
+        }
+        services["BXT-2"].reachable = False
+        fleet = BiolectorXTFleet(services, cache_ttl=0.5)
+
+        self.assertEqual(list(fleet.get_inventories()), ["BXT-1"])
+        self.assertIn("BXT-2", fleet.get_errors())
+        fleet.get_inventories()
+        # the failed instrument is retried on each call, the other one is cached
+        self.assertEqual(services["BXT-1"].nb_calls, 2)
+        self.assertEqual(services["BXT-2"].nb_calls, 4)
+
+        time.sleep(0.5)
+        services["BXT-2"].reachable = True
+        self.assertEqual(list(fleet.get_inventories()), ["BXT-1", "BXT-2"])
+        self.assertEqual(services["BXT-1"].nb_calls, 4)
+        self.assertEqual(fleet.get_errors(), {})
@@ -0,0 +1,95 @@
+import socket
+
+from google.protobuf.empty_pb2 import Empty
+from gws_core import BaseTestCase
+from gws_plate_reader.biolector_xt._benchmark.biolector_xt_grpc_benchmark import (
+    format_report,
+    run_benchmark,
+)
+from gws_plate_reader.biolector_xt._benchmark.biolector_xt_mock_server import (
+    BiolectorXTMockServer,
+    BiolectorXTMockServicer,
+)
+from gws_plate_reader.biolector_xt.biolector_xt_exception import BiolectorXTConnectException
+from gws_plate_reader.biolector_xt.biolector_xt_grpc_channel import BiolectorXTChannelPool
+from gws_plate_reader.biolector_xt.biolector_xt_service import BiolectorXTService
+from gws_plate_reader.biolector_xt.biolector_xt_types import CredentialsDataBiolector
+
+
+def _get_unused_endpoint() -> str:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return f"127.0.0.1:{sock.getsockname()[1]}"
+
+
+class TestBiolectorXTGrpcChannel(BaseTestCase):
+    """Tests for the pooled gRPC channel of BiolectorXTService."""
+
+    def setUp(self):
+        self.server = BiolectorXTMockServer(
+            BiolectorXTMockServicer(nb_protocols=3, nb_experiments=5)
+        ).start()
+        self.endpoint = self.server.get_endpoint()
+        self.service = BiolectorXTService(self.server.get_credentials())
+
+    def tearDown(self):
+        BiolectorXTChannelPool.clear()
+        self.server.stop()
+
+    def test_channel_reused(self):
+        """All the calls of an endpoint use the same channel and stub."""
+        self.assertEqual(len(self.service.get_protocols()), 3)
+        channel = self.service.get_grpc_channel()
+        self.assertEqual(len(self.service.get_experiments()), 5)
+
+        self.assertIs(self.service.get_grpc_channel(), channel)
+        self.assertIs(self.service.get_grpc_channel().stub, channel.stub)
+        self.assertFalse(channel.is_closed())
+        self.assertIn(self.endpoint, BiolectorXTChannelPool.get_endpoints())
+
+        experiments = self.service.get_biolector_experiments()
+        self.assertEqual(experiments[1].protocol.name, "Protocol 1")
+
+    def test_health_check(self):
+        """The health check connects the channel, an unreachable device is reported."""
+        self.assertTrue(self.service.check_connection(timeout=5))
+
+        unreachable_endpoint = _get_unused_endpoint()
+        self.assertFalse(BiolectorXTChannelPool.check_health(unreachable_endpoint, timeout=0.5))
+        unreachable_service = BiolectorXTService(
+            CredentialsDataBiolector(endpoint_url=unreachable_endpoint, secure_channel=False)
+        )
+        failed_channel = unreachable_service.get_grpc_channel()
+        with self.assertRaises(BiolectorXTConnectException):
+            unreachable_service.get_protocols()
+        # the failed channel is replaced on the next call, it is not closed for the other callers
+        self.assertFalse(failed_channel.is_usable())
+        self.assertIsNot(unreachable_service.get_grpc_channel(), failed_channel)
+        self.assertTrue(failed_channel.is_detached())
+        self.assertFalse(failed_channel.is_closed())
+
+    def test_pool_size(self):
+        """The least recently used channels are removed above the maximum size, not closed."""
+        stub = self.service.get_grpc_channel().stub
+        channels = [
+            BiolectorXTChannelPool.get_channel(f"127.0.0.1:{port}")
+            for port in range(1, BiolectorXTChannelPool.MAX_SIZE + 1)
+        ]
+        self.assertEqual(
+            len(BiolectorXTChannelPool.get_endpoints()), BiolectorXTChannelPool.MAX_SIZE
+        )
+        self.assertNotIn(self.endpoint, BiolectorXTChannelPool.get_endpoints())
+        # a caller that still holds the stub of the removed channel can call the device
+        self.assertEqual(len(stub.GetProtocols(Empty(), timeout=5).protocols), 3)
+        self.assertFalse(channels[-1].is_closed())
+
+        BiolectorXTChannelPool.remove(channels[-1].endpoint)
+        self.assertTrue(channels[-1].is_closed())
+
+    def test_benchmark(self):
+        """The benchmark runs against the mock server."""
+        measures = run_benchmark(nb_calls=5, nb_experiments=10, nb_protocols=2)
+
+        self.assertEqual(set(measures), {"new_channel", "pooled_channel", "biolector_experiments"})
+        self.assertEqual(measures["pooled_channel"].nb_calls, 5)
+        self.assertIn("speedup", format_report(measures))
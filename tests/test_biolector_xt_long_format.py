@@ -0,0 +1,166 @@
+import pandas as pd
+from gws_core import BaseTestCase
+from gws_plate_reader.biolector_xt_data_parser import BiolectorXTLoadData
+from gws_plate_reader.biolector_xt_data_parser.biolector_raw_data_index import (
+    BiolectorRawDataIndex,
+)
+from gws_plate_reader.biolector_xt_data_parser.biolector_xt_long_format import (
+    LONG_FORMAT_COLUMNS,
+    BiolectorLongFormatView,
+    build_long_format_data,
+    concat_long_format_data,
+    pivot_long_format_data,
+)
+
+
+class TestBiolectorXTLongFormat(BaseTestCase):
+    """Tests for the long-format output of BiolectorXTLoadData and its view."""
+
+    METADATA = {"Channels": [{"Name": "Biomass"}, {"Name": "pH"}]}
+
+    def _make_raw_data(self, offset: float) -> pd.DataFrame:
+        """Create raw data with 2 filtersets and 3 wells, A02 misses its last cycle in Biomass."""
+        rows = []
+        for filterset, time_shift in [("Biomass", 0), ("pH", 10)]:
+            for well in ["A01", "A02", "B01"]:
+                nb_cycles = 2 if (well == "A02" and filterset == "Biomass") else 3
+                for cycle in range(nb_cycles):
+                    rows.append(
+                        {
+                            "Well": well,
+                            "Filterset": filterset,
+                            "Time": cycle * 1800.0 + time_shift,
+                            "Cal": offset + cycle + (10 if filterset == "pH" else 0),
+                        }
+                    )
+        return pd.DataFrame(rows)
+
+    def _build_plate(self, plate_name: str, raw_data: pd.DataFrame) -> pd.DataFrame:
+        index = BiolectorRawDataIndex(raw_data)
+        loader = BiolectorXTLoadData()
+        return build_long_format_data(
+            plate_name, index.get_filter_pivots(loader.get_filters(self.METADATA))
+        )
+
+    def test_build_long_format_data(self):
+        """One row per measured value, missing values and empty wells have no row."""
+        data = self._build_plate("plate_0", self._make_raw_data(0))
+
+        self.assertEqual(list(data.columns), LONG_FORMAT_COLUMNS)
+        # 3 wells x 2 channels x 3 cycles, minus the missing Biomass value of A02
+        self.assertEqual(len(data), 17)
+        self.assertEqual(list(data["Well"].unique()), ["A1", "A2", "B1"])
+        a2_biomass = data[(data["Well"] == "A2") & (data["Channel"] == "Biomass")]
+        self.assertEqual(list(a2_biomass["Time"]), [0.0, 0.5])
+        self.assertEqual(list(a2_biomass["Value"]), [0.0, 1.0])
+        # time of the cycles from the first channel, in hours
+        a2_ph = data[(data["Well"] == "A2") & (data["Channel"] == "pH")]
+        self.assertEqual(list(a2_ph["Time"]), [0.0, 0.5, 1.0])
+
+    def test_long_format_matches_well_tables(self):
+        """The long-format data of several plates has the same values as the well tables."""
+        raw_data = self._make_raw_data(0)
+        data = concat_long_format_data(
+            [
+                self._build_plate("plate_0", raw_data),
+                self._build_plate("plate_1", self._make_raw_data(100)),
+            ]
+        )
+
+        self.assertEqual(list(data["Plate"].cat.categories), ["plate_0", "plate_1"])
+        self.assertEqual(list(data["Channel"].cat.categories), ["Biomass", "pH"])
+
+        parsed_data = BiolectorXTLoadData().parse_data(raw_data, self.METADATA)
+        first_df = parsed_data["Biomass"]
+        plate_data = data[data["Plate"] == "plate_0"]
+        for well in ["A01", "A02", "B01"]:
+            expected = first_df[["Time"]].copy()
+            for filter_name, filter_df in parsed_data.items():
+                expected[filter_name] = filter_df[well]
+
+            well_data = plate_data[plate_data["Well"] == f"{well[0]}{int(well[1:])}"].pivot_table(
+                index="Time", columns="Channel", values="Value", aggfunc="first", observed=True
+            )
+            well_data.columns = [str(col) for col in well_data.columns]
+            pd.testing.assert_frame_equal(
+                well_data.reset_index(),
+                expected.dropna(subset=["pH", "Biomass"], how="all"),
+                check_names=False,
+            )
+
+        plate_1_b1 = data[(data["Plate"] == "plate_1") & (data["Well"] == "B1")]
+        self.assertEqual(plate_1_b1[plate_1_b1["Channel"] == "pH"]["Value"].iloc[0], 110.0)
+
+    def test_cached_tables_are_not_modified(self):
+        """Building the long format from the cached tables of the index does not change them."""
+        index = BiolectorRawDataIndex(self._make_raw_data(0))
+        filters = BiolectorXTLoadData().get_filters(self.METADATA)
+        expected = index.get_filter_tables(filters)
+
+        build_long_format_data("plate_0", index.get_filter_pivots(filters))
+
+        for filter_name, table in index.get_filter_pivots(filters).items():
+            pd.testing.assert_frame_equal(table, expected[filter_name])
+
+    def test_pivot_long_format_data(self):
+        """The values of a channel get one column per plate/well, like ResourceSetToDataTable."""
+        data = concat_long_format_data(
+            [
+                self._build_plate("plate_0", self._make_raw_data(0)),
+                self._build_plate("plate_1", self._make_raw_data(100)),
+            ]
+        )
+
+        pivot = pivot_long_format_data(data, "Biomass")
+
+        self.assertEqual(
+            list(pivot.columns),
+            [
+                "Time",
+                "plate_0_A1",
+                "plate_0_A2",
+                "plate_0_B1",
+                "plate_1_A1",
+                "plate_1_A2",
+                "plate_1_B1",
+            ],
+        )
+        self.assertEqual(list(pivot["Time"]), [0.0, 0.5, 1.0])
+        self.assertEqual(list(pivot["plate_1_B1"]), [100.0, 101.0, 102.0])
+        self.assertTrue(pd.isna(pivot["plate_0_A2"].iloc[2]))
+        self.assertEqual(list(pivot_long_format_data(data, "Unknown").columns), ["Time"])
+
+    def test_view(self):
+        """The view gives the data of a plate/well/channel and the rows of selected wells."""
+        raw_data = self._make_raw_data(0)
+        view = BiolectorLongFormatView(
+            concat_long_format_data(
+                [
+                    self._build_plate("plate_0", raw_data),
+                    self._build_plate("plate_1", self._make_raw_data(100)),
+                ]
+            )
+        )
+
+        self.assertEqual(
+            view.get_wells()[:3], [("plate_0", "A1"), ("plate_0", "A2"), ("plate_0", "B1")]
+        )
+        self.assertEqual(len(view.get_wells()), 6)
+        self.assertEqual(view.get_channels(), ["Biomass", "pH"])
+
+        a2_biomass = view.get_values("plate_0", "A2", "Biomass")
+        self.assertEqual(list(a2_biomass.columns), ["Time", "Value"])
+        self.assertEqual(list(a2_biomass["Value"]), [0.0, 1.0])
+        self.assertTrue(view.get_values("plate_0", "F8", "Biomass").empty)
+
+        # same values as the well table
+        expected = BiolectorXTLoadData().parse_data(raw_data, self.METADATA)
+        well_data = view.get_well_data("plate_0", "B1")
+        self.assertEqual(list(well_data.columns), ["Time", "Biomass", "pH"])
+        self.assertEqual(list(well_data["pH"]), list(expected["pH"]["B01"]))
+
+        selected = view.select_wells([("plate_1", "B1"), ("plate_0", "A2"), ("plate_0", "F8")])
+        self.assertEqual(len(selected), 11)
+        # rows keep the order of the data
+        self.assertEqual(list(selected["Plate"].astype(str).unique()), ["plate_0", "plate_1"])
+        self.assertTrue(view.select_wells([]).empty)
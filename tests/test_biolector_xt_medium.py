@@ -0,0 +1,105 @@
+import numpy as np
+import pandas as pd
+from gws_core import BaseTestCase
+from gws_plate_reader.biolector_xt_data_parser.biolector_xt_medium import (
+    MediumCompositionIndex,
+    to_long_well_ids,
+    to_short_well_ids,
+)
+
+
+def legacy_metadata_rows(
+    medium_df: pd.DataFrame, info_df: pd.DataFrame, wells: list[str]
+) -> pd.DataFrame:
+    """Per-well implementation of the medium part of create_metadata_table, used as reference."""
+    info_df = info_df.copy()
+    info_df["Well"] = info_df["Well"].apply(lambda well: f"{well[0]}{int(well[1:])}")
+    well_to_medium = dict(zip(info_df["Well"], info_df["Medium"], strict=False))
+    info_columns = [col for col in info_df.columns if col not in ["Well", "Medium"]]
+    rows = []
+    for well in wells:
+        row = {}
+        medium_name = well_to_medium.get(well)
+        medium_row = medium_df[medium_df["Medium"] == medium_name]
+        if medium_name and not medium_row.empty:
+            for col in medium_df.columns:
+                if col != "Medium":
+                    row[col] = medium_row.iloc[0][col]
+        info_row = info_df[info_df["Well"] == well]
+        for col in info_columns:
+            if not info_row.empty:
+                value = info_row.iloc[0][col]
+                if pd.isna(value):
+                    row[col] = 0
+                elif value == "":
+                    row[col] = np.nan
+                else:
+                    try:
+                        row[col] = float(value)
+                    except (ValueError, TypeError):
+                        row[col] = value
+            else:
+                is_numeric = (
+                    pd.to_numeric(info_df[col].dropna().astype(str), errors="coerce").notna().any()
+                )
+                row[col] = 0 if is_numeric else np.nan
+        rows.append(row)
+    return pd.DataFrame(rows)
+
+
+class TestBiolectorXTMedium(BaseTestCase):
+    """Tests for the vectorized well → medium → composition join."""
+
+    def _make_tables(self) -> tuple[pd.DataFrame, pd.DataFrame]:
+        medium_df = pd.DataFrame(
+            {"Medium": ["M1", "M2", "M3"], "Glucose": [10.0, 20.0, 5.0], "Yeast": [1.0, 0.0, 2.0]}
+        )
+        info_df = pd.DataFrame(
+            {
+                "Well": ["A1", "A02", "B01", "C10"],
+                "Medium": ["M1", "M2", "M_UNKNOWN", "M1"],
+                "Dose": ["1.5", np.nan, "3", "2"],
+                "Compound": ["X", "Y", "", "Z"],
+            }
+        )
+        return medium_df, info_df
+
+    def test_well_ids(self):
+        wells = pd.Series(["A1", "A01", "C10", " B2 ", "other"])
+        self.assertEqual(list(to_short_well_ids(wells)), ["A1", "A1", "C10", "B2", "other"])
+        self.assertEqual(list(to_long_well_ids(wells)), ["A01", "A01", "C10", "B02", "other"])
+
+    def test_tags_mapping(self):
+        """The well → medium mapping uses 2-digit well IDs, compositions are by medium name."""
+        medium_df, info_df = self._make_tables()
+        mapping = MediumCompositionIndex(medium_df).map_wells(info_df)
+
+        self.assertEqual(
+            mapping.get_well_to_medium(),
+            {"A01": "M1", "A02": "M2", "B01": "M_UNKNOWN", "C10": "M1"},
+        )
+        self.assertEqual(mapping.get_medium_compositions()["M2"], {"Glucose": 20.0, "Yeast": 0.0})
+        # the info table is not modified
+        self.assertEqual(list(info_df["Well"]), ["A1", "A02", "B01", "C10"])
+
+    def test_metadata_identical_to_legacy(self):
+        """The metadata columns are the same as with the per-well implementation."""
+        medium_df, info_df = self._make_tables()
+        wells = ["A1", "A2", "B1", "C10", "F8"]
+
+        metadata = MediumCompositionIndex(medium_df).map_wells(info_df).get_metadata(wells)
+
+        pd.testing.assert_frame_equal(
+            metadata, legacy_metadata_rows(medium_df, info_df, wells), check_dtype=False
+        )
+
+    def test_composition_index_shared(self):
+        """The compositions of a medium table are computed once for all the plates."""
+        medium_df, info_df = self._make_tables()
+        composition_index = MediumCompositionIndex(medium_df)
+
+        first_plate = composition_index.map_wells(info_df)
+        second_plate = composition_index.map_wells(info_df.iloc[:2])
+
+        self.assertIs(first_plate.get_medium_compositions(), second_plate.get_medium_compositions())
+        self.assertEqual(list(second_plate.get_metadata(["A1"])["Glucose"]), [10.0])
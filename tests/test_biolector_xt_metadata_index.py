@@ -0,0 +1,84 @@
+import json
+import os
+import tempfile
+
+from gws_core import BaseTestCase
+from gws_plate_reader.biolector_xt_data_parser.biolector_xt_metadata import (
+    BiolectorMetadataIndex,
+    load_metadata_file,
+)
+
+
+class TestBiolectorMetadataIndex(BaseTestCase):
+    """Tests for the discovery and cache of the BXT metadata files."""
+
+    def setUp(self):
+        BiolectorMetadataIndex.clear_cache()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def _write_metadata(self, file_name: str, metadata: dict) -> str:
+        file_path = os.path.join(self.tmp_dir.name, file_name)
+        with open(file_path, "w", encoding="UTF-8") as file:
+            json.dump(metadata, file)
+        return file_path
+
+    def test_only_needed_keys_are_kept(self):
+        """The metadata keeps the keys used by the parsers, protocol details are dropped."""
+        self._write_metadata(
+            "exp BXT.json",
+            {
+                "Name": "exp",
+                "Channels": [{"Name": "Biomass"}],
+                "Microplate": {"CultivationLabels": ["A01"]},
+                "Protocol": {"Steps": list(range(1000))},
+            },
+        )
+        self._write_metadata("other.json", {"Name": "other"})
+
+        folder_metadata = BiolectorMetadataIndex.get_folder_metadata(self.tmp_dir.name)
+        self.assertEqual(folder_metadata.file_names, ["exp BXT.json"])
+        self.assertFalse(folder_metadata.is_ambiguous())
+        self.assertEqual(
+            folder_metadata.metadata,
+            {
+                "Channels": [{"Name": "Biomass"}],
+                "Microplate": {"CultivationLabels": ["A01"]},
+                "Name": "exp",
+            },
+        )
+
+    def test_cache_by_size_and_mtime(self):
+        """The file is parsed again only when it changes."""
+        file_path = self._write_metadata("exp BXT.json", {"Name": "first"})
+        first = load_metadata_file(self.tmp_dir.name)
+        self.assertIs(load_metadata_file(self.tmp_dir.name), first)
+
+        self._write_metadata("exp BXT.json", {"Name": "second version"})
+        file_stat = os.stat(file_path)
+        os.utime(file_path, ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns + 1_000_000))
+        self.assertEqual(load_metadata_file(self.tmp_dir.name), {"Name": "second version"})
+
+    def test_ambiguous_folder(self):
+        """With several metadata files, the last one in sorted order is used and reported."""
+        self._write_metadata("b BXT.json", {"Name": "b"})
+        self._write_metadata("a BXT.json", {"Name": "a"})
+
+        folder_metadata = BiolectorMetadataIndex.get_folder_metadata(self.tmp_dir.name)
+        self.assertTrue(folder_metadata.is_ambiguous())
+        self.assertEqual(folder_metadata.file_names, ["a BXT.json", "b BXT.json"])
+        self.assertEqual(folder_metadata.selected_file_name, "b BXT.json")
+        self.assertEqual(folder_metadata.metadata, {"Name": "b"})
+        self.assertIn("2 metadata files", folder_metadata.get_ambiguity_message())
+
+    def test_no_metadata_file_and_invalid_file(self):
+        """A folder without metadata file has no metadata, an invalid file raises an error."""
+        self.assertIsNone(load_metadata_file(self.tmp_dir.name))
+
+        with open(os.path.join(self.tmp_dir.name, "bad BXT.json"), "w", encoding="UTF-8") as file:
+            file.write("{not json")
+        with self.assertRaises(Exception) as context:
+            load_metadata_file(self.tmp_dir.name)
+        self.assertIn("bad BXT.json", str(context.exception))
@@ -0,0 +1,153 @@
+import hashlib
+import os
+import tempfile
+import time
+import zipfile
+
+from gws_core import BaseTestCase
+from gws_plate_reader.biolector_xt._benchmark.biolector_xt_grpc_benchmark import (
+    format_download_report,
+    run_download_benchmark,
+)
+from gws_plate_reader.biolector_xt._benchmark.biolector_xt_mock_server import (
+    BiolectorXTMockServer,
+    BiolectorXTMockServicer,
+    BiolectorXTNetworkProfile,
+)
+from gws_plate_reader.biolector_xt.biolector_xt_exception import BiolectorXTDownloadException
+from gws_plate_reader.biolector_xt.biolector_xt_grpc_channel import BiolectorXTChannelPool
+from gws_plate_reader.biolector_xt.biolector_xt_service import BiolectorXTService
+from gws_plate_reader.biolector_xt.biolector_xt_telemetry import BiolectorXTTelemetryWorker
+from gws_plate_reader.biolector_xt.grpc.biolectorxtremotecontrol_pb2 import (
+    StartProtocolResponse,
+    StopProtocolStatus,
+)
+from gws_plate_reader.biolector_xt_data_parser.biolector_xt_csv_reader import read_raw_data_csv
+from gws_plate_reader.biolector_xt_data_parser.biolector_xt_metadata import (
+    get_filters,
+    load_metadata_file,
+)
+from gws_plate_reader.biolector_xt_data_parser.biolector_xt_synthetic_export import (
+    SYNTHETIC_RAW_DATA_FILE_NAME,
+    SyntheticExportConfig,
+)
+
+
+class TestBiolectorXTMockServer(BaseTestCase):
+    """Tests for the in-process BiolectorXT mock server, with the real service."""
+
+    def _start_server(self, **servicer_params) -> BiolectorXTService:
+        self.servicer = BiolectorXTMockServicer(**servicer_params)
+        self.server = BiolectorXTMockServer(self.servicer).start()
+        return BiolectorXTService(self.server.get_credentials())
+
+    def setUp(self):
+        self.server = None
+
+    def tearDown(self):
+        BiolectorXTChannelPool.clear()
+        if self.server:
+            self.server.stop()
+
+    def test_experiments(self):
+        """The synthetic exports are listed and downloaded as zip files of the configured size."""
+        service = self._start_server(
+            nb_protocols=3,
+            nb_experiments=6,
+            experiment_size=200_000,
+            export_config=SyntheticExportConfig(nb_wells=4, nb_channels=2, nb_cycles=10),
+        )
+
+        experiments = service.get_biolector_experiments()
+        self.assertEqual(len(experiments), 6)
+        self.assertEqual(experiments[4].id, "experiment-4")
+        self.assertEqual(experiments[4].protocol.name, "Protocol 1")
+
+        data = self.servicer.get_experiment_data("experiment-4")
+        file_path = service.download_experiment(
+            "experiment-4", expected_sha256=hashlib.sha256(data).hexdigest()
+        )
+        self.assertEqual(os.path.getsize(file_path), 200_000)
+        with tempfile.TemporaryDirectory() as export_dir:
+            with zipfile.ZipFile(file_path) as zip_file:
+                zip_file.extractall(export_dir)
+            raw_data = read_raw_data_csv(os.path.join(export_dir, SYNTHETIC_RAW_DATA_FILE_NAME))
+            metadata = load_metadata_file(export_dir)
+        self.assertEqual(get_filters(metadata), ["Channel 0", "Channel 1"])
+        self.assertEqual(sorted(raw_data["Well"].unique()), ["A01", "A02", "A03", "A04"])
+        # the experiments are different and always the same
+        self.assertNotEqual(self.servicer.get_experiment_data("experiment-3"), data)
+        self.assertEqual(self.servicer.get_experiment_data("{experiment-4}"), data)
+
+        with self.assertRaises(BiolectorXTDownloadException):
+            service.download_experiment("unknown")
+
+    def test_protocol_run(self):
+        """A started protocol creates a running experiment and its progress."""
+        service = self._start_server(nb_protocols=2, nb_experiments=1)
+
+        self.assertEqual(
+            service.start_protocol("unknown").status, StartProtocolResponse.PROTOCOL_NOT_FOUND
+        )
+        self.assertEqual(service.start_protocol("protocol-1").status, StartProtocolResponse.SUCCESS)
+        self.assertEqual(
+            service.start_protocol("protocol-0").status, StartProtocolResponse.DEVICE_NOT_IDLE
+        )
+        experiments = service.get_biolector_experiments()
+        self.assertEqual(len(experiments), 2)
+        self.assertFalse(experiments[1].finished)
+        self.assertEqual(experiments[1].protocol.id, "protocol-1")
+
+        self.assertEqual(service.get_current_progress().total_cultivations, 48)
+        cultivation_values = service.get_cultivation_values()
+        self.assertEqual(len(cultivation_values.cultivation), 48)
+        self.assertEqual(len(cultivation_values.cultivation[0].value), 3)
+
+        self.assertEqual(service.stop_current_protocol().status, StopProtocolStatus.SUCCESS)
+        self.assertTrue(service.get_biolector_experiments()[1].finished)
+        self.assertEqual(self.servicer.nb_calls["StartProtocol"], 3)
+
+    def test_status_stream(self):
+        """The telemetry worker receives the measurements of all the wells and channels."""
+        service = self._start_server(status_interval=0.1)
+        worker = BiolectorXTTelemetryWorker(service, poll_interval=0.1)
+        worker.start()
+        try:
+            end_time = time.monotonic() + 5
+            while len(worker.get_snapshot().values) < 48 * 3 and time.monotonic() < end_time:
+                time.sleep(0.05)
+            snapshot = worker.get_snapshot()
+        finally:
+            worker.stop()
+
+        self.assertEqual(len(snapshot.values), 48 * 3)
+        self.assertEqual(snapshot.status["cover_state"], "COV_CLOSED")
+        self.assertEqual(snapshot.comments[0], ("C_SYSTEM", "Status stream started"))
+
+    def test_network_profile(self):
+        """The responses are delayed and the downloads throttled by the network profile."""
+        service = self._start_server(
+            nb_experiments=1,
+            experiment_size=300_000,
+            profile=BiolectorXTNetworkProfile(latency=0.2, bandwidth=1_000_000),
+        )
+        service.check_connection()
+
+        start = time.perf_counter()
+        service.get_protocols()
+        self.assertGreaterEqual(time.perf_counter() - start, 0.2)
+
+        start = time.perf_counter()
+        service.download_experiment("experiment-0")
+        # latency and 300 kB at 1 MB/s
+        self.assertGreaterEqual(time.perf_counter() - start, 0.45)
+
+    def test_download_benchmark(self):
+        """The download benchmark runs against the mock server."""
+        measures = run_download_benchmark(
+            experiment_size=500_000, profile_names=("local",), nb_clients=(1, 3)
+        )
+
+        self.assertEqual([measure.nb_clients for measure in measures], [1, 3])
+        self.assertEqual(measures[1].total_size, 3 * 500_000)
+        self.assertIn("MB/s", format_download_report(measures))
@@ -0,0 +1,92 @@
+import json
+import os
+
+import pandas as pd
+from gws_core import BaseTestCase, Settings
+from gws_plate_reader.biolector_xt_data_parser.biolector_raw_data_index import (
+    BiolectorRawDataIndex,
+)
+from gws_plate_reader.biolector_xt_data_parser.biolector_xt_plate_loader import (
+    parse_plate,
+    parse_plates_in_parallel,
+)
+
+
+class TestBiolectorXTPlateLoader(BaseTestCase):
+    """Tests for the parallel parsing of BiolectorXT plates."""
+
+    def _make_plate(self, plate_idx: int) -> tuple[pd.DataFrame, str, str]:
+        """Create the raw data and metadata folder of a plate, values depend on the plate index."""
+        rows = [
+            {
+                "Well": well,
+                "Filterset": filterset,
+                "Time": cycle * 900.0,
+                "Cal": float(plate_idx * 100 + cycle),
+                "Comment": "",
+            }
+            for filterset in ["Biomass", "pH"]
+            for well in ["A01", "A02", "B01"]
+            for cycle in range(3 + plate_idx)
+        ]
+        folder_path = Settings.make_temp_dir()
+        metadata = {"Name": f"plate {plate_idx}", "Channels": [{"Name": "Biomass"}, {"Name": "pH"}]}
+        with open(os.path.join(folder_path, "exp BXT.json"), "w", encoding="UTF-8") as json_file:
+            json.dump(metadata, json_file)
+        return pd.DataFrame(rows), folder_path, f"plate_{plate_idx}"
+
+    def test_parse_plates_in_parallel(self):
+        """Plates parsed in parallel are identical to plates parsed sequentially, in plate order."""
+        plates = [self._make_plate(plate_idx) for plate_idx in range(3)]
+        parsed_plate_indexes: list[int] = []
+
+        parsed_plates = parse_plates_in_parallel(
+            plates,
+            max_workers=2,
+            on_plate_parsed=lambda plate_idx, _: parsed_plate_indexes.append(plate_idx),
+        )
+
+        self.assertEqual(sorted(parsed_plate_indexes), [0, 1, 2])
+        for plate, parsed_plate in zip(plates, parsed_plates, strict=True):
+            expected = parse_plate(*plate)
+            self.assertEqual(parsed_plate.metadata, expected.metadata)
+            filters = ["Biomass", "pH"]
+            for filter_name, table in parsed_plate.raw_data_index.get_filter_tables(
+                filters
+            ).items():
+                pd.testing.assert_frame_equal(
+                    table, expected.raw_data_index.get_filter_tables(filters)[filter_name]
+                )
+
+    def test_parse_plates_in_parallel_cache(self):
+        """The plates parsed by the workers are cached, a reload does not parse them again."""
+        BiolectorRawDataIndex.clear_cache()
+        plates = [self._make_plate(plate_idx) for plate_idx in range(2)]
+        cache_keys = [
+            BiolectorRawDataIndex.compute_content_hash(raw_data) for raw_data, _, _ in plates
+        ]
+
+        parsed_plates = parse_plates_in_parallel(plates, max_workers=2, cache_keys=cache_keys)
+        for cache_key, parsed_plate in zip(cache_keys, parsed_plates, strict=True):
+            self.assertIs(
+                BiolectorRawDataIndex.get_from_cache(cache_key), parsed_plate.raw_data_index
+            )
+
+        # the cached plates are not sent to the workers
+        parsed_plate_indexes: list[int] = []
+        reloaded_plates = parse_plates_in_parallel(
+            plates,
+            max_workers=2,
+            on_plate_parsed=lambda plate_idx, _: parsed_plate_indexes.append(plate_idx),
+            cache_keys=cache_keys,
+        )
+        self.assertEqual(parsed_plate_indexes, [0, 1])
+        for parsed_plate, reloaded_plate in zip(parsed_plates, reloaded_plates, strict=True):
+            self.assertIs(reloaded_plate.raw_data_index, parsed_plate.raw_data_index)
+            self.assertEqual(reloaded_plate.metadata, parsed_plate.metadata)
+
+    def test_parse_plate_without_metadata(self):
+        """A plate without BXT.json metadata file raises an error with the plate name."""
+        raw_data, _, _ = self._make_plate(0)
+        with self.assertRaisesRegex(Exception, "plate_9"):
+            parse_plate(raw_data, Settings.make_temp_dir(), "plate_9")
@@ -0,0 +1,44 @@
+from gws_core import BaseTestCase
+from gws_plate_reader.biolector_xt._benchmark.biolector_xt_slow_service import (
+    BiolectorXTSlowListService,
+)
+from gws_plate_reader.biolector_xt.grpc.biolectorxtremotecontrol_pb2 import (
+    ExperimentInfo,
+    ProtocolInfo,
+)
+
+
+class TestBiolectorXTService(BaseTestCase):
+    """Tests for the methods shared by the BiolectorXT services."""
+
+    def test_get_biolector_experiments(self):
+        """Experiments and protocols are fetched concurrently and joined by protocol id."""
+        protocols = [
+            ProtocolInfo(protocol_id="p1", protocol_name="Protocol 1"),
+            ProtocolInfo(protocol_id="p2", protocol_name="Protocol 2"),
+            ProtocolInfo(protocol_id="p2", protocol_name="Protocol 2 duplicate"),
+        ]
+        experiments = [
+            ExperimentInfo(
+                experiment_id=f"{{e{i}}}",
+                protocol_id=f"{{{protocol_id}}}",
+                start_time="2024-01-01T10:00:00+01:00",
+                file_path=f"C:/experiment_{i}",
+                finished=i % 2 == 0,
+            )
+            for i, protocol_id in enumerate(["p1", "p2", "unknown"])
+        ]
+        service = BiolectorXTSlowListService(experiments, protocols)
+
+        biolector_experiments = service.get_biolector_experiments()
+
+        # both lists are requested at the same time
+        self.assertEqual(service.call_counter.max_running_calls, 2)
+
+        self.assertEqual([exp.id for exp in biolector_experiments], ["e0", "e1", "e2"])
+        self.assertEqual(biolector_experiments[0].protocol.name, "Protocol 1")
+        # the first protocol with the id is used
+        self.assertEqual(biolector_experiments[1].protocol.name, "Protocol 2")
+        self.assertEqual(biolector_experiments[2].protocol.id, "unknown")
+        self.assertEqual(biolector_experiments[2].protocol.name, "")
+        self.assertTrue(biolector_experiments[0].finished)
@@ -0,0 +1,118 @@
+import numpy as np
+import pandas as pd
+from gws_core import BaseTestCase, Table
+from gws_core.tag.tag import Tag, TagOrigins
+from gws_core.tag.tag_dto import TagOriginType
+from gws_core.user.current_user_service import CurrentUserService
+from gws_plate_reader.biolector_xt_data_parser import BiolectorXTLoadData
+from gws_plate_reader.biolector_xt_data_parser.biolector_xt_tags import (
+    apply_well_tags,
+    build_well_column_tags,
+    build_well_tags,
+    get_user_tag_origins,
+)
+
+CHANNELS = ["Biomass", "pH", "DO", "Fluo 1", "Fluo 2", "Fluo 3"]
+
+
+def legacy_tag_well_table(table: Table, plate_name: str, well_clean: str) -> None:
+    """Per-column tagging of a well table, used as reference."""
+    user_id = (
+        CurrentUserService.get_current_user().id if CurrentUserService.get_current_user() else None
+    )
+    origins = TagOrigins(TagOriginType.USER, user_id)
+    table.add_column_tag_by_name("Time", "column_name", "Time")
+    table.add_column_tag_by_name("Time", "unit", "h")
+    table.add_column_tag_by_name("Time", "is_index_column", "true")
+    for col in table.column_names:
+        if col != "Time":
+            table.add_column_tag_by_name(col, "column_name", col)
+            table.add_column_tag_by_name(col, "is_data_column", "true")
+    table.tags._tags.extend(
+        [
+            Tag(
+                key="batch", value=plate_name, auto_parse=True, origins=origins, is_propagable=True
+            ),
+            Tag(
+                key="sample", value=well_clean, auto_parse=True, origins=origins, is_propagable=True
+            ),
+        ]
+    )
+
+
+class TestBiolectorXTTags(BaseTestCase):
+    """Tests for the bulk tagging of the BiolectorXT well tables."""
+
+    def _make_well_table(self, nb_cycles: int = 10) -> Table:
+        data = {"Time": np.arange(nb_cycles) * 0.25}
+        for channel in CHANNELS:
+            data[channel] = np.random.default_rng(0).normal(size=nb_cycles)
+        return Table(pd.DataFrame(data))
+
+    def test_bulk_tags_identical_to_per_column(self):
+        """The bulk tags are the same as the tags added column by column."""
+        expected = self._make_well_table()
+        legacy_tag_well_table(expected, "plate_0", "A1")
+
+        table = self._make_well_table()
+        column_tags = build_well_column_tags(table.column_names)
+        apply_well_tags(
+            table, column_tags, build_well_tags(get_user_tag_origins(), "plate_0", "A1")
+        )
+
+        for column_name in expected.column_names:
+            self.assertEqual(
+                table.get_column_tags_by_name(column_name),
+                expected.get_column_tags_by_name(column_name),
+            )
+        self.assertEqual(
+            [(tag.key, tag.value) for tag in table.tags.get_tags()],
+            [(tag.key, tag.value) for tag in expected.tags.get_tags()],
+        )
+
+        # column tags are not shared between tables
+        table.add_column_tag_by_name("pH", "unit", "pH")
+        self.assertNotIn("unit", column_tags[CHANNELS.index("pH") + 1])
+
+    def test_build_well_tags_optional_tags(self):
+        """Medium and missing_value tags are only added when provided."""
+        origins = get_user_tag_origins()
+        self.assertEqual(
+            [tag.key for tag in build_well_tags(origins, "plate_0", "A1")], ["batch", "sample"]
+        )
+        tags = build_well_tags(
+            origins,
+            "plate_0",
+            "A1",
+            medium_name="M1",
+            medium_composition={"Glucose": 10},
+            missing_value="plate_layout",
+        )
+        self.assertEqual([tag.key for tag in tags], ["batch", "sample", "medium", "missing_value"])
+        self.assertEqual(tags[2].additional_info, {"composed": {"Glucose": 10}})
+
+    def test_create_parsed_resource_set_tags(self):
+        """Each well table of the loaded plate has its column tags and batch/sample tags."""
+        wells = ["A01", "A02", "B01"]
+        rows = [
+            {"Well": well, "Filterset": filterset, "Time": cycle * 900.0, "Cal": float(cycle)}
+            for filterset in ["Biomass", "pH"]
+            for well in wells
+            for cycle in range(4)
+        ]
+        metadata = {
+            "Channels": [{"Name": "Biomass"}, {"Name": "pH"}],
+            "Microplate": {"CultivationLabels": wells, "ReservoirLabels": []},
+        }
+
+        resource_set = BiolectorXTLoadData().create_parsed_resource_set(
+            pd.DataFrame(rows), metadata, plate_name="plate_1"
+        )
+
+        resources = resource_set.get_resources()
+        self.assertEqual(sorted(resources.keys()), ["A1", "A2", "B1"])
+        table: Table = resources["A2"]
+        self.assertEqual(table.get_column_tags_by_name("Time").get("is_index_column"), "true")
+        self.assertEqual(table.get_column_tags_by_name("pH").get("is_data_column"), "true")
+        self.assertEqual(table.tags.get_by_key("batch")[0].value, "plate_1")
+        self.assertEqual(table.tags.get_by_key("sample")[0].value, "A2")
@@ -0,0 +1,145 @@
+import time
+
+import grpc
+from google.protobuf.timestamp_pb2 import Timestamp
+from gws_core import BaseTestCase
+from gws_plate_reader.biolector_xt._benchmark.biolector_xt_mock_server import (
+    BiolectorXTMockServer,
+    BiolectorXTMockServicer,
+)
+from gws_plate_reader.biolector_xt.biolector_xt_grpc_channel import BiolectorXTChannelPool
+from gws_plate_reader.biolector_xt.biolector_xt_mock_service import BiolectorXTMockService
+from gws_plate_reader.biolector_xt.biolector_xt_service import BiolectorXTService
+from gws_plate_reader.biolector_xt.biolector_xt_telemetry import BiolectorXTTelemetryWorker
+from gws_plate_reader.biolector_xt.grpc.biolectorxtremotecontrol_pb2 import (
+    CoverStatus,
+    CultivationValuesItem,
+    GetCultivationValuesResponse,
+    GetCurrentProgressResponse,
+    MeasurementStatus,
+    StatusUpdateStreamResponse,
+    WellLabel,
+)
+
+
+class TelemetryServicer(BiolectorXTMockServicer):
+    """
+    Streams 10 biomass measurements of well A01 per connection, the first connection is
+    aborted after its measurements and the next ones stay open.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(nb_protocols=0, nb_experiments=0)
+        self.nb_streams = 0
+
+    def StatusUpdateStream(self, request, context):
+        self.nb_streams += 1
+        yield StatusUpdateStreamResponse(cover_state=CoverStatus.COV_CLOSED)
+        yield StatusUpdateStreamResponse(actual_temperature=30.5)
+        first_index = (self.nb_streams - 1) * 10
+        for index in range(first_index, first_index + 10):
+            yield StatusUpdateStreamResponse(
+                measurement_status=MeasurementStatus(
+                    cultivation=WellLabel.A01,
+                    channel_name="Biomass",
+                    value=index,
+                    time_stamp=Timestamp(seconds=1_700_000_000 + index),
+                )
+            )
+        if self.nb_streams == 1:
+            context.abort(grpc.StatusCode.UNAVAILABLE, "Connection lost")
+        while context.is_active():
+            time.sleep(0.05)
+
+    def GetCultivationValues(self, request, context):
+        return GetCultivationValuesResponse(
+            cultivation=[
+                CultivationValuesItem(
+                    label=WellLabel.B02,
+                    current_volume=800,
+                    value=[
+                        CultivationValuesItem.Value(
+                            index=9,
+                            name="pH",
+                            value=7.1,
+                            time_stamp=Timestamp(seconds=1_700_000_000),
+                        )
+                    ],
+                )
+            ]
+        )
+
+    def GetCurrentProgress(self, request, context):
+        return GetCurrentProgressResponse(cycle=3, total_channels=4)
+
+
+class TestBiolectorXTTelemetry(BaseTestCase):
+    """Tests for the background ingestion of the BiolectorXT telemetry."""
+
+    def setUp(self):
+        self.servicer = TelemetryServicer()
+        self.server = BiolectorXTMockServer(self.servicer).start()
+        service = BiolectorXTService(self.server.get_credentials())
+        self.worker = BiolectorXTTelemetryWorker(
+            service, buffer_size=15, poll_interval=0.1, initial_backoff=0.05
+        )
+
+    def tearDown(self):
+        self.worker.stop()
+        BiolectorXTChannelPool.clear()
+        self.server.stop()
+
+    def _wait_for(self, condition, timeout: float = 5) -> None:
+        end_time = time.monotonic() + timeout
+        while not condition(self.worker.get_snapshot()):
+            if time.monotonic() > end_time:
+                self.fail("Condition not reached")
+            time.sleep(0.02)
+
+    def test_telemetry_worker(self):
+        """The stream is reconnected and the values are kept in bounded buffers."""
+        self.worker.start()
+        self._wait_for(lambda snapshot: len(snapshot.values.get(("A01", "Biomass"), [])) == 15)
+        self._wait_for(lambda snapshot: snapshot.progress and snapshot.connected)
+        snapshot = self.worker.get_snapshot()
+
+        self.assertEqual(self.servicer.nb_streams, 2)
+        self.assertEqual(snapshot.nb_reconnections, 1)
+        self.assertIn("Connection lost", snapshot.last_error)
+        # the ring buffer keeps the last 15 of the 20 values
+        self.assertEqual(
+            [value for _, value in snapshot.values[("A01", "Biomass")]], list(range(5, 20))
+        )
+        self.assertEqual(snapshot.status["cover_state"], "COV_CLOSED")
+        self.assertAlmostEqual(snapshot.status["actual_temperature"], 30.5)
+        self.assertEqual(snapshot.progress["cycle"], 3)
+        self.assertEqual(snapshot.volumes["B02"]["current_volume"], 800)
+        # the polled value is added once
+        self.assertEqual(len(snapshot.values[("B02", "pH")]), 1)
+
+        values_df = snapshot.get_values_dataframe()
+        self.assertEqual(len(values_df), 16)
+        self.assertEqual(list(values_df.columns), ["Well", "Channel", "Time", "Value"])
+
+        self.worker.stop()
+        self.assertFalse(self.worker.is_running())
+        self.assertFalse(self.worker.get_snapshot().connected)
+        # the snapshot is a copy
+        snapshot.values.clear()
+        self.assertEqual(len(self.worker.get_snapshot().values), 2)
+
+    def test_telemetry_worker_with_mock_service(self):
+        """The stream of the mock service stays open and is cancelled on stop."""
+        self.worker = BiolectorXTTelemetryWorker(BiolectorXTMockService(), poll_interval=0.1)
+        self.worker.start()
+        self._wait_for(
+            lambda snapshot: snapshot.connected and ("A01", "Biomass") in snapshot.values
+        )
+        snapshot = self.worker.get_snapshot()
+
+        self.assertEqual(snapshot.nb_reconnections, 0)
+        self.assertIsNone(snapshot.last_error)
+        self.assertEqual(snapshot.status["target_temperature"], 30)
+
+        self.worker.stop()
+        self.assertFalse(self.worker.is_running())
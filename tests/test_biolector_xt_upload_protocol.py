@@ -0,0 +1,87 @@
+import os
+import tempfile
+import tracemalloc
+
+from gws_core import BaseTestCase
+from gws_plate_reader.biolector_xt._benchmark.biolector_xt_grpc_benchmark import (
+    format_upload_report,
+    run_upload_benchmark,
+)
+from gws_plate_reader.biolector_xt._benchmark.biolector_xt_mock_server import (
+    BiolectorXTMockServer,
+    BiolectorXTMockServicer,
+)
+from gws_plate_reader.biolector_xt.biolector_xt_grpc_channel import BiolectorXTChannelPool
+from gws_plate_reader.biolector_xt.biolector_xt_service import BiolectorXTService
+from gws_plate_reader.biolector_xt.grpc.biolectorxtremotecontrol_pb2 import StdItemStatus
+
+
+class TestBiolectorXTUploadProtocol(BaseTestCase):
+    """Tests for the streaming upload of the protocols to the BiolectorXT device."""
+
+    FILE_SIZE = 4 * 1024 * 1024 + 123
+
+    def setUp(self):
+        self.servicer = BiolectorXTMockServicer(nb_protocols=0, nb_experiments=0)
+        self.server = BiolectorXTMockServer(self.servicer).start()
+        self.service = BiolectorXTService(self.server.get_credentials())
+        with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as file:
+            file.write(os.urandom(self.FILE_SIZE))
+        self.file_path = file.name
+
+    def tearDown(self):
+        os.remove(self.file_path)
+        BiolectorXTChannelPool.clear()
+        self.server.stop()
+
+    def test_chunker(self):
+        """The chunks are read while they are consumed, with file reads or a memory map."""
+        for use_mmap in (False, True):
+            tracemalloc.start()
+            chunks = self.service._upload_protocol_chunker(self.file_path, 100_000, use_mmap)
+            self.assertEqual(next(chunks).metadata.filename, self.file_path)
+            chunk_sizes = [len(chunk.chunk_data) for chunk in chunks]
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+            self.assertEqual(sum(chunk_sizes), self.FILE_SIZE)
+            self.assertEqual(max(chunk_sizes), 100_000)
+            self.assertEqual(chunk_sizes[-1], self.FILE_SIZE % 100_000)
+            # only a few chunks are in memory at the same time
+            self.assertLess(peak, self.FILE_SIZE / 4)
+
+        with self.assertRaises(ValueError):
+            next(
+                self.service._upload_protocol_chunker(
+                    self.file_path, BiolectorXTService.MAX_UPLOAD_CHUNK_SIZE + 1
+                )
+            )
+
+    def test_upload_protocol(self):
+        """The whole file is received by the device, including an empty file."""
+        for use_mmap in (False, True):
+            response = self.service.upload_protocol(
+                self.file_path,
+                chunk_size=BiolectorXTService.MAX_UPLOAD_CHUNK_SIZE,
+                use_mmap=use_mmap,
+            )
+            self.assertEqual(response.status, StdItemStatus.OK)
+            self.assertEqual(self.servicer.uploaded_filename, self.file_path)
+            self.assertEqual(self.servicer.uploaded_size, self.FILE_SIZE)
+            self.assertEqual(
+                self.servicer.max_uploaded_chunk_size, BiolectorXTService.MAX_UPLOAD_CHUNK_SIZE
+            )
+
+        with tempfile.NamedTemporaryFile(suffix=".json") as empty_file:
+            self.service.upload_protocol(empty_file.name, use_mmap=True)
+            self.assertEqual(self.servicer.uploaded_size, 0)
+
+    def test_upload_throughput(self):
+        """The upload throughput is measured for each chunk size and read mode."""
+        measures = run_upload_benchmark(file_size=self.FILE_SIZE, chunk_sizes=(50_000, 131_071))
+
+        self.assertEqual(len(measures), 4)
+        for measure in measures:
+            self.assertEqual(measure.file_size, self.FILE_SIZE)
+            self.assertGreater(measure.throughput_mb_s, 0)
+        self.assertIn("MB/s", format_upload_report(measures))
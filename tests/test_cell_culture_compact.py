@@ -0,0 +1,54 @@
+import numpy as np
+import pandas as pd
+from gws_core import BaseTestCase
+from gws_plate_reader.cell_culture_filter.cell_culture_compact import (
+    compact_dataframe,
+    format_memory_report,
+    get_memory_usage,
+)
+
+
+class TestCellCultureCompact(BaseTestCase):
+    """Tests for the compact mode helpers of the cell culture tasks."""
+
+    def _make_dataframe(self) -> pd.DataFrame:
+        nb_rows = 200
+        return pd.DataFrame(
+            {
+                "Time": np.arange(nb_rows, dtype=np.float64),
+                "Biomasse": np.linspace(0, 1, nb_rows),
+                "Cycle": np.arange(nb_rows, dtype=np.int64),
+                "Batch": ["B1", "B2"] * (nb_rows // 2),
+                "Comment": [f"comment {i}" for i in range(nb_rows)],
+            },
+            index=pd.Index(np.arange(nb_rows, dtype=np.int64) * 2),
+        )
+
+    def test_compact_dataframe(self):
+        """Measurements become float32, repeated text categorical, kept columns are unchanged."""
+        df = self._make_dataframe()
+        compact_df = compact_dataframe(df, keep_columns=["Time"])
+
+        self.assertEqual(compact_df["Time"].dtype, np.float64)
+        self.assertEqual(compact_df["Biomasse"].dtype, np.float32)
+        self.assertEqual(compact_df["Cycle"].dtype, np.int32)
+        self.assertIsInstance(compact_df["Batch"].dtype, pd.CategoricalDtype)
+        self.assertEqual(compact_df["Comment"].dtype, df["Comment"].dtype)
+        self.assertEqual(compact_df.index.dtype, np.int32)
+        # input is not modified
+        self.assertEqual(df["Biomasse"].dtype, np.float64)
+
+        np.testing.assert_allclose(compact_df["Biomasse"], df["Biomasse"], rtol=1e-6)
+        self.assertEqual(list(compact_df["Batch"].astype(str)), list(df["Batch"]))
+        self.assertLess(get_memory_usage(compact_df), get_memory_usage(df))
+
+    def test_int_column_with_large_values_kept(self):
+        """Integer columns that do not fit in int32 keep their type."""
+        df = pd.DataFrame({"Value": [0, 2**40]})
+        self.assertEqual(compact_dataframe(df)["Value"].dtype, np.int64)
+
+    def test_format_memory_report(self):
+        self.assertEqual(
+            format_memory_report("plate", 2000, 500),
+            "plate: 2,000 → 500 bytes (saved 1,500 bytes, 75.0%)",
+        )
@@ -25,10 +25,15 @@ class TestFilterFermentorAnalyseLoadedResourceSetBySelection(BaseTestCase):
         rs.add_resource(self._make_tagged_table("B2", "S2"), "B2_S2")
         return rs
 
-    def _run_task(self, rs: ResourceSet, selection: list[dict]) -> dict:
+    def _run_task(
+        self, rs: ResourceSet, selection: list[dict], long_format_table: Table | None = None
+    ) -> dict:
+        inputs = {"resource_set": rs}
+        if long_format_table is not None:
+            inputs["long_format_table"] = long_format_table
         runner = TaskRunner(
             task_type=FilterFermentorAnalyseLoadedResourceSetBySelection,
-            inputs={"resource_set": rs},
+            inputs=inputs,
             params={"selection_criteria": selection},
         )
         return runner.run()
@@ -116,3 +121,32 @@ class TestFilterFermentorAnalyseLoadedResourceSetBySelection(BaseTestCase):
         filtered = outputs["filtered_resource_set"]
         resources = filtered.get_resources()
         self.assertEqual(len(resources), 0)  # lowercase doesn't match uppercase
+
+    def test_filter_long_format_table(self):
+        """The long format table is filtered with the same batch/sample (plate/well) selection."""
+        rows = [
+            {"Plate": batch, "Well": sample, "Channel": channel, "Time": time, "Value": 1.0}
+            for batch in ["B1", "B2"]
+            for sample in ["S1", "S2"]
+            for channel in ["Biomass", "pH"]
+            for time in [0.0, 0.5]
+        ]
+        long_format_table = Table(pd.DataFrame(rows))
+        long_format_table.add_column_tag_by_name("Time", "unit", "h")
+
+        outputs = self._run_task(
+            self._make_resource_set(),
+            [{"batch": "B2", "sample": "S1"}, {"batch": "B1", "sample": "S2"}],
+            long_format_table,
+        )
+
+        filtered = outputs["filtered_long_format_table"]
+        df = filtered.get_data()
+        self.assertEqual(len(df), 8)
+        # the rows keep the order of the input table
+        wells = df[["Plate", "Well"]].drop_duplicates()
+        self.assertEqual(
+            list(wells.itertuples(index=False, name=None)), [("B1", "S2"), ("B2", "S1")]
+        )
+        self.assertEqual(filtered.get_column_tags_by_name("Time").get("unit"), "h")
+        self.assertEqual(len(outputs["filtered_resource_set"].get_resources()), 2)
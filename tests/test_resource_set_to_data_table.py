@@ -213,3 +213,26 @@ class TestResourceSetToDataTable(BaseTestCase):
                     "data_column": "Biomasse",
                 },
             )
+
+    def test_long_format_table(self):
+        """The long format table is pivoted to one column per plate/well for the channel."""
+        long_df = pd.DataFrame(
+            {
+                "Plate": ["plate_0"] * 5,
+                "Well": ["A1", "A1", "A2", "A2", "A1"],
+                "Channel": ["Biomass", "Biomass", "Biomass", "Biomass", "pH"],
+                "Time": [0.0, 0.5, 0.0, 1.0, 0.0],
+                "Value": [1.0, 2.0, 3.0, 4.0, 7.0],
+            }
+        )
+        runner = TaskRunner(
+            task_type=ResourceSetToDataTable,
+            inputs={"long_format_table": Table(long_df)},
+            params={"index_column": "Time", "data_column": "Biomass"},
+        )
+        df = runner.run()["data_table"].get_data()
+
+        self.assertEqual(list(df.columns), ["Time", "plate_0_A1", "plate_0_A2"])
+        self.assertEqual(list(df["Time"]), [0.0, 0.5, 1.0])
+        self.assertEqual(list(df["plate_0_A1"].fillna(-1)), [1.0, 2.0, -1])
+        self.assertEqual(list(df["plate_0_A2"].fillna(-1)), [3.0, -1, 4.0])
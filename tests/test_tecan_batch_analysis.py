@@ -0,0 +1,142 @@
+import numpy as np
+import pandas as pd
+from gws_core import BaseTestCase, JSONDict, ResourceSet, Table, TaskRunner
+from gws_plate_reader.tecan.tecan_batch_analysis import TecanBatchAnalysis
+from gws_plate_reader.tecan.tecan_batch_statistics import (
+    BATCH_SUMMARY_COLUMNS,
+    compute_batch_statistics,
+    stack_plate_reads,
+)
+from gws_plate_reader.tecan.tecan_plate_format import PLATE_96, PLATE_384
+from gws_plate_reader.tecan.tecan_well_index import build_layout_grid
+
+
+class TestTecanBatchAnalysis(BaseTestCase):
+    """Tests for the batch statistics of Tecan plate reads."""
+
+    LAYOUT = {
+        "A1": {"compound": "untreated"},
+        "A2": {"compound": "untreated"},
+        "A3": {"compound": "untreated"},
+        "B1": {"compound": "drug"},
+        "B2": {"compound": "drug"},
+        "B3": {"compound": "drug"},
+        "C1": {"compound": "blank"},
+    }
+
+    def _make_read(self, seed: int, plate_format=PLATE_96) -> pd.DataFrame:
+        rng = np.random.default_rng(seed)
+        return pd.DataFrame(
+            rng.normal(100, 10, (plate_format.nb_rows, plate_format.nb_cols)),
+            index=plate_format.row_labels,
+            columns=plate_format.col_labels,
+        )
+
+    def _reference_statistics(self, reads: dict[str, pd.DataFrame]) -> pd.DataFrame:
+        """Statistics computed plate by plate with a pandas groupby."""
+        rows = []
+        for plate_name, read in reads.items():
+            long = read.stack().rename("value").reset_index()
+            long["well"] = long["level_0"] + long["level_1"].astype(str)
+            long["compound"] = long["well"].map(
+                lambda well: self.LAYOUT.get(well, {}).get("compound")
+            )
+            grouped = long.dropna(subset=["compound"]).groupby("compound")["value"]
+            for compound, values in grouped:
+                rows.append(
+                    {
+                        "Plate": plate_name,
+                        "Compound": compound,
+                        "Nb wells": len(values),
+                        "Nb values": int(values.count()),
+                        "Mean": values.mean(),
+                        "SD": values.std(ddof=1),
+                    }
+                )
+        return pd.DataFrame(rows)
+
+    def test_statistics_match_groupby(self):
+        """The vectorized statistics are the same as a groupby plate by plate."""
+        reads = {f"plate_{i}": self._make_read(i) for i in range(4)}
+        reads["plate_1"].loc["A", "2"] = np.nan
+
+        stack = stack_plate_reads(list(reads.values()), PLATE_96)
+        compound_grid, _ = build_layout_grid(PLATE_96, self.LAYOUT)
+        summary = compute_batch_statistics(stack, compound_grid, list(reads.keys()))
+        reference = self._reference_statistics(reads)
+
+        self.assertEqual(list(summary.columns), BATCH_SUMMARY_COLUMNS)
+        self.assertEqual(len(summary), 4 * 3)
+        merged = summary.merge(reference, on=["Plate", "Compound"], suffixes=("", "_ref"))
+        self.assertEqual(len(merged), len(summary))
+        for column in ["Nb wells", "Nb values", "Mean", "SD"]:
+            np.testing.assert_allclose(merged[column], merged[f"{column}_ref"], equal_nan=True)
+        np.testing.assert_allclose(merged["CV (%)"], merged["SD"] / merged["Mean"].abs() * 100)
+
+        row = summary[(summary["Plate"] == "plate_1") & (summary["Compound"] == "untreated")]
+        self.assertEqual(row["Nb wells"].iloc[0], 3)
+        self.assertEqual(row["Nb values"].iloc[0], 2)
+        # a single well: no standard deviation
+        blank = summary[summary["Compound"] == "blank"]
+        self.assertTrue(blank["SD"].isna().all())
+
+    def test_z_factor(self):
+        """The Z' factor of each plate is computed from the control compounds."""
+        reads = {"plate_0": self._make_read(0), "plate_1": self._make_read(1)}
+        stack = stack_plate_reads(list(reads.values()), PLATE_96)
+        compound_grid, _ = build_layout_grid(PLATE_96, self.LAYOUT)
+        summary = compute_batch_statistics(
+            stack, compound_grid, list(reads.keys()), "drug", "untreated"
+        )
+
+        for plate_name, read in reads.items():
+            positive = read.loc["B", ["1", "2", "3"]]
+            negative = read.loc["A", ["1", "2", "3"]]
+            expected = 1 - 3 * (positive.std() + negative.std()) / abs(
+                positive.mean() - negative.mean()
+            )
+            z_factors = summary.loc[summary["Plate"] == plate_name, "Z' factor"]
+            np.testing.assert_allclose(z_factors, expected)
+
+        # unknown control: no Z' factor
+        summary = compute_batch_statistics(
+            stack, compound_grid, list(reads.keys()), "unknown", "untreated"
+        )
+        self.assertTrue(summary["Z' factor"].isna().all())
+
+    def test_stack_partial_reads(self):
+        """Reads are aligned on the plate, missing wells and non numeric values are NaN."""
+        full_read = self._make_read(0)
+        partial_read = full_read.loc[["B", "A"], ["2", "1"]].copy()
+        partial_read.columns = [2, 1]
+        text_read = full_read.astype(object)
+        text_read.loc["A", "1"] = "OVER"
+
+        stack = stack_plate_reads([full_read, partial_read, text_read], PLATE_96)
+
+        self.assertEqual(stack.shape, (3, 8, 12))
+        np.testing.assert_array_equal(stack[0], full_read.to_numpy())
+        np.testing.assert_array_equal(stack[1, :2, :2], full_read.iloc[:2, :2].to_numpy())
+        self.assertTrue(np.isnan(stack[1, 2:, :]).all())
+        self.assertTrue(np.isnan(stack[1, :, 2:]).all())
+        self.assertTrue(np.isnan(stack[2, 0, 0]))
+        self.assertEqual(stack[2, 0, 1], full_read.loc["A", "2"])
+
+    def test_task(self):
+        """The task outputs one summary row per plate and compound."""
+        plate_reads = ResourceSet()
+        for i in range(3):
+            plate_reads.add_resource(Table(self._make_read(i, PLATE_384)), f"plate_{i}")
+
+        runner = TaskRunner(
+            task_type=TecanBatchAnalysis,
+            inputs={"plate_reads": plate_reads, "plate_layout": JSONDict(self.LAYOUT)},
+            params={"positive_control": "drug", "negative_control": "untreated"},
+        )
+        outputs = runner.run()
+
+        summary = outputs["summary_table"].get_data()
+        self.assertEqual(list(summary.columns), BATCH_SUMMARY_COLUMNS)
+        self.assertEqual(len(summary), 3 * 3)
+        self.assertEqual(set(summary["Plate"]), {"plate_0", "plate_1", "plate_2"})
+        self.assertFalse(summary["Z' factor"].isna().any())
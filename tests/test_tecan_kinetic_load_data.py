@@ -0,0 +1,122 @@
+import numpy as np
+import pandas as pd
+from gws_core import BaseTestCase, JSONDict, ResourceSet, Table, TaskRunner
+from gws_plate_reader.biolector_xt_data_parser.biolector_xt_long_format import (
+    LONG_FORMAT_COLUMNS,
+    get_short_well_name,
+)
+from gws_plate_reader.tecan.tecan_kinetic_load_data import TecanKineticLoadData
+from gws_plate_reader.tecan.tecan_kinetic_parser import (
+    align_channels,
+    get_time_unit_in_seconds,
+    parse_kinetic_table,
+)
+
+
+class TestTecanKineticLoadData(BaseTestCase):
+    """Tests for the Tecan kinetic parser and TecanKineticLoadData task."""
+
+    WELLS = ["A1", "A2", "B1"]
+
+    def _make_cycles_as_rows(self, nb_cycles: int = 4, offset: float = 0.0) -> pd.DataFrame:
+        """Kinetic export with one row per cycle (Cycle Nr., Time [s], Temp. [°C], wells)."""
+        data = {
+            "Cycle Nr.": list(range(1, nb_cycles + 1)),
+            "Time [s]": [cycle * 600.0 for cycle in range(nb_cycles)],
+            "Temp. [°C]": [37.0] * nb_cycles,
+        }
+        for well_idx, well in enumerate(["A01", "A02", "B01"]):
+            data[well] = [offset + well_idx * 10 + cycle for cycle in range(nb_cycles)]
+        return pd.DataFrame(data)
+
+    def test_time_labels(self):
+        """The time unit is read from the label, seconds by default."""
+        self.assertEqual(get_time_unit_in_seconds("Time [s]"), 1)
+        self.assertEqual(get_time_unit_in_seconds("Time"), 1)
+        self.assertEqual(get_time_unit_in_seconds("time [min]"), 60)
+        self.assertEqual(get_time_unit_in_seconds("Time [h]"), 3600)
+        self.assertIsNone(get_time_unit_in_seconds("Temp. [°C]"))
+        self.assertIsNone(get_time_unit_in_seconds("A1"))
+
+    def test_parse_both_orientations(self):
+        """Exports with cycles as rows or wells as rows give the same data."""
+        cycles_as_rows = self._make_cycles_as_rows()
+        wells_as_rows = cycles_as_rows.set_index("Cycle Nr.").T
+        wells_in_first_column = wells_as_rows.reset_index()
+
+        expected = parse_kinetic_table(cycles_as_rows)
+        self.assertEqual(expected.wells, self.WELLS)
+        np.testing.assert_array_equal(expected.times, [0, 600, 1200, 1800])
+        np.testing.assert_array_equal(expected.values[1], [10, 11, 12, 13])
+
+        for data in [wells_as_rows, wells_in_first_column]:
+            parsed = parse_kinetic_table(data)
+            self.assertEqual(parsed.wells, expected.wells)
+            np.testing.assert_array_equal(parsed.times, expected.times)
+            np.testing.assert_array_equal(parsed.values, expected.values)
+
+    def test_parse_invalid_table(self):
+        """A table without time or wells cannot be parsed."""
+        with self.assertRaises(ValueError):
+            parse_kinetic_table(pd.DataFrame({"A1": [1.0, 2.0]}))
+        with self.assertRaises(ValueError):
+            parse_kinetic_table(pd.DataFrame({"Time [s]": [0.0, 60.0], "Temp": [37, 37]}))
+
+    def test_align_channels(self):
+        """Channels are aligned on the cycles of the first channel."""
+        first = parse_kinetic_table(self._make_cycles_as_rows(nb_cycles=4))
+        second = parse_kinetic_table(
+            self._make_cycles_as_rows(nb_cycles=3, offset=100).drop(columns="A02")
+        )
+
+        aligned = align_channels({"OD600": first, "GFP": second})
+
+        self.assertEqual(aligned["GFP"].wells, self.WELLS)
+        np.testing.assert_array_equal(aligned["GFP"].times, first.times)
+        np.testing.assert_array_equal(aligned["GFP"].values[0], [100, 101, 102, np.nan])
+        self.assertTrue(np.isnan(aligned["GFP"].values[1]).all())
+
+    def test_short_well_name(self):
+        """Well names with one or two row letters are converted to C1 format."""
+        self.assertEqual(get_short_well_name("C01"), "C1")
+        self.assertEqual(get_short_well_name("AB12"), "AB12")
+        self.assertEqual(get_short_well_name("AF048"), "AF48")
+
+    def test_task(self):
+        """The task outputs one tagged time-indexed table per well."""
+        kinetic_data = ResourceSet()
+        kinetic_data.add_resource(Table(self._make_cycles_as_rows()), "OD600")
+        kinetic_data.add_resource(Table(self._make_cycles_as_rows(offset=100)), "GFP")
+        plate_layout = JSONDict({"A1": {"compound": "glucose"}, "C3": {"compound": "blank"}})
+
+        runner = TaskRunner(
+            task_type=TecanKineticLoadData,
+            inputs={"kinetic_data": kinetic_data, "plate_layout": plate_layout},
+            params={"plate_name": "plate_0"},
+        )
+        outputs = runner.run()
+
+        resources = outputs["resource_set"].get_resources()
+        self.assertEqual(
+            sorted(resources.keys()), ["plate_0_A1", "plate_0_A2", "plate_0_B1", "plate_0_C3"]
+        )
+        well_df = resources["plate_0_A2"].get_data()
+        self.assertEqual(list(well_df.columns), ["Time", "OD600", "GFP"])
+        np.testing.assert_allclose(well_df["Time"], [0, 1 / 6, 2 / 6, 3 / 6])
+        np.testing.assert_array_equal(well_df["GFP"], [110, 111, 112, 113])
+        self.assertEqual(resources["plate_0_A2"].tags.get_by_key("sample")[0].value, "A2")
+        self.assertEqual(
+            resources["plate_0_A2"].tags.get_by_key("missing_value")[0].value, "plate_layout"
+        )
+        self.assertEqual(
+            resources["plate_0_C3"].tags.get_by_key("missing_value")[0].value, "raw_data"
+        )
+
+        metadata_df = outputs["metadata_table"].get_data()
+        self.assertEqual(
+            metadata_df.set_index("Series").at["plate_0_A1", "plate_compound"], "glucose"
+        )
+
+        long_df = outputs["long_format_table"].get_data()
+        self.assertEqual(list(long_df.columns), LONG_FORMAT_COLUMNS)
+        self.assertEqual(len(long_df), 2 * 3 * 4)
@@ -2,6 +2,13 @@ import numpy as np
 import pandas as pd
 from gws_core import BaseTestCase, JSONDict, Table
 from gws_plate_reader.tecan.tecan_parser import TecanParser
+from gws_plate_reader.tecan.tecan_plate_format import (
+    PLATE_96,
+    PLATE_384,
+    PLATE_1536,
+    TecanPlateFormat,
+    get_row_label,
+)
 
 
 class TestTecanParser(BaseTestCase):
@@ -141,6 +148,44 @@ class TestTecanParser(BaseTestCase):
         if "A" in result_df.index and "1" in result_df.columns:
             self.assertTrue(np.isnan(result_df.at["A", "1"]))
 
+    def test_remove_wells_keeps_input_data(self):
+        """remove_wells_from_dataframe keeps a mask of the wells, the input table is not modified."""
+        data_table = self._make_data_table()
+        original_df = data_table.get_data().copy()
+        parser = TecanParser(data_file=data_table, plate_layout=self._make_plate_layout())
+        # no removed wells: the data is not copied
+        self.assertIs(parser.parse_data(), data_table.get_data())
+
+        parser.remove_wells_from_dataframe(["A1"])
+        result_df = parser.remove_wells_from_dataframe(["A2", "Z99"])
+
+        pd.testing.assert_frame_equal(data_table.get_data(), original_df)
+        self.assertEqual(parser.get_excluded_wells(), ["A1", "A2"])
+        self.assertTrue(np.isnan(result_df.at["A", "1"]))
+        self.assertTrue(np.isnan(result_df.at["A", "2"]))
+        self.assertEqual(result_df.at["A", "3"], 3.0)
+        # the data with the removed wells is built once
+        self.assertIs(parser.parse_data(), parser.parse_data())
+        self.assertTrue(np.isnan(parser.parse_data().at["A", "1"]))
+        self.assertTrue(np.isnan(parser.enrich_well_metadata()["A1"]["data"]))
+        self.assertIsNone(parser.mean_data_for_compound("glucose"))
+
+        # new data replaces the removed wells
+        parser.update_row_data(original_df)
+        self.assertEqual(parser.get_excluded_wells(), [])
+        self.assertEqual(parser.mean_data_for_compound("glucose"), 1.5)
+
+    def test_get_wells_label_description_dict_does_not_modify_layout(self):
+        """The returned descriptions can be modified without changing the plate layout."""
+        plate_layout = self._make_plate_layout()
+        parser = TecanParser(data_file=self._make_data_table(), plate_layout=plate_layout)
+
+        labels = parser.get_wells_label_description_dict()
+        labels["A1"]["compound"] = "modified"
+
+        self.assertEqual(plate_layout.get_data()["A1"]["compound"], "glucose")
+        self.assertEqual(parser.get_wells_label_description_dict()["A1"]["compound"], "glucose")
+
     def test_parse_data(self):
         """parse_data returns the raw DataFrame."""
         parser = TecanParser(
@@ -164,3 +209,122 @@ class TestTecanParser(BaseTestCase):
 
         result = parser.parse_data()
         self.assertEqual(result.shape[0], 1)
+
+    def test_well_index_matches_per_well_lookups(self):
+        """The well index gives the same values, lists and means as per-well lookups."""
+        data_table = self._make_data_table()
+        df = data_table.get_data()
+        df.at["B", "2"] = np.nan
+        parser = TecanParser(data_file=data_table, plate_layout=self._make_plate_layout())
+
+        enriched = parser.enrich_well_metadata()
+        for well in parser.get_wells_tecan():
+            value = df.at[well[0], well[1:]]
+            if np.isnan(value):
+                self.assertTrue(np.isnan(enriched[well]["data"]))
+            else:
+                self.assertEqual(enriched[well]["data"], value)
+        self.assertEqual(enriched["A2"]["concentration"], "20mM")
+
+        self.assertEqual(parser.get_wells_list_by_compound_type("lactose"), ["B1", "B2"])
+        self.assertEqual(parser.mean_data_for_compound("glucose"), (1.0 + 2.0) / 2)
+        # NaN values are ignored
+        self.assertEqual(parser.mean_data_for_compound("lactose"), 13.0)
+
+        # the index is built once, returned dicts and lists can be modified
+        enriched["A1"]["data"] = 0
+        parser.get_wells_list_by_compound_type("lactose").append("H12")
+        self.assertIs(parser.get_well_index(), parser.get_well_index())
+        self.assertEqual(parser.enrich_well_metadata()["A1"]["data"], 1.0)
+        self.assertEqual(parser.get_wells_list_by_compound_type("lactose"), ["B1", "B2"])
+
+    def test_well_index_updated_with_data(self):
+        """The compound means follow the updates and removals of the data."""
+        parser = TecanParser(
+            data_file=self._make_data_table(),
+            plate_layout=self._make_plate_layout(),
+        )
+        self.assertEqual(parser.mean_data_for_compound("glucose"), 1.5)
+
+        parser.remove_wells_from_dataframe(["A1", "Z99"])
+        self.assertEqual(parser.mean_data_for_compound("glucose"), 2.0)
+
+        updated_df = parser.parse_data() * 2
+        parser.update_row_data(updated_df)
+        self.assertEqual(parser.mean_data_for_compound("glucose"), 4.0)
+
+    def _make_plate(self, nb_rows: int, nb_cols: int) -> tuple[Table, JSONDict]:
+        """Create a full plate data table and a layout with one compound per row."""
+        row_labels = [get_row_label(row) for row in range(nb_rows)]
+        values = np.arange(nb_rows * nb_cols, dtype=float).reshape(nb_rows, nb_cols)
+        df = pd.DataFrame(
+            values, index=row_labels, columns=[str(col) for col in range(1, nb_cols + 1)]
+        )
+        layout = {
+            f"{row_label}{col}": {"compound": f"compound_{row_label}"}
+            for row_label in row_labels
+            for col in range(1, nb_cols + 1)
+        }
+        return Table(df), JSONDict(layout)
+
+    def _check_plate_size(self, plate_format: TecanPlateFormat, last_well: str):
+        data_table, plate_layout = self._make_plate(plate_format.nb_rows, plate_format.nb_cols)
+        parser = TecanParser(data_file=data_table, plate_layout=plate_layout)
+
+        self.assertEqual(parser.plate_format, plate_format)
+        wells = parser.get_wells_tecan()
+        self.assertEqual(len(wells), plate_format.nb_wells)
+        self.assertEqual(wells[-1], last_well)
+
+        nb_cols = plate_format.nb_cols
+        enriched = parser.enrich_well_metadata()
+        self.assertEqual(enriched[last_well]["data"], plate_format.nb_wells - 1)
+        self.assertEqual(enriched["B2"]["data"], nb_cols + 1)
+
+        # the wells of the row B have the values nb_cols to 2 * nb_cols - 1
+        self.assertEqual(len(parser.get_wells_list_by_compound_type("compound_B")), nb_cols)
+        self.assertEqual(parser.mean_data_for_compound("compound_B"), nb_cols + (nb_cols - 1) / 2)
+
+        statistics = parser.get_well_index().get_compound_statistics()
+        self.assertEqual(len(statistics), plate_format.nb_rows)
+        self.assertEqual(statistics.loc["compound_B", "nb_values"], nb_cols)
+        self.assertAlmostEqual(
+            statistics.loc["compound_B", "std"], np.std(np.arange(nb_cols), ddof=1)
+        )
+
+        result_df = parser.remove_wells_from_dataframe(["B1", last_well])
+        self.assertTrue(np.isnan(result_df.at["B", "1"]))
+        self.assertEqual(parser.mean_data_for_compound("compound_B"), nb_cols + nb_cols / 2)
+
+    def test_96_well_plate(self):
+        """A 96-well plate (8 x 12) is parsed and aggregated."""
+        self._check_plate_size(PLATE_96, "H12")
+
+    def test_384_well_plate(self):
+        """A 384-well plate (16 x 24) is parsed and aggregated."""
+        self._check_plate_size(PLATE_384, "P24")
+
+    def test_1536_well_plate(self):
+        """A 1536-well plate (32 x 48, rows A to AF) is parsed and aggregated."""
+        self._check_plate_size(PLATE_1536, "AF48")
+
+    def test_plate_format(self):
+        """Plate formats are detected from the data and wells are located in the grid."""
+        self.assertEqual(TecanPlateFormat.from_nb_wells(384), PLATE_384)
+        with self.assertRaises(ValueError):
+            TecanPlateFormat.from_nb_wells(100)
+
+        self.assertEqual(get_row_label(25), "Z")
+        self.assertEqual(get_row_label(26), "AA")
+        self.assertEqual(PLATE_1536.get_well_position("AA01"), 26 * 48)
+        self.assertIsNone(PLATE_96.get_well_position("I1"))
+        self.assertIsNone(PLATE_96.get_well_position("A13"))
+        self.assertIsNone(PLATE_96.get_well_position("blank"))
+
+        # a partial table uses the smallest format that contains it
+        df = pd.DataFrame({"13": [1.0]}, index=["B"])
+        self.assertEqual(TecanPlateFormat.detect(df), PLATE_384)
+        self.assertEqual(TecanParser(data_file=Table(df)).plate_format, PLATE_384)
+        self.assertEqual(
+            TecanParser(data_file=Table(df), plate_format=PLATE_1536).plate_format, PLATE_1536
+        )